@@ -11,6 +11,7 @@ WAFFLE_NAMESPACE = u'studio'
 
 # Switches
 ENABLE_ACCESSIBILITY_POLICY_PAGE = u'enable_policy_page'
+ENABLE_COURSE_OUTLINE_CACHE = u'enable_course_outline_cache'
 
 
 def waffle():
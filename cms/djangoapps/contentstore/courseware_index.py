@@ -1,12 +1,16 @@
 """ Code to allow module store to interface with courseware index """
 
 
+import hashlib
+import json
 import logging
 import re
+import zlib
 from abc import ABCMeta, abstractmethod
 from datetime import timedelta
 
 from django.conf import settings
+from django.core.cache import cache
 from django.urls import resolve
 from django.utils.translation import ugettext as _
 from django.utils.translation import ugettext_lazy
@@ -28,6 +32,13 @@ from xmodule.modulestore import ModuleStoreEnum
 # how far back from the trigger point to look back in order to index
 REINDEX_AGE = timedelta(0, 60)  # 60 seconds
 
+# The maximum number of items sent to the search engine at once
+INDEX_BATCH_SIZE = 500
+
+# How long the state of the last indexing of a course or library is kept;
+# once it expires, the next update of the index falls back on REINDEX_AGE
+INDEX_STATE_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+
 log = logging.getLogger('edx.modulestore')
 
 
@@ -132,6 +143,12 @@ class SearchIndexerBase(object):
             which items may need to be removed from the index
             If None, then a full reindex takes place
 
+        Updates of the index use the state recorded by the previous indexing of
+        the structure, when available, instead of REINDEX_AGE: the items whose
+        version, start date, content groups and location are unchanged since
+        then are not extracted again, and the items removed since then are
+        removed from the index without searching for them.
+
         Returns:
         Number of items that have been added to the index
         """
@@ -143,6 +160,13 @@ class SearchIndexerBase(object):
         structure_key = cls.normalize_structure_key(structure_key)
         location_info = cls._get_location_info(structure_key)
 
+        # The state of the previous indexing, used to only extract the items changed since
+        index_state = cls._get_index_state(structure_key) if triggered_at is not None else None
+        previous_fingerprints = index_state['fingerprints'] if index_state else {}
+
+        # fingerprints are those of all the items that are in the index once this indexing is done
+        fingerprints = {}
+
         # Wrap counter in dictionary - otherwise we seem to lose scope inside the embedded function `prepare_item_index`
         indexed_count = {
             "count": 0
@@ -181,9 +205,8 @@ class SearchIndexerBase(object):
             item_content_groups - content groups assigned to indexed item
             """
             is_indexable = hasattr(item, "index_dictionary")
-            item_index_dictionary = item.index_dictionary() if is_indexable else None
             # if it's not indexable and it does not have children, then ignore
-            if not item_index_dictionary and not item.has_children:
+            if not is_indexable and not item.has_children:
                 return
 
             item_content_groups = None
@@ -212,8 +235,10 @@ class SearchIndexerBase(object):
             indexed_items.add(item_id)
             if item.has_children:
                 # determine if it's okay to skip adding the children herein based upon how recently any may have changed
-                skip_child_index = skip_index or \
-                    (triggered_at is not None and (triggered_at - item.subtree_edited_on) > reindex_age)
+                skip_child_index = skip_index or (
+                    index_state is None and triggered_at is not None and
+                    (triggered_at - item.subtree_edited_on) > reindex_age
+                )
                 children_groups_usage = []
                 for child_item in item.get_children():
                     if modulestore.has_published_version(child_item):
@@ -227,20 +252,32 @@ class SearchIndexerBase(object):
                 if None in children_groups_usage:
                     item_content_groups = None
 
-            if skip_index or not item_index_dictionary:
+            if skip_index or not is_indexable:
                 return
 
             item_index = {}
             # if it has something to add to the index, then add it
             try:
+                item_fields = {'id': item_id}
+                if item.start:
+                    item_fields['start_date'] = item.start
+                item_fields['content_groups'] = item_content_groups if item_content_groups else None
+                item_fields.update(cls.supplemental_fields(item))
+                fingerprint = cls._item_fingerprint(item, location_info, item_fields)
+                if previous_fingerprints.get(item_id) == fingerprint:
+                    # unchanged since the previous indexing, so already in the index
+                    fingerprints[item_id] = fingerprint
+                    return item_content_groups
+
+                item_index_dictionary = item.index_dictionary()
+                if not item_index_dictionary:
+                    return
+
                 item_index.update(location_info)
                 item_index.update(item_index_dictionary)
-                item_index['id'] = item_id
-                if item.start:
-                    item_index['start_date'] = item.start
-                item_index['content_groups'] = item_content_groups if item_content_groups else None
-                item_index.update(cls.supplemental_fields(item))
+                item_index.update(item_fields)
                 items_index.append(item_index)
+                fingerprints[item_id] = fingerprint
                 indexed_count["count"] += 1
                 return item_content_groups
             except Exception as err:  # pylint: disable=broad-except
@@ -259,8 +296,15 @@ class SearchIndexerBase(object):
                 # Now index the content
                 for item in structure.get_children():
                     prepare_item_index(item, groups_usage_info=groups_usage_info)
-                searcher.index(cls.DOCUMENT_TYPE, items_index)
-                cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                for batch_start in range(0, len(items_index), INDEX_BATCH_SIZE):
+                    searcher.index(cls.DOCUMENT_TYPE, items_index[batch_start:batch_start + INDEX_BATCH_SIZE])
+                if index_state:
+                    deleted_items = set(index_state['items']) - indexed_items
+                    if deleted_items:
+                        searcher.remove(cls.DOCUMENT_TYPE, list(deleted_items))
+                else:
+                    cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                cls._set_index_state(structure_key, indexed_items, fingerprints)
         except Exception as err:  # pylint: disable=broad-except
             # broad exception so that index operation does not prevent the rest of the application from working
             log.exception(
@@ -275,6 +319,54 @@ class SearchIndexerBase(object):
 
         return indexed_count["count"]
 
+    @classmethod
+    def _item_fingerprint(cls, item, location_info, item_fields):
+        """
+        Returns a hash of the version of the given item and of the fields of
+        its index that don't come from it, which changes whenever the item
+        needs to be indexed again.
+        """
+        return hashlib.md5(json.dumps(
+            [location_info, item_fields, getattr(item, 'update_version', None), item.edited_on],
+            default=text_type,
+            sort_keys=True,
+        ).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _index_state_cache_key(cls, structure_key):
+        """
+        Returns the cache key of the state of the last indexing of the given structure.
+        """
+        return u'contentstore.search_index_state.{}.{}'.format(cls.INDEX_NAME, structure_key)
+
+    @classmethod
+    def _get_index_state(cls, structure_key):
+        """
+        Returns the state recorded by the last indexing of the given structure,
+        a dictionary of the ids of the items kept in the index and of the
+        fingerprints of those indexed, or None if there is none.
+        """
+        index_state = cache.get(cls._index_state_cache_key(structure_key))
+        if index_state is None:
+            return None
+        return json.loads(zlib.decompress(index_state).decode('utf-8'))
+
+    @classmethod
+    def _set_index_state(cls, structure_key, indexed_items, fingerprints):
+        """
+        Records the state of the indexing of the given structure, compressed
+        since the state of a large course holds thousands of items.
+        """
+        index_state = {
+            'items': sorted(indexed_items),
+            'fingerprints': fingerprints,
+        }
+        cache.set(
+            cls._index_state_cache_key(structure_key),
+            zlib.compress(json.dumps(index_state).encode('utf-8')),
+            INDEX_STATE_CACHE_TIMEOUT
+        )
+
     @classmethod
     def _do_reindex(cls, modulestore, structure_key):
         """
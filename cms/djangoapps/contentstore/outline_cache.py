@@ -0,0 +1,109 @@
+"""
+Caching of the xblock info of the sections of Studio course outlines.
+"""
+
+
+import hashlib
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+from pytz import UTC
+from six import text_type
+
+from cms.djangoapps.contentstore.config import waffle
+from cms.djangoapps.contentstore.config.waffle import SHOW_REVIEW_RULES_FLAG
+from openedx.core.djangoapps.schedules.config import COURSE_UPDATE_WAFFLE_FLAG
+from xmodule.fields import Date
+from xmodule.modulestore.django import modulestore
+from xmodule.partitions.partitions_service import get_all_partitions_for_course
+
+OUTLINE_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+class CourseOutlineCache(object):
+    """
+    Caches the xblock info of each section of a course outline, keyed by the
+    versions of the section's blocks, so that only the sections edited or
+    published since the outline was last loaded are recomputed.
+
+    The key also covers everything else a section's info depends on: the
+    course's settings, its user partitions, the waffle flags and settings
+    read by create_xblock_info and the language.  Since the visibility
+    state of a section depends on whether its blocks are released, its
+    info expires when the first of its blocks is released.
+    """
+    def __init__(self, course, is_concise):
+        # Imported here since the views import this module.
+        from contentstore.views.item import highlights_setting
+
+        self.context_hash = self._hash([
+            text_type(course.id),
+            text_type(course.edited_on),
+            text_type(course.published_on),
+            is_concise,
+            get_language(),
+            [partition.to_json() for partition in get_all_partitions_for_course(course)],
+            highlights_setting.is_enabled(),
+            COURSE_UPDATE_WAFFLE_FLAG.is_enabled(course.id),
+            SHOW_REVIEW_RULES_FLAG.is_enabled(course.id),
+            settings.FEATURES.get('ENABLE_SPECIAL_EXAMS'),
+        ])
+
+    @classmethod
+    def for_course(cls, course, is_concise):
+        """
+        Returns the CourseOutlineCache of the given course, or None if its
+        outline cannot be cached.
+        """
+        if not waffle.waffle().is_enabled(waffle.ENABLE_COURSE_OUTLINE_CACHE):
+            return None
+        if not modulestore().check_supports(course.id, 'get_subtree_versions_hash'):
+            return None
+        if course.enable_subsection_gating:
+            # Prerequisites are stored outside of the modulestore.
+            return None
+        return cls(course, is_concise)
+
+    def get_or_create(self, xblock, create_xblock_info):
+        """
+        Returns the cached xblock info of the given section, or the result
+        of create_xblock_info(), which is then cached.
+        """
+        cache_key = u'contentstore.course_outline.{}.{}'.format(
+            self._hash([self.context_hash, modulestore().get_subtree_versions_hash(xblock.location)]),
+            xblock.location.block_id,
+        )
+        xblock_info = cache.get(cache_key)
+        if xblock_info is None:
+            xblock_info = create_xblock_info()
+            timeout = self._timeout(xblock_info)
+            if timeout > 0:
+                cache.set(cache_key, xblock_info, timeout)
+        return xblock_info
+
+    @classmethod
+    def _timeout(cls, xblock_info):
+        """
+        Returns the number of seconds until the first of the blocks of the
+        given xblock info is released, at most OUTLINE_CACHE_TIMEOUT.
+        """
+        now = datetime.now(UTC)
+        timeout = OUTLINE_CACHE_TIMEOUT
+        xblock_infos = [xblock_info]
+        while xblock_infos:
+            info = xblock_infos.pop()
+            start = Date().from_json(info.get('start'))
+            if start is not None and start > now:
+                timeout = min(timeout, int((start - now).total_seconds()))
+            xblock_infos.extend(info.get('child_info', {}).get('children', []))
+        return timeout
+
+    @staticmethod
+    def _hash(values):
+        """
+        Returns a hash of the given JSON serializable values.
+        """
+        return hashlib.md5(json.dumps(values, sort_keys=True).encode('utf-8')).hexdigest()
@@ -438,13 +438,45 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
         # index based on time, will include an index of the origin sequential
         # because it is in a common subtree but not of the original vertical
         # because the original sequential's subtree is too old
-        new_indexed_count = self.index_recent_changes(store, before_time)
+        # (the time is only used without the state of the previous indexing)
+        with patch.object(CoursewareSearchIndexer, '_get_index_state', return_value=None):
+            new_indexed_count = self.index_recent_changes(store, before_time)
         self.assertEqual(new_indexed_count, 5)
 
         # full index again
         indexed_count = self.reindex_course(store)
         self.assertEqual(indexed_count, 7)
 
+    def _test_incremental_index(self, store):
+        """ Make sure that an update of the index only indexes the items changed since the previous indexing """
+        self.publish_item(store, self.vertical.location)
+        indexed_count = self.reindex_course(store)
+        self.assertEqual(indexed_count, 4)
+
+        # nothing changed, even though everything is recent
+        indexed_count = self.index_recent_changes(store, datetime(2015, 1, 1, tzinfo=UTC))
+        self.assertEqual(indexed_count, 0)
+
+        html_unit = store.get_item(self.html_unit.location)
+        html_unit.display_name = "Updated Html Content"
+        self.update_item(store, html_unit)
+        self.publish_item(store, self.html_unit.location)
+        indexed_count = self.index_recent_changes(store, datetime(2015, 1, 1, tzinfo=UTC))
+        self.assertEqual(indexed_count, 1)
+        response = self.search()
+        self.assertEqual(response["total"], 4)
+        self.assertIn(
+            "Updated Html Content",
+            [result["data"].get("content", {}).get("display_name") for result in response["results"]]
+        )
+
+        # deleted items are removed from the index
+        self.delete_item(store, self.html_unit.location)
+        self.publish_item(store, self.vertical.location)
+        self.index_recent_changes(store, datetime(2015, 1, 1, tzinfo=UTC))
+        response = self.search()
+        self.assertEqual(response["total"], 3)
+
     def _test_course_about_property_index(self, store):
         """ Test that informational properties in the course object end up in the course_info index """
         display_name = "Help, I need somebody!"
@@ -576,6 +608,10 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
     def test_time_based_index(self, store_type):
         self._perform_test_using_store(store_type, self._test_time_based_index)
 
+    @ddt.data(*WORKS_WITH_STORES)
+    def test_incremental_index(self, store_type):
+        self._perform_test_using_store(store_type, self._test_incremental_index)
+
     @ddt.data(*WORKS_WITH_STORES)
     def test_exception(self, store_type):
         self._perform_test_using_store(store_type, self._test_exception)
@@ -885,6 +921,22 @@ class TestLibrarySearchIndexer(MixedWithOptionsTestCase):
         html_contents = [cont['html_content'] for cont in self._get_contents(response)]
         self.assertIn(new_data, html_contents)
 
+    def _test_incremental_index(self, store):
+        """ test that an update of the index only indexes the items changed since the previous indexing """
+        self.reindex_library(store)
+
+        new_data = "I'm new data"
+        self.html_unit1.data = new_data
+        self.update_item(store, self.html_unit1)
+        indexed_count = LibrarySearchIndexer.index(
+            store, self.library.location.library_key, triggered_at=datetime.now(UTC)
+        )
+        self.assertEqual(indexed_count, 1)
+        response = self.search()
+        self.assertEqual(response["total"], 2)
+        html_contents = [cont['html_content'] for cont in self._get_contents(response)]
+        self.assertIn(new_data, html_contents)
+
     def _test_deleting_item(self, store):
         """ test deleting an item """
         self.reindex_library(store)
@@ -939,6 +991,10 @@ class TestLibrarySearchIndexer(MixedWithOptionsTestCase):
     def test_creating_item(self, store_type):
         self._perform_test_using_store(store_type, self._test_creating_item)
 
+    @ddt.data(*WORKS_WITH_STORES)
+    def test_incremental_index(self, store_type):
+        self._perform_test_using_store(store_type, self._test_incremental_index)
+
     @ddt.data(*WORKS_WITH_STORES)
     def test_deleting_item(self, store_type):
         self._perform_test_using_store(store_type, self._test_deleting_item)
@@ -642,6 +642,31 @@ class TestTranscript(unittest.TestCase):
         with self.assertRaises(transcripts_utils.TranscriptsGenerationException):
             transcripts_utils.Transcript.convert(invalid_srt_transcript, 'srt', 'sjson')
 
+    def test_convert_cached(self):
+        """
+        Tests that conversions of the same transcript content are only made once.
+        """
+        transcripts_utils.get_conversion_cache().clear()
+        with patch.object(
+            transcripts_utils.Transcript, '_convert', wraps=transcripts_utils.Transcript._convert
+        ) as mock_convert:
+            first = transcripts_utils.Transcript.convert(self.sjson_transcript, 'sjson', 'srt')
+            second = transcripts_utils.Transcript.convert(self.sjson_transcript, 'sjson', 'srt')
+            transcripts_utils.Transcript.convert(self.sjson_transcript, 'sjson', 'txt')
+        self.assertEqual(first, second)
+        self.assertEqual(mock_convert.call_count, 2)
+
+    def test_change_speed(self):
+        """
+        Tests that the sjson transcript is converted to other speeds.
+        """
+        actual = transcripts_utils.Transcript.change_speed(self.sjson_transcript, 2)
+        self.assertDictEqual(json.loads(actual), {
+            'start': [21000, 30000],
+            'end': [26000, 36000],
+            'text': ["Elephant&#39;s Dream", "At the left we can see..."],
+        })
+
     def test_dummy_non_existent_transcript(self):
         """
         Test `Transcript.asset` raises `NotFoundError` for dummy non-existent transcript.
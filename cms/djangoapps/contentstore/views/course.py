@@ -17,6 +17,7 @@ from ccx_keys.locator import CCXLocator
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied, ValidationError
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.http import Http404, HttpResponse, HttpResponseBadRequest, HttpResponseNotFound
 from django.shortcuts import redirect
 from django.urls import reverse
@@ -39,6 +40,7 @@ from contentstore.course_group_config import (
 )
 from contentstore.course_info_model import delete_course_update, get_course_updates, update_course_updates
 from contentstore.courseware_index import CoursewareSearchIndexer, SearchIndexingError
+from contentstore.outline_cache import CourseOutlineCache
 from contentstore.tasks import rerun_course as rerun_course_task
 from contentstore.utils import (
     add_instructor,
@@ -116,6 +118,10 @@ __all__ = ['course_info_handler', 'course_handler', 'course_listing',
 
 WAFFLE_NAMESPACE = 'studio_home'
 
+# The default and maximum numbers of sections of each page of a paginated course outline
+OUTLINE_PAGE_SIZE = 20
+MAX_OUTLINE_PAGE_SIZE = 100
+
 
 class AccessListFallback(Exception):
     """
@@ -338,19 +344,49 @@ def course_search_index_handler(request, course_key_string):
 def _course_outline_json(request, course_module):
     """
     Returns a JSON representation of the course module and recursively all of its children.
+
+    If a page number is requested, only the sections of that page, of page_size sections, are
+    included, and the pagination is described by the 'pagination' of the response.
     """
     is_concise = request.GET.get('format') == 'concise'
     include_children_predicate = lambda xblock: not xblock.category == 'vertical'
     if is_concise:
         include_children_predicate = lambda xblock: xblock.has_children
-    return create_xblock_info(
+
+    children = pagination = None
+    if 'page' in request.GET:
+        try:
+            page_size = min(int(request.GET.get('page_size', OUTLINE_PAGE_SIZE)), MAX_OUTLINE_PAGE_SIZE)
+        except ValueError:
+            page_size = OUTLINE_PAGE_SIZE
+        paginator = Paginator(course_module.get_children(), max(page_size, 1))
+        try:
+            page = paginator.page(request.GET['page'])
+        except PageNotAnInteger:
+            page = paginator.page(1)
+        except EmptyPage:
+            page = paginator.page(paginator.num_pages)
+        children = page.object_list
+        pagination = {
+            'count': paginator.count,
+            'num_pages': paginator.num_pages,
+            'page': page.number,
+            'page_size': paginator.per_page,
+        }
+
+    course_outline_info = create_xblock_info(
         course_module,
         include_child_info=True,
         course_outline=False if is_concise else True,
         include_children_predicate=include_children_predicate,
         is_concise=is_concise,
-        user=request.user
+        user=request.user,
+        children=children,
+        outline_cache=CourseOutlineCache.for_course(course_module, is_concise),
     )
+    if pagination is not None:
+        course_outline_info['pagination'] = pagination
+    return course_outline_info
 
 
 def get_in_process_course_actions(request):
@@ -1079,7 +1079,7 @@ def _get_gating_info(course, xblock):
 
 def create_xblock_info(xblock, data=None, metadata=None, include_ancestor_info=False, include_child_info=False,
                        course_outline=False, include_children_predicate=NEVER, parent_xblock=None, graders=None,
-                       user=None, course=None, is_concise=False):
+                       user=None, course=None, is_concise=False, children=None, outline_cache=None):
     """
     Creates the information needed for client-side XBlockInfo.
 
@@ -1095,6 +1095,9 @@ def create_xblock_info(xblock, data=None, metadata=None, include_ancestor_info=F
 
     In addition, an optional include_children_predicate argument can be provided to define whether or
     not a particular xblock should have its children included.
+
+    The children of the xblock whose info is included can be limited to a given list of them with the
+    children argument, and the info of sections can be cached with an optional CourseOutlineCache.
     """
     is_library_block = isinstance(xblock.location, LibraryUsageLocator)
     is_xblock_unit = is_unit(xblock, parent_xblock)
@@ -1127,7 +1130,9 @@ def create_xblock_info(xblock, data=None, metadata=None, include_ancestor_info=F
             include_children_predicate=include_children_predicate,
             user=user,
             course=course,
-            is_concise=is_concise
+            is_concise=is_concise,
+            children=children,
+            outline_cache=outline_cache,
         )
     else:
         child_info = None
@@ -1430,10 +1435,10 @@ def _create_xblock_ancestor_info(xblock, course_outline=False, include_child_inf
 
 
 def _create_xblock_child_info(xblock, course_outline, graders, include_children_predicate=NEVER, user=None,
-                              course=None, is_concise=False):
+                              course=None, is_concise=False, children=None, outline_cache=None):
     """
-    Returns information about the children of an xblock, as well as about the primary category
-    of xblock expected as children.
+    Returns information about the children of an xblock, or of the given children of it, as well
+    as about the primary category of xblock expected as children.
     """
     child_info = {}
     child_category = xblock_primary_child_category(xblock)
@@ -1443,8 +1448,10 @@ def _create_xblock_child_info(xblock, course_outline, graders, include_children_
             'display_name': xblock_type_display_name(child_category, default_display_name=child_category),
         }
     if xblock.has_children and include_children_predicate(xblock):
-        child_info['children'] = [
-            create_xblock_info(
+        child_info['children'] = []
+        for child in (xblock.get_children() if children is None else children):
+            create_child_info = partial(
+                create_xblock_info,
                 child, include_child_info=True, course_outline=course_outline,
                 include_children_predicate=include_children_predicate,
                 parent_xblock=xblock,
@@ -1452,8 +1459,11 @@ def _create_xblock_child_info(xblock, course_outline, graders, include_children_
                 user=user,
                 course=course,
                 is_concise=is_concise
-            ) for child in xblock.get_children()
-        ]
+            )
+            if outline_cache is not None and child.category == 'chapter':
+                child_info['children'].append(outline_cache.get_or_create(child, create_child_info))
+            else:
+                child_info['children'].append(create_child_info())
     return child_info
 
 
@@ -18,7 +18,9 @@ from django.utils.translation import ugettext as _
 from edx_django_utils.monitoring.middleware import _DEFAULT_NAMESPACE as DJANGO_UTILS_NAMESPACE
 from opaque_keys.edx.locator import CourseLocator
 from search.api import perform_search
+from waffle.testutils import override_switch
 
+from contentstore.config.waffle import ENABLE_COURSE_OUTLINE_CACHE
 from contentstore.config.waffle import WAFFLE_NAMESPACE as STUDIO_WAFFLE_NAMESPACE
 from contentstore.courseware_index import CoursewareSearchIndexer, SearchIndexingError
 from contentstore.tests.utils import CourseTestCase
@@ -488,6 +490,59 @@ class TestCourseOutline(CourseTestCase):
         # Finally, validate the entire response for consistency
         self.assert_correct_json_response(json_response, is_concise)
 
+    def test_json_responses_paginated(self):
+        """
+        Verify that the sections of the course outline can be fetched a page at a time.
+        """
+        second_chapter = ItemFactory.create(
+            parent_location=self.course.location, category='chapter', display_name="Week 2"
+        )
+        outline_url = reverse_course_url('course_handler', self.course.id)
+        resp = self.client.get(outline_url + '?page=2&page_size=1', HTTP_ACCEPT='application/json')
+        json_response = json.loads(resp.content.decode('utf-8'))
+
+        children = json_response['child_info']['children']
+        self.assertEqual([child['id'] for child in children], [six.text_type(second_chapter.location)])
+        self.assertEqual(
+            json_response['pagination'],
+            {'count': 2, 'num_pages': 2, 'page': 2, 'page_size': 1}
+        )
+
+    @ddt.data(('first', 1), ('3', 2), ('-1', 2))
+    @ddt.unpack
+    def test_json_responses_invalid_page(self, page, expected_page):
+        """
+        Verify that invalid page numbers fall back to the first page, and out of range ones to the last.
+        """
+        ItemFactory.create(parent_location=self.course.location, category='chapter', display_name="Week 2")
+        outline_url = reverse_course_url('course_handler', self.course.id)
+        resp = self.client.get(outline_url + '?page={}&page_size=1'.format(page), HTTP_ACCEPT='application/json')
+        self.assertEqual(resp.status_code, 200)
+        json_response = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(json_response['pagination']['page'], expected_page)
+
+    def test_json_responses_cached(self):
+        """
+        Verify that the sections of the course outline are cached until they are edited.
+        """
+        outline_url = reverse_course_url('course_handler', self.course.id)
+        with override_switch(u'{}.{}'.format(STUDIO_WAFFLE_NAMESPACE, ENABLE_COURSE_OUTLINE_CACHE), True):
+            resp = self.client.get(outline_url, HTTP_ACCEPT='application/json')
+            uncached_response = json.loads(resp.content.decode('utf-8'))
+
+            with mock.patch(
+                'contentstore.views.item.create_xblock_info', wraps=create_xblock_info
+            ) as mock_create_xblock_info:
+                resp = self.client.get(outline_url, HTTP_ACCEPT='application/json')
+            self.assertEqual(json.loads(resp.content.decode('utf-8')), uncached_response)
+            self.assertFalse(mock_create_xblock_info.called)
+
+            self.chapter.display_name = 'Week 1 Updated'
+            self.store.update_item(self.chapter, self.user.id)
+            resp = self.client.get(outline_url, HTTP_ACCEPT='application/json')
+            json_response = json.loads(resp.content.decode('utf-8'))
+            self.assertEqual(json_response['child_info']['children'][0]['display_name'], 'Week 1 Updated')
+
     def assert_correct_json_response(self, json_response, is_concise=False):
         """
         Asserts that the JSON response is syntactically consistent
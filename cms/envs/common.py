@@ -97,6 +97,7 @@ from lms.envs.common import (
     DEBUG_TOOLBAR_PATCH_SETTINGS,
 
     COURSE_ENROLLMENT_MODES,
+    ENROLLMENT_STATES_CACHE_TIMEOUT,
     CONTENT_TYPE_GATE_GROUP_IDS,
 
     DISABLE_ACCOUNT_ACTIVATION_REQUIREMENT_SWITCH,
@@ -146,6 +147,11 @@ BLOCK_STRUCTURES_SETTINGS = dict(
 
     # Backend storage options
     PRUNING_ACTIVE=False,
+
+    # Maximum total size, in bytes of serialized data, of the collected
+    # block structures held in memory by each process.  Set to 0 to
+    # disable the per-process cache.
+    PROCESS_CACHE_MAX_SIZE=0,
 )
 
 ############################ FEATURE CONFIGURATION #############################
@@ -1873,6 +1879,26 @@ CACHES = {
     },
 }
 
+# Host-local tier of the course_structure_cache, shared by all processes of a
+# host.  Set DIRECTORY, preferably to a directory on a tmpfs such as /dev/shm,
+# to enable it.  DIRECTORY must be owned by the user of these processes and not
+# writable by other users, and the files are signed with SECRET_KEY.  MAX_SIZE
+# is in bytes.
+COURSE_STRUCTURE_HOST_CACHE = {
+    'DIRECTORY': None,
+    'MAX_SIZE': 512 * 1024 * 1024,
+}
+
+# Local disk cache of the course assets served by the contentserver that are
+# too large for the course_assets cache.  Set DIRECTORY to enable it.  MAX_SIZE
+# is in bytes.  When X_ACCEL_REDIRECT_LOCATION names an internal nginx location
+# aliased to DIRECTORY, nginx sends the cached files.
+CONTENTSERVER_DISK_CACHE = {
+    'DIRECTORY': None,
+    'MAX_SIZE': 10 * 1024 * 1024 * 1024,
+    'X_ACCEL_REDIRECT_LOCATION': None,
+}
+
 ############################ OAUTH2 Provider ###################################
 
 
@@ -2096,6 +2122,13 @@ VIDEO_TRANSCRIPTS_SETTINGS = dict(
 
 VIDEO_TRANSCRIPTS_MAX_AGE = 31536000
 
+# The total length, in characters, of the converted transcripts kept in memory by each process
+TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE = 16 * 1024 * 1024
+
+# Whether the waffle flags, switches and course overrides are read from a snapshot kept in
+# memory by each process, see openedx.core.djangoapps.waffle_utils.snapshot
+WAFFLE_UTILS_SNAPSHOT_ENABLED = False
+
 ############################ TRANSCRIPT PROVIDERS SETTINGS ########################
 
 # Note: These settings will also exist in video-encode-manager, so any update here
@@ -2182,6 +2215,16 @@ BLOCKSTORE_API_URL = 'http://localhost:18250/api/v1/'
 # Which of django's caches to use for storing anonymous user state for XBlocks
 # in the blockstore-based XBlock runtime
 XBLOCK_RUNTIME_V2_EPHEMERAL_DATA_CACHE = 'default'
+# Local cache of the contents of Blockstore bundle files, keyed by their hash:
+# the total size in bytes of the files kept in memory by each process, the
+# directory they are also stored in (shared by the processes of a server) if
+# any, and its total size in bytes.
+BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE = 16 * 1024 * 1024
+BLOCKSTORE_FILE_CACHE_DIR = None
+BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE = 256 * 1024 * 1024
+# How many files of a bundle are fetched from Blockstore at once when
+# prefetching its OLX files.
+BLOCKSTORE_FILE_PREFETCH_THREADS = 4
 
 ###################### LEARNER PORTAL ################################
 LEARNER_PORTAL_URL_ROOT = 'https://learner-portal-localhost:18000'
@@ -212,6 +212,9 @@ if 'loc_cache' not in CACHES:
 if 'staticfiles' in CACHES:
     CACHES['staticfiles']['KEY_PREFIX'] = EDX_PLATFORM_REVISION
 
+COURSE_STRUCTURE_HOST_CACHE.update(ENV_TOKENS.get('COURSE_STRUCTURE_HOST_CACHE', {}))
+CONTENTSERVER_DISK_CACHE.update(ENV_TOKENS.get('CONTENTSERVER_DISK_CACHE', {}))
+
 # In order to transition from local disk asset storage to S3 backed asset storage,
 # we need to run asset collection twice, once for local disk and once for S3.
 # Once we have migrated to service assets off S3, then we can convert this back to
@@ -380,6 +383,14 @@ DOC_STORE_CONFIG = AUTH_TOKENS['DOC_STORE_CONFIG']
 BLOCKSTORE_API_URL = ENV_TOKENS.get('BLOCKSTORE_API_URL', None)  # e.g. "https://blockstore.example.com/api/v1/"
 # Configure an API auth token at (blockstore URL)/admin/authtoken/token/
 BLOCKSTORE_API_AUTH_TOKEN = AUTH_TOKENS.get('BLOCKSTORE_API_AUTH_TOKEN', None)
+BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE = ENV_TOKENS.get(
+    'BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE', BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE
+)
+BLOCKSTORE_FILE_CACHE_DIR = ENV_TOKENS.get('BLOCKSTORE_FILE_CACHE_DIR', BLOCKSTORE_FILE_CACHE_DIR)
+BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE = ENV_TOKENS.get(
+    'BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE', BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE
+)
+BLOCKSTORE_FILE_PREFETCH_THREADS = ENV_TOKENS.get('BLOCKSTORE_FILE_PREFETCH_THREADS', BLOCKSTORE_FILE_PREFETCH_THREADS)
 
 # Datadog for events!
 DATADOG = AUTH_TOKENS.get("DATADOG", {})
@@ -463,6 +474,10 @@ PARSE_KEYS = AUTH_TOKENS.get("PARSE_KEYS", {})
 # Video Caching. Pairing country codes with CDN URLs.
 # Example: {'CN': 'http://api.xuetangx.com/edx/video?s3_url='}
 VIDEO_CDN_URL = ENV_TOKENS.get('VIDEO_CDN_URL', {})
+TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE = ENV_TOKENS.get(
+    'TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE', TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE
+)
+WAFFLE_UTILS_SNAPSHOT_ENABLED = ENV_TOKENS.get('WAFFLE_UTILS_SNAPSHOT_ENABLED', WAFFLE_UTILS_SNAPSHOT_ENABLED)
 
 if FEATURES['ENABLE_COURSEWARE_INDEX'] or FEATURES['ENABLE_LIBRARY_INDEX']:
     # Use ElasticSearch for the search engine
@@ -150,7 +150,38 @@ def make_static_urls_absolute(request, html):
     )
 
 
-def replace_static_urls(text, data_directory=None, course_id=None, static_asset_path='', static_paths_out=None):
+def _get_course_static_url(course_id, rest):
+    """
+    Returns the url of the static content at the given path of the course.
+    """
+    # first look in the static file pipeline and see if we are trying to reference
+    # a piece of static content which is in the edx-platform repo (e.g. JS associated with an xmodule)
+
+    exists_in_staticfiles_storage = False
+    try:
+        exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
+    except Exception as err:
+        log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
+            rest, str(err)))
+
+    if exists_in_staticfiles_storage:
+        url = staticfiles_storage.url(rest)
+    else:
+        # if not, then assume it's courseware specific content and then look in the
+        # Mongo-backed database
+        # Import is placed here to avoid model import at project startup.
+        from static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
+        base_url = AssetBaseUrlConfig.get_base_url()
+        excluded_exts = AssetExcludedExtensionsConfig.get_excluded_extensions()
+        url = StaticContent.get_canonicalized_asset_path(course_id, rest, base_url, excluded_exts)
+
+        if AssetLocator.CANONICAL_NAMESPACE in url:
+            url = url.replace('block@', 'block/', 1)
+    return url
+
+
+def replace_static_urls(text, data_directory=None, course_id=None, static_asset_path='', static_paths_out=None,
+                        static_url_map=None):
     """
     Replace /static/$stuff urls either with their correct url as generated by collectstatic,
     (/static/$md5_hashed_stuff) or by the course-specific content static url
@@ -164,6 +195,8 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
     static_paths_out: (optional) pass an array to collect tuples for each static URI found:
       * the original unmodified static URI
       * the updated static URI (will match the original if unchanged)
+    static_url_map: (optional) the StaticUrlMap of the course, used to look up and store the urls of the
+      course's static content instead of checking the static file pipeline and the contentstore each time
     """
 
     if static_paths_out is None:
@@ -186,29 +219,11 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
 
         # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
         elif (not static_asset_path) and course_id:
-            # first look in the static file pipeline and see if we are trying to reference
-            # a piece of static content which is in the edx-platform repo (e.g. JS associated with an xmodule)
-
-            exists_in_staticfiles_storage = False
-            try:
-                exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
-            except Exception as err:
-                log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
-                    rest, str(err)))
-
-            if exists_in_staticfiles_storage:
-                url = staticfiles_storage.url(rest)
-            else:
-                # if not, then assume it's courseware specific content and then look in the
-                # Mongo-backed database
-                # Import is placed here to avoid model import at project startup.
-                from static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
-                base_url = AssetBaseUrlConfig.get_base_url()
-                excluded_exts = AssetExcludedExtensionsConfig.get_excluded_extensions()
-                url = StaticContent.get_canonicalized_asset_path(course_id, rest, base_url, excluded_exts)
-
-                if AssetLocator.CANONICAL_NAMESPACE in url:
-                    url = url.replace('block@', 'block/', 1)
+            url = static_url_map.get(rest) if static_url_map is not None else None
+            if url is None:
+                url = _get_course_static_url(course_id, rest)
+                if static_url_map is not None:
+                    static_url_map.set(rest, url)
 
         # Otherwise, look the file up in staticfiles_storage, and append the data directory if needed
         else:
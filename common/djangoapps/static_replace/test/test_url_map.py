@@ -0,0 +1,52 @@
+"""Tests for the static url maps of courses"""
+
+
+from django.test import TestCase
+from mock import patch
+from opaque_keys.edx.keys import CourseKey
+
+from static_replace.models import AssetBaseUrlConfig
+from static_replace.url_map import StaticUrlMap, clear_static_url_maps, get_course_static_url_map
+
+COURSE_KEY = CourseKey.from_string('course-v1:org+course+run')
+
+
+class StaticUrlMapTest(TestCase):
+    """
+    Tests for StaticUrlMap and get_course_static_url_map.
+    """
+    def setUp(self):
+        super(StaticUrlMapTest, self).setUp()
+        clear_static_url_maps()
+        self.addCleanup(clear_static_url_maps)
+        patcher = patch('static_replace.url_map._get_course_assets_version', return_value='version')
+        self.mock_get_course_assets_version = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_max_size(self):
+        static_url_map = StaticUrlMap(max_size=1)
+        static_url_map.set('first.png', '/first.png')
+        static_url_map.set('second.png', '/second.png')
+        self.assertEqual(static_url_map.get('first.png'), '/first.png')
+        self.assertIsNone(static_url_map.get('second.png'))
+
+    def test_shared(self):
+        get_course_static_url_map(COURSE_KEY).set('file.png', '/file.png')
+        self.assertEqual(get_course_static_url_map(COURSE_KEY).get('file.png'), '/file.png')
+        self.assertIsNone(
+            get_course_static_url_map(CourseKey.from_string('course-v1:org+course+other')).get('file.png')
+        )
+
+    def test_assets_version_changes(self):
+        get_course_static_url_map(COURSE_KEY).set('file.png', '/file.png')
+        self.mock_get_course_assets_version.return_value = 'other version'
+        self.assertIsNone(get_course_static_url_map(COURSE_KEY).get('file.png'))
+
+    def test_base_url_changes(self):
+        get_course_static_url_map(COURSE_KEY).set('file.png', '/file.png')
+        AssetBaseUrlConfig.objects.create(enabled=True, base_url='cdn.example.com')
+        self.assertIsNone(get_course_static_url_map(COURSE_KEY).get('file.png'))
+
+    def test_unknown_assets_version(self):
+        self.mock_get_course_assets_version.return_value = None
+        self.assertIsNone(get_course_static_url_map(COURSE_KEY))
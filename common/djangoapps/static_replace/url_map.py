@@ -0,0 +1,101 @@
+"""
+Per-course maps of the static urls replaced in course content.
+"""
+
+
+from threading import Lock
+
+from edx_django_utils.cache import RequestCache
+from six import text_type
+
+from openedx.core.lib.cache_utils import ProcessLRUCache
+from xmodule.contentstore.django import contentstore
+
+# The number of courses whose maps are kept in memory.
+MAX_CACHED_COURSES = 100
+
+# The number of urls kept in memory per course.
+MAX_URLS_PER_COURSE = 10000
+
+# The (version, StaticUrlMap) of the courses, by course key.
+_maps = ProcessLRUCache(MAX_CACHED_COURSES)
+
+
+class StaticUrlMap(object):
+    """
+    Maps the static urls found in the content of a course, such as
+    /static/image.png, to the urls replacing them, such as
+    /asset-v1:org+course+run+type@asset+block/image.png.
+
+    A map is only valid for the version of the course's assets and the
+    asset settings it was created for, see get_course_static_url_map.
+    """
+    def __init__(self, max_size=MAX_URLS_PER_COURSE):
+        self.max_size = max_size
+        self._urls = {}
+        self._lock = Lock()
+
+    def get(self, path):
+        """
+        Returns the url replacing the given static path, or None.
+        """
+        return self._urls.get(path)
+
+    def set(self, path, url):
+        """
+        Stores the url replacing the given static path.
+        """
+        with self._lock:
+            if len(self._urls) < self.max_size:
+                self._urls[path] = url
+
+    def __len__(self):
+        return len(self._urls)
+
+
+def get_course_static_url_map(course_key):
+    """
+    Returns the StaticUrlMap of the given course, or None if the version of
+    the course's assets is not known.
+
+    The map is shared by the requests handled by this process until an
+    asset of the course or the asset settings change.
+    """
+    # Import is placed here to avoid model import at project startup.
+    from static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
+
+    assets_version = _get_course_assets_version(course_key)
+    if assets_version is None:
+        return None
+
+    version = (
+        assets_version,
+        AssetBaseUrlConfig.get_base_url(),
+        tuple(AssetExcludedExtensionsConfig.get_excluded_extensions()),
+    )
+    map_version, static_url_map = _maps.get(text_type(course_key), (None, None))
+    if map_version != version:
+        static_url_map = StaticUrlMap()
+        _maps.set(text_type(course_key), (version, static_url_map))
+    return static_url_map
+
+
+def clear_static_url_maps():
+    """
+    Removes all the maps kept in memory.
+    """
+    _maps.clear()
+
+
+def _get_course_assets_version(course_key):
+    """
+    Returns the version of the course's assets, which is only looked up once
+    per request.
+    """
+    request_cache = RequestCache('static_replace.assets_version')
+    cached_response = request_cache.get_cached_response(text_type(course_key))
+    if cached_response.is_found:
+        return cached_response.value
+    assets_version = contentstore().get_course_assets_version(course_key)
+    request_cache.set(text_type(course_key), assets_version)
+    return assets_version
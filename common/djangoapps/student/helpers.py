@@ -26,7 +26,12 @@ from six import iteritems, text_type
 import third_party_auth
 from course_modes.models import CourseMode
 from lms.djangoapps.certificates.api import get_certificate_url, has_html_certificates_enabled
-from lms.djangoapps.certificates.models import CertificateStatuses, certificate_status_for_student
+from lms.djangoapps.certificates.models import (
+    CertificateStatuses,
+    GeneratedCertificate,
+    certificate_status,
+    certificate_status_for_student
+)
 from lms.djangoapps.grades.api import CourseGradeFactory
 from lms.djangoapps.verify_student.models import VerificationDeadline
 from lms.djangoapps.verify_student.services import IDVerificationService
@@ -446,6 +451,36 @@ def cert_info(user, course_overview):
     )
 
 
+def cert_info_for_enrollments(user, course_enrollments):
+    """
+    Get the certificate info of cert_info for each of the given enrollments of
+    the given student, reading all of the student's certificates at once.
+
+    Arguments:
+        user (User): A user.
+        course_enrollments (list[CourseEnrollment]): Enrollments of the user.
+
+    Returns:
+        dict: A dictionary mapping the course id of each enrollment to the
+            dictionary returned by cert_info for its course overview.
+    """
+    certificates_by_course = {
+        certificate.course_id: certificate
+        for certificate in GeneratedCertificate.objects.filter(
+            user=user,
+            course_id__in=[enrollment.course_id for enrollment in course_enrollments],
+        )
+    }
+    return {
+        enrollment.course_id: _cert_info(
+            user,
+            enrollment.course_overview,
+            certificate_status(certificates_by_course.get(enrollment.course_id))
+        )
+        for enrollment in course_enrollments
+    }
+
+
 def _cert_info(user, course_overview, cert_status):
     """
     Implements the logic for cert_info -- split out for testing.
@@ -32,7 +32,7 @@ from django.contrib.sites.models import Site
 from django.core.cache import cache
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from django.core.validators import FileExtensionValidator, RegexValidator
-from django.db import IntegrityError, models
+from django.db import IntegrityError, models, transaction
 from django.db.models import Count, Index, Q
 from django.db.models.signals import post_save, pre_save
 from django.db.utils import ProgrammingError
@@ -62,7 +62,8 @@ from lms.djangoapps.certificates.models import GeneratedCertificate
 from lms.djangoapps.courseware.models import (
     CourseDynamicUpgradeDeadlineConfiguration,
     DynamicUpgradeDeadlineConfiguration,
-    OrgDynamicUpgradeDeadlineConfiguration
+    OrgDynamicUpgradeDeadlineConfiguration,
+    chunks
 )
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
@@ -72,8 +73,10 @@ from openedx.core.djangoapps.enrollments.api import (
     set_enrollment_attributes
 )
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
+from openedx.core.djangoapps.waffle_utils import WaffleSwitch
 from openedx.core.djangoapps.xmodule_django.models import NoneToEmptyManager
 from openedx.core.djangolib.model_mixins import DeletableByUserValue
+from student import STUDENT_WAFFLE_NAMESPACE
 from student.signals import ENROLL_STATUS_CHANGE, ENROLLMENT_TRACK_UPDATED, UNENROLL_DONE
 from track import contexts, segment
 from util.milestones_helpers import is_entrance_exams_enabled
@@ -84,6 +87,9 @@ log = logging.getLogger(__name__)
 AUDIT_LOG = logging.getLogger("audit")
 SessionStore = import_module(settings.SESSION_ENGINE).SessionStore  # pylint: disable=invalid-name
 
+# Waffle switch for caching the states of all of a user's enrollments across requests
+ENROLLMENT_STATES_CACHE_SWITCH = WaffleSwitch(STUDENT_WAFFLE_NAMESPACE, 'cache_enrollment_states')
+
 # enroll status changed events - signaled to email_marketing.  See email_marketing.tasks for more info
 
 
@@ -1120,6 +1126,14 @@ class CourseEnrollment(models.Model):
 
     MODE_CACHE_NAMESPACE = u'CourseEnrollment.mode_and_active'
 
+    # cache key format e.g enrollment_states.<user_id>, holding the states of
+    # all of the user's enrollments
+    USER_ENROLLMENT_STATES_CACHE_KEY = u"enrollment_states.{}"
+    USER_ENROLLMENT_STATES_CACHE_NAMESPACE = u'CourseEnrollment.user_enrollment_states'
+
+    # The number of users, and of courses, of each query of bulk_fetch_enrollment_states_for_courses
+    ENROLLMENT_STATES_CHUNK_SIZE = 1000
+
     class Meta(object):
         unique_together = (('user', 'course'), )
         indexes = [Index(fields=['user', '-created'])]
@@ -1973,6 +1987,11 @@ class CourseEnrollment(models.Model):
         if user.is_anonymous:
             return CourseEnrollmentState(None, None)
         enrollment_state = cls._get_enrollment_in_request_cache(user, course_key)
+        if not enrollment_state and ENROLLMENT_STATES_CACHE_SWITCH.is_enabled():
+            enrollment_state = cls._get_user_enrollment_states(user).get(
+                text_type(course_key), CourseEnrollmentState(None, None)
+            )
+            cls._update_enrollment_in_request_cache(user, course_key, enrollment_state)
         if not enrollment_state:
             try:
                 record = cls.objects.get(user=user, course_id=course_key)
@@ -1998,6 +2017,67 @@ class CourseEnrollment(models.Model):
             enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
             cls._update_enrollment(cache, record.user.id, course_key, enrollment_state)
 
+    @classmethod
+    def bulk_fetch_enrollment_states_for_courses(cls, users, course_keys):
+        """
+        Bulk pre-fetches the enrollment states of each of the given users
+        in each of the given courses, with a query per chunk of users and
+        courses, so that is_enrolled and enrollment_mode_for_user make no
+        queries for them.
+
+        Unlike bulk_fetch_enrollment_states, previously cached entries are
+        kept, and the users' lack of enrollment in a course is cached too.
+        """
+        users = [user for user in users if not user.is_anonymous]
+        course_keys = list(course_keys)
+        cache = cls._get_mode_active_request_cache()
+        for user in users:
+            for course_key in course_keys:
+                cls._update_enrollment(cache, user.id, course_key, CourseEnrollmentState(None, None))
+
+        for users_chunk in chunks(users, cls.ENROLLMENT_STATES_CHUNK_SIZE):
+            for course_keys_chunk in chunks(course_keys, cls.ENROLLMENT_STATES_CHUNK_SIZE):
+                records = cls.objects.filter(
+                    user__in=users_chunk,
+                    course_id__in=course_keys_chunk,
+                ).values_list('user_id', 'course_id', 'mode', 'is_active')
+                for user_id, course_key, mode, is_active in records:
+                    cls._update_enrollment(cache, user_id, course_key, CourseEnrollmentState(mode, is_active))
+
+    @classmethod
+    def _get_user_enrollment_states(cls, user):
+        """
+        Returns a dict of the CourseEnrollmentStates of all of the user's
+        enrollments, by course id string.
+
+        The dict is kept in the request cache and in the django cache,
+        from which it is removed whenever one of the user's enrollments
+        is saved or deleted.
+        """
+        request_cache = RequestCache(cls.USER_ENROLLMENT_STATES_CACHE_NAMESPACE).data
+        enrollment_states = request_cache.get(user.id)
+        if enrollment_states is None:
+            cache_key = cls.USER_ENROLLMENT_STATES_CACHE_KEY.format(user.id)
+            enrollment_states = cache.get(cache_key)
+            if enrollment_states is None:
+                enrollment_states = {
+                    text_type(course_key): CourseEnrollmentState(mode, is_active)
+                    for course_key, mode, is_active in cls.objects.filter(user=user).values_list(
+                        'course_id', 'mode', 'is_active'
+                    )
+                }
+                cache.set(cache_key, enrollment_states, settings.ENROLLMENT_STATES_CACHE_TIMEOUT)
+            request_cache[user.id] = enrollment_states
+        return enrollment_states
+
+    @classmethod
+    def _clear_user_enrollment_states(cls, user_id):
+        """
+        Removes the cached states of all of the user's enrollments.
+        """
+        RequestCache(cls.USER_ENROLLMENT_STATES_CACHE_NAMESPACE).data.pop(user_id, None)
+        cache.delete(cls.USER_ENROLLMENT_STATES_CACHE_KEY.format(user_id))
+
     @classmethod
     def _get_mode_active_request_cache(cls):
         """
@@ -2051,13 +2131,23 @@ class FBEEnrollmentExclusion(models.Model):
 def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument, invalid-name
     """
     Invalidate the cache of CourseEnrollment model.
+
+    The cache is invalidated again once the current transaction is committed,
+    so that states read by other processes before then aren't kept.
     """
 
     cache_key = CourseEnrollment.cache_key_name(
         instance.user.id,
         text_type(instance.course_id)
     )
-    cache.delete(cache_key)
+    user_id = instance.user_id
+
+    def _invalidate():
+        cache.delete(cache_key)
+        CourseEnrollment._clear_user_enrollment_states(user_id)  # pylint: disable=protected-access
+
+    _invalidate()
+    transaction.on_commit(_invalidate)
 
 
 @receiver(models.signals.post_save, sender=CourseEnrollment)
@@ -9,10 +9,14 @@ import factory
 import pytz
 from django.contrib.auth.models import AnonymousUser
 from django.core.cache import cache
+from django.db import transaction
 from django.db.models import signals
 from django.db.models.functions import Lower
 from django.test import TestCase
+from edx_django_utils.cache import RequestCache
+from mock import patch
 from opaque_keys.edx.keys import CourseKey
+from waffle.testutils import override_switch
 
 from course_modes.models import CourseMode
 from course_modes.tests.factories import CourseModeFactory
@@ -128,6 +132,57 @@ class CourseEnrollmentTests(SharedModuleStoreTestCase):
         )
         self.assertListEqual([self.user, self.user_2], all_enrolled_users)
 
+    def test_bulk_fetch_enrollment_states_for_courses(self):
+        other_course_key = CourseKey.from_string('course-v1:edX+Other+Run')
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='verified')
+        CourseEnrollmentFactory.create(user=self.user_2, course_id=other_course_key, is_active=False)
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(1):
+            CourseEnrollment.bulk_fetch_enrollment_states_for_courses(
+                [self.user, self.user_2, AnonymousUser()], [self.course.id, other_course_key]
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id), ('verified', True))
+            self.assertEqual(CourseEnrollment.enrollment_mode_for_user(self.user, other_course_key), (None, None))
+            self.assertFalse(CourseEnrollment.is_enrolled(self.user_2, self.course.id))
+            self.assertFalse(CourseEnrollment.is_enrolled(self.user_2, other_course_key))
+            self.assertFalse(CourseEnrollment.is_enrolled(AnonymousUser(), self.course.id))
+
+    @override_switch('student.cache_enrollment_states', True)
+    def test_cached_enrollment_states(self):
+        other_course_key = CourseKey.from_string('course-v1:edX+Other+Run')
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='verified')
+        RequestCache.clear_all_namespaces()
+
+        self.assertTrue(CourseEnrollment.is_enrolled(self.user, self.course.id))
+        self.assertFalse(CourseEnrollment.is_enrolled(self.user, other_course_key))
+
+        # Later requests read the states from the cache.
+        RequestCache.clear_all_namespaces()
+        with self.assertNumQueries(0):
+            self.assertEqual(CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id), ('verified', True))
+            self.assertFalse(CourseEnrollment.is_enrolled(self.user, other_course_key))
+
+        # Enrolling the user removes the cached states.
+        CourseEnrollmentFactory.create(user=self.user, course_id=other_course_key)
+        RequestCache.clear_all_namespaces()
+        self.assertTrue(CourseEnrollment.is_enrolled(self.user, other_course_key))
+
+    @override_switch('student.cache_enrollment_states', True)
+    def test_cached_enrollment_states_cleared_on_commit(self):
+        other_course_key = CourseKey.from_string('course-v1:edX+Other+Run')
+        with patch('student.models.transaction.on_commit') as mock_on_commit:
+            with transaction.atomic():
+                CourseEnrollmentFactory.create(user=self.user, course_id=other_course_key)
+                # As another process could, before the enrollment is committed.
+                cache.set(CourseEnrollment.USER_ENROLLMENT_STATES_CACHE_KEY.format(self.user.id), {}, None)
+        for call in mock_on_commit.call_args_list:
+            call[0][0]()
+
+        RequestCache.clear_all_namespaces()
+        self.assertTrue(CourseEnrollment.is_enrolled(self.user, other_course_key))
+
     @skip_unless_lms
     # NOTE: We mute the post_save signal to prevent Schedules from being created for new enrollments
     @factory.django.mute_signals(signals.post_save)
@@ -38,7 +38,7 @@ from openedx.core.djangoapps.catalog.tests.factories import CourseRunFactory, Pr
 from openedx.core.djangoapps.programs.tests.mixins import ProgramsApiConfigMixin
 from openedx.core.djangoapps.site_configuration.tests.mixins import SiteMixin
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase, skip_unless_lms
-from student.helpers import _cert_info, process_survey_link
+from student.helpers import _cert_info, cert_info, cert_info_for_enrollments, process_survey_link
 from student.models import (
     CourseEnrollment,
     LinkedInAddToProfileConfiguration,
@@ -289,6 +289,34 @@ class CourseEndingTest(TestCase):
                 }
             )
 
+    def test_cert_info_for_enrollments(self):
+        """
+        Tests that the cert info of many enrollments is the same as that of
+        cert_info, and that the certificates of the user are read at once.
+        """
+        user = UserFactory.create()
+        courses = [
+            Mock(
+                end_of_course_survey_url="http://a_survey.com",
+                certificates_display_behavior='end',
+                id=CourseLocator(org="x", course="y", run=six.text_type(run)),
+            )
+            for run in range(3)
+        ]
+        GeneratedCertificateFactory.create(
+            user=user, course_id=courses[0].id, status=CertificateStatuses.generating, grade='0.7', mode='honor'
+        )
+        GeneratedCertificateFactory.create(
+            user=user, course_id=courses[1].id, status=CertificateStatuses.audit_passing, mode='honor'
+        )
+        enrollments = [Mock(course_id=course.id, course_overview=course) for course in courses]
+
+        with patch('lms.djangoapps.grades.course_grade_factory.CourseGradeFactory.read', return_value=None):
+            with self.assertNumQueries(1):
+                cert_statuses = cert_info_for_enrollments(user, enrollments)
+            self.assertEqual(cert_statuses, {course.id: cert_info(user, course) for course in courses})
+        self.assertEqual(cert_statuses[courses[0].id]['status'], 'generating')
+
 
 @ddt.ddt
 class DashboardTest(ModuleStoreTestCase, TestVerificationBase):
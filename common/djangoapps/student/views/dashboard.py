@@ -26,7 +26,7 @@ from course_modes.models import CourseMode
 from edxmako.shortcuts import render_to_response, render_to_string
 from entitlements.models import CourseEntitlement
 from lms.djangoapps.commerce.utils import EcommerceService  # pylint: disable=import-error
-from lms.djangoapps.courseware.access import has_access
+from lms.djangoapps.courseware.access import bulk_has_access, has_access
 from lms.djangoapps.experiments.utils import get_dashboard_course_info
 from lms.djangoapps.verify_student.services import IDVerificationService
 from openedx.core.djangoapps.catalog.utils import (
@@ -45,9 +45,13 @@ from openedx.core.djangoapps.util.maintenance_banner import add_maintenance_bann
 from openedx.core.djangoapps.waffle_utils import WaffleFlag, WaffleFlagNamespace
 from openedx.core.djangolib.markup import HTML, Text
 from openedx.features.enterprise_support.api import get_dashboard_consent_notification
-from shoppingcart.models import CourseRegistrationCode, DonationConfiguration
+from shoppingcart.models import DonationConfiguration, RegistrationCodeRedemption
 from student.api import COURSE_DASHBOARD_PLUGIN_VIEW_NAME
-from student.helpers import cert_info, check_verify_status_by_course, get_resume_urls_for_enrollments
+from student.helpers import (
+    cert_info_for_enrollments,
+    check_verify_status_by_course,
+    get_resume_urls_for_enrollments
+)
 from student.models import (
     AccountRecovery,
     CourseEnrollment,
@@ -699,10 +703,12 @@ def student_dashboard(request):
         staff_access = True
         errored_courses = modulestore().get_errored_courses()
 
-    show_courseware_links_for = {
-        enrollment.course_id: has_access(request.user, 'load', enrollment.course_overview)
-        for enrollment in course_enrollments
-    }
+    show_courseware_links_for = dict(zip(
+        [enrollment.course_id for enrollment in course_enrollments],
+        bulk_has_access(
+            request.user, 'load', [enrollment.course_overview for enrollment in course_enrollments]
+        )
+    ))
 
     # Find programs associated with course runs being displayed. This information
     # is passed in the template context to allow rendering of program-related
@@ -755,10 +761,7 @@ def student_dashboard(request):
     # If a course is not included in this dictionary,
     # there is no verification messaging to display.
     verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
-    cert_statuses = {
-        enrollment.course_id: cert_info(request.user, enrollment.course_overview)
-        for enrollment in course_enrollments
-    }
+    cert_statuses = cert_info_for_enrollments(request.user, course_enrollments)
 
     # only show email settings for Mongo course and when bulk email is turned on
     show_email_settings_for = frozenset(
@@ -776,14 +779,20 @@ def student_dashboard(request):
     statuses = ["approved", "denied", "pending", "must_reverify"]
     reverifications = reverification_info(statuses)
 
+    # Read the registration codes redeemed by the user in all of the courses at once.
+    redeemed_registration_codes_by_course = defaultdict(list)
+    for redemption in RegistrationCodeRedemption.objects.filter(
+        redeemed_by=request.user,
+        registration_code__course_id__in=[enrollment.course_id for enrollment in course_enrollments],
+    ).select_related('registration_code__invoice_item__invoice'):
+        registration_code = redemption.registration_code
+        redeemed_registration_codes_by_course[registration_code.course_id].append(registration_code)
+
     block_courses = frozenset(
         enrollment.course_id for enrollment in course_enrollments
         if is_course_blocked(
             request,
-            CourseRegistrationCode.objects.filter(
-                course_id=enrollment.course_id,
-                registrationcoderedemption__redeemed_by=request.user
-            ),
+            redeemed_registration_codes_by_course[enrollment.course_id],
             enrollment.course_id
         )
     )
@@ -25,3 +25,12 @@ class BaseBackend(six.with_metaclass(abc.ABCMeta, object)):
     def send(self, event):
         """Send event to tracker."""
         pass
+
+    def send_many(self, events):
+        """
+        Send a batch of events to tracker.
+
+        Backends able to store several events at once can override this.
+        """
+        for event in events:
+            self.send(event)
@@ -0,0 +1,243 @@
+"""
+Event tracker backend that hands events over to another backend from a
+background thread.
+
+The events are put in a bounded in-memory queue, which a background
+thread drains by sending them in batches to the wrapped backend, so that
+the request sending an event does not wait for the tracking sink.  It
+can be configured as below::
+
+  TRACKING_BACKENDS = {
+      'mongo': {
+          'ENGINE': 'track.backends.async_backend.AsyncBackend',
+          'OPTIONS': {
+              'backend': {
+                  'ENGINE': 'track.backends.mongodb.MongoBackend',
+                  'OPTIONS': {...},
+              },
+              'max_queue_size': 10000,
+              'batch_size': 100,
+              'overflow': 'drop',
+          }
+      }
+  }
+
+"""
+
+
+import atexit
+import logging
+import os
+import pickle
+import threading
+
+from edx_django_utils.monitoring import set_custom_metric
+from six.moves import queue
+
+from track.backends import BaseBackend
+
+log = logging.getLogger(__name__)
+
+OVERFLOW_DROP = 'drop'
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_SPILL = 'spill'
+OVERFLOW_POLICIES = (OVERFLOW_DROP, OVERFLOW_BLOCK, OVERFLOW_SPILL)
+
+
+class AsyncBackend(BaseBackend):
+    """
+    Event tracker backend that queues events for another backend.
+
+    When the queue is full, the overflow policy decides what happens to
+    new events: they are dropped, the sender blocks until the queue has
+    room for them (for at most block_timeout seconds, after which they
+    are dropped), or they are spilled to a file, which is replayed once
+    the queue is drained.
+    """
+
+    def __init__(self, backend, max_queue_size=10000, batch_size=100, overflow=OVERFLOW_DROP,
+                 block_timeout=1.0, spill_path=None, **kwargs):
+        """
+        :Parameters:
+          - `backend`: configuration of the wrapped backend, a dict with
+            an `ENGINE` and optional `OPTIONS`, as in TRACKING_BACKENDS
+          - `max_queue_size`: number of events kept in memory
+          - `batch_size`: maximum number of events sent at once
+          - `overflow`: one of 'drop', 'block' or 'spill'
+          - `block_timeout`: seconds a sender waits with 'block'
+          - `spill_path`: file the events are spilled to with 'spill',
+            suffixed with the id of each process spilling events
+
+        """
+        super(AsyncBackend, self).__init__(**kwargs)
+
+        # Imported here since the tracker imports the backends.
+        from track.tracker import _instantiate_backend_from_name
+
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Invalid event track overflow policy %s' % overflow)
+        if overflow == OVERFLOW_SPILL and not spill_path:
+            raise ValueError('The spill overflow policy requires a spill_path')
+
+        self.backend = _instantiate_backend_from_name(backend['ENGINE'], backend.get('OPTIONS', {}))
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.spill_path = spill_path
+
+        self.dropped_count = 0
+        self.spilled_count = 0
+        self._spill_lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+        atexit.register(self.close)
+
+    @property
+    def queue_depth(self):
+        """Number of events waiting to be sent."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def send(self, event):
+        """Queue the event, applying the overflow policy if the queue is full."""
+        self._ensure_started()
+        # The caller and the other backends keep using the event while the
+        # background thread sends it, so the queued event is a copy.
+        event = dict(event)
+        try:
+            if self.overflow == OVERFLOW_BLOCK:
+                self._queue.put(event, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(event)
+        except queue.Full:
+            if self.overflow == OVERFLOW_SPILL:
+                self._spill(event)
+            else:
+                self.dropped_count += 1
+                set_custom_metric('tracking_events_dropped', self.dropped_count)
+        set_custom_metric('tracking_queue_depth', self._queue.qsize())
+
+    def send_many(self, events):
+        for event in events:
+            self.send(event)
+
+    def flush(self):
+        """Wait until the queued and spilled events are sent."""
+        if self._queue is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self, timeout=5):
+        """
+        Send the remaining events and stop the background thread, waiting
+        for it at most timeout seconds.
+        """
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _ensure_started(self):
+        """
+        Start the background thread, in this process: the thread of a
+        parent process does not survive a fork.
+        """
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(self.max_queue_size)
+            self._thread = threading.Thread(target=self._run, name='tracking-{}'.format(id(self)))
+            self._thread.daemon = True
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        """Send the queued events in batches, until close is called."""
+        reported_dropped_count = 0
+        while True:
+            events = [self._queue.get()]
+            while len(events) < self.batch_size:
+                try:
+                    events.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            batch = [event for event in events if event is not None]
+            try:
+                self._send_batch(batch)
+                if self._queue.empty():
+                    self._replay_spilled_events()
+
+                if self.dropped_count > reported_dropped_count:
+                    log.warning(
+                        u'Dropped %d tracking events since the queue was full',
+                        self.dropped_count - reported_dropped_count,
+                    )
+                    reported_dropped_count = self.dropped_count
+            except Exception:  # pylint: disable=broad-except
+                # The thread must keep draining the queue, or senders would block or drop events.
+                log.exception(u'Error sending tracking events from the background thread')
+            finally:
+                for _ in events:
+                    self._queue.task_done()
+            if len(batch) < len(events):
+                return
+
+    def _send_batch(self, events):
+        """Send the events to the wrapped backend, logging any failure."""
+        if not events:
+            return
+        try:
+            self.backend.send_many(events)
+        except Exception:  # pylint: disable=broad-except
+            log.exception(u'Error sending %d events to the event tracker backend', len(events))
+
+    @property
+    def _spill_file_path(self):
+        """
+        The spill file of this process: the processes sharing a spill_path
+        must not replay the events spilled by one another.
+        """
+        return u'{}.{}'.format(self.spill_path, os.getpid())
+
+    def _spill(self, event):
+        """Append the event to the spill file."""
+        with self._spill_lock:
+            try:
+                with open(self._spill_file_path, 'ab') as spill_file:
+                    pickle.dump(event, spill_file, pickle.HIGHEST_PROTOCOL)
+                self.spilled_count += 1
+            except (IOError, OSError, pickle.PicklingError):
+                log.exception(u'Error spilling a tracking event to %s', self._spill_file_path)
+                self.dropped_count += 1
+                set_custom_metric('tracking_events_dropped', self.dropped_count)
+
+    def _replay_spilled_events(self):
+        """Send the events of the spill file, which is then removed."""
+        if self.spill_path is None:
+            return
+        spill_path = self._spill_file_path
+        with self._spill_lock:
+            if not os.path.exists(spill_path):
+                return
+            replay_path = spill_path + '.replay'
+            os.rename(spill_path, replay_path)
+
+        events = []
+        with open(replay_path, 'rb') as replay_file:
+            while True:
+                try:
+                    events.append(pickle.load(replay_file))
+                except EOFError:
+                    break
+                except pickle.UnpicklingError:
+                    log.exception(u'Error reading the tracking events spilled to %s', replay_path)
+                    break
+                if len(events) == self.batch_size:
+                    self._send_batch(events)
+                    events = []
+        self._send_batch(events)
+        os.remove(replay_path)
@@ -33,6 +33,27 @@ class LoggerBackend(BaseBackend):
         self.event_logger = logging.getLogger(name)
 
     def send(self, event):
+        self.event_logger.info(self._serialize(event))
+
+    def send_many(self, events):
+        """
+        Serialize all the events before logging them, so that the
+        handlers of the logger are not interleaved with the encoding.
+        """
+        event_strs = []
+        for event in events:
+            try:
+                event_strs.append(self._serialize(event))
+            except UnicodeDecodeError:
+                # Already logged, the rest of the batch is still sent.
+                pass
+
+        for event_str in event_strs:
+            self.event_logger.info(event_str)
+
+    @staticmethod
+    def _serialize(event):
+        """Returns the event as a JSON string, truncated to TRACK_MAX_EVENT."""
         try:
             event_str = json.dumps(event, cls=DateTimeJSONEncoder)
         except UnicodeDecodeError:
@@ -44,6 +65,4 @@ class LoggerBackend(BaseBackend):
         # TODO: remove trucation of the serialized event, either at a
         # higher level during the emittion of the event, or by
         # providing warnings when the events exceed certain size.
-        event_str = event_str[:settings.TRACK_MAX_EVENT]
-
-        self.event_logger.info(event_str)
+        return event_str[:settings.TRACK_MAX_EVENT]
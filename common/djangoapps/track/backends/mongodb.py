@@ -98,3 +98,18 @@ class MongoBackend(BaseBackend):
             # during the next event.
             msg = 'Error inserting to MongoDB event tracker backend'
             log.exception(msg)
+
+    def send_many(self, events):
+        """Insert the events in to the Mongo collection at once"""
+        if not events:
+            return
+        try:
+            # insert_many adds an _id to the documents it is given, so the
+            # events, which are shared with the other backends, are copied.
+            self.collection.insert_many([dict(event) for event in events], ordered=False)
+        except (PyMongoError, BSONError):
+            # As in send, the events are lost. Since the insert is
+            # unordered, the events following one that cannot be
+            # inserted are inserted anyway.
+            msg = 'Error inserting to MongoDB event tracker backend'
+            log.exception(msg)
@@ -0,0 +1,157 @@
+"""Tests for the asynchronous event tracker backend."""
+
+
+import os
+import shutil
+import tempfile
+import threading
+
+from django.test import TestCase
+from mock import patch
+
+from track.backends import BaseBackend
+from track.backends.async_backend import AsyncBackend
+
+
+class RecordingBackend(BaseBackend):
+    """Backend keeping the batches it is sent, optionally waiting for a go."""
+    def __init__(self, **options):
+        super(RecordingBackend, self).__init__(**options)
+        self.batches = []
+        self.sending = threading.Event()
+        self.go = threading.Event()
+        self.go.set()
+
+    def send(self, event):
+        self.send_many([event])
+
+    def send_many(self, events):
+        self.sending.set()
+        self.go.wait()
+        self.batches.append(list(events))
+
+    @property
+    def events(self):
+        return [event for batch in self.batches for event in batch]
+
+
+class TestAsyncBackend(TestCase):
+    """Tests for AsyncBackend."""
+    def setUp(self):
+        super(TestAsyncBackend, self).setUp()
+        self.spill_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spill_dir)
+
+    def _create_backend(self, **options):
+        backend = AsyncBackend(
+            backend={'ENGINE': 'track.backends.tests.test_async_backend.RecordingBackend'},
+            **options
+        )
+        self.addCleanup(backend.close)
+        return backend
+
+    def _block(self, backend):
+        """Make the wrapped backend wait, with one event being sent."""
+        backend.backend.go.clear()
+        backend.backend.sending.clear()
+        backend.send({'blocking': True})
+        backend.backend.sending.wait()
+
+    def test_send(self):
+        backend = self._create_backend()
+        events = [{'test': index} for index in range(5)]
+        for event in events:
+            backend.send(event)
+        backend.flush()
+        self.assertEqual(backend.backend.events, events)
+
+    def test_send_copy(self):
+        backend = self._create_backend()
+        event = {'test': 0}
+        backend.send(event)
+        backend.flush()
+        self.assertEqual(backend.backend.events, [event])
+        self.assertIsNot(backend.backend.events[0], event)
+
+    def test_batches(self):
+        backend = self._create_backend(batch_size=2)
+        self._block(backend)
+        for index in range(5):
+            backend.send({'test': index})
+        backend.backend.go.set()
+        backend.flush()
+        self.assertEqual(
+            [len(batch) for batch in backend.backend.batches],
+            [1, 2, 2, 1],
+        )
+
+    def test_overflow_drop(self):
+        backend = self._create_backend(max_queue_size=2)
+        self._block(backend)
+        for index in range(4):
+            backend.send({'test': index})
+        self.assertEqual(backend.queue_depth, 2)
+        self.assertEqual(backend.dropped_count, 2)
+        backend.backend.go.set()
+        backend.flush()
+        self.assertEqual(backend.backend.events[1:], [{'test': 0}, {'test': 1}])
+
+    def test_overflow_block(self):
+        backend = self._create_backend(max_queue_size=1, overflow='block', block_timeout=0.2)
+        self._block(backend)
+        backend.send({'test': 0})
+        backend.send({'test': 1})
+        self.assertEqual(backend.dropped_count, 1)
+
+        threading.Timer(0.01, backend.backend.go.set).start()
+        backend.send({'test': 2})
+        backend.flush()
+        self.assertEqual(backend.backend.events[1:], [{'test': 0}, {'test': 2}])
+
+    def test_overflow_spill(self):
+        spill_path = os.path.join(self.spill_dir, 'events')
+        backend = self._create_backend(max_queue_size=1, overflow='spill', spill_path=spill_path)
+        self._block(backend)
+        for index in range(3):
+            backend.send({'test': index})
+        self.assertEqual(backend.dropped_count, 0)
+        self.assertEqual(backend.spilled_count, 2)
+
+        backend.backend.go.set()
+        backend.flush()
+        self.assertEqual(backend.backend.events[1:], [{'test': index} for index in range(3)])
+        self.assertEqual(os.listdir(self.spill_dir), [])
+
+    def test_spill_path_per_process(self):
+        spill_path = os.path.join(self.spill_dir, 'events')
+        backend = self._create_backend(max_queue_size=1, overflow='spill', spill_path=spill_path)
+        self._block(backend)
+        backend.send({'test': 0})
+        backend.send({'test': 1})
+        self.assertEqual(os.listdir(self.spill_dir), ['events.{}'.format(os.getpid())])
+        backend.backend.go.set()
+        backend.flush()
+
+    def test_background_thread_error(self):
+        spill_path = os.path.join(self.spill_dir, 'events')
+        backend = self._create_backend(overflow='spill', spill_path=spill_path)
+        with patch.object(backend, '_replay_spilled_events', side_effect=IOError('Disk unavailable')):
+            backend.send({'test': 0})
+            backend.flush()
+        backend.send({'test': 1})
+        backend.flush()
+        self.assertEqual(backend.backend.events, [{'test': 0}, {'test': 1}])
+        self.assertTrue(backend._thread.is_alive())  # pylint: disable=protected-access
+
+    def test_close(self):
+        backend = self._create_backend()
+        backend.send({'test': 0})
+        backend.close()
+        self.assertEqual(backend.backend.events, [{'test': 0}])
+        self.assertFalse(backend._thread.is_alive())  # pylint: disable=protected-access
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            self._create_backend(overflow='other')
+        with self.assertRaises(ValueError):
+            self._create_backend(overflow='spill')
@@ -36,3 +36,12 @@ class TestMongoBackend(TestCase):
 
         self.assertEqual(events[0], first_argument(calls[0]))
         self.assertEqual(events[1], first_argument(calls[1]))
+
+    def test_mongo_backend_send_many(self):
+        events = [{'test': 1}, {'test': 2}]
+
+        self.backend.send_many(events)
+
+        self.backend.collection.insert_many.assert_called_once_with(events, ordered=False)
+        inserted_events = self.backend.collection.insert_many.call_args[0][0]
+        self.assertTrue(all(inserted is not event for inserted, event in zip(inserted_events, events)))
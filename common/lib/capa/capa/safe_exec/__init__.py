@@ -1,3 +1,4 @@
 """Capa's specialized use of codejail.safe_exec."""
 
+from .process_cache import ProcessCacheTier
 from .safe_exec import safe_exec, update_hash
@@ -0,0 +1,61 @@
+"""
+A per-process tier for the safe_exec result cache.
+"""
+
+
+import copy
+
+from openedx.core.lib.cache_utils import ProcessLRUCache
+
+
+class ProcessCacheTier(object):
+    """
+    Wraps the cache given to safe_exec with a bounded, per-process LRU
+    store of results.
+
+    safe_exec keys its results by a hash of the code, the globals and
+    the random seed, so a stored result never goes stale.  Results that
+    are found in memory are neither unpickled from the backing cache nor
+    recomputed in a new sandbox, which matters most for the script of a
+    randomized problem, run whenever the problem is loaded for a user.
+
+    Like the backing cache, only `.get(key)` and `.set(key, value)` are
+    supported.
+    """
+    def __init__(self, cache, max_entries):
+        """
+        Arguments:
+            cache - The backing cache, an object with .get(key) and
+                .set(key, value) methods, or None.
+            max_entries (int) - The number of results kept in memory.
+                No results are kept in memory if it is 0.
+        """
+        self.cache = cache
+        self._entries = ProcessLRUCache(max_entries)
+
+    def get(self, key):
+        """
+        Returns the result stored for the given key, or None.
+        """
+        value = self._entries.get(key)
+        if value is None and self.cache is not None:
+            value = self.cache.get(key)
+            if value is not None:
+                self._entries.set(key, value)
+        # safe_exec copies the resulting globals into the globals of
+        # the code, where they may be modified.
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        """
+        Stores the given result for the given key.
+        """
+        if self.cache is not None:
+            self.cache.set(key, value)
+        self._entries.set(key, copy.deepcopy(value))
+
+    def clear(self):
+        """
+        Removes all results kept in memory.
+        """
+        self._entries.clear()
@@ -107,7 +107,7 @@ def safe_exec(
 
     `cache` is an object with .get(key) and .set(key, value) methods.  It will be used
     to cache the execution, taking into account the code, the values of the globals,
-    and the random seed.
+    the contents of `extra_files`, and the random seed.
 
     `slug` is an arbitrary string, a description that's meaningful to the
     caller, that will be used in log messages.
@@ -121,6 +121,9 @@ def safe_exec(
         md5er = hashlib.md5()
         md5er.update(repr(code).encode('utf-8'))
         update_hash(md5er, safe_globals)
+        for filename, contents in extra_files or ():
+            md5er.update(filename.encode('utf-8'))
+            md5er.update(contents if isinstance(contents, bytes) else contents.encode('utf-8'))
         key = "safe_exec.%r.%s" % (random_seed, md5er.hexdigest())
         cached = cache.get(key)
         if cached is not None:
@@ -15,7 +15,8 @@ from codejail.safe_exec import SafeExecException
 from six import text_type, unichr
 from six.moves import range
 
-from capa.safe_exec import safe_exec, update_hash
+from capa.safe_exec import ProcessCacheTier, safe_exec, update_hash
+from openedx.core.lib.cache_utils import clear_process_caches
 
 
 class TestSafeExec(unittest.TestCase):
@@ -180,6 +181,68 @@ class TestSafeExecCaching(unittest.TestCase):
             except UnicodeEncodeError:
                 self.fail("Tried executing code with non-ASCII unicode: {0}".format(code))
 
+    def test_cache_extra_files(self):
+        # Results depend on the contents of the extra files, such as an
+        # updated python_lib.zip.
+        cache = {}
+        safe_exec("a = 1", {}, extra_files=[("lib.py", b"b = 1")], cache=DictCache(cache))
+        safe_exec("a = 1", {}, extra_files=[("lib.py", b"b = 2")], cache=DictCache(cache))
+        self.assertEqual(len(cache), 2)
+
+
+class TestProcessCacheTier(unittest.TestCase):
+    """Test the per-process tier of the safe_exec cache."""
+
+    def test_hit_in_memory(self):
+        cache = {}
+        process_cache = ProcessCacheTier(DictCache(cache), max_entries=10)
+        safe_exec("a = [int(math.pi)]", {}, cache=process_cache)
+
+        # The result is found in memory, whatever the backing cache holds.
+        cache[list(cache.keys())[0]] = (None, {'a': [17]})
+        g = {}
+        safe_exec("a = [int(math.pi)]", g, cache=process_cache)
+        self.assertEqual(g['a'], [3])
+
+        # Results are copied out of memory.
+        g['a'].append(4)
+        g = {}
+        safe_exec("a = [int(math.pi)]", g, cache=process_cache)
+        self.assertEqual(g['a'], [3])
+
+    def test_miss_in_memory(self):
+        cache = {}
+        safe_exec("a = int(math.pi)", {}, cache=DictCache(cache))
+        cache[list(cache.keys())[0]] = (None, {'a': 17})
+
+        process_cache = ProcessCacheTier(DictCache(cache), max_entries=10)
+        g = {}
+        safe_exec("a = int(math.pi)", g, cache=process_cache)
+        self.assertEqual(g['a'], 17)
+
+    def test_lru_eviction(self):
+        process_cache = ProcessCacheTier(None, max_entries=2)
+        process_cache.set('a', 1)
+        process_cache.set('b', 2)
+        self.assertEqual(process_cache.get('a'), 1)
+        process_cache.set('c', 3)
+        self.assertIsNone(process_cache.get('b'))
+        self.assertEqual(process_cache.get('a'), 1)
+        self.assertEqual(process_cache.get('c'), 3)
+
+    def test_clear_process_caches(self):
+        process_cache = ProcessCacheTier(None, max_entries=2)
+        process_cache.set('a', 1)
+        clear_process_caches()
+        self.assertIsNone(process_cache.get('a'))
+
+    def test_disabled(self):
+        cache = {}
+        process_cache = ProcessCacheTier(DictCache(cache), max_entries=0)
+        process_cache.set('a', 1)
+        del cache['a']
+        self.assertIsNone(process_cache.get('a'))
+
 
 class TestUpdateHash(unittest.TestCase):
     """Test the safe_exec.update_hash function to be sure it canonicalizes properly."""
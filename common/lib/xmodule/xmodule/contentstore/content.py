@@ -374,6 +374,14 @@ class ContentStore(object):
         '''
         raise NotImplementedError
 
+    def get_course_assets_version(self, course_key):
+        """
+        Returns a string which changes whenever an asset of the course is
+        added, replaced, deleted, locked or unlocked, or None if this
+        ContentStore cannot tell.
+        """
+        return None
+
     def delete_all_course_assets(self, course_key):
         """
         Delete all of the assets which use this course_key as an identifier
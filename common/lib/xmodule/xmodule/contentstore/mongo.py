@@ -340,6 +340,30 @@ class MongoContentStore(ContentStore):
             asset['asset_key'] = course_key.make_asset_key(asset_id['category'], asset_id['name'])
         return assets, count
 
+    @autoretry_read()
+    def get_course_assets_version(self, course_key):
+        """
+        See :meth:`.ContentStore.get_course_assets_version`
+
+        Combines the number of the course's assets, the number of those locked
+        and the date of the last upload, aggregated by the database rather than
+        read asset by asset.
+        """
+        cursor = self.fs_files.aggregate([
+            {'$match': query_for_course(course_key)},
+            {'$group': {
+                '_id': None,
+                'count': {'$sum': 1},
+                'locked_count': {'$sum': {'$cond': ['$locked', 1, 0]}},
+                'last_upload_date': {'$max': '$uploadDate'},
+            }},
+        ])
+        try:
+            result = cursor.next()
+        except StopIteration:
+            return u'0'
+        return u'{}.{}.{}'.format(result['count'], result['locked_count'], result['last_upload_date'])
+
     def set_attr(self, asset_key, attr, value=True):
         """
         Add/set the given attr on the asset at the given location. Does not allow overwriting gridFS built in
@@ -942,6 +942,14 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
         store = self._verify_modulestore_support(xblock.location.course_key, 'has_changes')
         return store.has_changes(xblock)
 
+    def get_subtree_versions_hash(self, location):
+        """
+        Returns a hash of the draft and published versions of the block at
+        the given location and of each of its descendants.
+        """
+        store = self._verify_modulestore_support(location.course_key, 'get_subtree_versions_hash')
+        return store.get_subtree_versions_hash(location)
+
     def check_supports(self, course_key, method):
         """
         Verifies that the modulestore for a particular course supports a feature.
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from collections import deque
 
 import six
 from contracts import contract, new_contract
@@ -44,6 +45,10 @@ class CachingDescriptorSystem(MakoDescriptorSystem, EditInfoRuntimeMixin):
 
     Computes the settings (nee 'metadata') inheritance upon creation.
     """
+    # The maximum number of definitions loaded by a single query when
+    # the definition of a lazily loaded block is first accessed.
+    DEFINITION_PREFETCH_LIMIT = 250
+
     @contract(course_entry=CourseEnvelope)
     def __init__(self, modulestore, course_entry, default_class, module_data, lazy, **kwargs):
         """
@@ -85,6 +90,7 @@ class CachingDescriptorSystem(MakoDescriptorSystem, EditInfoRuntimeMixin):
         self.module_data = module_data
         self.default_class = default_class
         self.local_modules = {}
+        self._definitions = {}
         self._services['library_tools'] = LibraryToolsService(modulestore)
 
     @lazy
@@ -96,6 +102,58 @@ class CachingDescriptorSystem(MakoDescriptorSystem, EditInfoRuntimeMixin):
                 parent_map[child] = block_key
         return parent_map
 
+    @lazy
+    def _definition_parent_map(self):
+        """
+        Maps the definition id of each block to the key of its parent.
+        """
+        return {
+            block.definition: self._parent_map[block_key]
+            for block_key, block in six.iteritems(self.course_entry.structure['blocks'])
+            if block_key in self._parent_map
+        }
+
+    def get_definition(self, course_key, definition_id):
+        """
+        Returns the definition with the given id for DefinitionLazyLoader.
+
+        The first time the definition of a block is needed, the unloaded
+        definitions of the blocks in the subtree of its parent are loaded
+        along with it in a single query, since rendering or collecting a
+        block usually accesses the definitions of its siblings and their
+        descendants next.
+        """
+        if definition_id not in self._definitions:
+            definition_ids = self._definition_ids_to_prefetch(definition_id)
+            for definition in self.modulestore.get_definitions(course_key, definition_ids):
+                self._definitions[definition['_id']] = definition
+        return self._definitions.get(definition_id)
+
+    def _definition_ids_to_prefetch(self, definition_id):
+        """
+        Returns the given definition id, followed by those of the blocks
+        in the subtree of the parent of the block whose definition it is,
+        up to DEFINITION_PREFETCH_LIMIT ids in all.
+        """
+        blocks = self.course_entry.structure['blocks']
+        definition_ids = [definition_id]
+        parent_key = self._definition_parent_map.get(definition_id)
+        if parent_key is None:
+            return definition_ids
+
+        block_keys = deque([parent_key])
+        while block_keys and len(definition_ids) < self.DEFINITION_PREFETCH_LIMIT:
+            block = blocks.get(block_keys.popleft())
+            if block is None:
+                continue
+            if (
+                block.definition is not None and not block.definition_loaded and
+                block.definition not in self._definitions and block.definition not in definition_ids
+            ):
+                definition_ids.append(block.definition)
+            block_keys.extend(block.fields.get('children', []))
+        return definition_ids
+
     @contract(usage_key="BlockUsageLocator | BlockKey", course_entry_override="CourseEnvelope | None")
     def _load_item(self, usage_key, course_entry_override=None, **kwargs):
         """
@@ -196,7 +254,7 @@ class CachingDescriptorSystem(MakoDescriptorSystem, EditInfoRuntimeMixin):
 
         if definition_id is not None and not block_data.definition_loaded:
             definition_loader = DefinitionLazyLoader(
-                self.modulestore,
+                self,
                 course_key,
                 block_key.type,
                 definition_id,
@@ -15,7 +15,7 @@ class DefinitionLazyLoader(object):
     def __init__(self, modulestore, course_key, block_type, definition_id, field_converter):
         """
         Simple placeholder for yet-to-be-fetched data
-        :param modulestore: the pymongo db connection with the definitions
+        :param modulestore: the split modulestore, or its runtime, from which to get the definitions
         :param definition_locator: the id of the record in the above to fetch
         """
         self.modulestore = modulestore
@@ -0,0 +1,239 @@
+"""
+A host-local tier for the split modulestore's course structure cache.
+"""
+
+
+import errno
+import hashlib
+import hmac
+import logging
+import mmap
+import os
+import stat
+import tempfile
+from threading import Lock
+
+import six
+from six.moves import cPickle as pickle
+
+log = logging.getLogger(__name__)
+
+
+class HostStructureCache(object):
+    """
+    Stores course structures, which are immutable, in files of a
+    directory shared by all processes of a host, preferably on a tmpfs
+    such as /dev/shm.
+
+    Structures are stored as uncompressed pickles, named after the
+    structure's ObjectId.  They are read through a memory map of the
+    file, without fetching them from memcached or decompressing them,
+    and read by all processes from the same pages of the page cache.
+
+    As pickles can run code when they are loaded, the directory is only
+    used if it is owned by the user of the process and can't be written
+    by other users, and each file starts with an HMAC of its pickle,
+    keyed on secret_key, which is checked before the pickle is loaded.
+
+    Files are written atomically, and once their total size exceeds
+    max_size bytes, the least recently used ones are removed until it is
+    back to PRUNE_RATIO of max_size.
+    """
+    FILE_SUFFIX = '.structure'
+    PRUNE_RATIO = 0.9
+    DIGEST_SIZE = hashlib.sha256().digest_size
+
+    def __init__(self, directory, max_size, secret_key):
+        self.directory = directory
+        self.max_size = max_size
+        self._signing_key = hashlib.sha256(
+            b'xmodule.modulestore.split_mongo.host_structure_cache' + six.ensure_binary(secret_key)
+        ).digest()
+        # Whether the directory is safe to load pickles from, once it exists.
+        self._directory_safe = None
+        # The total size of the files of the directory, as last listed and
+        # then increased by the files written by this process.
+        self._size = None
+        self._lock = Lock()
+
+    @classmethod
+    def from_settings(cls, settings_dict, secret_key):
+        """
+        Returns a HostStructureCache configured by the given
+        COURSE_STRUCTURE_HOST_CACHE settings and signing its files with
+        the given secret key, or None if no DIRECTORY or secret key is
+        set.
+        """
+        if not settings_dict or not settings_dict.get('DIRECTORY') or not secret_key:
+            return None
+        return cls(settings_dict['DIRECTORY'], settings_dict.get('MAX_SIZE', 0), secret_key)
+
+    def get(self, key):
+        """
+        Returns the structure stored for the given structure id, or
+        None.
+        """
+        if not self._is_directory_safe():
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as structure_file:
+                data = mmap.mmap(structure_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            # The file was never written, was evicted, or is empty.
+            return None
+
+        try:
+            structure = self._load(data)
+        except Exception:  # pylint: disable=broad-except
+            log.warning("HostStructureCache: Bad data in %s", path)
+            self._remove(path)
+            return None
+        finally:
+            data.close()
+
+        try:
+            # Marks the file as recently used.
+            os.utime(path, None)
+        except OSError:
+            pass
+        return structure
+
+    def set(self, key, structure):
+        """
+        Stores the given structure for the given structure id, then
+        evicts the least recently used structures if the directory
+        grew beyond max_size.
+        """
+        path = self._path(key)
+        if os.path.exists(path):
+            # Structures are immutable, so the stored one is the same.
+            return
+
+        pickled_data = pickle.dumps(structure, 4)
+        if self.DIGEST_SIZE + len(pickled_data) > self.max_size:
+            return
+
+        try:
+            os.makedirs(self.directory, 0o700)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                log.warning("HostStructureCache: Unable to create %s", self.directory)
+                return
+        if not self._is_directory_safe():
+            return
+
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                temp_file.write(self._digest(pickled_data))
+                temp_file.write(pickled_data)
+            os.rename(temp_path, path)
+        except (IOError, OSError):
+            log.warning("HostStructureCache: Unable to store structure %s", key)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += self.DIGEST_SIZE + len(pickled_data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _is_directory_safe(self):
+        """
+        Returns whether the directory exists, is owned by the user of this
+        process and can't be written by other users.
+        """
+        if self._directory_safe is None:
+            try:
+                directory_stat = os.lstat(self.directory)
+            except OSError:
+                return False
+            self._directory_safe = (
+                stat.S_ISDIR(directory_stat.st_mode) and
+                directory_stat.st_uid == os.getuid() and
+                not directory_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+            )
+            if not self._directory_safe:
+                log.warning(
+                    "HostStructureCache: Not using %s, which must be a directory owned by the current user "
+                    "and not writable by other users",
+                    self.directory,
+                )
+        return self._directory_safe
+
+    def _digest(self, pickled_data):
+        """
+        Returns the HMAC of the given pickled structure.
+        """
+        return hmac.new(self._signing_key, pickled_data, hashlib.sha256).digest()
+
+    def _load(self, data):
+        """
+        Returns the structure stored in the given file data, after checking
+        the HMAC of its pickle.
+        """
+        if six.PY2:
+            data = data[:]
+            digest, pickled_data = data[:self.DIGEST_SIZE], data[self.DIGEST_SIZE:]
+            if not hmac.compare_digest(digest, self._digest(pickled_data)):
+                raise ValueError("Bad HMAC")
+            return pickle.loads(pickled_data)
+
+        # Read in place, through memory views released before the map is closed.
+        with memoryview(data) as view, view[self.DIGEST_SIZE:] as pickled_data:
+            if not hmac.compare_digest(view[:self.DIGEST_SIZE].tobytes(), self._digest(pickled_data)):
+                raise ValueError("Bad HMAC")
+            return pickle.loads(pickled_data, encoding='latin-1')
+
+    def _entries(self):
+        """
+        Returns a list of (last use time, size, path) tuples of the
+        structures stored in the directory.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.FILE_SUFFIX):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        """
+        Removes the least recently used structures until the total size
+        of the remaining ones is at most PRUNE_RATIO of max_size.
+
+        The directory is shared by all processes of the host, so its size
+        is computed again from the files it holds.
+        """
+        entries = self._entries()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if self._size <= self.max_size * self.PRUNE_RATIO:
+                break
+            self._remove(path)
+            self._size -= size
+
+    def _path(self, key):
+        """
+        Returns the path of the file of the given structure id.
+        """
+        return os.path.join(self.directory, six.text_type(key) + self.FILE_SUFFIX)
+
+    @staticmethod
+    def _remove(path):
+        """
+        Removes the given file, which other processes may have removed
+        already.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -23,9 +23,11 @@ from pymongo.errors import DuplicateKeyError  # pylint: disable=unused-import
 from xmodule.exceptions import HeartbeatFailure
 from xmodule.modulestore import BlockData
 from xmodule.modulestore.split_mongo import BlockKey
+from xmodule.modulestore.split_mongo.host_structure_cache import HostStructureCache
 from xmodule.mongo_utils import connect_to_mongodb, create_collection_index
 
 try:
+    from django.conf import settings
     from django.core.cache import caches, InvalidCacheBackendError
     DJANGO_AVAILABLE = True
 except ImportError:
@@ -211,16 +213,40 @@ class CourseStructureCache(object):
 
     If the 'course_structure_cache' doesn't exist, then don't do anything for
     for set and get.
+
+    If COURSE_STRUCTURE_HOST_CACHE configures a directory, structures are
+    also kept in a HostStructureCache, which is read first.
     """
     def __init__(self):
         self.cache = None
+        self.host_cache = None
         if DJANGO_AVAILABLE:
             try:
                 self.cache = get_cache('course_structure_cache')
             except InvalidCacheBackendError:
                 pass
+            self.host_cache = HostStructureCache.from_settings(
+                getattr(settings, 'COURSE_STRUCTURE_HOST_CACHE', None), getattr(settings, 'SECRET_KEY', None)
+            )
 
     def get(self, key, course_context=None):
+        """
+        Read the struct from the host cache, else pull the compressed,
+        pickled struct data from cache and deserialize.
+        """
+        if self.host_cache is not None:
+            with TIMER.timer("CourseStructureCache.get_from_host", course_context) as tagger:
+                structure = self.host_cache.get(key)
+                tagger.tag(from_cache=str(structure is not None).lower())
+            if structure is not None:
+                return structure
+
+        structure = self._get_from_cache(key, course_context)
+        if structure is not None and self.host_cache is not None:
+            self.host_cache.set(key, structure)
+        return structure
+
+    def _get_from_cache(self, key, course_context=None):
         """Pull the compressed, pickled struct data from cache and deserialize."""
         if self.cache is None:
             return None
@@ -252,6 +278,9 @@ class CourseStructureCache(object):
 
     def set(self, key, structure, course_context=None):
         """Given a structure, will pickle, compress, and write to cache."""
+        if self.host_cache is not None:
+            self.host_cache.set(key, structure)
+
         if self.cache is None:
             return None
 
@@ -3,6 +3,8 @@ Module for the dual-branch fall-back Draft->Published Versioning ModuleStore
 """
 
 
+import hashlib
+
 from contracts import contract
 from opaque_keys.edx.locator import CourseLocator, LibraryLocator, LibraryUsageLocator
 
@@ -368,6 +370,33 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
 
         return has_changes_subtree(BlockKey.from_usage_key(xblock.location))
 
+    def get_subtree_versions_hash(self, location):
+        """
+        Returns a hash of the draft and published versions of the block at
+        the given location and of each of its draft descendants, which changes
+        whenever one of the blocks is edited, published, added or removed.
+        """
+        course_key = location.course_key
+        draft_structure = self._lookup_course(course_key.for_branch(ModuleStoreEnum.BranchName.draft)).structure
+        published_structure = self._lookup_course(
+            course_key.for_branch(ModuleStoreEnum.BranchName.published)
+        ).structure
+
+        versions_hash = hashlib.md5()
+        block_keys = [BlockKey.from_usage_key(location)]
+        while block_keys:
+            block_key = block_keys.pop()
+            draft_block = self._get_block_from_structure(draft_structure, block_key)
+            published_block = self._get_block_from_structure(published_structure, block_key)
+            versions_hash.update(repr([
+                block_key,
+                [(block.edit_info.update_version, block.edit_info.source_version) if block else None
+                 for block in (draft_block, published_block)],
+            ]).encode('utf-8'))
+            if draft_block is not None and 'children' in draft_block.fields:
+                block_keys.extend(reversed(draft_block.fields['children']))
+        return versions_hash.hexdigest()
+
     def publish(self, location, user_id, blacklist=None, **kwargs):
         """
         Publishes the subtree under location from the draft branch to the published branch
@@ -180,6 +180,37 @@ class TestContentstore(unittest.TestCase):
             self.contentstore.set_attr(asset_key, 'locked', not prelocked)
             self.assertEqual(self.contentstore.get_attr(asset_key, 'locked', False), not prelocked)
 
+    @ddt.data(True, False)
+    def test_get_course_assets_version(self, deprecated):
+        """
+        Test that the version of the assets of a course changes with them
+        """
+        self.set_up_assets(deprecated)
+        version = self.contentstore.get_course_assets_version(self.course1_key)
+        self.assertEqual(self.contentstore.get_course_assets_version(self.course1_key), version)
+
+        asset_key = self.course1_key.make_asset_key('asset', self.course1_files[0])
+        self.contentstore.set_attr(asset_key, 'locked', True)
+        locked_version = self.contentstore.get_course_assets_version(self.course1_key)
+        self.assertNotEqual(locked_version, version)
+
+        self.contentstore.delete(asset_key)
+        self.assertNotIn(
+            self.contentstore.get_course_assets_version(self.course1_key),
+            (version, locked_version),
+        )
+
+        # Replacing an asset changes its upload date.
+        version = self.contentstore.get_course_assets_version(self.course1_key)
+        asset_key = self.course1_key.make_asset_key('asset', self.course1_files[1])
+        self.contentstore.save(StaticContent(asset_key, 'replaced', 'text/plain', b'replaced'))
+        self.assertNotEqual(self.contentstore.get_course_assets_version(self.course1_key), version)
+
+        # The assets of other courses are not part of the version.
+        version = self.contentstore.get_course_assets_version(self.course1_key)
+        self.contentstore.delete(self.course2_key.make_asset_key('asset', self.course2_files[0]))
+        self.assertEqual(self.contentstore.get_course_assets_version(self.course1_key), version)
+
     @ddt.data(True, False)
     def test_copy_assets(self, deprecated):
         """
@@ -794,6 +794,32 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
         for key in locations:
             self.assertFalse(self._has_changes(locations[key]))
 
+    def test_get_subtree_versions_hash(self):
+        """
+        Tests that get_subtree_versions_hash() changes only for the ancestors
+        of a changed block, and again once the change is published
+        """
+        locations = self.setup_has_changes(ModuleStoreEnum.Type.split)
+        hashes = {key: self.store.get_subtree_versions_hash(location) for key, location in locations.items()}
+
+        # Change the child
+        child = self.store.get_item(locations['child'])
+        child.display_name = 'Changed Display Name'
+        self.store.update_item(child, self.user_id)
+
+        changed_hashes = {key: self.store.get_subtree_versions_hash(location) for key, location in locations.items()}
+        for key in ('grandparent', 'parent', 'child'):
+            self.assertNotEqual(changed_hashes[key], hashes[key])
+        for key in ('parent_sibling', 'child_sibling'):
+            self.assertEqual(changed_hashes[key], hashes[key])
+
+        # Publish the unit with changes
+        self.store.publish(locations['parent'], self.user_id)
+        self.assertNotEqual(self.store.get_subtree_versions_hash(locations['parent']), changed_hashes['parent'])
+        self.assertEqual(
+            self.store.get_subtree_versions_hash(locations['parent_sibling']), hashes['parent_sibling']
+        )
+
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_has_changes_publish_ancestors(self, default_ms):
         """
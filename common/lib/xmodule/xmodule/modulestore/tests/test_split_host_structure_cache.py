@@ -0,0 +1,124 @@
+""" Test the behavior of split_mongo/HostStructureCache """
+
+
+import os
+import pickle
+import unittest
+
+from bson.objectid import ObjectId
+from mock import patch
+
+from openedx.core.lib import tempdir
+from xmodule.modulestore.split_mongo.host_structure_cache import HostStructureCache
+
+SECRET_KEY = 'secret'
+
+
+class TestHostStructureCache(unittest.TestCase):
+    """ Tests for HostStructureCache """
+
+    def setUp(self):
+        super(TestHostStructureCache, self).setUp()
+        self.directory = os.path.join(tempdir.mkdtemp_clean(), 'structures')
+        self.structure = {'_id': ObjectId(), 'blocks': {'course': {'fields': {'display_name': u'Tëst'}}}}
+
+    def test_get_set(self):
+        host_cache = HostStructureCache(self.directory, 2 ** 20, SECRET_KEY)
+        key = self.structure['_id']
+        self.assertIsNone(host_cache.get(key))
+
+        host_cache.set(key, self.structure)
+        self.assertEqual(host_cache.get(key), self.structure)
+        # Other processes read the same files.
+        self.assertEqual(HostStructureCache(self.directory, 2 ** 20, SECRET_KEY).get(key), self.structure)
+
+    def test_lru_eviction(self):
+        keys = [ObjectId() for _ in range(3)]
+        host_cache = HostStructureCache(self.directory, 2 ** 20, SECRET_KEY)
+        host_cache.set(keys[0], self.structure)
+        structure_size = os.path.getsize(host_cache._path(keys[0]))  # pylint: disable=protected-access
+
+        host_cache.max_size = 2 * structure_size + structure_size // 2
+        host_cache.set(keys[1], self.structure)
+        os.utime(host_cache._path(keys[0]), (0, 0))  # pylint: disable=protected-access
+        os.utime(host_cache._path(keys[1]), (1, 1))  # pylint: disable=protected-access
+        host_cache.get(keys[0])
+
+        host_cache.set(keys[2], self.structure)
+        self.assertIsNone(host_cache.get(keys[1]))
+        self.assertEqual(host_cache.get(keys[0]), self.structure)
+        self.assertEqual(host_cache.get(keys[2]), self.structure)
+
+    def test_directory_size_tracked(self):
+        keys = [ObjectId() for _ in range(3)]
+        host_cache = HostStructureCache(self.directory, 2 ** 20, SECRET_KEY)
+        host_cache.set(keys[0], self.structure)
+        structure_size = os.path.getsize(host_cache._path(keys[0]))  # pylint: disable=protected-access
+
+        # The directory is only listed again once it grows beyond max_size.
+        with patch('os.listdir', wraps=os.listdir) as listdir:
+            host_cache.set(keys[1], self.structure)
+            host_cache.set(keys[1], self.structure)
+            self.assertEqual(listdir.call_count, 0)
+            host_cache.max_size = 2 * structure_size
+            host_cache.set(keys[2], self.structure)
+            self.assertEqual(listdir.call_count, 1)
+
+    def test_too_large(self):
+        host_cache = HostStructureCache(self.directory, 10, SECRET_KEY)
+        host_cache.set(self.structure['_id'], self.structure)
+        self.assertIsNone(host_cache.get(self.structure['_id']))
+
+    def test_bad_data(self):
+        host_cache = HostStructureCache(self.directory, 2 ** 20, SECRET_KEY)
+        key = self.structure['_id']
+        host_cache.set(key, self.structure)
+        with open(host_cache._path(key), 'wb') as structure_file:  # pylint: disable=protected-access
+            structure_file.write(b'bad_data')
+
+        self.assertIsNone(host_cache.get(key))
+        self.assertFalse(os.path.exists(host_cache._path(key)))  # pylint: disable=protected-access
+
+    def test_unsigned_data(self):
+        host_cache = HostStructureCache(self.directory, 2 ** 20, SECRET_KEY)
+        key = self.structure['_id']
+        host_cache.set(key, self.structure)
+        with open(host_cache._path(key), 'wb') as structure_file:  # pylint: disable=protected-access
+            structure_file.write(b'0' * HostStructureCache.DIGEST_SIZE + pickle.dumps(self.structure))
+
+        self.assertIsNone(host_cache.get(key))
+        self.assertFalse(os.path.exists(host_cache._path(key)))  # pylint: disable=protected-access
+
+    def test_other_secret_key(self):
+        key = self.structure['_id']
+        HostStructureCache(self.directory, 2 ** 20, 'other').set(key, self.structure)
+        self.assertIsNone(HostStructureCache(self.directory, 2 ** 20, SECRET_KEY).get(key))
+
+    def test_private_directory(self):
+        host_cache = HostStructureCache(self.directory, 2 ** 20, SECRET_KEY)
+        host_cache.set(self.structure['_id'], self.structure)
+        self.assertEqual(os.stat(self.directory).st_mode & 0o777, 0o700)
+
+    def test_writable_directory(self):
+        key = self.structure['_id']
+        HostStructureCache(self.directory, 2 ** 20, SECRET_KEY).set(key, self.structure)
+        os.chmod(self.directory, 0o777)
+
+        host_cache = HostStructureCache(self.directory, 2 ** 20, SECRET_KEY)
+        self.assertIsNone(host_cache.get(key))
+        host_cache.set(ObjectId(), self.structure)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_directory_of_other_user(self):
+        key = self.structure['_id']
+        HostStructureCache(self.directory, 2 ** 20, SECRET_KEY).set(key, self.structure)
+
+        with patch('os.getuid', return_value=os.getuid() + 1):
+            self.assertIsNone(HostStructureCache(self.directory, 2 ** 20, SECRET_KEY).get(key))
+
+    def test_from_settings(self):
+        self.assertIsNone(HostStructureCache.from_settings(None, SECRET_KEY))
+        self.assertIsNone(HostStructureCache.from_settings({'DIRECTORY': None, 'MAX_SIZE': 100}, SECRET_KEY))
+        self.assertIsNone(HostStructureCache.from_settings({'DIRECTORY': self.directory, 'MAX_SIZE': 100}, None))
+        host_cache = HostStructureCache.from_settings({'DIRECTORY': self.directory, 'MAX_SIZE': 100}, SECRET_KEY)
+        self.assertEqual((host_cache.directory, host_cache.max_size), (self.directory, 100))
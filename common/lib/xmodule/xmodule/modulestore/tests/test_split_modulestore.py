@@ -15,6 +15,7 @@ import six
 from ccx_keys.locator import CCXBlockUsageLocator
 from contracts import contract
 from django.core.cache import InvalidCacheBackendError, caches
+from django.test.utils import override_settings
 from mock import patch
 from opaque_keys.edx.locator import BlockUsageLocator, CourseKey, CourseLocator, LocalId, VersionTree
 from path import Path as path
@@ -1001,6 +1002,19 @@ class TestCourseStructureCache(SplitModuleTest):
         # now make sure that you get the same structure
         self.assertEqual(cached_structure, not_cached_structure)
 
+    def test_host_cache(self):
+        host_cache_dir = tempdir.mkdtemp_clean()
+        with override_settings(COURSE_STRUCTURE_HOST_CACHE={'DIRECTORY': host_cache_dir, 'MAX_SIZE': 2 ** 30}):
+            with check_mongo_calls(1):
+                not_cached_structure = self._get_structure(self.new_course)
+
+            # The dummy course_structure_cache caches nothing, but the
+            # host cache does.
+            with check_mongo_calls(0):
+                cached_structure = self._get_structure(self.new_course)
+
+        self.assertEqual(cached_structure, not_cached_structure)
+
     def test_dummy_cache(self):
         with check_mongo_calls(1):
             not_cached_structure = self._get_structure(self.new_course)
@@ -1022,6 +1036,28 @@ class TestCourseStructureCache(SplitModuleTest):
         )
 
 
+class TestDefinitionPrefetch(SplitModuleTest):
+    """Tests for the prefetching of lazily loaded definitions"""
+
+    def test_prefetch_sibling_definitions(self):
+        user = random.getrandbits(32)
+        course = modulestore().create_course('org', 'prefetch', 'run', user, BRANCH_NAME_DRAFT)
+        vertical = modulestore().create_child(user, course.location, 'vertical', fields={'display_name': 'vertical'})
+        for index in range(3):
+            modulestore().create_child(
+                user, vertical.location, 'html', fields={'data': '<p>html {}</p>'.format(index)}
+            )
+
+        vertical = modulestore().get_item(vertical.location, depth=1)
+        children = vertical.get_children()
+        # The definitions of the siblings are loaded along with the first one.
+        with check_mongo_calls(1):
+            self.assertEqual(
+                [child.data for child in children],
+                ['<p>html {}</p>'.format(index) for index in range(3)],
+            )
+
+
 class SplitModuleItemTests(SplitModuleTest):
     '''
     Item read tests including inheritance
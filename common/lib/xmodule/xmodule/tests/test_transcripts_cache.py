@@ -0,0 +1,46 @@
+"""
+Tests for the transcript conversion cache.
+"""
+
+
+import unittest
+
+from xmodule.video_module.transcripts_cache import TranscriptConversionCache
+
+
+class TranscriptConversionCacheTest(unittest.TestCase):
+    """
+    Tests for TranscriptConversionCache.
+    """
+    def test_key(self):
+        key = TranscriptConversionCache.key(u'transcript', 'srt', 'txt')
+        self.assertEqual(key, TranscriptConversionCache.key(b'transcript', 'srt', 'txt'))
+        self.assertNotEqual(key, TranscriptConversionCache.key(u'transcript', 'srt', 'sjson'))
+        self.assertNotEqual(key, TranscriptConversionCache.key(u'transcript', 'srt', 'txt', 1.5))
+        self.assertNotEqual(key, TranscriptConversionCache.key(u'other transcript', 'srt', 'txt'))
+
+    def test_get_or_convert(self):
+        cache = TranscriptConversionCache(100)
+        self.assertEqual(cache.get_or_convert('key', lambda: u'converted'), u'converted')
+        self.assertEqual(cache.get_or_convert('key', lambda: u'converted again'), u'converted')
+
+    def test_eviction(self):
+        cache = TranscriptConversionCache(10)
+        cache.set('first', u'12345')
+        cache.set('second', u'12345')
+        # Marks the first conversion as recently used.
+        cache.get('first')
+        cache.set('third', u'12345')
+        self.assertEqual(cache.get('first'), u'12345')
+        self.assertIsNone(cache.get('second'))
+        self.assertEqual(cache.get('third'), u'12345')
+
+    def test_too_large(self):
+        cache = TranscriptConversionCache(10)
+        cache.set('key', u'12345678901')
+        self.assertIsNone(cache.get('key'))
+
+    def test_disabled(self):
+        cache = TranscriptConversionCache(0)
+        cache.set('key', u'converted')
+        self.assertIsNone(cache.get('key'))
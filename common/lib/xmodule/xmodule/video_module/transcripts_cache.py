@@ -0,0 +1,70 @@
+"""
+A per-process cache of converted transcripts.
+"""
+
+
+import hashlib
+
+import six
+
+from openedx.core.lib.cache_utils import ProcessLRUCache
+
+
+class TranscriptConversionCache(object):
+    """
+    Keeps the results of transcript conversions in memory, keyed by the
+    digest of the converted content, the input and output formats and the
+    speed, so that a transcript downloaded or looked up many times is only
+    parsed and serialized once per process.
+
+    Since conversions are keyed by the content they are made from, they
+    never go stale.  The least recently used conversions are evicted once
+    the total length of those kept exceeds max_size characters.
+    """
+    def __init__(self, max_size):
+        """
+        Arguments:
+            max_size (int) - The total length of the conversions kept in
+                memory. Nothing is kept if it is 0.
+        """
+        self._entries = ProcessLRUCache(max_size, size=len)
+
+    @staticmethod
+    def key(content, input_format, output_format, speed=1.0):
+        """
+        Returns the key of the conversion of the given content.
+        """
+        if isinstance(content, six.text_type):
+            content = content.encode('utf-8')
+        return (hashlib.sha1(content).hexdigest(), input_format, output_format, float(speed))
+
+    def get(self, key):
+        """
+        Returns the conversion stored for the given key, or None.
+        """
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        """
+        Stores the given conversion for the given key, evicting the least
+        recently used ones beyond max_size.
+        """
+        if value is not None:
+            self._entries.set(key, value)
+
+    def get_or_convert(self, key, convert):
+        """
+        Returns the conversion stored for the given key, or the result of
+        convert(), which is then stored.
+        """
+        value = self.get(key)
+        if value is None:
+            value = convert()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        """
+        Removes all conversions kept in memory.
+        """
+        self._entries.clear()
@@ -23,11 +23,13 @@ from six.moves.html_parser import HTMLParser  # pylint: disable=import-error
 
 from openedx.core.djangolib import blockstore_cache
 from openedx.core.lib import blockstore_api
+from openedx.core.lib.cache_utils import register_process_cache
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
 from xmodule.exceptions import NotFoundError
 
 from .bumper_utils import get_bumper_settings
+from .transcripts_cache import TranscriptConversionCache
 
 try:
     from edxval import api as edxval_api
@@ -285,32 +287,39 @@ def generate_subs_from_source(speed_subs, subs_type, subs_filedata, item, langua
     return subs
 
 
-def generate_srt_from_sjson(sjson_subs, speed):
-    """Generate transcripts with speed = 1.0 from sjson to SubRip (*.srt).
+def iter_srt_from_sjson(sjson_subs, speed):
+    """Generate transcripts with speed = 1.0 from sjson to SubRip (*.srt),
+    one subtitle at a time, so that large transcripts can be streamed.
 
     :param sjson_subs: "sjson" subs.
     :param speed: speed of `sjson_subs`.
-    :returns: "srt" subs.
+    :returns: iterator over the "srt" subs.
     """
-
-    output = ''
-
     equal_len = len(sjson_subs['start']) == len(sjson_subs['end']) == len(sjson_subs['text'])
     if not equal_len:
-        return output
+        return
 
-    sjson_speed_1 = generate_subs(speed, 1, sjson_subs)
-
-    for i in range(len(sjson_speed_1['start'])):
+    coefficient = 1.0 * speed
+    for i, (start, end, text) in enumerate(zip(sjson_subs['start'], sjson_subs['end'], sjson_subs['text'])):
+        if speed != 1:
+            start, end = int(round(start * coefficient)), int(round(end * coefficient))
         item = SubRipItem(
             index=i,
-            start=SubRipTime(milliseconds=sjson_speed_1['start'][i]),
-            end=SubRipTime(milliseconds=sjson_speed_1['end'][i]),
-            text=sjson_speed_1['text'][i]
+            start=SubRipTime(milliseconds=start),
+            end=SubRipTime(milliseconds=end),
+            text=text
         )
-        output += (six.text_type(item))
-        output += '\n'
-    return output
+        yield six.text_type(item) + u'\n'
+
+
+def generate_srt_from_sjson(sjson_subs, speed):
+    """Generate transcripts with speed = 1.0 from sjson to SubRip (*.srt).
+
+    :param sjson_subs: "sjson" subs.
+    :param speed: speed of `sjson_subs`.
+    :returns: "srt" subs.
+    """
+    return u''.join(iter_srt_from_sjson(sjson_subs, speed))
 
 
 def generate_sjson_from_srt(srt_subs):
@@ -623,6 +632,32 @@ def convert_video_transcript(file_name, content, output_format):
     return dict(filename=filename, content=converted_transcript)
 
 
+_conversion_cache = None  # pylint: disable=invalid-name
+
+
+def get_conversion_cache():
+    """
+    Returns the TranscriptConversionCache of the process, of the size set by
+    the TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE setting.
+    """
+    global _conversion_cache  # pylint: disable=global-statement
+    if _conversion_cache is None:
+        _conversion_cache = TranscriptConversionCache(
+            getattr(settings, 'TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE', 0)
+        )
+    return _conversion_cache
+
+
+@register_process_cache
+def _clear_conversion_cache():
+    """
+    Drops the TranscriptConversionCache of the process, so that it is created
+    again from the current settings.
+    """
+    global _conversion_cache  # pylint: disable=global-statement
+    _conversion_cache = None
+
+
 class Transcript(object):
     """
     Container for transcript methods.
@@ -644,6 +679,9 @@ class Transcript(object):
         Accepted input formats: sjson, srt.
         Accepted output format: srt, txt, sjson.
 
+        Conversions are kept in the transcript conversion cache of the
+        process, keyed by the digest of `content`.
+
         Raises:
             TranscriptsGenerationException: On parsing the invalid srt content during conversion from srt to sjson.
         """
@@ -653,6 +691,28 @@ class Transcript(object):
         if input_format == output_format:
             return content
 
+        return get_conversion_cache().get_or_convert(
+            TranscriptConversionCache.key(content, input_format, output_format),
+            lambda: Transcript._convert(content, input_format, output_format)
+        )
+
+    @staticmethod
+    def change_speed(content, speed):
+        """
+        Returns the sjson transcript `content`, of speed 1.0, converted to
+        the given speed.
+        """
+        return get_conversion_cache().get_or_convert(
+            TranscriptConversionCache.key(content, Transcript.SJSON, Transcript.SJSON, speed),
+            lambda: json.dumps(generate_subs(speed, 1, json.loads(content)))
+        )
+
+    @staticmethod
+    def _convert(content, input_format, output_format):
+        """
+        Convert transcript `content` from `input_format` to `output_format`,
+        which differ, without using the conversion cache.
+        """
         if input_format == 'srt':
             # Standardize content into bytes for later decoding.
             if isinstance(content, text_type):
@@ -990,9 +1050,7 @@ def get_transcript_from_contentstore(video, language, output_format, transcripts
 
     if youtube_id:
         youtube_ids = youtube_speed_dict(video)
-        transcript_content = json.dumps(
-            generate_subs(youtube_ids.get(youtube_id, 1), 1, json.loads(transcript_content))
-        )
+        transcript_content = Transcript.change_speed(transcript_content, youtube_ids.get(youtube_id, 1))
 
     return transcript_content, transcript_name, Transcript.mime_types[output_format]
 
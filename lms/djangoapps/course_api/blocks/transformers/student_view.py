@@ -31,6 +31,8 @@ class StudentViewTransformer(BlockStructureTransformer):
         block_structure.request_xblock_fields('category')
 
         for block_key in block_structure.topological_traversal():
+            if not block_structure.should_collect(block_key):
+                continue
             block = block_structure.get_xblock(block_key)
 
             # We're iterating through descriptors (not bound to a user) that are
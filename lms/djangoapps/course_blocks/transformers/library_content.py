@@ -30,6 +30,7 @@ class ContentLibraryTransformer(FilteringTransformerMixin, BlockStructureTransfo
     """
     WRITE_VERSION = 1
     READ_VERSION = 1
+    SUPPORTS_INCREMENTAL_COLLECT = True
 
     @classmethod
     def name(cls):
@@ -68,6 +69,8 @@ class ContentLibraryTransformer(FilteringTransformerMixin, BlockStructureTransfo
         ):
             xblock = block_structure.get_xblock(block_key)
             for child_key in xblock.children:
+                if not block_structure.should_collect(child_key):
+                    continue
                 summary = summarize_block(child_key)
                 block_structure.set_transformer_block_field(child_key, cls, 'block_analytics_summary', summary)
 
@@ -28,6 +28,7 @@ class SplitTestTransformer(FilteringTransformerMixin, BlockStructureTransformer)
     """
     WRITE_VERSION = 1
     READ_VERSION = 1
+    SUPPORTS_INCREMENTAL_COLLECT = True
 
     @classmethod
     def name(cls):
@@ -51,6 +52,8 @@ class SplitTestTransformer(FilteringTransformerMixin, BlockStructureTransformer)
                 filter_func=lambda block_key: block_key.block_type == 'split_test',
                 yield_descendants_of_unyielded=True,
         ):
+            if not block_structure.should_collect(block_key):
+                continue
             xblock = block_structure.get_xblock(block_key)
             partition_for_this_block = next(
                 (
@@ -14,6 +14,8 @@ from six.moves import range
 from mock import patch
 
 from course_modes.tests.factories import CourseModeFactory
+from openedx.core.djangoapps.content.block_structure.factory import BlockStructureFactory
+from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
 from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort
 from openedx.core.djangoapps.course_groups.partition_scheme import CohortPartitionScheme
 from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory, config_course_cohorts
@@ -254,6 +256,38 @@ class UserPartitionTransformerTestCase(UserPartitionTestMixin, CourseStructureTe
                                      for b in trans_block_structure.get_block_keys()]
             self.assertSetEqual(set(xblocks_denial_reason), set([u'Feature-based Enrollments']))
 
+    @ddt.data(True, False)
+    def test_collect_incrementally(self, partitions_changed):
+        """
+        Tests that all blocks are collected again when the user partitions
+        changed, even though no block was edited.
+        """
+        self.setup_partitions_and_course()
+        previous_block_structure = BlockStructureFactory.create_from_modulestore(self.course.location, self.store)
+        with patch(
+            'lms.djangoapps.course_blocks.transformers.user_partitions.get_all_partitions_for_course',
+            return_value=[] if partitions_changed else self.user_partitions,
+        ):
+            BlockStructureTransformers.collect(previous_block_structure)
+
+        block_structure = BlockStructureFactory.create_from_modulestore(self.course.location, self.store)
+        with patch(
+            'lms.djangoapps.course_blocks.transformers.user_partitions.get_all_partitions_for_course',
+            return_value=self.user_partitions,
+        ), patch(
+            'lms.djangoapps.course_blocks.transformers.user_partitions._MergedGroupAccess',
+            wraps=_MergedGroupAccess,
+        ) as mock_merged_group_access:
+            self.assertTrue(
+                BlockStructureTransformers.collect_incrementally(block_structure, previous_block_structure)
+            )
+        block_keys = list(block_structure.topological_traversal())
+        self.assertEqual(mock_merged_group_access.call_count, len(block_keys) if partitions_changed else 0)
+        for block_key in block_keys:
+            self.assertIsNotNone(
+                block_structure.get_transformer_block_field(block_key, UserPartitionTransformer, 'merged_group_access')
+            )
+
     def test_transform_on_inactive_partition(self):
         """
         Tests UserPartitionTransformer for inactive UserPartition.
@@ -31,6 +31,7 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
     """
     WRITE_VERSION = 1
     READ_VERSION = 1
+    SUPPORTS_INCREMENTAL_COLLECT = True
 
     @classmethod
     def name(cls):
@@ -49,16 +50,27 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
         Arguments:
             block_structure (BlockStructureCollectedData)
         """
-        # First have the split test transformer setup its group access
-        # data for each block.
-        SplitTestTransformer.collect(block_structure)
-
         # Because user partitions are course-wide, only store data for
         # them on the root block.
         root_block = block_structure.get_xblock(block_structure.root_block_usage_key)
         user_partitions = get_all_partitions_for_course(root_block, active_only=True)
+
+        # The merged group access of every block depends on the user
+        # partitions, and dynamic partitions can change without any
+        # block being edited, so all blocks are collected again when
+        # they differ from the previously collected ones.
+        previous_user_partitions = block_structure.get_transformer_data(cls, 'user_partitions')
+        if previous_user_partitions is None or (
+                [partition.to_json() for partition in previous_user_partitions] !=
+                [partition.to_json() for partition in user_partitions]
+        ):
+            block_structure.collect_all_blocks()
         block_structure.set_transformer_data(cls, 'user_partitions', user_partitions)
 
+        # Then have the split test transformer setup its group access
+        # data for each block.
+        SplitTestTransformer.collect(block_structure)
+
         # If there are no user partitions, this transformation is a
         # no-op, so there is nothing to collect.
         if not user_partitions:
@@ -69,6 +81,8 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
         # already have merged group access computed before the block
         # itself.
         for block_key in block_structure.topological_traversal():
+            if not block_structure.should_collect(block_key):
+                continue
             xblock = block_structure.get_xblock(block_key)
             parent_keys = block_structure.get_parents(block_key)
             merged_parent_access_list = [
@@ -38,6 +38,9 @@ def collect_unioned_set_field(block_structure, transformer, merged_field_name, f
             block_key should be included in the result set
     """
     for block_key in block_structure.topological_traversal():
+        if not block_structure.should_collect(block_key):
+            continue
+
         result_set = {block_key} if filter_by(block_key) else set()
         for parent in block_structure.get_parents(block_key):
             result_set |= block_structure.get_transformer_block_field(
@@ -75,6 +78,9 @@ def collect_merged_boolean_field(
     """
 
     for block_key in block_structure.topological_traversal():
+        if not block_structure.should_collect(block_key):
+            continue
+
         # compute merged value of the boolean field from all parents
         parents = block_structure.get_parents(block_key)
         all_parents_merged_value = all(
@@ -117,6 +123,8 @@ def collect_merged_date_field(
     """
 
     for block_key in block_structure.topological_traversal():
+        if not block_structure.should_collect(block_key):
+            continue
 
         parents = block_structure.get_parents(block_key)
         block_date = get_field_on_block(block_structure.get_xblock(block_key), xblock_field_name)
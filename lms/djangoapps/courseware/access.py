@@ -13,7 +13,9 @@ Note: The access control logic in this file does NOT check for enrollment in
 
 
 import logging
+import threading
 from datetime import datetime
+from functools import partial
 
 import six
 from django.conf import settings  # pylint: disable=unused-import
@@ -72,6 +74,30 @@ from xmodule.x_module import XModule
 log = logging.getLogger(__name__)
 
 
+class _AccessDecisions(threading.local):
+    """
+    The decisions shared by the access checks of the objects of a
+    bulk_has_access call, keyed by the user, the course and the decision.
+    """
+    decisions = None
+
+
+_ACCESS_DECISIONS = _AccessDecisions()
+
+
+def _shared_decision(key, decide):
+    """
+    Returns decide(), made once for the given key while bulk_has_access
+    runs.
+    """
+    decisions = _ACCESS_DECISIONS.decisions
+    if decisions is None:
+        return decide()
+    if key not in decisions:
+        decisions[key] = decide()
+    return decisions[key]
+
+
 def has_ccx_coach_role(user, course_key):
     """
     Check if user is a coach on this ccx.
@@ -137,8 +163,11 @@ def has_access(user, action, obj, course_key=None):
         user = AnonymousUser()
 
     # Preview mode is only accessible by staff.
-    if in_preview_mode() and course_key:
-        if not has_staff_access_to_preview_mode(user, course_key):
+    if course_key and _shared_decision(('in_preview_mode',), in_preview_mode):
+        if not _shared_decision(
+            ('preview_mode', id(user), course_key),
+            lambda: has_staff_access_to_preview_mode(user, course_key),
+        ):
             return ACCESS_DENIED
 
     # delegate the work to type-specific functions.
@@ -174,6 +203,31 @@ def has_access(user, action, obj, course_key=None):
                     .format(type(obj)))
 
 
+@function_trace('bulk_has_access')
+def bulk_has_access(user, action, objs, course_key=None):
+    """
+    Returns the list of the results of has_access(user, action, obj, course_key)
+    for each of the given objs, e.g. the blocks of a course or their usage keys,
+    in order.
+
+    The decisions that only depend on the user and the course, i.e. preview mode,
+    the user's course roles and masquerade, and the user's group in each user
+    partition, are made once for all objs rather than once per obj.
+    """
+    if not user:
+        user = AnonymousUser()
+
+    if _ACCESS_DECISIONS.decisions is not None:
+        # Already sharing the decisions of an enclosing call.
+        return [has_access(user, action, obj, course_key) for obj in objs]
+
+    _ACCESS_DECISIONS.decisions = {}
+    try:
+        return [has_access(user, action, obj, course_key) for obj in objs]
+    finally:
+        _ACCESS_DECISIONS.decisions = None
+
+
 def has_staff_access_to_preview_mode(user, course_key):
     """
     Checks if given user can access course in preview mode.
@@ -503,10 +557,9 @@ def _has_group_access(descriptor, user, course_key):
     # If missing_groups is NOT empty, we generate an error based on one of the particular groups they are missing.
     missing_groups = []
     for partition, groups in partition_groups:
-        user_group = partition.scheme.get_group_for_user(
-            course_key,
-            user,
-            partition,
+        user_group = _shared_decision(
+            ('group', id(user), course_key, partition.id),
+            partial(partition.scheme.get_group_for_user, course_key, user, partition),
         )
         if user_group not in groups:
             missing_groups.append((partition, user_group, groups))
@@ -731,6 +784,16 @@ def _has_access_to_course(user, access_level, course_key):
 
     access_level = string, either "staff" or "instructor"
     """
+    return _shared_decision(
+        ('course_access', id(user), access_level, course_key),
+        lambda: _decide_access_to_course(user, access_level, course_key),
+    )
+
+
+def _decide_access_to_course(user, access_level, course_key):
+    """
+    Decides the result of _has_access_to_course.
+    """
     if user is None or (not user.is_authenticated):
         debug("Deny: no user or anon user")
         return ACCESS_DENIED
@@ -908,6 +971,13 @@ def get_user_role(user, course_key):
     Return corresponding string if user has staff, instructor or student
     course role in LMS.
     """
+    return _shared_decision(('user_role', id(user), course_key), lambda: _decide_user_role(user, course_key))
+
+
+def _decide_user_role(user, course_key):
+    """
+    Decides the result of get_user_role.
+    """
     role = get_masquerade_role(user, course_key)
     if role:
         return role
@@ -84,6 +84,38 @@ def _all_block_types(descriptors, aside_types):
     return block_types
 
 
+def _descendent_descriptors(descriptor, depth, descriptor_filter):
+    """
+    Return a list of `descriptor` and all of its descendant descriptors down to
+    the specified depth that match the descriptor filter.
+
+    descriptor: The parent to search inside
+    depth: The number of levels to descend, or None for infinite depth
+    descriptor_filter(descriptor): A function that returns True
+        if descriptor should be included in the results
+    """
+    def get_child_descriptors(descriptor, depth, descriptor_filter):
+        """
+        Return a list of all child descriptors down to the specified depth
+        that match the descriptor filter. Includes `descriptor`
+        """
+        if descriptor_filter(descriptor):
+            descriptors = [descriptor]
+        else:
+            descriptors = []
+
+        if depth is None or depth > 0:
+            new_depth = depth - 1 if depth is not None else depth
+
+            for child in descriptor.get_children() + descriptor.get_required_module_descriptors():
+                descriptors.extend(get_child_descriptors(child, new_depth, descriptor_filter))
+
+        return descriptors
+
+    with modulestore().bulk_operations(descriptor.location.course_key):
+        return get_child_descriptors(descriptor, depth, descriptor_filter)
+
+
 class DjangoKeyValueStore(KeyValueStore):
     """
     This KeyValueStore will read and write data in the following scopes to django models
@@ -176,6 +208,25 @@ class DjangoOrmFieldCache(six.with_metaclass(ABCMeta, object)):
         for field_object in self._read_objects(fields, xblocks, aside_types):
             self._cache[self._cache_key_for_field_object(field_object)] = field_object
 
+    @classmethod
+    def cache_fields_for_users(cls, caches, fields, xblocks, aside_types):
+        """
+        Load all fields specified by ``fields`` for the supplied ``xblocks``
+        and ``aside_types`` into each of the supplied caches, which each
+        belong to a different user.
+
+        By default, each cache loads its own fields.  Caches of per-user
+        data override this to load the fields of all users at once.
+
+        Arguments:
+            caches (list of :class:`DjangoOrmFieldCache`): Caches to load fields into.
+            fields (list of str): Field names to cache.
+            xblocks (list of :class:`XBlock`): XBlocks to cache fields for.
+            aside_types (list of str): Aside types to cache fields for.
+        """
+        for cache in caches:
+            cache.cache_fields(fields, xblocks, aside_types)
+
     @contract(kvs_key=DjangoKeyValueStore.Key)
     def get(self, kvs_key):
         """
@@ -369,6 +420,27 @@ class UserStateCache(object):
         for user_state in block_field_state:
             self._cache[user_state.block_key] = user_state.state
 
+    @classmethod
+    def cache_fields_for_users(cls, caches, fields, xblocks, aside_types):  # pylint: disable=unused-argument
+        """
+        Load all fields specified by ``fields`` for the supplied ``xblocks``
+        and ``aside_types`` into each of the supplied caches, which each
+        belong to a different user, loading the state of all the users at once.
+
+        Arguments:
+            caches (list of :class:`UserStateCache`): Caches to load fields into.
+            fields (list of str): Field names to cache.
+            xblocks (list of :class:`XBlock`): XBlocks to cache fields for.
+            aside_types (list of str): Aside types to cache fields for.
+        """
+        caches_by_username = {cache.user.username: cache for cache in caches}
+        block_field_state = DjangoXBlockUserStateClient().get_many_for_users(
+            [cache.user for cache in caches],
+            _all_usage_keys(xblocks, aside_types),
+        )
+        for user_state in block_field_state:
+            caches_by_username[user_state.username]._cache[user_state.block_key] = user_state.state
+
     @contract(kvs_key=DjangoKeyValueStore.Key)
     def set(self, kvs_key, value):
         """
@@ -599,6 +671,24 @@ class PreferencesCache(DjangoOrmFieldCache):
             field_name__in=set(field.name for field in fields),
         )
 
+    @classmethod
+    def cache_fields_for_users(cls, caches, fields, xblocks, aside_types):
+        """
+        Load all fields specified by ``fields`` for the supplied ``xblocks``
+        and ``aside_types`` into each of the supplied caches, which each
+        belong to a different user, loading the fields of all the users at once.
+        """
+        caches_by_user_id = {cache.user.pk: cache for cache in caches}
+        field_objects = XModuleStudentPrefsField.objects.chunked_filter(
+            'student__in',
+            list(caches_by_user_id),
+            module_type__in=_all_block_types(xblocks, aside_types),
+            field_name__in=set(field.name for field in fields),
+        )
+        for field_object in field_objects:
+            cache = caches_by_user_id[field_object.student_id]
+            cache._cache[cache._cache_key_for_field_object(field_object)] = field_object  # pylint: disable=protected-access
+
     def _cache_key_for_field_object(self, field_object):
         """
         Return the key used in this DjangoOrmFieldCache to store the specified field_object.
@@ -659,6 +749,23 @@ class UserInfoCache(DjangoOrmFieldCache):
             field_name__in=set(field.name for field in fields),
         )
 
+    @classmethod
+    def cache_fields_for_users(cls, caches, fields, xblocks, aside_types):
+        """
+        Load all fields specified by ``fields`` for the supplied ``xblocks``
+        and ``aside_types`` into each of the supplied caches, which each
+        belong to a different user, loading the fields of all the users at once.
+        """
+        caches_by_user_id = {cache.user.pk: cache for cache in caches}
+        field_objects = XModuleStudentInfoField.objects.chunked_filter(
+            'student__in',
+            list(caches_by_user_id),
+            field_name__in=set(field.name for field in fields),
+        )
+        for field_object in field_objects:
+            cache = caches_by_user_id[field_object.student_id]
+            cache._cache[cache._cache_key_for_field_object(field_object)] = field_object  # pylint: disable=protected-access
+
     def _cache_key_for_field_object(self, field_object):
         """
         Return the key used in this DjangoOrmFieldCache to store the specified field_object.
@@ -749,33 +856,7 @@ class FieldDataCache(object):
                 should be cached
         """
 
-        def get_child_descriptors(descriptor, depth, descriptor_filter):
-            """
-            Return a list of all child descriptors down to the specified depth
-            that match the descriptor filter. Includes `descriptor`
-
-            descriptor: The parent to search inside
-            depth: The number of levels to descend, or None for infinite depth
-            descriptor_filter(descriptor): A function that returns True
-                if descriptor should be included in the results
-            """
-            if descriptor_filter(descriptor):
-                descriptors = [descriptor]
-            else:
-                descriptors = []
-
-            if depth is None or depth > 0:
-                new_depth = depth - 1 if depth is not None else depth
-
-                for child in descriptor.get_children() + descriptor.get_required_module_descriptors():
-                    descriptors.extend(get_child_descriptors(child, new_depth, descriptor_filter))
-
-            return descriptors
-
-        with modulestore().bulk_operations(descriptor.location.course_key):
-            descriptors = get_child_descriptors(descriptor, depth, descriptor_filter)
-
-        self.add_descriptors_to_cache(descriptors)
+        self.add_descriptors_to_cache(_descendent_descriptors(descriptor, depth, descriptor_filter))
 
     @classmethod
     def cache_for_descriptor_descendents(cls, course_id, user, descriptor, depth=None,
@@ -794,6 +875,48 @@ class FieldDataCache(object):
         cache.add_descriptor_descendents(descriptor, depth, descriptor_filter)
         return cache
 
+    @classmethod
+    def bulk_cache_for_descriptor_descendents(cls, course_id, users, descriptor, depth=None,
+                                              descriptor_filter=lambda descriptor: True,
+                                              asides=None, read_only=False):
+        """
+        Returns a dict mapping the id of each of the supplied users to the
+        FieldDataCache that `cache_for_descriptor_descendents` returns for that
+        user, with the per-user data of all the users loaded at once, in a few
+        chunked queries, rather than in queries for each user.
+
+        course_id: the course in the context of which we want StudentModules.
+        users: the django users for whom to load modules.
+        descriptor: An XModuleDescriptor
+        depth is the number of levels of descendant modules to load StudentModules for, in addition to
+            the supplied descriptor. If depth is None, load all descendant StudentModules
+        descriptor_filter is a function that accepts a descriptor and return whether the field data
+            should be cached
+        """
+        caches = {
+            user.id: FieldDataCache([], course_id, user, asides=asides, read_only=read_only)
+            for user in users
+        }
+        authenticated_caches = [cache for cache in caches.values() if cache.user.is_authenticated]
+        if not authenticated_caches:
+            return caches
+
+        descriptors = _descendent_descriptors(descriptor, depth, descriptor_filter)
+        scorable_locations = set(desc.location for desc in descriptors if desc.has_score)
+        for cache in authenticated_caches:
+            cache.scorable_locations.update(scorable_locations)
+
+        first_cache = authenticated_caches[0]
+        for scope, fields in first_cache._fields_to_cache(descriptors).items():
+            if scope not in first_cache.cache:
+                continue
+
+            first_cache.cache[scope].cache_fields_for_users(
+                [cache.cache[scope] for cache in authenticated_caches], fields, descriptors, first_cache.asides,
+            )
+
+        return caches
+
     def _fields_to_cache(self, descriptors):
         """
         Returns a map of scopes to fields in that scope that should be cached
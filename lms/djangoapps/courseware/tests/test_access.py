@@ -451,6 +451,47 @@ class AccessTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase, MilestonesTes
 
         self.verify_access(mock_unit, expected_access, expected_error_type)
 
+    @patch.dict('django.conf.settings.FEATURES', {'DISABLE_START_DATES': False})
+    def test_bulk_has_access(self):
+        """
+        Tests that bulk_has_access returns the results of has_access, making the
+        decisions that only depend on the user and the course once.
+        """
+        partition_id = MINIMUM_STATIC_PARTITION_ID
+        group_id = MINIMUM_STATIC_PARTITION_ID + 1
+        self.course.user_partitions.append(UserPartition(
+            partition_id, 'Test User Partition', '', [Group(group_id, 'Group')], scheme_id='cohort'
+        ))
+        self.course.cohort_config = {'cohorted': True}
+        modulestore().update_item(self.course, ModuleStoreEnum.UserID.test)
+
+        chapter = ItemFactory.create(category='chapter', parent_location=self.course.location)
+        blocks = [chapter] + [
+            ItemFactory.create(category='sequential', parent_location=chapter.location, **fields)
+            for fields in [
+                {},
+                {'start': self.DATES[self.TOMORROW], 'days_early_for_beta': 2},
+                {'start': self.DATES[self.TOMORROW]},
+                {'visible_to_staff_only': True},
+                {'group_access': {partition_id: [group_id]}},
+            ]
+        ]
+        blocks = [modulestore().get_item(block.location) for block in blocks]
+
+        for user in [self.anonymous_user, self.student, self.beta_user, self.course_staff, self.global_staff]:
+            for action in ['load', 'staff']:
+                expected_results = [access.has_access(user, action, block, self.course.id) for block in blocks]
+                with patch.object(
+                    access, 'administrative_accesses_to_course_for_user',
+                    wraps=access.administrative_accesses_to_course_for_user,
+                ) as mock_administrative_accesses:
+                    results = access.bulk_has_access(user, action, blocks, self.course.id)
+                self.assertEqual(
+                    [(bool(result), getattr(result, 'error_code', None)) for result in results],
+                    [(bool(result), getattr(result, 'error_code', None)) for result in expected_results],
+                )
+                self.assertLessEqual(mock_administrative_accesses.call_count, 2)
+
     def test__has_access_descriptor_beta_user(self):
         mock_unit = Mock(user_partitions=[])
         mock_unit._class_tags = {}
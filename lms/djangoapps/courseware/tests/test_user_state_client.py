@@ -7,6 +7,7 @@ defined in edx_user_state_client.
 from collections import defaultdict
 
 from edx_user_state_client.tests import UserStateClientTestBase
+from opaque_keys.edx.locator import CourseLocator
 
 from lms.djangoapps.courseware.tests.factories import UserFactory
 from lms.djangoapps.courseware.user_state_client import DjangoXBlockUserStateClient
@@ -34,3 +35,26 @@ class TestDjangoUserStateClient(UserStateClientTestBase, ModuleStoreTestCase):
         super(TestDjangoUserStateClient, self).setUp()
         self.client = DjangoXBlockUserStateClient()
         self.users = defaultdict(UserFactory.create)
+
+    def test_get_many_for_users(self):
+        course_key = CourseLocator(org='org', course='course', run='run')
+        block_keys = [course_key.make_usage_key('problem', 'problem{}'.format(index)) for index in range(3)]
+        users = [self.users[index] for index in range(3)]
+        for user_index, user in enumerate(users):
+            self.client.set_many(user.username, {
+                block_key: {'index': user_index * 10 + block_index}
+                for block_index, block_key in enumerate(block_keys[:user_index + 1])
+            })
+        self.client.set_many(users[2].username, {block_keys[0]: {}})
+
+        expected_states = {
+            (user.username, state.block_key): state.state
+            for user in users
+            for state in self.client.get_many(user.username, block_keys[:2])
+        }
+        states = {
+            (state.username, state.block_key): state.state
+            for state in self.client.get_many_for_users(users, block_keys[:2])
+        }
+        self.assertEqual(states, expected_states)
+        self.assertEqual(len(states), 3)
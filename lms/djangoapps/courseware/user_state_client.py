@@ -19,7 +19,7 @@ from edx_django_utils import monitoring as monitoring_utils
 from edx_user_state_client.interface import XBlockUserState, XBlockUserStateClient
 from xblock.fields import Scope
 
-from lms.djangoapps.courseware.models import BaseStudentModuleHistory, StudentModule
+from lms.djangoapps.courseware.models import BaseStudentModuleHistory, StudentModule, chunks
 
 try:
     import simplejson as json
@@ -53,6 +53,10 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
     # Use this sample rate for DataDog events.
     API_DATADOG_SAMPLE_RATE = 0.1
 
+    # Maximum number of users, and separately of blocks, whose state is
+    # loaded by a single query of `get_many_for_users`.
+    BULK_QUERY_CHUNK_SIZE = 400
+
     class ServiceUnavailable(XBlockUserStateClient.ServiceUnavailable):
         """
         This error is raised if the service backing this client is currently unavailable.
@@ -106,6 +110,37 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
                 usage_key = student_module.module_state_key.map_into_course(student_module.course_id)
                 yield (student_module, usage_key)
 
+    def _get_student_modules_for_users(self, users, block_keys):
+        """
+        Retrieve the :class:`~StudentModule`s for the supplied ``users`` and ``block_keys``,
+        querying for chunks of users and of blocks at a time.
+
+        Arguments:
+            users (list of :class:`~User`): The users to load `StudentModule`s for.
+            block_keys (list of :class:`~UsageKey`): The set of XBlocks to load data for.
+        """
+        course_key_func = attrgetter('course_key')
+        by_course = itertools.groupby(
+            sorted(block_keys, key=course_key_func),
+            course_key_func,
+        )
+
+        user_ids = [user.id for user in users]
+        for course_key, usage_keys in by_course:
+            usage_keys = list(usage_keys)
+            for user_ids_chunk in chunks(user_ids, self.BULK_QUERY_CHUNK_SIZE):
+                query = StudentModule.objects.chunked_filter(
+                    'module_state_key__in',
+                    usage_keys,
+                    student_id__in=user_ids_chunk,
+                    course_id=course_key,
+                    chunk_size=self.BULK_QUERY_CHUNK_SIZE,
+                )
+
+                for student_module in query:
+                    usage_key = student_module.module_state_key.map_into_course(student_module.course_id)
+                    yield (student_module, usage_key)
+
     def _nr_metric_name(self, function_name, stat_name, block_type=None):
         """
         Return a metric name (string) representing the provided descriptors.
@@ -209,6 +244,65 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         duration = (finish_time - evt_time) * 1000  # milliseconds
         self._nr_stat_accumulate('get_many', 'duration', duration)
 
+    def get_many_for_users(self, users, block_keys, scope=Scope.user_state, fields=None):
+        """
+        Retrieve the stored XBlock state of multiple users for the specified XBlock usages,
+        in a few chunked queries rather than in queries for each user.
+
+        Arguments:
+            users ([User]): The users whose state should be retrieved
+            block_keys ([UsageKey]): A list of UsageKeys identifying which xblock states to load.
+            scope (Scope): The scope to load data from
+            fields: A list of field values to retrieve. If None, retrieve all stored fields.
+
+        Yields:
+            XBlockUserState tuples for each of the users and each specified UsageKey in
+            block_keys, in no particular order.
+            field_state is a dict mapping field names to values.
+        """
+        if scope != Scope.user_state:
+            raise ValueError(u"Only Scope.user_state is supported, not {}".format(scope))
+
+        evt_time = time()
+
+        # count how many times this function gets called
+        self._nr_stat_increment('get_many_for_users', 'calls')
+
+        # keep track of users and blocks requested
+        self._nr_stat_accumulate('get_many_for_users', 'users_requested', len(users))
+        self._nr_stat_accumulate('get_many_for_users', 'blocks_requested', len(block_keys))
+
+        usernames = {user.id: user.username for user in users}
+        modules = self._get_student_modules_for_users(users, block_keys)
+        for module, usage_key in modules:
+            if module.state is None:
+                continue
+
+            state = json.loads(module.state)
+
+            # If the state is the empty dict, then it has been deleted, and so
+            # conformant UserStateClients should treat it as if it doesn't exist.
+            if state == {}:
+                continue
+
+            # collect statistics for metric reporting
+            self._nr_block_stat_increment('get_many_for_users', usage_key.block_type, 'blocks_out')
+            self._nr_block_stat_accumulate('get_many_for_users', usage_key.block_type, 'size', len(module.state))
+
+            # filter state on fields
+            if fields is not None:
+                state = {
+                    field: state[field]
+                    for field in fields
+                    if field in state
+                }
+            yield XBlockUserState(usernames[module.student_id], usage_key, state, module.modified, scope)
+
+        # The rest of this method exists only to report metrics.
+        finish_time = time()
+        duration = (finish_time - evt_time) * 1000  # milliseconds
+        self._nr_stat_accumulate('get_many_for_users', 'duration', duration)
+
     def set_many(self, username, block_keys_to_state, scope=Scope.user_state):
         """
         Set fields for a particular XBlock.
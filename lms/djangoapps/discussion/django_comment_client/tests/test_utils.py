@@ -29,9 +29,12 @@ from lms.djangoapps.teams.tests.factories import CourseTeamFactory
 from openedx.core.djangoapps.course_groups import cohorts
 from openedx.core.djangoapps.course_groups.cohorts import set_course_cohorted
 from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory, config_course_cohorts
+from openedx.core.djangoapps.django_comment_common.comment_client.thread import Thread
 from openedx.core.djangoapps.django_comment_common.comment_client.utils import (
+    REQUEST_CACHE_NAMESPACE,
     CommentClientMaintenanceError,
-    perform_request
+    perform_request,
+    request
 )
 from openedx.core.djangoapps.django_comment_common.models import (
     CourseDiscussionSettings,
@@ -1811,7 +1814,7 @@ class ClientConfigurationTestCase(TestCase):
         with self.assertRaises(CommentClientMaintenanceError):
             perform_request('GET', 'http://www.google.com')
 
-    @patch('requests.request')
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.request')
     def test_enabled(self, mock_request):
         """Ensures that requests proceed normally when forums are enabled."""
         config = ForumsConfig.current()
@@ -1827,6 +1830,95 @@ class ClientConfigurationTestCase(TestCase):
         result = perform_request('GET', 'http://www.google.com')
         self.assertEqual(result, {})
 
+    @patch('requests.Session.request')
+    def test_session_reused(self, mock_session_request):
+        """Ensures that the requests of a thread are sent over the same session."""
+        request('get', 'http://www.google.com')
+        request('get', 'http://www.google.com')
+        self.assertEqual(mock_session_request.call_count, 2)
+
+        with patch('requests.Session.__init__', side_effect=AssertionError):
+            request('get', 'http://www.google.com')
+
+    def _configure(self, **kwargs):
+        """Saves an enabled ForumsConfig with the given fields."""
+        config = ForumsConfig.current()
+        config.enabled = True
+        for name, value in kwargs.items():
+            setattr(config, name, value)
+        config.save()
+        RequestCache(REQUEST_CACHE_NAMESPACE).clear()
+
+    def _mock_response(self, mock_request, data):
+        """Makes the mocked comment service return the given data."""
+        mock_request.return_value = Mock(status_code=200, json=Mock(return_value=data))
+
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.request')
+    def test_coalesce_requests(self, mock_request):
+        """Ensures that identical reads are only sent once per request, until a write."""
+        self._configure(coalesce_requests=True)
+        self._mock_response(mock_request, {'id': 'coalesced'})
+
+        self.assertEqual(perform_request('get', 'http://comments/threads', {'page': 1}), {'id': 'coalesced'})
+        self.assertEqual(perform_request('get', 'http://comments/threads', {'page': 1}), {'id': 'coalesced'})
+        self.assertEqual(mock_request.call_count, 1)
+
+        perform_request('get', 'http://comments/threads', {'page': 2})
+        self.assertEqual(mock_request.call_count, 2)
+
+        perform_request('post', 'http://comments/threads', {'title': 'New thread'})
+        perform_request('get', 'http://comments/threads', {'page': 1})
+        self.assertEqual(mock_request.call_count, 4)
+
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.request')
+    def test_cache_response(self, mock_request):
+        """Ensures that the cached reads are cached across requests, until a write."""
+        self._configure(cache_timeout=60)
+        self._mock_response(mock_request, {'collection': ['cached']})
+
+        perform_request('get', 'http://comments/users/1/active_threads', {'page': 1}, cache_response=True)
+        RequestCache.clear_all_namespaces()
+        result = perform_request('get', 'http://comments/users/1/active_threads', {'page': 1}, cache_response=True)
+        self.assertEqual(result, {'collection': ['cached']})
+        self.assertEqual(mock_request.call_count, 1)
+
+        # Other reads aren't cached
+        perform_request('get', 'http://comments/users/1', {'course_id': 'course'})
+        perform_request('get', 'http://comments/users/1', {'course_id': 'course'})
+        self.assertEqual(mock_request.call_count, 3)
+
+        perform_request('put', 'http://comments/threads/1', {'title': 'Updated thread'})
+        perform_request('get', 'http://comments/users/1/active_threads', {'page': 1}, cache_response=True)
+        self.assertEqual(mock_request.call_count, 5)
+
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.request')
+    def test_mark_as_read(self, mock_request):
+        """Ensures that retrieving a thread as read is never cached, and makes the cached reads out of date."""
+        self._configure(coalesce_requests=True, cache_timeout=60)
+        self._mock_response(mock_request, {'id': 'thread', 'title': 'Thread'})
+
+        perform_request('get', 'http://comments/users/1/active_threads', {'page': 1}, cache_response=True)
+        Thread(id='thread').retrieve(user_id='1', mark_as_read=True)
+        Thread(id='thread').retrieve(user_id='1', mark_as_read=True)
+        self.assertEqual(mock_request.call_count, 3)
+
+        perform_request('get', 'http://comments/users/1/active_threads', {'page': 1}, cache_response=True)
+        self.assertEqual(mock_request.call_count, 4)
+
+        Thread(id='thread').retrieve(user_id='1', mark_as_read=False)
+        Thread(id='thread').retrieve(user_id='1', mark_as_read=False)
+        self.assertEqual(mock_request.call_count, 5)
+
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.request')
+    def test_retrieve_all(self, mock_request):
+        """Ensures that instances of the same attributes are retrieved with a single request."""
+        self._configure()
+        self._mock_response(mock_request, {'id': 'thread', 'title': 'Thread'})
+
+        threads = Thread.retrieve_all([Thread(id='thread'), Thread(id='thread'), Thread(id='other_thread')])
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual([thread.title for thread in threads], ['Thread'] * 3)
+
 
 def set_discussion_division_settings(
         course_key, enable_cohorts=False, always_divide_inline_discussions=False,
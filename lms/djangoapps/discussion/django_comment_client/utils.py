@@ -19,7 +19,7 @@ from six import text_type
 from six.moves import map
 
 from lms.djangoapps.courseware import courses
-from lms.djangoapps.courseware.access import has_access
+from lms.djangoapps.courseware.access import bulk_has_access, has_access
 from lms.djangoapps.discussion.django_comment_client.constants import TYPE_ENTRY, TYPE_SUBCATEGORY
 from lms.djangoapps.discussion.django_comment_client.permissions import (
     check_permissions_by_view,
@@ -153,10 +153,13 @@ def get_accessible_discussion_xblocks_by_course_id(course_id, user=None, include
     Checks for the given user's access if include_all is False.
     """
     all_xblocks = modulestore().get_items(course_id, qualifiers={'category': 'discussion'}, include_orphans=False)
+    xblocks = [xblock for xblock in all_xblocks if has_required_keys(xblock)]
+    if include_all:
+        return xblocks
 
     return [
-        xblock for xblock in all_xblocks
-        if has_required_keys(xblock) and (include_all or has_access(user, 'load', xblock, course_id))
+        xblock for xblock, access in zip(xblocks, bulk_has_access(user, 'load', xblocks, course_id))
+        if access
     ]
 
 
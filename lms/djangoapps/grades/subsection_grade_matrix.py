@@ -0,0 +1,177 @@
+"""
+SubsectionGradeMatrix Class
+"""
+
+
+import numpy as np
+
+from .config import assume_zero_if_absent, should_persist_grades
+from .models import PersistentCourseGrade, PersistentSubsectionGrade
+
+
+class SubsectionGradeMatrix(object):
+    """
+    Graded subsection scores of a batch of users, held in NumPy arrays
+    with a row per user and a column per subsection, so that grading
+    policy computations can be applied to all users at once.
+
+    The values match those of the subsection grades of the CourseGrade
+    objects that CourseGradeFactory.read returns for the users.
+    """
+    def __init__(self, user_ids, percent_graded, attempted_graded, overridden, attempted):
+        """
+        Arguments:
+            user_ids (list(int)) - Ids of the users, in row order.
+            percent_graded (ndarray(float)) - The percent_graded of each
+                user's subsection grades.
+            attempted_graded (ndarray(bool)) - The attempted_graded of
+                each user's subsection grades.
+            overridden (ndarray(bool)) - Whether each user's subsection
+                grade is overridden.
+            attempted (ndarray(bool)) - Whether each user's course grade
+                is attempted.
+        """
+        self.user_ids = user_ids
+        self.percent_graded = percent_graded
+        self.attempted_graded = attempted_graded
+        self.overridden = overridden
+        self.attempted = attempted
+        self._rows = {user_id: row for row, user_id in enumerate(user_ids)}
+
+    def __contains__(self, user_id):
+        return user_id in self._rows
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    def row(self, user_id):
+        """
+        Returns the index of the row of the given user.
+        """
+        return self._rows[user_id]
+
+    @classmethod
+    def read(cls, course_key, users, subsection_keys):
+        """
+        Returns a SubsectionGradeMatrix for the given subsections, in
+        column order, of those of the given users whose subsection grades
+        are all read from storage rather than computed, i.e., users with a
+        persisted course grade and a persisted grade for each of the
+        subsections, and all other users if absent grades are assumed to
+        be zero.  Returns None if grades are not persisted for the course.
+
+        Grades are read from the prefetched grades of the users when
+        available (see prefetch_course_and_subsection_grades).
+
+        Note: When absent grades are assumed to be zero, a subsection
+        without a persisted grade is read as not attempted, with a percent
+        of 0.0, and a persisted course grade is always attempted.
+        Otherwise, a course grade is attempted if any of the user's
+        persisted subsection grades, graded or not, is attempted, without
+        building the user's subsection grades as CourseGrade.attempted
+        does.  This assumes the attempted subsections have persisted
+        grades, as they do once grades are persisted for the course.
+        """
+        if not should_persist_grades(course_key):
+            return None
+
+        zero_if_absent = assume_zero_if_absent(course_key)
+        columns = {subsection_key: column for column, subsection_key in enumerate(subsection_keys)}
+
+        user_ids, earned_rows, possible_rows, attempted_graded_rows, overridden_rows, attempted = [], [], [], [], [], []
+        for user in users:
+            try:
+                PersistentCourseGrade.read(user.id, course_key)
+            except PersistentCourseGrade.DoesNotExist:
+                if not zero_if_absent:
+                    # The course grade will be computed, along with
+                    # its subsection grades.
+                    continue
+                # A zero course grade has zero subsection grades, even
+                # when some are persisted.
+                grades = []
+                user_attempted = False
+            else:
+                grades = PersistentSubsectionGrade.bulk_read_grades(user.id, course_key)
+                if not zero_if_absent and not set(columns).issubset(grade.full_usage_key for grade in grades):
+                    # Some of the subsection grades will be computed.
+                    continue
+                user_attempted = zero_if_absent or any(grade.first_attempted is not None for grade in grades)
+
+            earned, possible = [0.0] * len(columns), [0.0] * len(columns)
+            attempted_graded, overridden = [False] * len(columns), [False] * len(columns)
+            for grade in grades:
+                column = columns.get(grade.full_usage_key)
+                if column is not None:
+                    earned[column], possible[column] = _graded_score_of_model(grade)
+                    attempted_graded[column] = grade.first_attempted is not None
+                    overridden[column] = hasattr(grade, 'override')
+
+            user_ids.append(user.id)
+            earned_rows.append(earned)
+            possible_rows.append(possible)
+            attempted_graded_rows.append(attempted_graded)
+            overridden_rows.append(overridden)
+            attempted.append(user_attempted)
+
+        shape = (len(user_ids), len(columns))
+        return cls(
+            user_ids,
+            compute_percents(
+                np.array(earned_rows, dtype=float).reshape(shape),
+                np.array(possible_rows, dtype=float).reshape(shape),
+            ),
+            np.array(attempted_graded_rows, dtype=bool).reshape(shape),
+            np.array(overridden_rows, dtype=bool).reshape(shape),
+            np.array(attempted, dtype=bool),
+        )
+
+    def total_with_drops(self, columns, drop_count):
+        """
+        Returns, for each user, the average percent_graded of the given
+        columns after dropping the drop_count lowest ones, exactly as
+        AssignmentFormatGrader.total_with_drops computes it.
+
+        Ties among the lowest percents are dropped from the last column
+        first, and the remaining percents are summed in column order, so
+        that the results are identical to the ones computed one user at
+        a time.
+        """
+        kept_count = len(columns) - drop_count
+        if kept_count <= 0:
+            # All percents are dropped, leaving the initial total of 0.
+            return np.zeros(len(self), dtype=int)
+
+        percents = self.percent_graded[:, columns]
+        if drop_count > 0:
+            sorted_columns = np.argsort(-percents, axis=1, kind='stable')
+            kept = np.ones(percents.shape, dtype=bool)
+            np.put_along_axis(kept, sorted_columns[:, kept_count:], False, axis=1)
+            percents = np.where(kept, percents, 0.0)
+
+        # Unlike sum, cumsum adds strictly in order.
+        return np.cumsum(percents, axis=1)[:, -1] / kept_count
+
+
+def compute_percents(earned, possible):
+    """
+    Returns an array of the percentages of the given arrays of earned
+    and possible values, as computed by scores.compute_percent.
+    """
+    has_possible = possible > 0
+    percents = np.around(earned / np.where(has_possible, possible, 1.0), decimals=2)
+    return np.where(has_possible, percents, 0.0)
+
+
+def _graded_score_of_model(grade_model):
+    """
+    Returns the graded (earned, possible) values of the given
+    PersistentSubsectionGrade, taking any override into account.
+    """
+    earned, possible = grade_model.earned_graded, grade_model.possible_graded
+    if hasattr(grade_model, 'override'):
+        if grade_model.override.earned_graded_override is not None:
+            earned = grade_model.override.earned_graded_override
+        if grade_model.override.possible_graded_override is not None:
+            possible = grade_model.override.possible_graded_override
+    return earned, possible
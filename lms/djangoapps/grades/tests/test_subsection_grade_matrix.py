@@ -0,0 +1,141 @@
+"""
+Tests for the SubsectionGradeMatrix class.
+"""
+
+
+from unittest import TestCase
+
+import ddt
+import numpy as np
+from django.conf import settings
+from mock import patch
+
+from xmodule.graders import AssignmentFormatGrader
+
+from ..course_grade_factory import CourseGradeFactory
+from ..models import PersistentSubsectionGrade
+from ..scores import compute_percent
+from ..subsection_grade_matrix import SubsectionGradeMatrix, compute_percents
+from .base import GradeTestBase
+from .utils import answer_problem
+
+
+@ddt.ddt
+class SubsectionGradeMatrixComputationTest(TestCase):
+    """
+    Tests that the computations of SubsectionGradeMatrix are identical
+    to those made for a single user.
+    """
+    PERCENTS = [
+        [0.5, 1.0, 0.0, 0.5, 0.25, 0.1, 0.7, 0.3, 0.9, 0.33],
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [0.33, 0.33, 0.33, 0.67, 0.67, 0.67, 0.1, 0.2, 0.3, 0.1],
+    ]
+
+    def _create_matrix(self, percents):
+        return SubsectionGradeMatrix(
+            list(range(len(percents))),
+            np.array(percents),
+            np.zeros((len(percents), len(percents[0])), dtype=bool),
+            np.zeros((len(percents), len(percents[0])), dtype=bool),
+            np.ones(len(percents), dtype=bool),
+        )
+
+    @ddt.data(
+        (list(range(10)), 0),
+        (list(range(10)), 2),
+        ([4, 1, 3, 8, 0, 9, 2], 3),
+        ([5, 2], 1),
+        ([5, 2], 2),
+        ([5, 2], 4),
+        ([], 0),
+    )
+    @ddt.unpack
+    def test_total_with_drops(self, columns, drop_count):
+        grader = AssignmentFormatGrader('Homework', len(columns), drop_count)
+        totals = self._create_matrix(self.PERCENTS).total_with_drops(columns, drop_count).tolist()
+        for row, percents in enumerate(self.PERCENTS):
+            expected_total, _ = grader.total_with_drops([{'percent': percents[column]} for column in columns])
+            self.assertEqual(totals[row], expected_total)
+            self.assertEqual(str(totals[row]), str(expected_total))
+
+    def test_compute_percents(self):
+        earned = [[0.0, 1.0, 1.0, 2.0, 1.5], [3.0, 0.0, 7.0, 1.0, 0.0]]
+        possible = [[0.0, 3.0, 1.0, 7.0, 0.0], [3.0, 5.0, 9.0, 6.0, 2.0]]
+        percents = compute_percents(np.array(earned), np.array(possible)).tolist()
+        for row_earned, row_possible, row_percents in zip(earned, possible, percents):
+            for value_earned, value_possible, percent in zip(row_earned, row_possible, row_percents):
+                self.assertEqual(percent, compute_percent(value_earned, value_possible))
+
+
+@patch.dict(settings.FEATURES, {
+    'PERSISTENT_GRADES_ENABLED_FOR_ALL_TESTS': True,
+    'ASSUME_ZERO_GRADE_IF_ABSENT_FOR_ALL_TESTS': False,
+})
+class SubsectionGradeMatrixReadTest(GradeTestBase):
+    """
+    Tests that SubsectionGradeMatrix reads the grades returned by
+    CourseGradeFactory.read.
+    """
+    def assert_matrix_matches_course_grade(self, grade_matrix, user, subsection_keys):
+        """
+        Asserts that the row of the given user in the given matrix matches the
+        user's course grade, as read by CourseGradeFactory.
+        """
+        self.assertIn(user.id, grade_matrix)
+        course_grade = CourseGradeFactory().read(user, self.course)
+        row = grade_matrix.row(user.id)
+        self.assertEqual(grade_matrix.attempted[row], course_grade.attempted)
+        for column, subsection_key in enumerate(subsection_keys):
+            subsection_grade = course_grade.subsection_grade(subsection_key)
+            self.assertEqual(grade_matrix.percent_graded[row, column], subsection_grade.percent_graded)
+            self.assertEqual(grade_matrix.attempted_graded[row, column], subsection_grade.attempted_graded)
+            self.assertFalse(grade_matrix.overridden[row, column])
+
+    def test_read(self):
+        user = self.request.user
+        answer_problem(self.course, self.request, self.problem, score=1, max_value=2)
+        CourseGradeFactory().update(user, self.course)
+
+        subsection_keys = [self.sequence2.location, self.sequence.location]
+        grade_matrix = SubsectionGradeMatrix.read(self.course.id, [user], subsection_keys)
+        self.assertEqual(grade_matrix.attempted.tolist(), [True])
+        self.assert_matrix_matches_course_grade(grade_matrix, user, subsection_keys)
+
+    def test_read_not_attempted(self):
+        user = self.request.user
+        CourseGradeFactory().update(user, self.course)
+
+        subsection_keys = [self.sequence2.location, self.sequence.location]
+        grade_matrix = SubsectionGradeMatrix.read(self.course.id, [user], subsection_keys)
+        self.assertEqual(grade_matrix.attempted.tolist(), [False])
+        self.assert_matrix_matches_course_grade(grade_matrix, user, subsection_keys)
+
+    def test_read_with_missing_subsection_grade(self):
+        user = self.request.user
+        answer_problem(self.course, self.request, self.problem, score=1, max_value=2)
+        CourseGradeFactory().update(user, self.course)
+        PersistentSubsectionGrade.objects.filter(user_id=user.id, usage_key=self.sequence2.location).delete()
+
+        # The grade of the subsection is computed from the user's scores.
+        grade_matrix = SubsectionGradeMatrix.read(
+            self.course.id, [user], [self.sequence2.location, self.sequence.location],
+        )
+        self.assertNotIn(user.id, grade_matrix)
+
+    @patch.dict(settings.FEATURES, {'ASSUME_ZERO_GRADE_IF_ABSENT_FOR_ALL_TESTS': True})
+    def test_read_with_missing_subsection_grade_assumed_zero(self):
+        user = self.request.user
+        answer_problem(self.course, self.request, self.problem, score=1, max_value=2)
+        CourseGradeFactory().update(user, self.course)
+        PersistentSubsectionGrade.objects.filter(user_id=user.id, usage_key=self.sequence.location).delete()
+
+        subsection_keys = [self.sequence2.location, self.sequence.location]
+        grade_matrix = SubsectionGradeMatrix.read(self.course.id, [user], subsection_keys)
+        self.assertEqual(grade_matrix.attempted.tolist(), [True])
+        self.assert_matrix_matches_course_grade(grade_matrix, user, subsection_keys)
+
+    def test_read_without_course_grade(self):
+        grade_matrix = SubsectionGradeMatrix.read(self.course.id, [self.request.user], [self.sequence.location])
+        self.assertNotIn(self.request.user.id, grade_matrix)
+        self.assertEqual(len(grade_matrix), 0)
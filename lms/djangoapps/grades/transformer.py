@@ -39,6 +39,7 @@ class GradesTransformer(BlockStructureTransformer):
     """
     WRITE_VERSION = 4
     READ_VERSION = 4
+    SUPPORTS_INCREMENTAL_COLLECT = True
     FIELDS_TO_COLLECT = [
         u'due',
         u'format',
@@ -117,6 +118,8 @@ class GradesTransformer(BlockStructureTransformer):
         block_types_to_ignore = {'course', 'chapter', 'sequential'}
 
         for block_key in block_structure.topological_traversal():
+            if not block_structure.should_collect(block_key):
+                continue
             if block_key.block_type in block_types_to_ignore:
                 _set_field(block_key, None)
             else:
@@ -139,6 +142,8 @@ class GradesTransformer(BlockStructureTransformer):
         Collect the `max_score` for every block in the provided `block_structure`.
         """
         for block_locator in block_structure.post_order_traversal():
+            if not block_structure.should_collect(block_locator):
+                continue
             block = block_structure.get_xblock(block_locator)
             if getattr(block, 'has_score', False):
                 cls._collect_max_score(block_structure, block)
@@ -161,6 +166,8 @@ class GradesTransformer(BlockStructureTransformer):
         `transformer_block_field` associated with the `GradesTransformer`.
         """
         course_location = block_structure.root_block_usage_key
+        if not block_structure.should_collect(course_location):
+            return
         course_block = block_structure.get_xblock(course_location)
         block_structure.set_transformer_block_field(
             course_block.location,
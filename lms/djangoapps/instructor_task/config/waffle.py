@@ -13,6 +13,8 @@ WAFFLE_SWITCHES = WaffleSwitchNamespace(name=WAFFLE_NAMESPACE)
 # Waffle switches
 OPTIMIZE_GET_LEARNERS_FOR_COURSE = u'optimize_get_learners_for_course'
 GENERATE_GRADE_REPORT_VERIFIED_ONLY = u'generate_grade_report_for_verified_only'
+BATCH_COURSE_GRADE_REPORT_GRADES = u'batch_course_grade_report_grades'
+PARALLEL_GRADE_REPORTS = u'parallel_grade_reports'
 
 
 def waffle_flags():
@@ -35,3 +37,19 @@ def generate_grade_report_for_verified_only():
     verified learners.
     """
     return WAFFLE_SWITCHES.is_enabled(GENERATE_GRADE_REPORT_VERIFIED_ONLY)
+
+
+def batch_course_grade_report_grades_enabled():
+    """
+    Returns True if waffle switch is enabled that indicates course grade reports
+    should compute the grades read from storage for each batch of learners at once.
+    """
+    return WAFFLE_SWITCHES.is_enabled(BATCH_COURSE_GRADE_REPORT_GRADES)
+
+
+def parallel_grade_reports_enabled():
+    """
+    Returns True if waffle switch is enabled that indicates grade reports should
+    be generated by subtasks that each grade a part of the learners in parallel.
+    """
+    return WAFFLE_SWITCHES.is_enabled(PARALLEL_GRADE_REPORTS)
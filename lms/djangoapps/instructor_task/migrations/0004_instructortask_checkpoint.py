@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('instructor_task', '0003_alter_task_input_field'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='instructortask',
+            name='checkpoint',
+            field=models.TextField(blank=True),
+        ),
+    ]
@@ -20,13 +20,15 @@ import hashlib
 import json
 import logging
 import os.path
+import shutil
+import tempfile
 from uuid import uuid4
 
 import six
 from boto.exception import BotoServerError
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.db import models, transaction
 from django.utils.encoding import python_2_unicode_compatible
 from django.utils.translation import ugettext as _
@@ -61,6 +63,8 @@ class InstructorTask(models.Model):
     `task_state` stores the last known state of the celery task
     `task_output` stores the output of the celery task.
         Format is a JSON-serialized dict.  Content varies by task_type and task_state.
+    `checkpoint` stores the progress of a task that can be resumed when retried.
+        Format is a JSON-serialized dict.  Content varies by task_type.
 
     `requester` stores id of user who submitted the task
     `created` stores date that entry was first created
@@ -82,6 +86,7 @@ class InstructorTask(models.Model):
     created = models.DateTimeField(auto_now_add=True, null=True)
     updated = models.DateTimeField(auto_now=True)
     subtasks = models.TextField(blank=True)  # JSON dictionary
+    checkpoint = models.TextField(blank=True)  # JSON dictionary
 
     def __repr__(self):
         return 'InstructorTask<%r>' % ({
@@ -300,6 +305,77 @@ class DjangoStorageReportStore(ReportStore):
         output_buffer.seek(0)
         self.store(course_id, filename, output_buffer)
 
+    def store_rows_part(self, course_id, parts_name, part_index, rows):
+        """
+        Given a course_id, the name of a set of parts, a part index, and
+        rows, write the rows to the storage backend in csv format, as the
+        part with the given index of a report that is later stored with
+        `store_parts`.  Any part previously written with the same index is
+        replaced.
+        """
+        path = self._part_path(course_id, parts_name, part_index)
+        if self.storage.exists(path):
+            self.storage.delete(path)
+        self.storage.save(path, ContentFile(self._get_csv_bytes(rows)))
+
+    def store_parts(self, course_id, filename, header_rows, parts_name, part_indices):
+        """
+        Given a course_id, filename, header rows, the name of a set of
+        parts, and the indices of the parts, write the header rows followed
+        by the rows of the parts, in order, to the storage backend in csv
+        format, then delete the parts.
+
+        The report is assembled in a temporary file, one part at a time,
+        so its size does not bound memory usage.
+        """
+        part_paths = [self._part_path(course_id, parts_name, part_index) for part_index in part_indices]
+        with tempfile.TemporaryFile() as report_file:
+            # Adding unicode signature (BOM) for MS Excel 2013 compatibility
+            if six.PY2:
+                report_file.write(codecs.BOM_UTF8)
+            report_file.write(self._get_csv_bytes(header_rows))
+            for part_path in part_paths:
+                with self.storage.open(part_path) as part_file:
+                    shutil.copyfileobj(part_file, report_file)
+            report_file.seek(0)
+            self.storage.save(self.path_to(course_id, filename), File(report_file))
+
+        self.delete_parts(course_id, parts_name, part_indices)
+
+    def delete_parts(self, course_id, parts_name, part_indices):
+        """
+        Delete the parts with the given indices from the storage backend,
+        along with their directory once it is empty, if the storage backend
+        has directories.
+        """
+        for part_index in part_indices:
+            self.storage.delete(self._part_path(course_id, parts_name, part_index))
+        try:
+            os.rmdir(self.storage.path(self.path_to(course_id, u'{}.parts'.format(parts_name))))
+        except (NotImplementedError, OSError):
+            # The storage backend has no directories, or the directory is
+            # missing or still holds parts.
+            pass
+
+    def _part_path(self, course_id, parts_name, part_index):
+        """
+        Return the full path to the part with the given index.  Parts are
+        stored in a directory of their own, so that they are not listed
+        by `links_for`.
+        """
+        return self.path_to(course_id, os.path.join(u'{}.parts'.format(parts_name), u'{:06d}.csv'.format(part_index)))
+
+    def _get_csv_bytes(self, rows):
+        """
+        Return the given rows in csv format, encoded as utf-8.
+        """
+        output_buffer = ContentFile('')
+        csvwriter = csv.writer(output_buffer)
+        csvwriter.writerows(self._get_utf8_encoded_rows(rows))
+        output_buffer.seek(0)
+        csv_data = output_buffer.read()
+        return csv_data if six.PY2 else csv_data.encode('utf-8')
+
     def links_for(self, course_id):
         """
         For a given `course_id`, return a list of `(filename, url)` tuples.
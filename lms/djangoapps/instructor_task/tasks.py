@@ -79,7 +79,7 @@ def rescore_problem(entry_id, xmodule_instance_args):
     action_name = ugettext_noop('rescored')
     update_fcn = partial(rescore_problem_module_state, xmodule_instance_args)
 
-    visit_fcn = partial(perform_module_state_update, update_fcn, None)
+    visit_fcn = partial(perform_module_state_update, update_fcn, None, bulk_load_field_data=True)
     return run_main_task(entry_id, visit_fcn, action_name)
 
 
@@ -92,7 +92,7 @@ def override_problem_score(entry_id, xmodule_instance_args):
     action_name = ugettext_noop('overridden')
     update_fcn = partial(override_score_module_state, xmodule_instance_args)
 
-    visit_fcn = partial(perform_module_state_update, update_fcn, None)
+    visit_fcn = partial(perform_module_state_update, update_fcn, None, bulk_load_field_data=True)
     return run_main_task(entry_id, visit_fcn, action_name)
 
 
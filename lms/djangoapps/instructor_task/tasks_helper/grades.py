@@ -2,21 +2,25 @@
 Functionality for generating grade reports.
 """
 
+import json
 import logging
 import re
+import traceback
 from collections import OrderedDict, defaultdict
 from datetime import datetime
-from itertools import chain
+from itertools import chain, count
 from time import time
 
 import six
+from celery import task
+from celery.states import FAILURE, SUCCESS
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from lazy import lazy
 from opaque_keys.edx.keys import UsageKey
 from pytz import UTC
 from six import text_type
-from six.moves import zip, zip_longest
+from six.moves import range, zip, zip_longest
 
 from course_blocks.api import get_course_blocks
 from course_modes.models import CourseMode
@@ -26,17 +30,28 @@ from lms.djangoapps.courseware.user_state_client import DjangoXBlockUserStateCli
 from lms.djangoapps.grades.api import CourseGradeFactory
 from lms.djangoapps.grades.api import context as grades_context
 from lms.djangoapps.grades.api import prefetch_course_and_subsection_grades
+from lms.djangoapps.grades.api import SubsectionGradeMatrix
 from lms.djangoapps.instructor_analytics.basic import list_problem_responses
 from lms.djangoapps.instructor_analytics.csvs import format_dictlist
 from lms.djangoapps.instructor_task.config.waffle import (
+    batch_course_grade_report_grades_enabled,
     generate_grade_report_for_verified_only,
-    optimize_get_learners_switch_enabled
+    optimize_get_learners_switch_enabled,
+    parallel_grade_reports_enabled
+)
+from lms.djangoapps.instructor_task.models import InstructorTask, ReportStore
+from lms.djangoapps.instructor_task.subtasks import (
+    SubtaskStatus,
+    check_subtask_is_valid,
+    queue_subtasks_for_query,
+    update_subtask_status
 )
 from lms.djangoapps.teams.models import CourseTeamMembership
 from lms.djangoapps.verify_student.services import IDVerificationService
 from openedx.core.lib.cache_utils import get_cache
 from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
 from openedx.core.djangoapps.course_groups.cohorts import bulk_cache_cohorts, get_cohort, is_course_cohorted
+from openedx.core.djangoapps.course_groups.membership_index import get_membership_index
 from openedx.core.djangoapps.user_api.course_tag.api import BulkCourseTags
 from student.models import CourseEnrollment
 from student.roles import BulkRoleCache
@@ -45,7 +60,7 @@ from xmodule.partitions.partitions_service import PartitionService
 from xmodule.split_test_module import get_split_user_partitions
 
 from .runner import TaskProgress
-from .utils import upload_csv_to_report_store
+from .utils import ResumableReportUpload, upload_csv_to_report_store, upload_parts_to_report_store
 
 TASK_LOG = logging.getLogger('edx.celery.task')
 
@@ -218,9 +233,11 @@ class _CourseGradeReportContext(object):
             course_id=course_id,
             task_input=_task_input,
         )
+        self.entry_id = _entry_id
         self.action_name = action_name
         self.course_id = course_id
         self.task_progress = TaskProgress(self.action_name, total=None, start_time=time())
+        self.file_name = 'grade_report'
 
     @lazy
     def course(self):
@@ -242,6 +259,10 @@ class _CourseGradeReportContext(object):
     def cohorts_enabled(self):
         return is_course_cohorted(self.course_id)
 
+    @lazy
+    def batch_grades_enabled(self):
+        return batch_course_grade_report_grades_enabled()
+
     @lazy
     def graded_assignments(self):
         """
@@ -412,22 +433,43 @@ class CourseGradeReport(object):
         """
         with modulestore().bulk_operations(course_id):
             context = _CourseGradeReportContext(_xmodule_instance_args, _entry_id, course_id, _task_input, action_name)
+            if context.cohorts_enabled:
+                # Builds the cohort membership index once, for bulk_cache_cohorts
+                # to read the cohorts of each batch of users from.
+                get_membership_index(course_id)
+            if _entry_id is not None and parallel_grade_reports_enabled():
+                return _queue_grade_report_subtasks(cls, _xmodule_instance_args, context)
             return CourseGradeReport()._generate(context)
 
     def _generate(self, context):
         """
         Internal method for generating a grade report for the given context.
+
+        The rows of each batch of users are uploaded as soon as they are
+        computed, rather than held in memory until the end, and a retried
+        task resumes after the last batch uploaded by a previous attempt.
         """
         context.update_status(u'Starting grades')
         success_headers = self._success_headers(context)
         error_headers = self._error_headers()
-        batched_rows = self._batched_rows(context)
+        report_upload = ResumableReportUpload(context.entry_id, context.course_id)
 
         context.update_status(u'Compiling grades')
-        success_rows, error_rows = self._compile(context, batched_rows)
+        for users in self._batch_users(context, after_user_id=report_upload.last_batch_key):
+            users = [u for u in users if u is not None]
+            if not users:
+                continue
+            success_rows, error_rows = self._rows_for_users(context, users)
+            report_upload.add_batch(max(user.id for user in users), success_rows, error_rows)
+
+        # update metrics on task status
+        context.task_progress.succeeded = report_upload.succeeded
+        context.task_progress.failed = report_upload.failed
+        context.task_progress.attempted = context.task_progress.succeeded + context.task_progress.failed
+        context.task_progress.total = context.task_progress.attempted
 
         context.update_status(u'Uploading grades')
-        self._upload(context, success_headers, success_rows, error_headers, error_rows)
+        report_upload.upload(context.file_name, success_headers, error_headers, datetime.now(UTC))
 
         return context.update_status(u'Completed grades')
 
@@ -452,41 +494,6 @@ class CourseGradeReport(object):
         """
         return ["Student ID", "Username", "Error"]
 
-    def _batched_rows(self, context):
-        """
-        A generator of batches of (success_rows, error_rows) for this report.
-        """
-        for users in self._batch_users(context):
-            users = [u for u in users if u is not None]
-            yield self._rows_for_users(context, users)
-
-    def _compile(self, context, batched_rows):
-        """
-        Compiles and returns the complete list of (success_rows, error_rows) for
-        the given batched_rows and context.
-        """
-        # partition and chain successes and errors
-        success_rows, error_rows = zip(*batched_rows)
-        success_rows = list(chain(*success_rows))
-        error_rows = list(chain(*error_rows))
-
-        # update metrics on task status
-        context.task_progress.succeeded = len(success_rows)
-        context.task_progress.failed = len(error_rows)
-        context.task_progress.attempted = context.task_progress.succeeded + context.task_progress.failed
-        context.task_progress.total = context.task_progress.attempted
-        return success_rows, error_rows
-
-    def _upload(self, context, success_headers, success_rows, error_headers, error_rows):
-        """
-        Creates and uploads a CSV for the given headers and rows.
-        """
-        date = datetime.now(UTC)
-        upload_csv_to_report_store([success_headers] + success_rows, 'grade_report', context.course_id, date)
-        if len(error_rows) > 0:
-            error_rows = [error_headers] + error_rows
-            upload_csv_to_report_store(error_rows, 'grade_report_err', context.course_id, date)
-
     def _grades_header(self, context):
         """
         Returns the applicable grades-related headers for this report.
@@ -499,9 +506,10 @@ class CourseGradeReport(object):
             grades_header.append(assignment_info['average_header'])
         return grades_header
 
-    def _batch_users(self, context):
+    def _batch_users(self, context, after_user_id=None):
         """
-        Returns a generator of batches of users.
+        Returns a generator of batches of users, in order of user id,
+        starting after the user with the given id, if any.
         """
 
         def grouper(iterable, chunk_size=self.USER_BATCH_SIZE, fillvalue=None):
@@ -534,7 +542,9 @@ class CourseGradeReport(object):
                 include_inactive=True,
                 verified_only=verified_only,
             )
-            users = users.select_related('profile')
+            if after_user_id is not None:
+                users = users.filter(id__gt=after_user_id)
+            users = users.select_related('profile').order_by('id')
             return grouper(users)
 
         def users_for_course_v2(course_id, verified_only=False):
@@ -549,7 +559,10 @@ class CourseGradeReport(object):
             if verified_only:
                 filter_kwargs['courseenrollment__mode'] = CourseMode.VERIFIED
 
-            user_ids_list = get_user_model().objects.filter(**filter_kwargs).values_list('id', flat=True).order_by('id')
+            user_ids_list = get_user_model().objects.filter(**filter_kwargs)
+            if after_user_id is not None:
+                user_ids_list = user_ids_list.filter(id__gt=after_user_id)
+            user_ids_list = user_ids_list.values_list('id', flat=True).order_by('id')
             user_chunks = grouper(user_ids_list)
             for user_ids in user_chunks:
                 user_ids = [user_id for user_id in user_ids if user_id is not None]
@@ -559,7 +572,7 @@ class CourseGradeReport(object):
                     id__gte=min_id,
                     id__lte=max_id,
                     **filter_kwargs
-                ).select_related('profile')
+                ).select_related('profile').order_by('id')
                 yield users
 
         course_id = context.course_id
@@ -586,6 +599,54 @@ class CourseGradeReport(object):
 
         return [course_grade.percent] + _flatten(grade_results)
 
+    def _batched_user_grades(self, context, users):
+        """
+        Returns a dict mapping the ids of those of the given users whose
+        subsection grades are read from storage to their grade results,
+        corresponding to the headers for this report, save for the course
+        grade percent.
+
+        Rather than building the subsection grades of each user, the grading
+        policy is applied to a SubsectionGradeMatrix of all the users at once,
+        yielding the same results as _user_grades.
+        """
+        subsection_keys = [
+            subsection_location
+            for assignment_info in six.itervalues(context.graded_assignments)
+            for subsection_location in assignment_info['subsection_headers']
+        ]
+        grade_matrix = SubsectionGradeMatrix.read(context.course_id, users, subsection_keys)
+        if grade_matrix is None:
+            return {}
+
+        percents = grade_matrix.percent_graded.tolist()
+        shown = (grade_matrix.attempted_graded | grade_matrix.overridden).tolist()
+        attempted = grade_matrix.attempted.tolist()
+
+        grade_columns = []
+        first_column = 0
+        for assignment_info in six.itervalues(context.graded_assignments):
+            columns = list(range(first_column, first_column + len(assignment_info['subsection_headers'])))
+            first_column += len(columns)
+            for column in columns:
+                grade_columns.append([
+                    row_percents[column] if row_shown[column] else u'Not Attempted'
+                    for row_percents, row_shown in zip(percents, shown)
+                ])
+
+            if assignment_info['separate_subsection_avg_headers'] and assignment_info['grader']:
+                averages = grade_matrix.total_with_drops(columns, assignment_info['grader'].drop_count).tolist()
+                grade_columns.append([
+                    average if row_attempted else 0.0
+                    for average, row_attempted in zip(averages, attempted)
+                ])
+
+        grade_rows = zip(*grade_columns) if grade_columns else [()] * len(grade_matrix)
+        return {
+            user_id: list(grade_results)
+            for user_id, grade_results in zip(grade_matrix.user_ids, grade_rows)
+        }
+
     def _user_subsection_grades(self, course_grade, subsection_headers):
         """
         Returns a list of grade results for the given course_grade corresponding
@@ -680,6 +741,7 @@ class CourseGradeReport(object):
         """
         with modulestore().bulk_operations(context.course_id):
             bulk_context = _CourseGradeBulkContext(context, users)
+            batched_user_grades = self._batched_user_grades(context, users) if context.batch_grades_enabled else {}
 
             success_rows, error_rows = [], []
             for user, course_grade, error in CourseGradeFactory().iter(
@@ -692,9 +754,13 @@ class CourseGradeReport(object):
                     # An empty gradeset means we failed to grade a student.
                     error_rows.append([user.id, user.username, text_type(error)])
                 else:
+                    if user.id in batched_user_grades:
+                        user_grades = [course_grade.percent] + batched_user_grades[user.id]
+                    else:
+                        user_grades = self._user_grades(course_grade, context)
                     success_rows.append(
                         [user.id, user.email, user.username] +
-                        self._user_grades(course_grade, context) +
+                        user_grades +
                         self._user_cohort_group_names(user, context) +
                         self._user_experiment_group_names(user, context) +
                         self._user_team_names(user, bulk_context.teams) +
@@ -717,6 +783,8 @@ class ProblemGradeReport(GradeReportBase):
         """
         with modulestore().bulk_operations(course_id):
             context = _ProblemGradeReportContext(_xmodule_instance_args, _entry_id, course_id, _task_input, action_name)
+            if _entry_id is not None and parallel_grade_reports_enabled():
+                return _queue_grade_report_subtasks(cls, _xmodule_instance_args, context)
             # pylint: disable=protected-access
             return ProblemGradeReport()._generate(context)
 
@@ -817,6 +885,202 @@ class ProblemGradeReport(GradeReportBase):
             get_cache(CourseEnrollment.MODE_CACHE_NAMESPACE).clear()
 
 
+# Grade reports that can be generated by subtasks, along with their contexts.
+_PARALLEL_GRADE_REPORTS = {
+    report_class.__name__: (report_class, context_class)
+    for report_class, context_class in [
+        (CourseGradeReport, _CourseGradeReportContext),
+        (ProblemGradeReport, _ProblemGradeReportContext),
+    ]
+}
+
+
+def _queue_grade_report_subtasks(report_class, xmodule_instance_args, context):
+    """
+    Queues subtasks that each generate the rows of the given report for a part
+    of the enrolled learners, no more than settings.GRADE_REPORT_USERS_PER_SUBTASK
+    in size, so that the learners are graded in parallel by as many workers as
+    are available.  The last subtask to complete uploads the report, with the
+    rows of the parts in order of user id.
+
+    The report is generated by the current task instead if the course has no
+    enrolled learners.
+    """
+    entry = InstructorTask.objects.get(pk=context.entry_id)
+
+    # Check to see if subtasks have already been defined, in case the current
+    # task was requeued, and if so return the progress made by the subtasks.
+    if len(entry.subtasks) > 0 and len(entry.task_output) > 0:
+        TASK_LOG.warning(u'%s, Grade report subtasks have already been queued', context.task_info_string)
+        return json.loads(entry.task_output)
+
+    filter_kwargs = {
+        'courseenrollment__course_id': context.course_id,
+    }
+    if generate_grade_report_for_verified_only():
+        filter_kwargs['courseenrollment__mode'] = CourseMode.VERIFIED
+    users = get_user_model().objects.filter(**filter_kwargs).order_by('id')
+
+    total_num_users = users.count()
+    if total_num_users == 0:
+        return report_class()._generate(context)  # pylint: disable=protected-access
+
+    part_indices = count()
+
+    def _create_grade_report_part_subtask(user_list, initial_subtask_status):
+        """Creates a subtask to generate the rows of a given list of users."""
+        return generate_grade_report_part.subtask(
+            (
+                context.entry_id,
+                report_class.__name__,
+                xmodule_instance_args,
+                [user['pk'] for user in user_list],
+                next(part_indices),
+                initial_subtask_status.to_dict(),
+            ),
+            task_id=initial_subtask_status.task_id,
+            routing_key=settings.GRADES_DOWNLOAD_ROUTING_KEY,
+        )
+
+    return queue_subtasks_for_query(
+        entry,
+        context.action_name,
+        _create_grade_report_part_subtask,
+        [users],
+        [],
+        settings.GRADE_REPORT_USERS_PER_SUBTASK,
+        total_num_users,
+    )
+
+
+@task(routing_key=settings.GRADES_DOWNLOAD_ROUTING_KEY)
+def generate_grade_report_part(entry_id, report_class_name, xmodule_instance_args, user_ids, part_index,
+                               subtask_status_dict):
+    """
+    Generates the rows of a grade report for a list of users, and stores them
+    as the part of the report with the given index.  If this completes the last
+    of the report's subtasks, the parts are uploaded as the report.
+
+    Inputs are:
+      * `entry_id`: id of the InstructorTask object to which progress should be recorded.
+      * `report_class_name`: name of the class of the report, i.e. CourseGradeReport
+        or ProblemGradeReport.
+      * `xmodule_instance_args`: the arguments of the parent task.
+      * `user_ids`: ids of the users, in increasing order.
+      * `part_index`: index of the part of the report, in order of user id.
+      * `subtask_status_dict`: dict containing values representing current status.
+    """
+    subtask_status = SubtaskStatus.from_dict(subtask_status_dict)
+    current_task_id = subtask_status.task_id
+    check_subtask_is_valid(entry_id, current_task_id, subtask_status)
+
+    entry = InstructorTask.objects.get(pk=entry_id)
+    report_class, context_class = _PARALLEL_GRADE_REPORTS[report_class_name]
+    report_store = ReportStore.from_config('GRADES_DOWNLOAD')
+    with modulestore().bulk_operations(entry.course_id):
+        context = context_class(
+            xmodule_instance_args,
+            entry_id,
+            entry.course_id,
+            json.loads(entry.task_input),
+            json.loads(entry.task_output)['action_name'],
+        )
+        report = report_class()
+
+        generate_exception = None
+        success_rows, error_rows = [], []
+        try:
+            success_rows, error_rows = _grade_report_part_rows(report, context, user_ids)
+        except Exception as exception:  # pylint: disable=broad-except
+            # Count all of the users as failed, so that the report can still
+            # be uploaded once the other subtasks complete.
+            TASK_LOG.exception(u'%s, Grade report subtask %s failed', context.task_info_string, current_task_id)
+            generate_exception = exception
+            subtask_status.increment(failed=len(user_ids), state=FAILURE)
+        else:
+            subtask_status.increment(succeeded=len(success_rows), failed=len(error_rows), state=SUCCESS)
+
+        report_store.store_rows_part(entry.course_id, entry.task_id, part_index, success_rows)
+        report_store.store_rows_part(entry.course_id, entry.task_id + '_err', part_index, error_rows)
+        if update_subtask_status(entry_id, current_task_id, subtask_status):
+            try:
+                _upload_grade_report_parts(report, context)
+            except Exception as exception:  # pylint: disable=broad-except
+                # The task was marked as succeeded along with its last subtask,
+                # so mark it as failed, since it has no report.
+                TASK_LOG.exception(u'%s, Grade report upload failed', context.task_info_string)
+                _fail_grade_report_upload(context, exception)
+                if generate_exception is None:
+                    generate_exception = exception
+
+    if generate_exception is not None:
+        raise generate_exception  # pylint: disable=raising-bad-type
+
+    return subtask_status.to_dict()
+
+
+def _grade_report_part_rows(report, context, user_ids):
+    """
+    Returns the (success_rows, error_rows) of the given report for the users
+    with the given ids, graded in batches.
+    """
+    success_rows, error_rows = [], []
+    for start in range(0, len(user_ids), CourseGradeReport.USER_BATCH_SIZE):
+        users = list(get_user_model().objects.filter(
+            id__in=user_ids[start:start + CourseGradeReport.USER_BATCH_SIZE],
+        ).select_related('profile').order_by('id'))
+        batch_success_rows, batch_error_rows = report._rows_for_users(context, users)  # pylint: disable=protected-access
+        success_rows.extend(batch_success_rows)
+        error_rows.extend(batch_error_rows)
+        # Clear the CourseEnrollment caches after each batch of users has been processed
+        get_cache('get_enrollment').clear()
+        get_cache(CourseEnrollment.MODE_CACHE_NAMESPACE).clear()
+    return success_rows, error_rows
+
+
+def _upload_grade_report_parts(report, context):
+    """
+    Uploads the parts stored by the subtasks of the given report, and, if any
+    learner failed to be graded, the parts of its error report.
+    """
+    entry = InstructorTask.objects.get(pk=context.entry_id)
+    task_progress = json.loads(entry.task_output)
+    part_indices = range(json.loads(entry.subtasks)['total'])
+    date = datetime.now(UTC)
+    # pylint: disable=protected-access
+    upload_parts_to_report_store(
+        [report._success_headers(context)], entry.task_id, part_indices, context.file_name, context.course_id, date,
+    )
+    if task_progress['failed'] > 0:
+        upload_parts_to_report_store(
+            [report._error_headers()], entry.task_id + '_err', part_indices, context.file_name + '_err',
+            context.course_id, date,
+        )
+    else:
+        ReportStore.from_config('GRADES_DOWNLOAD').delete_parts(context.course_id, entry.task_id + '_err', part_indices)
+    TASK_LOG.info(u'%s, Uploaded grade report from %d parts', context.task_info_string, len(part_indices))
+
+
+def _fail_grade_report_upload(context, exception):
+    """
+    Marks the task of the given report as failed with the given exception, and
+    deletes the parts stored by its subtasks.
+    """
+    entry = InstructorTask.objects.get(pk=context.entry_id)
+    part_indices = range(json.loads(entry.subtasks)['total'])
+    report_store = ReportStore.from_config('GRADES_DOWNLOAD')
+    for parts_name in (entry.task_id, entry.task_id + '_err'):
+        try:
+            report_store.delete_parts(context.course_id, parts_name, part_indices)
+        except Exception:  # pylint: disable=broad-except
+            TASK_LOG.exception(u'%s, Unable to delete the grade report parts %s', context.task_info_string, parts_name)
+
+    InstructorTask.objects.filter(pk=context.entry_id).update(
+        task_state=FAILURE,
+        task_output=InstructorTask.create_output_for_failure(exception, traceback.format_exc()),
+    )
+
+
 class ProblemResponses(object):
     """
     Class to encapsulate functionality related to generating Problem Responses Reports.
@@ -5,6 +5,7 @@ Instructor Tasks related to module state.
 
 import json
 import logging
+from collections import defaultdict
 from time import time
 
 import six
@@ -31,8 +32,12 @@ from .utils import UNKNOWN_TASK_ID, UPDATE_STATUS_FAILED, UPDATE_STATUS_SKIPPED,
 
 TASK_LOG = logging.getLogger('edx.celery.task')
 
+# Number of student modules whose field data is loaded at once, when loaded in bulk.
+FIELD_DATA_BATCH_SIZE = 100
 
-def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, task_input, action_name):
+
+def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, task_input, action_name,
+                                bulk_load_field_data=False):
     """
     Performs generic update by visiting StudentModule instances with the update_fcn provided.
 
@@ -44,6 +49,10 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     on the particular student module failed.
     A raised exception indicates a fatal condition -- that no other student modules should be considered.
 
+    If `bulk_load_field_data` is True, the field data of the students of each batch of student modules
+    is loaded at once, and the FieldDataCache of each student module is passed to `update_fcn` as its
+    `field_data_cache` keyword argument.
+
     The return value is a dict containing the task's results, with the following keys:
 
           'attempted': number of attempts made
@@ -89,12 +98,21 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     task_progress = TaskProgress(action_name, len(modules_to_update), start_time)
     task_progress.update_task_state()
 
-    for module_to_update in modules_to_update:
+    for index, module_to_update in enumerate(modules_to_update):
         task_progress.attempted += 1
         module_descriptor = problems[six.text_type(module_to_update.module_state_key)]
+        update_kwargs = {}
+        if bulk_load_field_data:
+            if index % FIELD_DATA_BATCH_SIZE == 0:
+                field_data_caches = _bulk_load_field_data_caches(
+                    course_id, modules_to_update[index:index + FIELD_DATA_BATCH_SIZE], problems,
+                )
+            update_kwargs['field_data_cache'] = field_data_caches[
+                (six.text_type(module_to_update.module_state_key), module_to_update.student_id)
+            ]
         # There is no try here:  if there's an error, we let it throw, and the task will
         # be marked as FAILED, with a stack trace.
-        update_status = update_fcn(module_descriptor, module_to_update, task_input)
+        update_status = update_fcn(module_descriptor, module_to_update, task_input, **update_kwargs)
         if update_status == UPDATE_STATUS_SUCCEEDED:
             # If the update_fcn returns true, then it performed some kind of work.
             # Logging of failures is left to the update_fcn itself.
@@ -110,10 +128,12 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
 
 
 @outer_atomic
-def rescore_problem_module_state(xmodule_instance_args, module_descriptor, student_module, task_input):
+def rescore_problem_module_state(xmodule_instance_args, module_descriptor, student_module, task_input,
+                                 field_data_cache=None):
     '''
     Takes an XModule descriptor and a corresponding StudentModule object, and
-    performs rescoring on the student's problem submission.
+    performs rescoring on the student's problem submission.  The student's field
+    data is read from `field_data_cache`, if provided.
 
     Throws exceptions if the rescoring is fatal and should be aborted if in a loop.
     In particular, raises UpdateProblemModuleStateError if module fails to instantiate,
@@ -138,7 +158,8 @@ def rescore_problem_module_state(xmodule_instance_args, module_descriptor, stude
             module_descriptor,
             xmodule_instance_args,
             grade_bucket_type='rescore',
-            course=course
+            course=course,
+            field_data_cache=field_data_cache,
         )
 
         if instance is None:
@@ -197,10 +218,12 @@ def rescore_problem_module_state(xmodule_instance_args, module_descriptor, stude
 
 
 @outer_atomic
-def override_score_module_state(xmodule_instance_args, module_descriptor, student_module, task_input):
+def override_score_module_state(xmodule_instance_args, module_descriptor, student_module, task_input,
+                                field_data_cache=None):
     '''
     Takes an XModule descriptor and a corresponding StudentModule object, and
-    performs an override on the student's problem score.
+    performs an override on the student's problem score.  The student's field
+    data is read from `field_data_cache`, if provided.
 
     Throws exceptions if the override is fatal and should be aborted if in a loop.
     In particular, raises UpdateProblemModuleStateError if module fails to instantiate,
@@ -223,7 +246,8 @@ def override_score_module_state(xmodule_instance_args, module_descriptor, studen
             student,
             module_descriptor,
             xmodule_instance_args,
-            course=course
+            course=course,
+            field_data_cache=field_data_cache,
         )
 
         if instance is None:
@@ -319,16 +343,19 @@ def delete_problem_module_state(xmodule_instance_args, _module_descriptor, stude
 
 
 def _get_module_instance_for_task(course_id, student, module_descriptor, xmodule_instance_args=None,
-                                  grade_bucket_type=None, course=None):
+                                  grade_bucket_type=None, course=None, field_data_cache=None):
     """
     Fetches a StudentModule instance for a given `course_id`, `student` object, and `module_descriptor`.
 
     `xmodule_instance_args` is used to provide information for creating a track function and an XQueue callback.
     These are passed, along with `grade_bucket_type`, to get_module_for_descriptor_internal, which sidesteps
     the need for a Request object when instantiating an xmodule instance.
+
+    The student's field data is loaded unless an already loaded `field_data_cache` is provided.
     """
     # reconstitute the problem's corresponding XModule:
-    field_data_cache = FieldDataCache.cache_for_descriptor_descendents(course_id, student, module_descriptor)
+    if field_data_cache is None:
+        field_data_cache = FieldDataCache.cache_for_descriptor_descendents(course_id, student, module_descriptor)
     student_data = KvsFieldData(DjangoKeyValueStore(field_data_cache))
 
     # get request-related tracking information from args passthrough, and supplement with task-specific
@@ -364,6 +391,28 @@ def _get_module_instance_for_task(course_id, student, module_descriptor, xmodule
     )
 
 
+def _bulk_load_field_data_caches(course_id, student_modules, problems):
+    """
+    Returns a dict mapping the (usage key string, student id) of each of the given
+    `student_modules` to the FieldDataCache of its student for its problem, as
+    `_get_module_instance_for_task` would load it, with the field data of the students
+    of each problem loaded at once.
+    """
+    students_by_problem = defaultdict(dict)
+    for student_module in student_modules:
+        students_by_problem[six.text_type(student_module.module_state_key)][student_module.student_id] = \
+            student_module.student
+
+    field_data_caches = {}
+    for usage_key_string, students in six.iteritems(students_by_problem):
+        caches = FieldDataCache.bulk_cache_for_descriptor_descendents(
+            course_id, list(students.values()), problems[usage_key_string],
+        )
+        for student_id, cache in six.iteritems(caches):
+            field_data_caches[(usage_key_string, student_id)] = cache
+    return field_data_caches
+
+
 def _get_track_function_for_task(student, xmodule_instance_args=None, source_page='x_module_task'):
     """
     Make a tracking function that logs what happened.
@@ -420,7 +469,7 @@ def _get_modules_to_update(course_id, usage_keys, student_identifier, filter_fcn
     if student:
         module_query_params['student_id'] = student.id
 
-    student_modules = StudentModule.get_state_by_params(**module_query_params)
+    student_modules = StudentModule.get_state_by_params(**module_query_params).select_related('student')
     if filter_fcn is not None:
         student_modules = filter_fcn(student_modules)
 
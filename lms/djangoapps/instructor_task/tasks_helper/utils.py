@@ -3,9 +3,12 @@ Utility methods for instructor tasks
 """
 
 
+import json
+from uuid import uuid4
+
 from eventtracking import tracker
 
-from lms.djangoapps.instructor_task.models import ReportStore
+from lms.djangoapps.instructor_task.models import InstructorTask, ReportStore
 from util.file import course_filename_prefix_generator
 
 REPORT_REQUESTED_EVENT_NAME = u'edx.instructor.report.requested'
@@ -37,15 +40,143 @@ def upload_csv_to_report_store(rows, csv_name, course_id, timestamp, config_name
         report_name: string - Name of the generated report
     """
     report_store = ReportStore.from_config(config_name)
-    report_name = u"{course_prefix}_{csv_name}_{timestamp_str}.csv".format(
+    report_name = _report_name(csv_name, course_id, timestamp)
+
+    report_store.store_rows(course_id, report_name, rows)
+    tracker_emit(csv_name)
+    return report_name
+
+
+def upload_parts_to_report_store(header_rows, parts_name, part_indices, csv_name, course_id, timestamp,
+                                 config_name='GRADES_DOWNLOAD'):
+    """
+    Upload a CSV of the given header rows followed by the rows of the parts
+    with the given indices, previously stored with `store_rows_part`, using
+    a `ReportStore`.  The parts are deleted once uploaded.
+
+    Arguments:
+        header_rows: list of lists, written before the rows of the parts
+        parts_name: name of the set of parts
+        part_indices: indices of the parts, in the order their rows are written
+        csv_name: name of the resulting CSV
+        course_id: ID of the course
+
+    Returns:
+        report_name: string - Name of the generated report
+    """
+    report_store = ReportStore.from_config(config_name)
+    report_name = _report_name(csv_name, course_id, timestamp)
+
+    report_store.store_parts(course_id, report_name, header_rows, parts_name, part_indices)
+    tracker_emit(csv_name)
+    return report_name
+
+
+def _report_name(csv_name, course_id, timestamp):
+    """
+    Returns the name of the CSV report with the given name, for the given
+    course and timestamp.
+    """
+    return u"{course_prefix}_{csv_name}_{timestamp_str}.csv".format(
         course_prefix=course_filename_prefix_generator(course_id),
         csv_name=csv_name,
         timestamp_str=timestamp.strftime("%Y-%m-%d-%H%M")
     )
 
-    report_store.store_rows(course_id, report_name, rows)
-    tracker_emit(csv_name)
-    return report_name
+
+class ResumableReportUpload(object):
+    """
+    Uploads the rows of a CSV report, along with those of its error report,
+    to the ReportStore in parts, as each batch of rows is completed, rather
+    than accumulating all rows in memory.
+
+    The progress of the upload is checkpointed on the report's InstructorTask
+    entry, if any, after each batch, so that a retried task resumes after the
+    last completed batch instead of starting over.  Batches must therefore be
+    added in the order of their keys, e.g. the largest user id in each batch.
+    """
+    def __init__(self, entry_id, course_id, config_name='GRADES_DOWNLOAD'):
+        self.entry_id = entry_id
+        self.course_id = course_id
+        self.config_name = config_name
+        self.report_store = ReportStore.from_config(config_name)
+
+        checkpoint = {}
+        if entry_id is not None:
+            saved_checkpoint = InstructorTask.objects.get(pk=entry_id).checkpoint
+            if saved_checkpoint:
+                checkpoint = json.loads(saved_checkpoint)
+
+        self.parts_name = checkpoint.get('parts_name', uuid4().hex)
+        # The key of the last completed batch, or None if none was completed.
+        self.last_batch_key = checkpoint.get('last_batch_key')
+        self.part_count = checkpoint.get('part_count', 0)
+        self.error_part_indices = checkpoint.get('error_part_indices', [])
+        self.succeeded = checkpoint.get('succeeded', 0)
+        self.failed = checkpoint.get('failed', 0)
+
+    def add_batch(self, batch_key, success_rows, error_rows):
+        """
+        Uploads the rows of the batch with the given key and checkpoints it
+        as completed.
+        """
+        part_index = self.part_count
+        self.report_store.store_rows_part(self.course_id, self.parts_name, part_index, success_rows)
+        if error_rows:
+            self.report_store.store_rows_part(self.course_id, self._error_parts_name, part_index, error_rows)
+            self.error_part_indices.append(part_index)
+        else:
+            # Deletes any error part stored by an attempt that failed before
+            # completing this batch.
+            self.report_store.delete_parts(self.course_id, self._error_parts_name, [part_index])
+
+        self.last_batch_key = batch_key
+        self.part_count += 1
+        self.succeeded += len(success_rows)
+        self.failed += len(error_rows)
+        self._save_checkpoint()
+
+    def upload(self, csv_name, success_headers, error_headers, timestamp):
+        """
+        Assembles the uploaded parts into the report, and, if any batch had
+        errors, the error report, then deletes any remaining error part and
+        clears the checkpoint.
+        """
+        upload_parts_to_report_store(
+            [success_headers], self.parts_name, range(self.part_count), csv_name, self.course_id, timestamp,
+            config_name=self.config_name,
+        )
+        if self.error_part_indices:
+            upload_parts_to_report_store(
+                [error_headers], self._error_parts_name, self.error_part_indices, csv_name + '_err', self.course_id,
+                timestamp, config_name=self.config_name,
+            )
+        # An attempt that failed before completing a batch may have stored an
+        # error part for it, including one past the last completed batch.
+        self.report_store.delete_parts(self.course_id, self._error_parts_name, range(self.part_count + 1))
+
+        if self.entry_id is not None:
+            InstructorTask.objects.filter(pk=self.entry_id).update(checkpoint='')
+
+    @property
+    def _error_parts_name(self):
+        return self.parts_name + '_err'
+
+    def _save_checkpoint(self):
+        """
+        Saves the progress of the upload on the InstructorTask entry.
+        """
+        if self.entry_id is None:
+            return
+
+        InstructorTask.objects.filter(pk=self.entry_id).update(checkpoint=json.dumps({
+            'parts_name': self.parts_name,
+            'last_batch_key': self.last_batch_key,
+            'part_count': self.part_count,
+            'error_part_indices': self.error_part_indices,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+        }))
 
 
 def tracker_emit(report_name):
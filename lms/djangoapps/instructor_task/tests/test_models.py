@@ -69,6 +69,23 @@ class ReportStoreTestMixin(object):
             ['new_file', 'middle_file', 'old_file']
         )
 
+    def test_store_parts(self):
+        """
+        Test that ReportStore.store_parts() stores the header rows followed
+        by the rows of the given parts, in order, and deletes the parts.
+        """
+        report_store = self.create_report_store()
+        report_store.store_rows_part(self.course_id, 'parts', 1, [[u'b', u'2']])
+        report_store.store_rows_part(self.course_id, 'parts', 0, [[u'ä', u'0'], [u'c', u'1']])
+        report_store.store_rows_part(self.course_id, 'parts', 1, [[u'd', u'3']])
+        report_store.store_parts(self.course_id, 'report.csv', [[u'name', u'value']], 'parts', [0, 1])
+
+        self.assertEqual([link[0] for link in report_store.links_for(self.course_id)], ['report.csv'])
+        with report_store.storage.open(report_store.path_to(self.course_id, 'report.csv')) as report_file:
+            csv_data = report_file.read().decode('utf-8-sig')
+        self.assertEqual(csv_data.splitlines(), [u'name,value', u'ä,0', u'c,1', u'd,3'])
+        self.assertFalse(report_store.storage.exists(report_store._part_path(self.course_id, 'parts', 0)))  # pylint: disable=protected-access
+
 
 class LocalFSReportStoreTestCase(ReportStoreTestMixin, TestReportMixin, SimpleTestCase):
     """
@@ -16,6 +16,7 @@ from django.utils.translation import ugettext_noop
 from mock import MagicMock, Mock, patch
 from opaque_keys.edx.keys import i4xEncoder
 from six.moves import range
+from xblock.fields import Scope
 
 from course_modes.models import CourseMode
 from lms.djangoapps.courseware.models import StudentModule
@@ -491,6 +492,37 @@ class TestRescoreInstructorTask(TestInstructorTasks):
             action_name='rescored'
         )
 
+    def test_rescoring_bulk_loads_field_data(self):
+        """
+        Tests that rescoring a problem for all students loads the field data
+        of the students at once, and provides each student's own data.
+        """
+        mock_instance = MagicMock()
+        mock_instance.has_submitted_answer.return_value = True
+
+        num_students = 10
+        students = self._create_students_with_state(num_students, json.dumps({'attempts': 1}))
+        task_entry = self._create_input_entry()
+        with patch(
+            'lms.djangoapps.instructor_task.tasks_helper.module_state.get_module_for_descriptor_internal'
+        ) as mock_get_module:
+            mock_get_module.return_value = mock_instance
+            with patch(
+                'lms.djangoapps.instructor_task.tasks_helper.module_state.FieldDataCache.cache_for_descriptor_descendents'
+            ) as mock_cache_for_descriptor_descendents:
+                self._run_task_with_mock_celery(rescore_problem, task_entry.id, task_entry.task_id)
+
+        mock_cache_for_descriptor_descendents.assert_not_called()
+        self.assertEqual(mock_get_module.call_count, num_students)
+        for call in mock_get_module.call_args_list:
+            field_data_cache = call[1]['student_data']._kvs._field_data_cache  # pylint: disable=protected-access
+            self.assertEqual(field_data_cache.user, call[1]['user'])
+            self.assertEqual(len(field_data_cache.cache[Scope.user_state]), 1)
+        self.assertEqual(
+            set(call[1]['user'].id for call in mock_get_module.call_args_list),
+            set(student.id for student in students),
+        )
+
 
 class TestResetAttemptsInstructorTask(TestInstructorTasks):
     """Tests instructor task that resets problem attempts."""
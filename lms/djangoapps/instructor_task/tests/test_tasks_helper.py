@@ -9,14 +9,17 @@ Unit tests for LMS instructor-initiated background tasks helper functions.
 """
 
 
+import json
 import os
 import shutil
 import tempfile
 from contextlib import contextmanager
 from datetime import datetime, timedelta
+from uuid import uuid4
 
 import ddt
 import unicodecsv
+from celery.states import FAILURE, SUCCESS
 from django.conf import settings
 from django.test.utils import override_settings
 from django.urls import reverse
@@ -37,7 +40,12 @@ from lms.djangoapps.certificates.models import CertificateStatuses, GeneratedCer
 from lms.djangoapps.certificates.tests.factories import CertificateWhitelistFactory, GeneratedCertificateFactory
 from lms.djangoapps.courseware.tests.factories import InstructorFactory
 from lms.djangoapps.grades.course_data import CourseData
-from lms.djangoapps.grades.models import PersistentCourseGrade, PersistentSubsectionGradeOverride
+from lms.djangoapps.grades.course_grade import CourseGrade
+from lms.djangoapps.grades.models import (
+    PersistentCourseGrade,
+    PersistentSubsectionGrade,
+    PersistentSubsectionGradeOverride
+)
 from lms.djangoapps.grades.subsection_grade import CreateSubsectionGrade
 from lms.djangoapps.grades.transformer import GradesTransformer
 from lms.djangoapps.instructor_analytics.basic import UNAVAILABLE, list_problem_responses
@@ -60,6 +68,7 @@ from lms.djangoapps.instructor_task.tasks_helper.misc import (
     upload_course_survey_report,
     upload_ora2_data
 )
+from lms.djangoapps.instructor_task.tests.factories import InstructorTaskFactory
 from lms.djangoapps.instructor_task.tests.test_base import (
     InstructorTaskCourseTestCase,
     InstructorTaskModuleTestCase,
@@ -90,15 +99,21 @@ from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory, check_mongo_calls
 from xmodule.partitions.partitions import Group, UserPartition
 
-from ..config.waffle import GENERATE_GRADE_REPORT_VERIFIED_ONLY
-from ..models import ReportStore
-from ..tasks_helper.utils import UPDATE_STATUS_FAILED, UPDATE_STATUS_SUCCEEDED
+from ..config.waffle import (
+    BATCH_COURSE_GRADE_REPORT_GRADES,
+    GENERATE_GRADE_REPORT_VERIFIED_ONLY,
+    PARALLEL_GRADE_REPORTS
+)
+from ..models import InstructorTask, ReportStore
+from ..tasks_helper.utils import UPDATE_STATUS_FAILED, UPDATE_STATUS_SUCCEEDED, ResumableReportUpload
 
 _TEAMS_CONFIG = TeamsConfig({
     'max_size': 2,
     'topics': [{'id': 'topic', 'name': 'Topic', 'description': 'A Topic'}],
 })
 SWITCH_GENERATE_GRADE_REPORT_VERIFIED_ONLY = '.'.join(['instructor_task', GENERATE_GRADE_REPORT_VERIFIED_ONLY])
+SWITCH_BATCH_COURSE_GRADE_REPORT_GRADES = '.'.join(['instructor_task', BATCH_COURSE_GRADE_REPORT_GRADES])
+SWITCH_PARALLEL_GRADE_REPORTS = '.'.join(['instructor_task', PARALLEL_GRADE_REPORTS])
 
 
 class InstructorGradeReportTestCase(TestReportMixin, InstructorTaskCourseTestCase):
@@ -420,7 +435,7 @@ class TestInstructorGradeReport(InstructorGradeReportTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        expected_query_count = 45
+        expected_query_count = 46
         with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
             with check_mongo_calls(mongo_count):
                 with self.assertNumQueries(expected_query_count):
@@ -485,6 +500,246 @@ class TestTeamGradeReport(InstructorGradeReportTestCase):
 
 
 # pylint: disable=protected-access
+@ddt.ddt
+@patch.dict(settings.FEATURES, {'PERSISTENT_GRADES_ENABLED_FOR_ALL_TESTS': True})
+class TestBatchedCourseGradeReport(TestReportMixin, InstructorTaskModuleTestCase):
+    """
+    Tests that grades computed for a batch of learners at once are reported
+    identically to those computed one learner at a time.
+    """
+    def setUp(self):
+        super(TestBatchedCourseGradeReport, self).setUp()
+        self.initialize_course()
+        self.second_section = ItemFactory.create(
+            parent_location=self.chapter.location,
+            category='sequential',
+            metadata={'graded': True, 'format': 'Homework'},
+            display_name=u'Second Subsection',
+        )
+        self.define_option_problem(u'Problem1', parent=self.problem_section)
+        self.define_option_problem(u'Problem2', parent=self.second_section)
+        self.students = [self.create_student(u'student_{}'.format(index)) for index in range(3)]
+
+    def _generate_report_rows(self):
+        """
+        Generates a course grade report and returns its rows.
+        """
+        with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
+            CourseGradeReport.generate(None, None, self.course.id, None, 'graded')
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        report_path = report_store.path_to(self.course.id, report_store.links_for(self.course.id)[0][0])
+        with report_store.storage.open(report_path) as csv_file:
+            return list(unicodecsv.reader(csv_file, encoding='utf-8-sig'))
+
+    def test_batched_grades(self):
+        self.submit_student_answer(self.students[0].username, u'Problem1', ['Option 1'])
+        self.submit_student_answer(self.students[0].username, u'Problem2', ['Option 2'])
+        self.submit_student_answer(self.students[1].username, u'Problem2', ['Option 1'])
+        expected_rows = self._generate_report_rows()
+
+        with override_switch(SWITCH_BATCH_COURSE_GRADE_REPORT_GRADES, True):
+            with patch.object(CourseGradeReport, '_user_grades', wraps=CourseGradeReport()._user_grades) as user_grades:
+                self.assertEqual(self._generate_report_rows(), expected_rows)
+
+        # Only the learner without a persisted course grade is graded individually.
+        self.assertEqual(user_grades.call_count, 1)
+
+    @ddt.data(True, False)
+    def test_batched_grades_with_missing_subsection_grade(self, assume_zero_if_absent):
+        with patch.dict(settings.FEATURES, {'ASSUME_ZERO_GRADE_IF_ABSENT_FOR_ALL_TESTS': assume_zero_if_absent}):
+            self.submit_student_answer(self.students[0].username, u'Problem1', ['Option 1'])
+            self.submit_student_answer(self.students[0].username, u'Problem2', ['Option 1'])
+            self.submit_student_answer(self.students[1].username, u'Problem1', ['Option 1'])
+            # As when content is moved to a new subsection after the grades were persisted.
+            PersistentSubsectionGrade.objects.filter(
+                user_id=self.students[0].id,
+                usage_key=self.second_section.location,
+            ).delete()
+            expected_rows = self._generate_report_rows()
+
+            with override_switch(SWITCH_BATCH_COURSE_GRADE_REPORT_GRADES, True):
+                with patch.object(
+                    CourseGradeReport, '_user_grades', wraps=CourseGradeReport()._user_grades
+                ) as user_grades:
+                    self.assertEqual(self._generate_report_rows(), expected_rows)
+
+        # Unless absent grades are assumed to be zero, the learner without a
+        # persisted course grade and the one missing a persisted subsection
+        # grade are graded individually.
+        self.assertEqual(user_grades.call_count, 0 if assume_zero_if_absent else 2)
+
+    def test_batched_grades_without_subsection_grades(self):
+        for student in self.students:
+            self.submit_student_answer(student.username, u'Problem1', ['Option 1'])
+        self.submit_student_answer(self.students[0].username, u'Problem2', ['Option 2'])
+        expected_rows = self._generate_report_rows()
+
+        # The subsection grades of the learners are not built, as they are
+        # read from storage all at once.
+        with override_switch(SWITCH_BATCH_COURSE_GRADE_REPORT_GRADES, True):
+            with patch.object(CourseGrade, '_get_subsection_grade') as get_subsection_grade:
+                self.assertEqual(self._generate_report_rows(), expected_rows)
+        self.assertFalse(get_subsection_grade.called)
+
+
+@patch.object(CourseGradeReport, 'USER_BATCH_SIZE', 1)
+class TestResumableCourseGradeReport(TestReportMixin, InstructorTaskModuleTestCase):
+    """
+    Tests that a course grade report is uploaded in batches, and resumed after
+    the last uploaded batch when retried.
+    """
+    def setUp(self):
+        super(TestResumableCourseGradeReport, self).setUp()
+        self.initialize_course()
+        self.define_option_problem(u'Problem1', parent=self.problem_section)
+        self.students = [self.create_student(u'student_{}'.format(index)) for index in range(3)]
+        self.entry = InstructorTaskFactory.create(course_id=self.course.id, task_type='grade_course')
+
+    def _generate_report_rows(self, entry_id):
+        """
+        Generates a course grade report, then returns its rows and deletes it.
+        """
+        with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
+            result = CourseGradeReport.generate(None, entry_id, self.course.id, None, 'graded')
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        links = report_store.links_for(self.course.id)
+        self.assertEqual(len(links), 1)
+        report_path = report_store.path_to(self.course.id, links[0][0])
+        with report_store.storage.open(report_path) as csv_file:
+            rows = list(unicodecsv.reader(csv_file, encoding='utf-8-sig'))
+        report_store.storage.delete(report_path)
+        return result, rows
+
+    def test_resume(self):
+        self.submit_student_answer(self.students[1].username, u'Problem1', ['Option 1'])
+        _, expected_rows = self._generate_report_rows(None)
+        self.assertGreater(len(expected_rows), len(self.students))
+
+        rows_for_users = CourseGradeReport._rows_for_users  # pylint: disable=protected-access
+
+        def fail_on_third_batch(report, context, users):
+            """
+            Fails to compute the rows of the third batch of users.
+            """
+            if mock_rows_for_users.call_count == 3:
+                raise ValueError
+            return rows_for_users(report, context, users)
+
+        with patch.object(CourseGradeReport, '_rows_for_users', autospec=True) as mock_rows_for_users:
+            mock_rows_for_users.side_effect = fail_on_third_batch
+            with self.assertRaises(ValueError):
+                self._generate_report_rows(self.entry.id)
+        self.assertNotEqual(InstructorTask.objects.get(pk=self.entry.id).checkpoint, '')
+
+        with patch.object(
+            CourseGradeReport, '_rows_for_users', autospec=True, side_effect=rows_for_users,
+        ) as mock_rows_for_users:
+            result, rows = self._generate_report_rows(self.entry.id)
+
+        self.assertEqual(rows, expected_rows)
+        self.assertEqual(mock_rows_for_users.call_count, len(expected_rows) - 3)
+        self.assertDictContainsSubset({'attempted': len(expected_rows) - 1, 'succeeded': len(expected_rows) - 1}, result)
+        self.assertEqual(InstructorTask.objects.get(pk=self.entry.id).checkpoint, '')
+
+
+class TestResumableReportUpload(TestReportMixin, InstructorTaskCourseTestCase):
+    """
+    Tests that ResumableReportUpload leaves no parts behind.
+    """
+    def setUp(self):
+        super(TestResumableReportUpload, self).setUp()
+        self.course = CourseFactory.create()
+        self.report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+
+    def _error_part_exists(self, upload, part_index):
+        """
+        Returns whether the error part with the given index of the given upload exists.
+        """
+        return self.report_store.storage.exists(
+            self.report_store._part_path(self.course.id, upload.parts_name + '_err', part_index)
+        )
+
+    def test_stale_error_parts_deleted(self):
+        upload = ResumableReportUpload(None, self.course.id)
+        # As stored by an attempt that failed before completing its batch.
+        self.report_store.store_rows_part(self.course.id, upload.parts_name + '_err', 0, [[u'1', u'error']])
+
+        upload.add_batch(1, [[u'1', u'row']], [])
+        self.assertFalse(self._error_part_exists(upload, 0))
+
+        self.report_store.store_rows_part(self.course.id, upload.parts_name + '_err', 1, [[u'2', u'error']])
+        upload.upload(u'report', [u'id', u'value'], [u'id', u'error'], datetime.now(UTC))
+        self.assertFalse(self._error_part_exists(upload, 1))
+        # Only the report is uploaded, without an error report.
+        self.assertEqual(len(self.report_store.links_for(self.course.id)), 1)
+
+
+@ddt.ddt
+@override_settings(GRADE_REPORT_USERS_PER_SUBTASK=2)
+class TestParallelGradeReports(TestReportMixin, InstructorTaskModuleTestCase):
+    """
+    Tests that grade reports generated by subtasks are identical to those
+    generated by a single task.
+    """
+    def setUp(self):
+        super(TestParallelGradeReports, self).setUp()
+        self.initialize_course()
+        self.define_option_problem(u'Problem1', parent=self.problem_section)
+        self.students = [self.create_student(u'student_{}'.format(index)) for index in range(5)]
+        self.submit_student_answer(self.students[1].username, u'Problem1', ['Option 1'])
+        self.submit_student_answer(self.students[4].username, u'Problem1', ['Option 2'])
+
+    def _generate_report_rows(self, report_class, entry_id):
+        """
+        Generates a report, then returns its rows and deletes it.
+        """
+        with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
+            report_class.generate(None, entry_id, self.course.id, {}, 'graded')
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        links = report_store.links_for(self.course.id)
+        self.assertEqual(len(links), 1)
+        report_path = report_store.path_to(self.course.id, links[0][0])
+        with report_store.storage.open(report_path) as csv_file:
+            rows = list(unicodecsv.reader(csv_file, encoding='utf-8-sig'))
+        report_store.storage.delete(report_path)
+        return rows
+
+    @ddt.data(CourseGradeReport, ProblemGradeReport)
+    def test_parallel_report(self, report_class):
+        expected_rows = self._generate_report_rows(report_class, None)
+
+        entry = InstructorTaskFactory.create(course_id=self.course.id, task_type='grade_course', task_id=str(uuid4()))
+        with override_switch(SWITCH_PARALLEL_GRADE_REPORTS, True):
+            self.assertEqual(self._generate_report_rows(report_class, entry.id), expected_rows)
+
+        entry = InstructorTask.objects.get(pk=entry.id)
+        self.assertEqual(entry.task_state, SUCCESS)
+        num_users = len(expected_rows) - 1
+        self.assertEqual(json.loads(entry.subtasks)['total'], (num_users + 1) // 2)
+        self.assertDictContainsSubset(
+            {'attempted': num_users, 'succeeded': num_users, 'failed': 0},
+            json.loads(entry.task_output),
+        )
+
+    def test_parallel_report_upload_failure(self):
+        entry = InstructorTaskFactory.create(course_id=self.course.id, task_type='grade_course', task_id=str(uuid4()))
+        with override_switch(SWITCH_PARALLEL_GRADE_REPORTS, True):
+            with patch(
+                'lms.djangoapps.instructor_task.tasks_helper.grades.upload_parts_to_report_store',
+                side_effect=IOError('Storage unavailable'),
+            ):
+                with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
+                    CourseGradeReport.generate(None, entry.id, self.course.id, {}, 'graded')
+
+        entry = InstructorTask.objects.get(pk=entry.id)
+        self.assertEqual(entry.task_state, FAILURE)
+        self.assertEqual(json.loads(entry.task_output)['message'], 'Storage unavailable')
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        self.assertFalse(report_store.storage.exists(
+            report_store._part_path(self.course.id, entry.task_id, 0)
+        ))
+
+
 class TestProblemResponsesReport(TestReportMixin, InstructorTaskModuleTestCase):
     """
     Tests that generation of CSV files listing student answers to a
@@ -622,6 +622,26 @@ CACHES = {
     },
 }
 
+# Host-local tier of the course_structure_cache, shared by all processes of a
+# host.  Set DIRECTORY, preferably to a directory on a tmpfs such as /dev/shm,
+# to enable it.  DIRECTORY must be owned by the user of these processes and not
+# writable by other users, and the files are signed with SECRET_KEY.  MAX_SIZE
+# is in bytes.
+COURSE_STRUCTURE_HOST_CACHE = {
+    'DIRECTORY': None,
+    'MAX_SIZE': 512 * 1024 * 1024,
+}
+
+# Local disk cache of the course assets served by the contentserver that are
+# too large for the course_assets cache.  Set DIRECTORY to enable it.  MAX_SIZE
+# is in bytes.  When X_ACCEL_REDIRECT_LOCATION names an internal nginx location
+# aliased to DIRECTORY, nginx sends the cached files.
+CONTENTSERVER_DISK_CACHE = {
+    'DIRECTORY': None,
+    'MAX_SIZE': 10 * 1024 * 1024 * 1024,
+    'X_ACCEL_REDIRECT_LOCATION': None,
+}
+
 ############################ OAUTH2 Provider ###################################
 OAUTH_EXPIRE_CONFIDENTIAL_CLIENT_DAYS = 365
 OAUTH_EXPIRE_PUBLIC_CLIENT_DAYS = 30
@@ -1132,6 +1152,10 @@ CODE_JAIL = {
     },
 }
 
+# Number of safe_exec results, such as those of the scripts of randomized
+# problems, kept in memory by each process in front of the django cache.
+SAFE_EXEC_PROCESS_CACHE_MAX_ENTRIES = 1000
+
 # Some courses are allowed to run unsafe code. This is a list of regexes, one
 # of them must match the course id for that course to run unsafe code.
 #
@@ -2189,6 +2213,11 @@ BLOCK_STRUCTURES_SETTINGS = dict(
 
     # Backend storage options
     PRUNING_ACTIVE=False,
+
+    # Maximum total size, in bytes of serialized data, of the collected
+    # block structures held in memory by each process.  Set to 0 to
+    # disable the per-process cache.
+    PROCESS_CACHE_MAX_SIZE=0,
 )
 
 ################################ Bulk Email ###################################
@@ -2866,6 +2895,10 @@ GRADES_DOWNLOAD = {
     'ROOT_PATH': None,
 }
 
+# Number of learners graded by each subtask of a grade report, when the
+# instructor_task.parallel_grade_reports waffle switch is enabled.
+GRADE_REPORT_USERS_PER_SUBTASK = 1000
+
 FINANCIAL_REPORTS = {
     'STORAGE_TYPE': 'localfs',
     'BUCKET': None,
@@ -2950,6 +2983,9 @@ VIDEO_TRANSCRIPTS_SETTINGS = dict(
 
 VIDEO_TRANSCRIPTS_MAX_AGE = 31536000
 
+# The total length, in characters, of the converted transcripts kept in memory by each process
+TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE = 16 * 1024 * 1024
+
 # Source:
 # http://loc.gov/standards/iso639-2/ISO-639-2_utf-8.txt according to http://en.wikipedia.org/wiki/ISO_639-1
 # Note that this is used as the set of choices to the `code` field of the
@@ -3230,6 +3266,14 @@ DEFAULT_MOBILE_AVAILABLE = False
 # Enrollment API Cache Timeout
 ENROLLMENT_COURSE_DETAILS_CACHE_TIMEOUT = 60
 
+# Timeout of the cached states of all of a user's enrollments, used when the
+# student.cache_enrollment_states waffle switch is enabled
+ENROLLMENT_STATES_CACHE_TIMEOUT = 60 * 60
+
+# Whether the waffle flags, switches and course overrides are read from a snapshot kept in
+# memory by each process, see openedx.core.djangoapps.waffle_utils.snapshot
+WAFFLE_UTILS_SNAPSHOT_ENABLED = False
+
 # These tabs are currently disabled
 NOTES_DISABLED_TABS = ['course_structure', 'tags']
 
@@ -3897,6 +3941,16 @@ BLOCKSTORE_API_URL = 'http://localhost:18250/api/v1/'
 # Which of django's caches to use for storing anonymous user state for XBlocks
 # in the blockstore-based XBlock runtime
 XBLOCK_RUNTIME_V2_EPHEMERAL_DATA_CACHE = 'default'
+# Local cache of the contents of Blockstore bundle files, keyed by their hash:
+# the total size in bytes of the files kept in memory by each process, the
+# directory they are also stored in (shared by the processes of a server) if
+# any, and its total size in bytes.
+BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE = 16 * 1024 * 1024
+BLOCKSTORE_FILE_CACHE_DIR = None
+BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE = 256 * 1024 * 1024
+# How many files of a bundle are fetched from Blockstore at once when
+# prefetching its OLX files.
+BLOCKSTORE_FILE_PREFETCH_THREADS = 4
 
 ########################## LEARNER PORTAL ##############################
 LEARNER_PORTAL_URL_ROOT = 'http://localhost:8734'
@@ -236,6 +236,9 @@ if 'loc_cache' not in CACHES:
 if 'staticfiles' in CACHES:
     CACHES['staticfiles']['KEY_PREFIX'] = EDX_PLATFORM_REVISION
 
+COURSE_STRUCTURE_HOST_CACHE.update(ENV_TOKENS.get('COURSE_STRUCTURE_HOST_CACHE', {}))
+CONTENTSERVER_DISK_CACHE.update(ENV_TOKENS.get('CONTENTSERVER_DISK_CACHE', {}))
+
 # In order to transition from local disk asset storage to S3 backed asset storage,
 # we need to run asset collection twice, once for local disk and once for S3.
 # Once we have migrated to service assets off S3, then we can convert this back to
@@ -353,6 +356,9 @@ for name, value in ENV_TOKENS.get("CODE_JAIL", {}).items():
         CODE_JAIL[name] = value
 
 COURSES_WITH_UNSAFE_CODE = ENV_TOKENS.get("COURSES_WITH_UNSAFE_CODE", [])
+SAFE_EXEC_PROCESS_CACHE_MAX_ENTRIES = ENV_TOKENS.get(
+    'SAFE_EXEC_PROCESS_CACHE_MAX_ENTRIES', SAFE_EXEC_PROCESS_CACHE_MAX_ENTRIES
+)
 
 # Event Tracking
 if "TRACKING_IGNORE_URL_PATTERNS" in ENV_TOKENS:
@@ -368,6 +374,10 @@ SSL_AUTH_DN_FORMAT_STRING = ENV_TOKENS.get(
 # Video Caching. Pairing country codes with CDN URLs.
 # Example: {'CN': 'http://api.xuetangx.com/edx/video?s3_url='}
 VIDEO_CDN_URL = ENV_TOKENS.get('VIDEO_CDN_URL', {})
+TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE = ENV_TOKENS.get(
+    'TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE', TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE
+)
+WAFFLE_UTILS_SNAPSHOT_ENABLED = ENV_TOKENS.get('WAFFLE_UTILS_SNAPSHOT_ENABLED', WAFFLE_UTILS_SNAPSHOT_ENABLED)
 
 # Determines whether the CSRF token can be transported on
 # unencrypted channels. It is set to False here for backward compatibility,
@@ -509,6 +519,14 @@ EMAIL_HOST_PASSWORD = AUTH_TOKENS.get('EMAIL_HOST_PASSWORD', '')  # django defau
 BLOCKSTORE_API_URL = ENV_TOKENS.get('BLOCKSTORE_API_URL', None)  # e.g. "https://blockstore.example.com/api/v1/"
 # Configure an API auth token at (blockstore URL)/admin/authtoken/token/
 BLOCKSTORE_API_AUTH_TOKEN = AUTH_TOKENS.get('BLOCKSTORE_API_AUTH_TOKEN', None)
+BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE = ENV_TOKENS.get(
+    'BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE', BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE
+)
+BLOCKSTORE_FILE_CACHE_DIR = ENV_TOKENS.get('BLOCKSTORE_FILE_CACHE_DIR', BLOCKSTORE_FILE_CACHE_DIR)
+BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE = ENV_TOKENS.get(
+    'BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE', BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE
+)
+BLOCKSTORE_FILE_PREFETCH_THREADS = ENV_TOKENS.get('BLOCKSTORE_FILE_PREFETCH_THREADS', BLOCKSTORE_FILE_PREFETCH_THREADS)
 
 # Datadog for events!
 DATADOG = AUTH_TOKENS.get("DATADOG", {})
@@ -576,6 +594,8 @@ GRADES_DOWNLOAD_ROUTING_KEY = ENV_TOKENS.get('GRADES_DOWNLOAD_ROUTING_KEY', HIGH
 
 GRADES_DOWNLOAD = ENV_TOKENS.get("GRADES_DOWNLOAD", GRADES_DOWNLOAD)
 
+GRADE_REPORT_USERS_PER_SUBTASK = ENV_TOKENS.get('GRADE_REPORT_USERS_PER_SUBTASK', GRADE_REPORT_USERS_PER_SUBTASK)
+
 # Rate limit for regrading tasks that a grading policy change can kick off
 
 # financial reports
@@ -698,6 +718,7 @@ DEFAULT_MOBILE_AVAILABLE = ENV_TOKENS.get(
 
 # Enrollment API Cache Timeout
 ENROLLMENT_COURSE_DETAILS_CACHE_TIMEOUT = ENV_TOKENS.get('ENROLLMENT_COURSE_DETAILS_CACHE_TIMEOUT', 60)
+ENROLLMENT_STATES_CACHE_TIMEOUT = ENV_TOKENS.get('ENROLLMENT_STATES_CACHE_TIMEOUT', ENROLLMENT_STATES_CACHE_TIMEOUT)
 
 if FEATURES.get('ENABLE_COURSEWARE_SEARCH') or \
    FEATURES.get('ENABLE_DASHBOARD_SEARCH') or \
@@ -9,6 +9,7 @@ StackedConfigurationModel: A ConfigurationModel that can be overridden at site,
 
 from collections import defaultdict
 from enum import Enum
+from uuid import uuid4
 
 import crum
 from config_models.models import ConfigurationModel, cache
@@ -16,13 +17,18 @@ from django.conf import settings
 from django.contrib.sites.models import Site
 from django.contrib.sites.requests import RequestSite
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils.translation import ugettext_lazy as _
 
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
-from openedx.core.lib.cache_utils import request_cached
+from openedx.core.lib.cache_utils import register_process_cache, request_cached
+
+# The current overrides of each StackedConfigurationModel by key, loaded once per version, see
+# StackedConfigurationModel._get_overrides.
+_overrides_snapshots = {}
+register_process_cache(_overrides_snapshots.clear)
 
 
 class Provenance(Enum):
@@ -175,14 +181,6 @@ class StackedConfigurationModel(ConfigurationModel):
         if site is None and org is not None:
             site = cls._site_from_org(org)
 
-        stackable_fields = [cls._meta.get_field(field_name) for field_name in cls.STACKABLE_FIELDS]
-        field_defaults = {
-            field.name: field.get_default()
-            for field in stackable_fields
-        }
-
-        values = field_defaults.copy()
-
         # Build a multi_filter_query that defaults to querying for the global-level setting and adds queries
         # for the stacked-level settings when applicable.
         # Note: Django2+ requires checking for 'isnull' rather than passing 'None' in the queries.
@@ -198,7 +196,6 @@ class StackedConfigurationModel(ConfigurationModel):
 
         overrides = cls.objects.current_set().filter(multi_filter_query)
 
-        provenances = defaultdict(lambda: Provenance.default)
         # We are sorting in python to avoid doing a filesort in the database for
         # what will only be 4 rows at maximum
 
@@ -217,7 +214,70 @@ class StackedConfigurationModel(ConfigurationModel):
                 override.site_id is not None
             )
 
-        for override in sorted(overrides, key=sort_key):
+        current = cls._stack_overrides(sorted(overrides, key=sort_key))
+        cache.set(cache_key_name, current, cls.cache_timeout)
+        return current
+
+    @classmethod
+    def current_many(cls, course_keys):
+        """
+        Return the current overridden configurations of the given courses, keyed by course key.
+
+        The configuration of each course is the same as ``cls.current(course_key=course_key)``,
+        but the overrides of all the courses are loaded at once, with at most one query per level,
+        and kept in a snapshot shared by the requests handled by this process until a configuration
+        of this model is saved.  The configurations are also cached for the subsequent calls to
+        ``current`` for these courses.
+
+        Arguments:
+            course_keys: The courses to return the current values for
+        """
+        stacks = {}
+        for course_key in course_keys:
+            org_course = cls._org_course_from_course_key(course_key)
+            org = cls._org_from_org_course(org_course)
+            site_id = getattr(cls._site_from_org(org), 'id', None)
+            # In increasing specificity.
+            stacks[course_key] = [
+                key for key in [
+                    (None, None, None, None),
+                    (site_id, None, None, None) if site_id is not None else None,
+                    (None, org, None, None),
+                    (None, None, org_course, None),
+                    (None, None, None, course_key),
+                ] if key is not None
+            ]
+
+        overrides = cls._get_overrides(set(key for stack in stacks.values() for key in stack))
+        configs = {
+            course_key: cls._stack_overrides(overrides[key] for key in stack if overrides[key] is not None)
+            for course_key, stack in stacks.items()
+        }
+        cache.set_many(
+            {
+                cls.cache_key_name(None, None, None, course_key): config
+                for course_key, config in configs.items()
+            },
+            cls.cache_timeout,
+        )
+        return configs
+
+    @classmethod
+    def _stack_overrides(cls, overrides):
+        """
+        Return an instance of this model with the values of the given overrides, sorted in
+        increasing specificity, stacked over the default values.
+        """
+        stackable_fields = [cls._meta.get_field(field_name) for field_name in cls.STACKABLE_FIELDS]
+        field_defaults = {
+            field.name: field.get_default()
+            for field in stackable_fields
+        }
+
+        values = field_defaults.copy()
+        provenances = defaultdict(lambda: Provenance.default)
+
+        for override in overrides:
             for field in stackable_fields:
                 value = field.value_from_object(override)
                 if value != field_defaults[field.name]:
@@ -235,9 +295,78 @@ class StackedConfigurationModel(ConfigurationModel):
 
         current = cls(**values)
         current.provenances = {field.name: provenances[field.name] for field in stackable_fields}  # pylint: disable=attribute-defined-outside-init
-        cache.set(cache_key_name, current, cls.cache_timeout)
         return current
 
+    @classmethod
+    def _get_overrides(cls, keys):
+        """
+        Return the current overrides of this model by (site_id, org, org_course, course_id) key,
+        with None for the given keys which have no override.
+
+        The overrides are kept in a snapshot until the version of the overrides of this model,
+        stored in the cache, is deleted by a save.  Only the overrides of the keys missing from
+        the snapshot are loaded, with one query per level.
+        """
+        version_cache_key = cls._overrides_version_cache_key()
+        version = cache.get(version_cache_key)
+        snapshot_version, snapshot = _overrides_snapshots.get(cls, (None, {}))
+        if version is None or snapshot_version != version:
+            if version is None:
+                # Set before loading the overrides, so that any save made
+                # while they are loaded changes the version again.
+                cache.add(version_cache_key, uuid4().hex, None)
+                version = cache.get(version_cache_key)
+            snapshot = {}
+            _overrides_snapshots[cls] = (version, snapshot)
+
+        missing_keys = [key for key in keys if key not in snapshot]
+        if missing_keys:
+            loaded_overrides = cls._load_overrides(missing_keys)
+            for key in missing_keys:
+                snapshot[key] = loaded_overrides.get(key)
+        return snapshot
+
+    @classmethod
+    def _load_overrides(cls, keys):
+        """
+        Return the current overrides of this model for the given (site_id, org, org_course, course_id)
+        keys, with one query per level.
+        """
+        no_key = dict(site__isnull=True, org__isnull=True, org_course__isnull=True, course_id__isnull=True)
+        level_queries = []
+        for index, (field_name, isnull_name) in enumerate([
+                ('site_id', 'site__isnull'),
+                ('org', 'org__isnull'),
+                ('org_course', 'org_course__isnull'),
+                ('course_id', 'course_id__isnull'),
+        ]):
+            values = set(key[index] for key in keys if key[index] is not None)
+            if values:
+                query = dict(no_key)
+                del query[isnull_name]
+                query[field_name + '__in'] = values
+                level_queries.append(query)
+        if (None, None, None, None) in keys:
+            level_queries.append(no_key)
+
+        overrides = {}
+        for query in level_queries:
+            for override in cls.objects.current_set().filter(**query):
+                overrides[(override.site_id, override.org, override.org_course, override.course_id)] = override
+        return overrides
+
+    @classmethod
+    def _overrides_version_cache_key(cls):
+        return u'configuration/{}/overrides_version'.format(cls.__name__)
+
+    def save(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        super(StackedConfigurationModel, self).save(*args, **kwargs)
+        version_cache_key = self._overrides_version_cache_key()
+        cache.delete(version_cache_key)
+        # Again once the save is committed, so that overrides loaded before
+        # then by another process aren't kept.
+        transaction.on_commit(lambda: cache.delete(version_cache_key))
+
     @classmethod
     def all_current_course_configs(cls):
         """
@@ -26,6 +26,10 @@ logger = getLogger(__name__)  # pylint: disable=invalid-name
 # A dictionary key value for storing a transformer's version number.
 TRANSFORMER_VERSION_KEY = '_version'
 
+# The name of the xBlock field that is collected for every block to
+# detect which blocks changed since a block structure was collected.
+EDITED_ON_FIELD = 'edited_on'
+
 
 class _BlockRelations(object):
     """
@@ -395,6 +399,230 @@ class BlockData(FieldData):
         self.transformer_data = TransformerDataMap()
 
 
+def _new_field_data(field_data_class, fields, **own_fields):
+    """
+    Returns a new instance of the given FieldData class with the given
+    fields dict, bypassing FieldData's attribute dispatch, which would
+    otherwise dominate the time to build large structures.
+    """
+    field_data = field_data_class.__new__(field_data_class)
+    field_data.__dict__.update(own_fields, fields=fields)
+    return field_data
+
+
+class _LazyFieldDict(dict):
+    """
+    A fields dict of a BlockData or TransformerData whose values are
+    filled in on demand from a source.
+
+    The source implements load(fields, key), which fills in the given
+    key if it's still pending, and load_all(fields).  Operations that
+    span all fields load everything first.  Copying or pickling results
+    in a plain dict.
+    """
+    __slots__ = ('_source',)
+
+    def __init__(self, source):
+        super(_LazyFieldDict, self).__init__()
+        self._source = source
+
+    def __missing__(self, key):
+        self._source.load(self, key)
+        if super(_LazyFieldDict, self).__contains__(key):
+            return super(_LazyFieldDict, self).__getitem__(key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        self._source.load(self, key)
+        return super(_LazyFieldDict, self).__contains__(key)
+
+    def __setitem__(self, key, value):
+        self._source.load(self, key)
+        super(_LazyFieldDict, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._source.load(self, key)
+        super(_LazyFieldDict, self).__delitem__(key)
+
+    def get(self, key, default=None):
+        self._source.load(self, key)
+        return super(_LazyFieldDict, self).get(key, default)
+
+    def pop(self, key, *args):
+        self._source.load(self, key)
+        return super(_LazyFieldDict, self).pop(key, *args)
+
+    def setdefault(self, key, default=None):
+        self._source.load(self, key)
+        return super(_LazyFieldDict, self).setdefault(key, default)
+
+    def update(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        self._source.load_all(self)
+        super(_LazyFieldDict, self).update(*args, **kwargs)
+
+    def __iter__(self):
+        self._source.load_all(self)
+        return super(_LazyFieldDict, self).__iter__()
+
+    def __len__(self):
+        self._source.load_all(self)
+        return super(_LazyFieldDict, self).__len__()
+
+    def __eq__(self, other):
+        self._source.load_all(self)
+        return super(_LazyFieldDict, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._source.load_all(self)
+        return super(_LazyFieldDict, self).__repr__()
+
+    def keys(self):
+        self._source.load_all(self)
+        return super(_LazyFieldDict, self).keys()
+
+    def values(self):
+        self._source.load_all(self)
+        return super(_LazyFieldDict, self).values()
+
+    def items(self):
+        self._source.load_all(self)
+        return super(_LazyFieldDict, self).items()
+
+    def copy(self):
+        self._source.load_all(self)
+        return dict(super(_LazyFieldDict, self).items())
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (self.copy(),))
+
+
+class _CopiedFieldsSource(object):
+    """
+    Source for the _LazyFieldDict of a copy-on-write BlockData or
+    TransformerData.  A field is deep-copied from the original fields
+    dict the first time it is accessed in the copy, so the original is
+    never modified through the copy.
+    """
+    __slots__ = ('_original_fields', '_loaded')
+
+    def __init__(self, original_fields):
+        self._original_fields = original_fields
+        self._loaded = set()
+
+    def load(self, fields, key):
+        """
+        Copies the given field from the original fields dict, unless it
+        was already copied.
+        """
+        if self._original_fields is None or key in self._loaded:
+            return False
+        self._loaded.add(key)
+        try:
+            value = self._original_fields[key]
+        except KeyError:
+            return False
+        dict.__setitem__(fields, key, deepcopy(value))
+        return True
+
+    def load_all(self, fields):
+        """
+        Copies all remaining fields from the original fields dict.
+        """
+        if self._original_fields is None:
+            return
+        for key in list(self._original_fields):
+            self.load(fields, key)
+        self._original_fields = None
+
+
+def _copy_block_data_on_write(block_data):
+    """
+    Returns a copy of the given BlockData whose fields and transformer
+    fields are copied from the original on first access.
+    """
+    transformer_data = TransformerDataMap()
+    for transformer_name, original_transformer_data in six.iteritems(block_data.transformer_data):
+        dict.__setitem__(
+            transformer_data,
+            transformer_name,
+            _new_field_data(
+                TransformerData,
+                _LazyFieldDict(_CopiedFieldsSource(original_transformer_data.fields)),
+            ),
+        )
+    return _new_field_data(
+        BlockData,
+        _LazyFieldDict(_CopiedFieldsSource(block_data.fields)),
+        location=block_data.location,
+        transformer_data=transformer_data,
+    )
+
+
+class _CopyOnAccessBlockDataMap(dict):
+    """
+    A block data map of a copy-on-write block structure.  Each BlockData
+    of the original structure is copied, with _copy_block_data_on_write,
+    the first time it is accessed through this map.
+    """
+    __slots__ = ('_uncopied',)
+
+    def __init__(self, original_block_data_map):
+        super(_CopyOnAccessBlockDataMap, self).__init__(original_block_data_map)
+        self._uncopied = set(original_block_data_map)
+
+    def _copy(self, usage_key):
+        """
+        Replaces the original BlockData for the given key with its copy,
+        unless it was already copied.
+        """
+        if usage_key in self._uncopied:
+            self._uncopied.discard(usage_key)
+            block_data = super(_CopyOnAccessBlockDataMap, self).__getitem__(usage_key)
+            super(_CopyOnAccessBlockDataMap, self).__setitem__(usage_key, _copy_block_data_on_write(block_data))
+
+    def _copy_all(self):
+        """
+        Copies all remaining original BlockData.
+        """
+        for usage_key in list(self._uncopied):
+            self._copy(usage_key)
+
+    def __getitem__(self, usage_key):
+        self._copy(usage_key)
+        return super(_CopyOnAccessBlockDataMap, self).__getitem__(usage_key)
+
+    def __setitem__(self, usage_key, block_data):
+        self._uncopied.discard(usage_key)
+        super(_CopyOnAccessBlockDataMap, self).__setitem__(usage_key, block_data)
+
+    def get(self, usage_key, default=None):
+        return self[usage_key] if usage_key in self else default
+
+    def pop(self, usage_key, *args):
+        self._uncopied.discard(usage_key)
+        return super(_CopyOnAccessBlockDataMap, self).pop(usage_key, *args)
+
+    def values(self):
+        self._copy_all()
+        return super(_CopyOnAccessBlockDataMap, self).values()
+
+    def items(self):
+        self._copy_all()
+        return super(_CopyOnAccessBlockDataMap, self).items()
+
+    def copy(self):
+        self._copy_all()
+        return dict(super(_CopyOnAccessBlockDataMap, self).items())
+
+    def __reduce_ex__(self, protocol):
+        return (dict, (self.copy(),))
+
+
 class BlockStructureBlockData(BlockStructure):
     """
     Subclass of BlockStructure that is responsible for managing block
@@ -430,6 +658,28 @@ class BlockStructureBlockData(BlockStructure):
             deepcopy(self._block_data_map),
         )
 
+    def copy_on_write(self):
+        """
+        Returns a new instance of BlockStructureBlockData that behaves
+        like a deep-copy of this instance, but copies each block's data
+        only when it is first accessed.  This instance must not be
+        modified for as long as the returned copy is in use.
+        """
+        from .factory import BlockStructureFactory
+        block_relations = {}
+        for usage_key, relations in six.iteritems(self._block_relations):
+            relations_copy = _BlockRelations()
+            relations_copy.parents = list(relations.parents)
+            relations_copy.children = list(relations.children)
+            block_relations[usage_key] = relations_copy
+
+        return BlockStructureFactory.create_new(
+            self.root_block_usage_key,
+            block_relations,
+            deepcopy(self.transformer_data),
+            _CopyOnAccessBlockDataMap(self._block_data_map),
+        )
+
     def iteritems(self):
         """
         Returns iterator of (UsageKey, BlockData) pairs for all
@@ -789,6 +1039,11 @@ class BlockStructureModulestoreData(BlockStructureBlockData):
         # set(string)
         self._requested_xblock_fields = set()
 
+        # Set of usage keys of the blocks whose data is to be collected,
+        # or None if the data of all blocks is to be collected.
+        # set(UsageKey)
+        self._block_keys_to_collect = None
+
     def request_xblock_fields(self, *field_names):
         """
         Records request for collecting data for the given xBlock fields.
@@ -805,6 +1060,33 @@ class BlockStructureModulestoreData(BlockStructureBlockData):
         """
         self._requested_xblock_fields.update(set(field_names))
 
+    def should_collect(self, usage_key):
+        """
+        Returns whether data is to be collected for the block identified
+        by the given usage_key.
+
+        When collecting incrementally, the data of blocks that are not
+        affected by changes since the previous collection is carried
+        over from the previously collected block structure, and should
+        not be collected again.
+
+        Arguments:
+            usage_key (UsageKey) - Usage key of the block.
+        """
+        return self._block_keys_to_collect is None or usage_key in self._block_keys_to_collect
+
+    def collect_all_blocks(self):
+        """
+        Makes the data of all blocks be collected, rather than only that
+        of the blocks affected by changes since the previous collection.
+
+        A transformer collecting incrementally calls this, before
+        collecting any block-specific data, when non-block-specific data
+        that its block-specific data depends on changed.  Transformers
+        collecting after it then also collect the data of all blocks.
+        """
+        self._block_keys_to_collect = None
+
     def get_xblock(self, usage_key):
         """
         Returns the instantiated xBlock for the given usage key.
@@ -839,10 +1121,86 @@ class BlockStructureModulestoreData(BlockStructureBlockData):
         collects all xBlock fields that were requested.
         """
         for xblock_usage_key, xblock in six.iteritems(self._xblock_map):
+            if not self.should_collect(xblock_usage_key):
+                continue
             block_data = self._get_or_create_block(xblock_usage_key)
             for field_name in self._requested_xblock_fields:
                 self._set_xblock_field(block_data, xblock, field_name)
 
+    def _carry_over_collected_data(self, previous_block_structure):
+        """
+        Restricts collection to the blocks affected by changes since the
+        given block structure was collected, and carries over the
+        collected data of all other blocks and the non-block-specific
+        transformer data from it.
+
+        A block is changed if it is new, if its relations changed, or if
+        its edited_on field differs from (or, in either structure, is
+        missing) the one collected previously.  The affected blocks are
+        the changed blocks along with all of their ancestors, whose data
+        may aggregate their descendants', and all of their descendants,
+        whose data may be inherited or percolated from their ancestors.
+
+        Note: The given block structure's data is reused rather than
+        copied, so it should no longer be used.
+
+        Arguments:
+            previous_block_structure (BlockStructureBlockData) - The
+                block structure collected before the changes.
+
+        Returns:
+            set(UsageKey) - The usage keys of the blocks to collect.
+        """
+        changed_block_keys = {
+            block_key for block_key in self._block_relations
+            if self._is_block_changed(block_key, previous_block_structure)
+        }
+        self._block_keys_to_collect = (
+            self._get_related_closure(changed_block_keys, self.get_parents) |
+            self._get_related_closure(changed_block_keys, self.get_children)
+        )
+
+        for block_key in self._block_relations:
+            if block_key not in self._block_keys_to_collect:
+                block_data = previous_block_structure._block_data_map.get(block_key)
+                if block_data is not None:
+                    self._block_data_map[block_key] = block_data
+
+        self.transformer_data = previous_block_structure.transformer_data
+        return self._block_keys_to_collect
+
+    def _is_block_changed(self, usage_key, previous_block_structure):
+        """
+        Returns whether the block identified by the given usage_key
+        changed since the given block structure was collected.
+        """
+        if usage_key not in previous_block_structure:
+            return True
+
+        edited_on = getattr(self._xblock_map.get(usage_key), EDITED_ON_FIELD, None)
+        if edited_on is None or edited_on != previous_block_structure.get_xblock_field(usage_key, EDITED_ON_FIELD):
+            return True
+
+        return (
+            self.get_children(usage_key) != previous_block_structure.get_children(usage_key) or
+            self.get_parents(usage_key) != previous_block_structure.get_parents(usage_key)
+        )
+
+    @staticmethod
+    def _get_related_closure(usage_keys, get_related):
+        """
+        Returns the given usage keys along with the usage keys of all
+        blocks transitively related to them through get_related.
+        """
+        closure = set(usage_keys)
+        to_visit = list(usage_keys)
+        while to_visit:
+            for related_key in get_related(to_visit.pop()):
+                if related_key not in closure:
+                    closure.add(related_key)
+                    to_visit.append(related_key)
+        return closure
+
     def _set_xblock_field(self, block_data, xblock, field_name):
         """
         Updates the given block's xBlock fields data with the xBlock
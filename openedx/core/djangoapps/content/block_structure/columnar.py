@@ -0,0 +1,497 @@
+"""
+Module for the columnar serialization format of collected BlockStructures.
+
+Rather than pickling the whole structure, the format lays out a compact
+index of the structure's usage keys, parent/child adjacency arrays and a
+separate column per xBlock field and per transformer field.  Columns are
+individually compressed and only decoded when a field in them is first
+accessed, so a transformer that reads a handful of fields does not pay
+for deserializing the rest of the structure.
+
+Serialized layout:
+
+    MAGIC (4 bytes) | FORMAT_VERSION (1 byte) | header length (4 bytes)
+    | zlib-compressed JSON header | payload of concatenated columns
+
+Column values are encoded as tagged JSON, which supports the primitive
+types, containers, datetimes and opaque keys.  A column containing any
+other type of value falls back to a zlib-compressed pickle for that
+column alone.
+"""
+
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date, datetime, timedelta
+from threading import Lock
+
+import six
+from opaque_keys import InvalidKeyError, OpaqueKey
+from opaque_keys.edx.keys import AssetKey, CourseKey, DefinitionKey, UsageKey
+from opaque_keys.edx.locator import BlockUsageLocator
+from pytz import utc
+
+from openedx.core.lib.cache_utils import zpickle, zunpickle
+
+from .block_structure import (
+    BlockData,
+    TransformerData,
+    TransformerDataMap,
+    _BlockRelations,
+    _LazyFieldDict,
+    _new_field_data
+)
+from .factory import BlockStructureFactory
+
+# Leading bytes identifying data serialized in the columnar format.
+MAGIC = b'BSC\x00'
+
+# The version of the columnar layout.  Update this value whenever the
+# layout changes so older serializations are rejected rather than
+# misread.
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct('>4sBI')
+
+# Column codecs.
+_JSON_CODEC = 'j'
+_PICKLE_CODEC = 'p'
+
+# Tag key used to mark non-JSON-native values in a JSON column.
+_TAG = '__t'
+
+# Opaque key base classes whose values can be encoded in JSON columns,
+# by KEY_TYPE.
+_OPAQUE_KEY_TYPES = {
+    key_class.KEY_TYPE: key_class for key_class in (UsageKey, CourseKey, DefinitionKey, AssetKey)
+}
+
+_PRIMITIVE_TYPES = (type(None), bool, float) + six.integer_types + (six.text_type,)
+
+
+class _NotEncodable(Exception):
+    """
+    Raised when a value cannot be encoded in a JSON column.
+    """
+    pass
+
+
+def is_columnar(serialized_data):
+    """
+    Returns whether the given serialized data is in the columnar format.
+    """
+    return bytes(serialized_data[:len(MAGIC)]) == MAGIC
+
+
+def serialize(block_structure):
+    """
+    Serializes the collected data of the given block_structure into the
+    columnar format and returns the resulting bytes.
+    """
+    # pylint: disable=protected-access
+    block_relations = block_structure._block_relations
+    block_data_map = block_structure._block_data_map
+
+    keys = list(block_relations)
+    keys.extend(key for key in block_data_map if key not in block_relations)
+    key_index = {key: index for index, key in enumerate(keys)}
+
+    payload = _PayloadWriter()
+    header = {
+        'keys': _encode_key_index(keys, block_structure.root_block_usage_key),
+        'num_related': len(block_relations),
+        'children': payload.add_array(_csr(block_relations, key_index, 'children')),
+        'parents': payload.add_array(_csr(block_relations, key_index, 'parents')),
+        'data_blocks': payload.add_array(array('i', [key_index[key] for key in block_data_map])),
+        'block_fields': {},
+        'transformer_data': {},
+        'transformer_blocks': {},
+    }
+
+    block_field_columns = {}
+    transformer_block_columns = {}
+    transformer_block_presence = {}
+    for usage_key, block_data in six.iteritems(block_data_map):
+        index = key_index[usage_key]
+        for field_name, value in six.iteritems(block_data.fields):
+            _add_to_column(block_field_columns, field_name, index, value)
+        for transformer_name, transformer_data in six.iteritems(block_data.transformer_data):
+            transformer_block_presence.setdefault(transformer_name, []).append(index)
+            columns = transformer_block_columns.setdefault(transformer_name, {})
+            for field_name, value in six.iteritems(transformer_data.fields):
+                _add_to_column(columns, field_name, index, value)
+
+    for field_name, column in six.iteritems(block_field_columns):
+        header['block_fields'][field_name] = payload.add_column(column)
+
+    for transformer_name, indices in six.iteritems(transformer_block_presence):
+        header['transformer_blocks'][transformer_name] = {
+            'blocks': payload.add_array(array('i', indices)),
+            'fields': {
+                field_name: payload.add_column(column)
+                for field_name, column in six.iteritems(transformer_block_columns.get(transformer_name, {}))
+            },
+        }
+
+    for transformer_name, transformer_data in six.iteritems(block_structure.transformer_data):
+        header['transformer_data'][transformer_name] = payload.add_column(dict(transformer_data.fields))
+
+    payload_bytes = payload.getvalue()
+    header['crc'] = zlib.crc32(payload_bytes) & 0xffffffff
+    header_bytes = zlib.compress(json.dumps(header, separators=(',', ':')).encode('utf-8'))
+    return _PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)) + header_bytes + payload_bytes
+
+
+def deserialize(serialized_data, root_block_usage_key):
+    """
+    Returns a BlockStructureBlockData for the given columnar serialized
+    data.  Block and transformer fields are decoded lazily, when first
+    accessed.
+
+    Raises:
+        ValueError if the data is not in a supported columnar format or
+        is corrupt.
+    """
+    view = memoryview(serialized_data)
+    magic, format_version, header_length = _PREAMBLE.unpack_from(view)
+    if magic != MAGIC or format_version != FORMAT_VERSION:
+        raise ValueError(u'Unsupported block structure serialization format.')
+
+    header_end = _PREAMBLE.size + header_length
+    header = json.loads(zlib.decompress(view[_PREAMBLE.size:header_end]).decode('utf-8'))
+    payload = view[header_end:]
+    if zlib.crc32(payload) & 0xffffffff != header['crc']:
+        raise ValueError(u'Block structure serialization failed its checksum.')
+
+    reader = _PayloadReader(payload)
+    keys = _decode_key_index(header['keys'])
+
+    relations_list = [_BlockRelations() for _ in range(header['num_related'])]
+    for attr_name in ('children', 'parents'):
+        for relations, related in six.moves.zip(
+                relations_list, _iter_csr(reader.read_array(header[attr_name]), header['num_related'])
+        ):
+            setattr(relations, attr_name, [keys[related_index] for related_index in related])
+    block_relations = dict(six.moves.zip(keys, relations_list))
+
+    block_data_by_index = {}
+    block_fields = _ColumnGroup(reader, header['block_fields'], block_data_by_index, _get_block_fields)
+    for index in reader.read_array(header['data_blocks']):
+        block_data_by_index[index] = _new_field_data(
+            BlockData,
+            _LazyFieldDict(block_fields),
+            location=keys[index],
+            transformer_data=TransformerDataMap(),
+        )
+
+    for transformer_name, transformer_header in six.iteritems(header['transformer_blocks']):
+        transformer_data_by_index = {}
+        transformer_fields = _ColumnGroup(
+            reader, transformer_header['fields'], transformer_data_by_index, _get_transformer_fields,
+        )
+        for index in reader.read_array(transformer_header['blocks']):
+            transformer_data = _new_field_data(TransformerData, _LazyFieldDict(transformer_fields))
+            dict.__setitem__(block_data_by_index[index].transformer_data, transformer_name, transformer_data)
+            transformer_data_by_index[index] = transformer_data
+
+    transformer_data_map = TransformerDataMap()
+    for transformer_name, column_header in six.iteritems(header['transformer_data']):
+        transformer_data_map[transformer_name] = _new_field_data(TransformerData, reader.read_column(column_header))
+
+    return BlockStructureFactory.create_new(
+        root_block_usage_key,
+        block_relations,
+        transformer_data_map,
+        {block_data.location: block_data for block_data in six.itervalues(block_data_by_index)},
+    )
+
+
+class _ColumnGroup(object):
+    """
+    The not-yet-decoded columns shared by a set of _LazyFieldDicts, along
+    with how to reach each block's fields dict.  Each column is decoded
+    into the fields dicts of all of its blocks at once.
+    """
+    def __init__(self, reader, column_headers, targets_by_index, get_fields):
+        self._reader = reader
+        self._pending = dict(column_headers)
+        self._targets_by_index = targets_by_index
+        self._get_fields = get_fields
+        # Deserialized structures may be shared across threads by the
+        # process-level cache.
+        self._lock = Lock()
+
+    def load(self, fields, field_name):  # pylint: disable=unused-argument
+        """
+        Decodes the column for the given field_name into the fields
+        dicts of its blocks, if it's still pending.  Returns whether a
+        column was decoded.
+        """
+        if not self._pending:
+            return False
+
+        with self._lock:
+            try:
+                column_header = self._pending[field_name]
+            except (KeyError, TypeError):
+                return False
+
+            indices, values = self._reader.read_column(column_header)
+            for index, value in six.moves.zip(indices, values):
+                dict.__setitem__(self._get_fields(self._targets_by_index[index]), field_name, value)
+            del self._pending[field_name]
+            return True
+
+    def load_all(self, fields):
+        """
+        Decodes all pending columns.
+        """
+        for field_name in list(self._pending):
+            self.load(fields, field_name)
+
+
+def _get_block_fields(block_data):
+    """
+    Returns the fields dict of the given BlockData.
+    """
+    return block_data.fields
+
+
+def _get_transformer_fields(transformer_data):
+    """
+    Returns the fields dict of the given TransformerData.
+    """
+    return transformer_data.fields
+
+
+class _PayloadWriter(object):
+    """
+    Accumulates the columns of a serialization and records their
+    location in the payload.
+    """
+    def __init__(self):
+        self._chunks = []
+        self._size = 0
+
+    def add_array(self, int_array):
+        """
+        Adds the given array of ints and returns its header entry.
+        """
+        if sys.byteorder != 'little':
+            int_array = array('i', int_array)
+            int_array.byteswap()
+        return self._add(zlib.compress(int_array.tobytes()))
+
+    def add_column(self, column):
+        """
+        Adds the given column, encoded as JSON when possible, and
+        returns its header entry.
+        """
+        try:
+            data = json.dumps(_encode_value(column), separators=(',', ':')).encode('utf-8')
+            return [_JSON_CODEC] + self._add(zlib.compress(data))
+        except _NotEncodable:
+            return [_PICKLE_CODEC] + self._add(zpickle(column))
+
+    def getvalue(self):
+        """
+        Returns the bytes of the payload.
+        """
+        return b''.join(self._chunks)
+
+    def _add(self, data):
+        location = [self._size, len(data)]
+        self._chunks.append(data)
+        self._size += len(data)
+        return location
+
+
+class _PayloadReader(object):
+    """
+    Decodes columns out of the payload of a serialization.
+    """
+    def __init__(self, payload):
+        self._payload = payload
+
+    def read_array(self, location):
+        """
+        Returns the array of ints at the given location.
+        """
+        int_array = array('i')
+        int_array.frombytes(zlib.decompress(self._slice(location)))
+        if sys.byteorder != 'little':
+            int_array.byteswap()
+        return int_array
+
+    def read_column(self, column_header):
+        """
+        Returns the decoded column for the given header entry.
+        """
+        codec, location = column_header[0], column_header[1:]
+        if codec == _JSON_CODEC:
+            return json.loads(zlib.decompress(self._slice(location)).decode('utf-8'), object_hook=_decode_tagged)
+        return zunpickle(self._slice(location))
+
+    def _slice(self, location):
+        offset, length = location
+        return self._payload[offset:offset + length]
+
+
+def _add_to_column(columns, field_name, index, value):
+    """
+    Appends the given block index and value to the named column.
+    """
+    column = columns.get(field_name)
+    if column is None:
+        column = columns[field_name] = ([], [])
+    column[0].append(index)
+    column[1].append(value)
+
+
+def _csr(block_relations, key_index, attr_name):
+    """
+    Returns the given relation of all blocks as a single array of
+    offsets followed by the related block indices.
+    """
+    offsets = array('i', [0])
+    related = array('i')
+    for relations in six.itervalues(block_relations):
+        related.extend(key_index[key] for key in getattr(relations, attr_name))
+        offsets.append(len(related))
+    return offsets + related
+
+
+def _iter_csr(int_array, num_blocks):
+    """
+    Yields the list of related block indices of each block from an
+    array built by _csr.
+    """
+    for index in range(num_blocks):
+        yield int_array[num_blocks + 1 + int_array[index]:num_blocks + 1 + int_array[index + 1]]
+
+
+def _encode_key_index(keys, root_block_usage_key):
+    """
+    Returns the header entry for the given usage keys.  Keys of blocks
+    in the root block's course are stored as (block_type, block_id)
+    pairs relative to the course.
+    """
+    course_key = getattr(root_block_usage_key, 'course_key', None)
+    if course_key is not None and all(
+            isinstance(key, BlockUsageLocator) and key == course_key.make_usage_key(key.block_type, key.block_id)
+            for key in keys
+    ):
+        return {
+            'course': six.text_type(course_key),
+            'blocks': [[key.block_type, key.block_id] for key in keys],
+        }
+    return {'values': _encode_value(keys)}
+
+
+def _decode_key_index(key_index):
+    """
+    Returns the list of usage keys for the given header entry.
+    """
+    if 'course' in key_index:
+        course_key = CourseKey.from_string(key_index['course'])
+        return [course_key.make_usage_key(block_type, block_id) for block_type, block_id in key_index['blocks']]
+    return _decode_tagged_tree(key_index['values'])
+
+
+def _encode_value(value):
+    """
+    Returns a JSON-serializable representation of the given value.
+
+    Raises:
+        _NotEncodable if the value, or anything within it, cannot be
+        represented.
+    """
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES:
+        return value
+    if value_type is list:
+        return [_encode_value(item) for item in value]
+    if value_type is tuple:
+        return {_TAG: 't', 'v': [_encode_value(item) for item in value]}
+    if value_type in (set, frozenset):
+        return {_TAG: 's' if value_type is set else 'f', 'v': [_encode_value(item) for item in value]}
+    if value_type is dict:
+        if _TAG not in value and all(type(key) is six.text_type for key in value):  # pylint: disable=unidiomatic-typecheck
+            return {key: _encode_value(item) for key, item in six.iteritems(value)}
+        return {_TAG: 'd', 'v': [[_encode_value(key), _encode_value(item)] for key, item in six.iteritems(value)]}
+    if value_type is datetime:
+        if value.tzinfo is not None and value.utcoffset() != timedelta(0):
+            raise _NotEncodable(value)
+        return {
+            _TAG: 'dt',
+            'v': [
+                value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond
+            ],
+            'z': value.tzinfo is not None,
+        }
+    if value_type is date:
+        return {_TAG: 'da', 'v': value.toordinal()}
+    if value_type is timedelta:
+        return {_TAG: 'td', 'v': [value.days, value.seconds, value.microseconds]}
+    if isinstance(value, OpaqueKey):
+        return _encode_opaque_key(value)
+    raise _NotEncodable(value)
+
+
+def _encode_opaque_key(value):
+    """
+    Returns the JSON-serializable representation of the given opaque
+    key, provided it round-trips through its string form.
+    """
+    key_class = _OPAQUE_KEY_TYPES.get(value.KEY_TYPE)
+    if key_class is None:
+        raise _NotEncodable(value)
+    serialized_key = six.text_type(value)
+    try:
+        if key_class.from_string(serialized_key) != value:
+            raise _NotEncodable(value)
+    except InvalidKeyError:
+        raise _NotEncodable(value)
+    return {_TAG: 'k', 'c': value.KEY_TYPE, 'v': serialized_key}
+
+
+def _decode_tagged(obj):
+    """
+    json object_hook that converts tagged JSON objects back into the
+    values they represent.
+    """
+    tag = obj.get(_TAG)
+    if tag is None:
+        return obj
+    value = obj['v']
+    if tag == 'k':
+        return _OPAQUE_KEY_TYPES[obj['c']].from_string(value)
+    if tag == 't':
+        return tuple(value)
+    if tag == 'dt':
+        return datetime(*value, tzinfo=utc if obj['z'] else None)
+    if tag == 'd':
+        return {key: item for key, item in value}
+    if tag == 's':
+        return set(value)
+    if tag == 'f':
+        return frozenset(value)
+    if tag == 'da':
+        return date.fromordinal(value)
+    if tag == 'td':
+        return timedelta(*value)
+    raise ValueError(u'Unknown block structure column tag: {}'.format(tag))
+
+
+def _decode_tagged_tree(value):
+    """
+    Decodes an already JSON-parsed tree of tagged values.
+    """
+    if isinstance(value, list):
+        return [_decode_tagged_tree(item) for item in value]
+    if isinstance(value, dict):
+        return _decode_tagged({key: _decode_tagged_tree(item) for key, item in six.iteritems(value)})
+    return value
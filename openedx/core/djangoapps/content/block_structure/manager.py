@@ -121,17 +121,36 @@ class BlockStructureManager(object):
     def _update_collected(self):
         """
         The store is updated with newly collected transformers data from
-        the modulestore.
+        the modulestore.  When incremental collection is enabled, only
+        the blocks affected by changes since the previous collection
+        are re-collected.
         """
         with self._bulk_operations():
             block_structure = BlockStructureFactory.create_from_modulestore(
                 self.root_block_usage_key,
                 self.modulestore,
             )
-            BlockStructureTransformers.collect(block_structure)
+            previous_block_structure = self._get_previous_collected()
+            if not (
+                    previous_block_structure is not None and
+                    BlockStructureTransformers.collect_incrementally(block_structure, previous_block_structure)
+            ):
+                BlockStructureTransformers.collect(block_structure)
             self.store.add(block_structure)
             return block_structure
 
+    def _get_previous_collected(self):
+        """
+        Returns the previously collected Block Structure from the store,
+        if incremental collection is enabled and one is found.
+        """
+        if not config.waffle().is_enabled(config.INCREMENTAL_COLLECT):
+            return None
+        try:
+            return self.store.get(self.root_block_usage_key)
+        except BlockStructureNotFound:
+            return None
+
     def clear(self):
         """
         Removes data for the block structure associated with the given
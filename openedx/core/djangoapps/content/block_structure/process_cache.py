@@ -0,0 +1,158 @@
+"""
+Module for the per-process cache tier of collected BlockStructures.
+"""
+
+
+from collections import OrderedDict
+from logging import getLogger
+from threading import Lock
+
+import six
+from django.conf import settings
+from edx_django_utils.monitoring import set_custom_metric
+
+from openedx.core.lib.cache_utils import register_process_cache
+
+logger = getLogger(__name__)  # pylint: disable=C0103
+
+# Default maximum total size, in bytes of serialized data, of the block
+# structures held by each process.
+DEFAULT_MAX_SIZE = 0
+
+_process_cache = None
+
+
+class BlockStructureProcessCache(object):
+    """
+    A memory-bounded, least-recently-used cache of deserialized block
+    structures, held by a single process.
+
+    Entries are keyed by the root usage key together with the version
+    data of the stored block structure, so an entry is never served
+    once a newer version has been collected.  The size of an entry is
+    measured by the length of its serialized data.
+
+    Cached block structures are shared and must not be modified; hand
+    out a copy (see BlockStructureBlockData.copy_on_write) instead.
+    """
+    def __init__(self, max_size):
+        """
+        Arguments:
+            max_size (int) - The maximum total size of all entries,
+                in bytes of serialized data.  A value of 0 disables
+                the cache.
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self):
+        """
+        Returns whether the cache holds any entries at all.
+        """
+        return self.max_size > 0
+
+    def get(self, cache_key):
+        """
+        Returns the block structure cached for the given key,
+        or None if not found.
+        """
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(cache_key)
+
+        self._set_custom_metrics(hit=entry is not None)
+        return entry[0] if entry else None
+
+    def set(self, cache_key, block_structure, size):
+        """
+        Caches the given block structure of the given size for the
+        given key, replacing any other version of the same block
+        structure and evicting the least recently used entries as
+        needed.
+        """
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            self._remove_versions(cache_key[0])
+            self._entries[cache_key] = (block_structure, size)
+            self.size += size
+            while self.size > self.max_size:
+                evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+                logger.info(u"BlockStructure: Evicted from process cache; %s.", evicted_key[0])
+
+    def delete(self, root_block_usage_key):
+        """
+        Removes all cached versions of the block structure for the
+        given root_block_usage_key.
+        """
+        with self._lock:
+            self._remove_versions(root_block_usage_key)
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = self.hits = self.misses = self.evictions = 0
+
+    def _remove_versions(self, root_block_usage_key):
+        """
+        Removes the entries of all versions for the given
+        root_block_usage_key.  Must be called with the lock held.
+        """
+        for cache_key in [key for key in self._entries if key[0] == root_block_usage_key]:
+            _, size = self._entries.pop(cache_key)
+            self.size -= size
+
+    def _set_custom_metrics(self, hit):
+        """
+        Reports the outcome of a lookup along with the current state of
+        the cache.
+        """
+        set_custom_metric('block_structure_process_cache_hit', hit)
+        for name, value in six.iteritems({
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size': self.size,
+        }):
+            set_custom_metric('block_structure_process_cache_{}'.format(name), value)
+
+
+def get_process_cache():
+    """
+    Returns this process's cache of block structures.
+    """
+    global _process_cache  # pylint: disable=global-statement
+    if _process_cache is None:
+        _process_cache = BlockStructureProcessCache(
+            settings.BLOCK_STRUCTURES_SETTINGS.get('PROCESS_CACHE_MAX_SIZE', DEFAULT_MAX_SIZE)
+        )
+    return _process_cache
+
+
+@register_process_cache
+def _clear_process_cache():
+    """
+    Clears and drops this process's cache of block structures, so that it
+    is created again from the current settings.
+    """
+    global _process_cache  # pylint: disable=global-statement
+    if _process_cache is not None:
+        _process_cache.clear()
+    _process_cache = None
@@ -9,13 +9,14 @@ from logging import getLogger
 import six
 
 from django.utils.encoding import python_2_unicode_compatible
-from openedx.core.lib.cache_utils import zpickle, zunpickle
+from openedx.core.lib.cache_utils import zunpickle
 
-from . import config
+from . import columnar, config
 from .block_structure import BlockStructureBlockData
 from .exceptions import BlockStructureNotFound
 from .factory import BlockStructureFactory
 from .models import BlockStructureModel
+from .process_cache import get_process_cache
 from .transformer_registry import TransformerRegistry
 
 logger = getLogger(__name__)  # pylint: disable=C0103
@@ -53,11 +54,12 @@ class BlockStructureStore(object):
                 is to be serialized.
         """
         self._cache = cache
+        self._process_cache = get_process_cache()
 
     def add(self, block_structure):
         """
-        Stores and caches a compressed and pickled serialization of
-        the given block structure.
+        Stores and caches a columnar serialization of the given block
+        structure.
 
         The data stored includes the structure's
         block relations, transformer data, and block data.
@@ -74,7 +76,13 @@ class BlockStructureStore(object):
     def get(self, root_block_usage_key):
         """
         Deserializes and returns the block structure starting at
-        root_block_usage_key, if found in the cache or storage.
+        root_block_usage_key, if found in the process cache, the cache
+        or storage.
+
+        Block structures are only held by the process cache while
+        storage backing is enabled, since the stored model provides
+        the version data that keys them.  The returned block structure
+        is a copy-on-write copy of the one held in the process cache.
 
         The given root_block_usage_key must equate the
         root_block_usage_key previously passed to the `add` method.
@@ -93,6 +101,11 @@ class BlockStructureStore(object):
             found.
         """
         bs_model = self._get_model(root_block_usage_key)
+        process_cache_key = self._encode_process_cache_key(bs_model)
+        if process_cache_key is not None:
+            block_structure = self._process_cache.get(process_cache_key)
+            if block_structure is not None:
+                return block_structure.copy_on_write()
 
         try:
             serialized_data = self._get_from_cache(bs_model)
@@ -100,7 +113,12 @@ class BlockStructureStore(object):
             serialized_data = self._get_from_store(bs_model)
             self._add_to_cache(serialized_data, bs_model)
 
-        return self._deserialize(serialized_data, root_block_usage_key)
+        block_structure = self._deserialize(serialized_data, root_block_usage_key)
+        if process_cache_key is None:
+            return block_structure
+
+        self._process_cache.set(process_cache_key, block_structure, len(serialized_data))
+        return block_structure.copy_on_write()
 
     def delete(self, root_block_usage_key):
         """
@@ -112,6 +130,7 @@ class BlockStructureStore(object):
                 of the block structure that is to be removed.
         """
         bs_model = self._get_model(root_block_usage_key)
+        self._process_cache.delete(bs_model.data_usage_key)
         self._cache.delete(self._encode_root_cache_key(bs_model))
         bs_model.delete()
         logger.info(u"BlockStructure: Deleted from cache and store; %s.", bs_model)
@@ -196,19 +215,19 @@ class BlockStructureStore(object):
         """
         Serializes the data for the given block_structure.
         """
-        data_to_cache = (
-            block_structure._block_relations,
-            block_structure.transformer_data,
-            block_structure._block_data_map,
-        )
-        return zpickle(data_to_cache)
+        return columnar.serialize(block_structure)
 
     def _deserialize(self, serialized_data, root_block_usage_key):
         """
         Deserializes the given data and returns the parsed block_structure.
+
+        Data serialized before the columnar format was introduced is
+        still read from its zpickled form.
         """
 
         try:
+            if columnar.is_columnar(serialized_data):
+                return columnar.deserialize(serialized_data, root_block_usage_key)
             block_relations, transformer_data, block_data_map = zunpickle(serialized_data)
         except Exception:
             # Somehow failed to de-serialized the data, assume it's corrupt.
@@ -238,6 +257,26 @@ class BlockStructureStore(object):
                 root_usage_key=six.text_type(bs_model.data_usage_key),
             )
 
+    def _encode_process_cache_key(self, bs_model):
+        """
+        Returns the key to use in the process cache for the given
+        BlockStructureModel, or None if the process cache is not to be
+        used for it.
+        """
+        if not (self._process_cache.enabled and _is_storage_backing_enabled()):
+            return None
+
+        version_data = self._version_data_of_model(bs_model)
+        if version_data['data_version'] is None and version_data['data_edit_timestamp'] is None:
+            # Without a version of the data itself, a newer collection
+            # could not be told apart from the cached one.
+            return None
+
+        return (
+            bs_model.data_usage_key,
+            tuple(version_data[field_name] for field_name in BlockStructureModel.VERSION_FIELDS),
+        )
+
     @staticmethod
     def _version_data_of_block(root_block):
         """
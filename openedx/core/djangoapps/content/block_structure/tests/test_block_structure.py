@@ -312,3 +312,36 @@ class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
         _set_value(new_copy, 'edit2')
         self.assertEqual(_get_value(block_structure), 'edit1')
         self.assertEqual(_get_value(new_copy), 'edit2')
+
+    def test_copy_on_write(self):
+        block_structure = self.create_block_structure(ChildrenMapTestMixin.LINEAR_CHILDREN_MAP)
+        for block in block_structure:
+            block_structure._get_or_create_block(block).children = block_structure.get_children(block)
+        block_structure.set_transformer_block_field(1, 'transformer', 'test_key', 'original_value')
+        block_structure.set_transformer_data('transformer', 'test_key', 'original_value')
+
+        # create a copy of the structure and verify they are equivalent
+        new_copy = block_structure.copy_on_write()
+        self.assertEqual(block_structure.root_block_usage_key, new_copy.root_block_usage_key)
+        self.assert_block_structure(new_copy, [[1], [2], [3], []])
+        for block in block_structure:
+            self.assertEqual(block_structure[block].children, new_copy[block].children)
+        self.assertEqual(new_copy.get_transformer_block_field(1, 'transformer', 'test_key'), 'original_value')
+        self.assertEqual(new_copy.get_transformer_data('transformer', 'test_key'), 'original_value')
+
+        # verify edits to the copy do not affect the original
+        new_copy.remove_block(2, keep_descendants=True)
+        new_copy.set_transformer_block_field(1, 'transformer', 'test_key', 'edit')
+        new_copy.set_transformer_data('transformer', 'test_key', 'edit')
+        new_copy.override_xblock_field(0, 'children', [])
+        new_copy[1].children.append(3)
+
+        self.assert_block_structure(new_copy, [[1], [3], [], []], missing_blocks=[2])
+        self.assert_block_structure(block_structure, [[1], [2], [3], []])
+        self.assertEqual(block_structure.get_transformer_block_field(1, 'transformer', 'test_key'), 'original_value')
+        self.assertEqual(block_structure.get_transformer_data('transformer', 'test_key'), 'original_value')
+        self.assertEqual(block_structure[0].children, [1])
+        self.assertEqual(block_structure[1].children, [2])
+
+        # verify a full copy of the copy includes its edits
+        self.assertEqual(new_copy.copy()[1].children, [2, 3])
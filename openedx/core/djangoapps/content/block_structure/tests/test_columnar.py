@@ -0,0 +1,159 @@
+"""
+Tests for block_structure/columnar.py
+"""
+
+
+import pickle
+# pylint: disable=protected-access
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+import ddt
+from pytz import utc
+
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from openedx.core.lib.cache_utils import zpickle
+
+from .. import columnar
+from ..block_structure import BlockStructureBlockData
+from ..exceptions import BlockStructureNotFound
+from ..store import BlockStructureStore
+from .helpers import ChildrenMapTestMixin, MockCache, MockTransformer, UsageKeyFactoryMixin
+
+
+class UnencodableValue(object):
+    """
+    A picklable value that cannot be represented in a JSON column.
+    """
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, UnencodableValue) and self.value == other.value
+
+    def __ne__(self, other):
+        return not self == other
+
+
+@ddt.ddt
+class TestColumnarSerialization(UsageKeyFactoryMixin, ChildrenMapTestMixin, TestCase):
+    """
+    Tests for the columnar serialization of block structures.
+    """
+    def setUp(self):
+        super(TestColumnarSerialization, self).setUp()
+        self.block_structure = self.create_block_structure(self.DAG_CHILDREN_MAP)
+        self.block_structure._add_transformer(MockTransformer)
+        self.block_structure.set_transformer_data(MockTransformer, 'partitions', [UnencodableValue(1)])
+        for block_id in range(len(self.DAG_CHILDREN_MAP)):
+            block_key = self.block_key_factory(block_id)
+            block_data = self.block_structure._get_or_create_block(block_key)
+            block_data.display_name = u'Block {}'.format(block_id)
+            block_data.start = datetime(2020, 1, block_id + 1, tzinfo=utc)
+            block_data.children = self.block_structure.get_children(block_key)
+            block_data.misc = {'__t': block_id, 1: (block_id, None), u'set': {block_id}, u'delta': timedelta(1)}
+            self.block_structure.set_transformer_block_field(block_key, MockTransformer, 'weight', block_id * 1.5)
+            if block_id % 2:
+                self.block_structure.set_transformer_block_field(
+                    block_key, MockTransformer, 'unencodable', UnencodableValue(block_id),
+                )
+
+    def _round_trip(self):
+        serialized_data = columnar.serialize(self.block_structure)
+        self.assertTrue(columnar.is_columnar(serialized_data))
+        return columnar.deserialize(serialized_data, self.block_structure.root_block_usage_key)
+
+    def test_relations(self):
+        deserialized = self._round_trip()
+        self.assert_block_structure(deserialized, self.DAG_CHILDREN_MAP)
+        for block_key in self.block_structure.get_block_keys():
+            self.assertEqual(deserialized.get_children(block_key), self.block_structure.get_children(block_key))
+            self.assertEqual(deserialized.get_parents(block_key), self.block_structure.get_parents(block_key))
+
+    @ddt.data('display_name', 'start', 'children', 'misc')
+    def test_block_fields(self, field_name):
+        deserialized = self._round_trip()
+        for block_key in self.block_structure.get_block_keys():
+            self.assertEqual(
+                deserialized.get_xblock_field(block_key, field_name),
+                self.block_structure.get_xblock_field(block_key, field_name),
+            )
+            self.assertIsNone(deserialized.get_xblock_field(block_key, 'not_collected'))
+
+    @ddt.data('weight', 'unencodable')
+    def test_transformer_block_fields(self, field_name):
+        deserialized = self._round_trip()
+        for block_key in self.block_structure.get_block_keys():
+            self.assertEqual(
+                deserialized.get_transformer_block_field(block_key, MockTransformer, field_name, 'default'),
+                self.block_structure.get_transformer_block_field(block_key, MockTransformer, field_name, 'default'),
+            )
+
+    def test_transformer_data(self):
+        deserialized = self._round_trip()
+        self.assertEqual(deserialized.get_transformer_data(MockTransformer, 'partitions'), [UnencodableValue(1)])
+        self.assertEqual(deserialized._get_transformer_data_version(MockTransformer), MockTransformer.WRITE_VERSION)
+
+    def test_lazy_field_updates(self):
+        deserialized = self._round_trip()
+        block_key = self.block_key_factory(1)
+        deserialized.override_xblock_field(block_key, 'display_name', u'Overridden')
+        deserialized.remove_transformer_block_field(block_key, MockTransformer, 'weight')
+        self.assertEqual(deserialized.get_xblock_field(block_key, 'display_name'), u'Overridden')
+        self.assertEqual(deserialized.get_xblock_field(self.block_key_factory(2), 'display_name'), u'Block 2')
+        self.assertIsNone(deserialized.get_transformer_block_field(block_key, MockTransformer, 'weight'))
+        self.assertEqual(set(deserialized[block_key].fields), set(self.block_structure[block_key].fields))
+
+    def test_copy_and_pickle(self):
+        block_key = self.block_key_factory(3)
+        copied = self._round_trip().copy()
+        self.assertIs(type(copied[block_key].fields), dict)
+        self.assertEqual(copied[block_key].fields, self.block_structure[block_key].fields)
+
+        unpickled = pickle.loads(pickle.dumps(self._round_trip()[block_key].fields))
+        self.assertIs(type(unpickled), dict)
+        self.assertEqual(unpickled, self.block_structure[block_key].fields)
+
+    def test_corrupt_data(self):
+        serialized_data = columnar.serialize(self.block_structure)
+        with self.assertRaises(ValueError):
+            columnar.deserialize(serialized_data[:-1], self.block_structure.root_block_usage_key)
+
+
+class TestColumnarSerializationOfIntegerKeys(ChildrenMapTestMixin, TestCase):
+    """
+    Tests for the columnar serialization of block structures whose keys
+    are not usage keys.
+    """
+    def test_relations(self):
+        block_structure = self.create_block_structure(self.SIMPLE_CHILDREN_MAP)
+        block_structure._get_or_create_block(1).display_name = u'Block 1'
+        deserialized = columnar.deserialize(columnar.serialize(block_structure), 0)
+        self.assert_block_structure(deserialized, self.SIMPLE_CHILDREN_MAP)
+        self.assertEqual(deserialized.get_xblock_field(1, 'display_name'), u'Block 1')
+
+
+class TestStoreSerializationFormats(UsageKeyFactoryMixin, ChildrenMapTestMixin, CacheIsolationTestCase):
+    """
+    Tests for the serialization formats read by BlockStructureStore.
+    """
+    def setUp(self):
+        super(TestStoreSerializationFormats, self).setUp()
+        self.block_structure = self.create_block_structure(self.SIMPLE_CHILDREN_MAP)
+        self.store = BlockStructureStore(MockCache())
+
+    def test_legacy_pickled_data(self):
+        serialized_data = zpickle((
+            self.block_structure._block_relations,
+            self.block_structure.transformer_data,
+            self.block_structure._block_data_map,
+        ))
+        self.assertFalse(columnar.is_columnar(serialized_data))
+        deserialized = self.store._deserialize(serialized_data, self.block_structure.root_block_usage_key)
+        self.assert_block_structure(deserialized, self.SIMPLE_CHILDREN_MAP)
+        self.assertIsInstance(deserialized, BlockStructureBlockData)
+
+    def test_corrupt_columnar_data(self):
+        serialized_data = self.store._serialize(self.block_structure)
+        with self.assertRaises(BlockStructureNotFound):
+            self.store._deserialize(serialized_data[:-1], self.block_structure.root_block_usage_key)
@@ -0,0 +1,65 @@
+"""
+Tests for block_structure/process_cache.py
+"""
+
+
+from unittest import TestCase
+
+import ddt
+from mock import patch
+
+from ..process_cache import BlockStructureProcessCache
+
+
+@ddt.ddt
+class TestBlockStructureProcessCache(TestCase):
+    """
+    Tests for BlockStructureProcessCache
+    """
+    def setUp(self):
+        super(TestBlockStructureProcessCache, self).setUp()
+        self.cache = BlockStructureProcessCache(max_size=10)
+        patcher = patch('openedx.core.djangoapps.content.block_structure.process_cache.set_custom_metric')
+        self.mock_set_custom_metric = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_and_set(self):
+        self.assertIsNone(self.cache.get(('root', 'v1')))
+        self.cache.set(('root', 'v1'), 'structure', 4)
+        self.assertEqual(self.cache.get(('root', 'v1')), 'structure')
+        self.assertIsNone(self.cache.get(('root', 'v2')))
+        self.assertEqual((self.cache.hits, self.cache.misses, self.cache.size), (1, 2, 4))
+        self.mock_set_custom_metric.assert_any_call('block_structure_process_cache_hit', True)
+        self.mock_set_custom_metric.assert_any_call('block_structure_process_cache_size', 4)
+
+    def test_new_version_replaces_old(self):
+        self.cache.set(('root', 'v1'), 'structure_v1', 4)
+        self.cache.set(('root', 'v2'), 'structure_v2', 5)
+        self.assertIsNone(self.cache.get(('root', 'v1')))
+        self.assertEqual(self.cache.get(('root', 'v2')), 'structure_v2')
+        self.assertEqual((self.cache.size, self.cache.evictions), (5, 0))
+
+    def test_lru_eviction(self):
+        self.cache.set(('root1', 'v1'), 'structure1', 4)
+        self.cache.set(('root2', 'v1'), 'structure2', 4)
+        self.cache.get(('root1', 'v1'))
+        self.cache.set(('root3', 'v1'), 'structure3', 4)
+
+        self.assertEqual(self.cache.get(('root1', 'v1')), 'structure1')
+        self.assertIsNone(self.cache.get(('root2', 'v1')))
+        self.assertEqual(self.cache.get(('root3', 'v1')), 'structure3')
+        self.assertEqual((self.cache.size, self.cache.evictions), (8, 1))
+
+    @ddt.data(0, 11)
+    def test_too_large(self, max_size):
+        self.cache.max_size = max_size
+        self.cache.set(('root', 'v1'), 'structure', 11)
+        self.assertEqual(self.cache.get(('root', 'v1')) is not None, max_size > 0)
+
+    def test_delete(self):
+        self.cache.set(('root1', 'v1'), 'structure1', 4)
+        self.cache.set(('root2', 'v1'), 'structure2', 4)
+        self.cache.delete('root1')
+        self.assertIsNone(self.cache.get(('root1', 'v1')))
+        self.assertEqual(self.cache.get(('root2', 'v1')), 'structure2')
+        self.assertEqual(self.cache.size, 4)
@@ -3,13 +3,17 @@ Tests for block_structure/cache.py
 """
 
 
+from datetime import datetime
+
 import ddt
+from pytz import UTC
 
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
 from ..config import STORAGE_BACKING_FOR_CACHE, waffle
 from ..config.models import BlockStructureConfiguration
 from ..exceptions import BlockStructureNotFound
+from ..process_cache import BlockStructureProcessCache
 from ..store import BlockStructureStore
 from .helpers import ChildrenMapTestMixin, MockCache, MockTransformer, UsageKeyFactoryMixin
 
@@ -90,3 +94,31 @@ class TestBlockStructureStore(UsageKeyFactoryMixin, ChildrenMapTestMixin, CacheI
         assert self.mock_cache.timeout_from_last_call == 0
         self.store.add(self.block_structure)
         assert self.mock_cache.timeout_from_last_call == timeout
+
+    def test_process_cache(self):
+        self.store._process_cache = BlockStructureProcessCache(max_size=10 ** 6)
+        root_block_data = self.block_structure._get_or_create_block(self.block_structure.root_block_usage_key)
+        root_block_data.course_version = 'version1'
+        root_block_data.subtree_edited_on = datetime(2020, 1, 1, tzinfo=UTC)
+
+        with waffle().override(STORAGE_BACKING_FOR_CACHE, active=True):
+            self.store.add(self.block_structure)
+            first_value = self.store.get(self.block_structure.root_block_usage_key)
+            self.mock_cache.map.clear()
+            second_value = self.store.get(self.block_structure.root_block_usage_key)
+
+            # The second value is served from the process cache, as an
+            # independent copy of the cached structure.
+            self.assertEqual(self.store._process_cache.hits, 1)
+            self.assert_block_structure(second_value, self.children_map)
+            first_value.remove_block(self.block_key_factory(1), keep_descendants=False)
+            self.assert_block_structure(second_value, self.children_map)
+
+            # A newly collected version replaces the cached one.
+            root_block_data.course_version = 'version2'
+            self.store.add(self.block_structure)
+            self.store.get(self.block_structure.root_block_usage_key)
+            self.assertEqual(self.store._process_cache.misses, 2)
+
+            self.store.delete(self.block_structure.root_block_usage_key)
+            self.assertEqual(self.store._process_cache.size, 0)
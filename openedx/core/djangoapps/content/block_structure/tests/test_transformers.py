@@ -5,12 +5,21 @@ Tests for transformers.py
 
 from unittest import TestCase
 
+from datetime import datetime
+
+import ddt
 from mock import MagicMock, patch
 
 from ..block_structure import BlockStructureModulestoreData
 from ..exceptions import TransformerDataIncompatible, TransformerException
 from ..transformers import BlockStructureTransformers
-from .helpers import ChildrenMapTestMixin, MockFilteringTransformer, MockTransformer, mock_registered_transformers
+from .helpers import (
+    ChildrenMapTestMixin,
+    MockFilteringTransformer,
+    MockTransformer,
+    MockXBlock,
+    mock_registered_transformers
+)
 
 
 class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
@@ -82,3 +91,94 @@ class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
                 self.transformers.verify_versions(block_structure)
             self.transformers.collect(block_structure)
             self.assertTrue(self.transformers.verify_versions(block_structure))
+
+
+class IncrementalTransformer(MockTransformer):
+    """
+    Mock transformer that supports incremental collection and records
+    the blocks it collected.
+    """
+    SUPPORTS_INCREMENTAL_COLLECT = True
+    collected_block_keys = None
+
+    @classmethod
+    def collect(cls, block_structure):
+        cls.collected_block_keys = set()
+        for block_key in block_structure.topological_traversal():
+            if block_structure.should_collect(block_key):
+                cls.collected_block_keys.add(block_key)
+                block_structure.set_transformer_block_field(block_key, cls, 'collected', True)
+
+
+@ddt.ddt
+class TestIncrementalCollect(ChildrenMapTestMixin, TestCase):
+    """
+    Test class for incremental collection by BlockStructureTransformers
+    """
+    def setUp(self):
+        super(TestIncrementalCollect, self).setUp()
+        self.registered_transformers = [IncrementalTransformer()]
+        self.previous_block_structure = self.create_modulestore_data(self.SIMPLE_CHILDREN_MAP)
+        with mock_registered_transformers(self.registered_transformers):
+            BlockStructureTransformers.collect(self.previous_block_structure)
+
+    def create_modulestore_data(self, children_map, edited_block_ids=()):
+        """
+        Returns a block structure for the given children_map whose blocks
+        were all edited on the same date, except for those in
+        edited_block_ids.
+        """
+        block_structure = self.create_block_structure(children_map, BlockStructureModulestoreData)
+        for block_key in range(len(children_map)):
+            edited_on = datetime(2020, 1, 2 if block_key in edited_block_ids else 1)
+            block_structure._add_xblock(  # pylint: disable=protected-access
+                block_key, MockXBlock(block_key, field_map={'edited_on': edited_on}),
+            )
+        return block_structure
+
+    @ddt.data(
+        # An edited leaf re-collects its ancestors.
+        ([3], ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP, {0, 1, 3}),
+        # An edited inner block re-collects its ancestors and descendants.
+        ([1], ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP, {0, 1, 3, 4}),
+        # A moved block re-collects its old and new relatives.
+        ([], [[1, 2], [3], [4], [], []], {0, 1, 2, 3, 4}),
+        # A new block re-collects its ancestors.
+        ([], [[1, 2], [3, 4], [5], [], [], []], {0, 2, 5}),
+        # Without changes, nothing is re-collected.
+        ([], ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP, set()),
+    )
+    @ddt.unpack
+    def test_collect_incrementally(self, edited_block_ids, children_map, expected_collected):
+        block_structure = self.create_modulestore_data(children_map, edited_block_ids)
+        with mock_registered_transformers(self.registered_transformers):
+            self.assertTrue(
+                BlockStructureTransformers.collect_incrementally(block_structure, self.previous_block_structure)
+            )
+            self.assertTrue(BlockStructureTransformers.verify_versions(block_structure))
+
+        self.assertEqual(IncrementalTransformer.collected_block_keys, expected_collected)
+        for block_key in range(len(children_map)):
+            self.assertTrue(
+                block_structure.get_transformer_block_field(block_key, IncrementalTransformer, 'collected')
+            )
+            self.assertEqual(
+                block_structure.get_xblock_field(block_key, 'edited_on'),
+                datetime(2020, 1, 2 if block_key in edited_block_ids else 1),
+            )
+
+    def test_unsupported_transformer(self):
+        block_structure = self.create_modulestore_data(self.SIMPLE_CHILDREN_MAP)
+        with mock_registered_transformers(self.registered_transformers + [MockTransformer()]):
+            self.assertFalse(
+                BlockStructureTransformers.collect_incrementally(block_structure, self.previous_block_structure)
+            )
+        self.assertEqual(len(block_structure._block_data_map), 0)  # pylint: disable=protected-access
+
+    def test_transformer_version_changed(self):
+        block_structure = self.create_modulestore_data(self.SIMPLE_CHILDREN_MAP)
+        with mock_registered_transformers(self.registered_transformers):
+            with patch.object(IncrementalTransformer, 'WRITE_VERSION', 2):
+                self.assertFalse(
+                    BlockStructureTransformers.collect_incrementally(block_structure, self.previous_block_structure)
+                )
@@ -57,6 +57,34 @@ class BlockStructureTransformer(object):
     WRITE_VERSION = 0
     READ_VERSION = 0
 
+    # Transformers may set SUPPORTS_INCREMENTAL_COLLECT to True if their
+    # collect method can patch previously collected data rather than
+    # recomputing it for the entire structure.  When collecting
+    # incrementally, the block structure passed to collect already
+    # contains the previously collected data of all blocks that are not
+    # affected by changes, and such a transformer's collect method must:
+    #
+    # 1. Only set block-specific data for blocks for which
+    #    block_structure.should_collect returns True.
+    #
+    # 2. Compute a block's data only from its own xBlock and the data
+    #    of its ancestors or descendants.  Every ancestor and descendant
+    #    of a changed block is re-collected along with it.  Only
+    #    transformers whose block-specific data depends solely on the
+    #    fields of that block and of its ancestors or descendants may
+    #    opt in, unless they call block_structure.collect_all_blocks
+    #    whenever anything else it depends on changed, such as
+    #    course-wide data that can change without any block being
+    #    edited.
+    #
+    # 3. Recompute all of its non-block-specific data whenever
+    #    block_structure.should_collect returns True for the root block.
+    #
+    # Transformers that only request xBlock fields satisfy these
+    # conditions trivially.  Incremental collection is used only when
+    # all registered transformers support it.
+    SUPPORTS_INCREMENTAL_COLLECT = False
+
     @classmethod
     def name(cls):
         """
@@ -6,6 +6,7 @@ Module for a collection of BlockStructureTransformers.
 import functools
 from logging import getLogger
 
+from .block_structure import EDITED_ON_FIELD
 from .exceptions import TransformerDataIncompatible, TransformerException
 from .transformer import FilteringTransformerMixin
 from .transformer_registry import TransformerRegistry
@@ -76,6 +77,10 @@ class BlockStructureTransformers(object):
         """
         Collects data for each registered transformer.
         """
+        # Collect the field needed to detect changed blocks during
+        # any later incremental collection.
+        block_structure.request_xblock_fields(EDITED_ON_FIELD)
+
         for transformer in TransformerRegistry.get_registered_transformers():
             block_structure._add_transformer(transformer)  # pylint: disable=protected-access
             transformer.collect(block_structure)
@@ -83,6 +88,43 @@ class BlockStructureTransformers(object):
         # Collect all fields that were requested by the transformers.
         block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
 
+    @classmethod
+    def collect_incrementally(cls, block_structure, previous_block_structure):
+        """
+        Collects data for each registered transformer, re-collecting only
+        the blocks affected by changes since previous_block_structure was
+        collected and carrying over the previously collected data of all
+        other blocks.
+
+        Incremental collection is only possible when all registered
+        transformers support it and the previously collected data was
+        written by their current versions.
+
+        Returns:
+            bool - Whether the data was collected.  If False, the given
+            block_structure is left unmodified and should be collected
+            with the collect method instead.
+        """
+        registered_transformers = TransformerRegistry.get_registered_transformers()
+        for transformer in registered_transformers:
+            if not transformer.SUPPORTS_INCREMENTAL_COLLECT:
+                return False
+            # pylint: disable=protected-access
+            if previous_block_structure._get_transformer_data_version(transformer) != transformer.WRITE_VERSION:
+                return False
+
+        block_keys_to_collect = block_structure._carry_over_collected_data(  # pylint: disable=protected-access
+            previous_block_structure,
+        )
+        logger.info(
+            u'BlockStructure: Collecting %d of %d blocks incrementally for %s.',
+            len(block_keys_to_collect),
+            len(block_structure),
+            block_structure.root_block_usage_key,
+        )
+        cls.collect(block_structure)
+        return True
+
     @classmethod
     def verify_versions(cls, block_structure):
         """
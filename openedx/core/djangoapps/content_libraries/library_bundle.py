@@ -21,6 +21,7 @@ from openedx.core.djangolib.blockstore_cache import (
     get_bundle_files_cached,
     get_bundle_file_metadata_with_cache,
     get_bundle_version_number,
+    prefetch_bundle_files,
 )
 from openedx.core.lib import blockstore_api
 
@@ -122,6 +123,14 @@ class LibraryBundle(object):
         bundle_files = get_bundle_files_cached(self.bundle_uuid, draft_name=self.draft_name)
         return [f.path for f in bundle_files if f.path.endswith("/definition.xml")]
 
+    def prefetch_olx_files(self):
+        """
+        Fetch all the OLX files of this bundle at once, so that loading its
+        XBlock definitions one by one does not need a request to Blockstore
+        for each of them.
+        """
+        prefetch_bundle_files(self.bundle_uuid, self.get_olx_files(), draft_name=self.draft_name)
+
     def definition_for_usage(self, usage_key):
         """
         Given the usage key for an XBlock in this library bundle, return the
@@ -217,6 +226,7 @@ class LibraryBundle(object):
                 add_definitions_children(child_usage, child_def_key)
 
         # Find all the definitions in this bundle and recursively add all their descendants:
+        self.prefetch_olx_files()
         bundle_files = get_bundle_files_cached(self.bundle_uuid, draft_name=self.draft_name)
         if self.draft_name:
             version_arg = {"draft_name": self.draft_name}
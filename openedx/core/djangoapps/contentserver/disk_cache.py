@@ -0,0 +1,160 @@
+"""
+Local disk cache of course assets too large for the course_assets cache.
+"""
+
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+
+from django.conf import settings
+
+log = logging.getLogger(__name__)
+
+DIGEST_PATTERN = re.compile(r'^[0-9a-f]+$')
+
+
+class AssetDiskCache(object):
+    """
+    Stores the contents of course assets in files of a local directory,
+    named after their content digest, so that repeated requests for a
+    large asset are served from disk rather than read from GridFS chunk
+    by chunk.
+
+    Since files are named after the MD5 digest of their contents, they
+    never go stale, and assets with identical contents share a file.
+    Files are written atomically, and the least recently used ones are
+    removed once their total size exceeds max_size bytes.
+    """
+    def __init__(self, directory, max_size, x_accel_redirect_location=None):
+        self.directory = directory
+        self.max_size = max_size
+        self.x_accel_redirect_location = x_accel_redirect_location
+
+    @classmethod
+    def from_settings(cls):
+        """
+        Returns an AssetDiskCache configured by the
+        CONTENTSERVER_DISK_CACHE setting, or None if no DIRECTORY is set.
+        """
+        cache_settings = getattr(settings, 'CONTENTSERVER_DISK_CACHE', None) or {}
+        if not cache_settings.get('DIRECTORY'):
+            return None
+        return cls(
+            cache_settings['DIRECTORY'],
+            cache_settings.get('MAX_SIZE', 0),
+            cache_settings.get('X_ACCEL_REDIRECT_LOCATION'),
+        )
+
+    def is_cacheable(self, content):
+        """
+        Returns whether the data of the given StaticContent can be cached.
+        """
+        return (
+            self._file_name(content) is not None and
+            content.length is not None and content.length <= self.max_size
+        )
+
+    def get(self, content):
+        """
+        Returns the name of the file holding the data of the given
+        StaticContent, or None if it is not cached.
+        """
+        file_name = self._file_name(content)
+        if file_name is None:
+            return None
+        try:
+            # Marks the file as recently used.
+            os.utime(os.path.join(self.directory, file_name), None)
+        except OSError:
+            return None
+        return file_name
+
+    def store(self, content):
+        """
+        Writes the data of the given StaticContentStream, which is
+        consumed, to a file and returns its name, or None if it cannot
+        be cached.
+        """
+        if not self.is_cacheable(content):
+            return None
+        file_name = self._file_name(content)
+
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError:
+            log.warning(u"AssetDiskCache: Unable to write to %s", self.directory)
+            return None
+
+        try:
+            md5 = hashlib.md5()
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                for chunk in content.stream_data():
+                    md5.update(chunk)
+                    temp_file.write(chunk)
+            if md5.hexdigest() != content.content_digest:
+                log.warning(u"AssetDiskCache: Digest mismatch for %s", content.location)
+                os.remove(temp_path)
+                return None
+            os.rename(temp_path, os.path.join(self.directory, file_name))
+        except (IOError, OSError):
+            log.warning(u"AssetDiskCache: Unable to store %s", content.location)
+            self._remove(temp_path)
+            return None
+
+        self._evict()
+        return file_name
+
+    def path(self, file_name):
+        """
+        Returns the path of the given cached file.
+        """
+        return os.path.join(self.directory, file_name)
+
+    def _evict(self):
+        """
+        Removes the least recently used files until the total size of
+        the remaining ones is at most max_size.
+        """
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if DIGEST_PATTERN.match(file_name):
+                path = os.path.join(self.directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    @staticmethod
+    def _file_name(content):
+        """
+        Returns the name of the file of the given content, or None if it
+        has no usable digest.
+        """
+        digest = getattr(content, 'content_digest', None)
+        if not digest or not DIGEST_PATTERN.match(digest):
+            return None
+        return digest
+
+    @staticmethod
+    def _remove(path):
+        """
+        Removes the given file, which other processes may have removed
+        already.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
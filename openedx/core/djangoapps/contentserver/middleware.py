@@ -5,15 +5,19 @@ Middleware to serve assets.
 
 import datetime
 import logging
+import uuid
+from functools import partial
 
 import six
 from django.http import (
+    FileResponse,
     HttpResponse,
     HttpResponseBadRequest,
     HttpResponseForbidden,
     HttpResponseNotFound,
     HttpResponseNotModified,
-    HttpResponsePermanentRedirect
+    HttpResponsePermanentRedirect,
+    StreamingHttpResponse
 )
 from django.utils.deprecation import MiddlewareMixin
 from opaque_keys import InvalidKeyError
@@ -23,12 +27,13 @@ from six import text_type
 from openedx.core.djangoapps.header_control import force_header_for_response
 from student.models import CourseEnrollment
 from xmodule.assetstore.assetmgr import AssetManager
-from xmodule.contentstore.content import XASSET_LOCATION_TAG, StaticContent
+from xmodule.contentstore.content import XASSET_LOCATION_TAG, StaticContent, StaticContentStream
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore import InvalidLocationError
 from xmodule.modulestore.exceptions import ItemNotFoundError
 
 from .caching import get_cached_content, set_cached_content
+from .disk_cache import AssetDiskCache
 from .models import CdnUserAgentsConfig, CourseAssetCacheTtlConfig
 
 log = logging.getLogger(__name__)
@@ -43,6 +48,9 @@ except ImportError:
 
 HTTP_DATE_FORMAT = u"%a, %d %b %Y %H:%M:%S GMT"
 
+# Size of the chunks read from files of the local disk cache.
+FILE_CHUNK_SIZE = 64 * 1024
+
 
 class StaticContentServer(MiddlewareMixin):
     """
@@ -126,63 +134,58 @@ class StaticContentServer(MiddlewareMixin):
                 if if_modified_since == last_modified_at_str:
                     return HttpResponseNotModified()
 
-            # *** File streaming within a byte range ***
-            # If a Range is provided, parse Range attribute of the request
-            # Add Content-Range in the response if Range is structurally correct
-            # Request -> Range attribute structure: "Range: bytes=first-[last]"
-            # Response -> Content-Range attribute structure: "Content-Range: bytes first-last/totalLength"
-            # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.35
-            response = None
-            if request.META.get('HTTP_RANGE'):
-                # If we have a StaticContent, get a StaticContentStream.  Can't manipulate the bytes otherwise.
-                if isinstance(content, StaticContent):
-                    content = AssetManager.find(loc, as_stream=True)
-
-                header_value = request.META['HTTP_RANGE']
-                try:
-                    unit, ranges = parse_range_header(header_value, content.length)
-                except ValueError as exception:
-                    # If the header field is syntactically invalid it should be ignored.
-                    log.exception(
-                        u"%s in Range header: %s for content: %s",
-                        text_type(exception), header_value, six.text_type(loc)
-                    )
+            # Large assets are served from the local disk cache, when one is
+            # configured, rather than read from GridFS on every request.
+            disk_cache = AssetDiskCache.from_settings()
+            cached_file_name = None
+            if disk_cache is not None and isinstance(content, StaticContentStream) and disk_cache.is_cacheable(content):
+                cached_file_name = disk_cache.get(content)
+                if cached_file_name is None:
+                    cached_file_name = disk_cache.store(content)
+                    if cached_file_name is None:
+                        # Storing consumed the stream.
+                        content = AssetManager.find(loc, as_stream=True)
+                if newrelic:
+                    newrelic.agent.add_custom_parameter('contentserver.disk_cached', cached_file_name is not None)
+
+            if cached_file_name is not None and disk_cache.x_accel_redirect_location:
+                # Let the web server send the file, and handle any Range header.
+                response = HttpResponse()
+                response['X-Accel-Redirect'] = u'{}/{}'.format(
+                    disk_cache.x_accel_redirect_location.rstrip('/'), cached_file_name
+                )
+            else:
+                cached_file = None
+                if cached_file_name is not None:
+                    try:
+                        cached_file = open(disk_cache.path(cached_file_name), 'rb')
+                    except (IOError, OSError):
+                        # Another process evicted the file in the meantime.
+                        log.warning(u'Asset %s was evicted from the disk cache, streaming it from GridFS', loc)
+                        content = AssetManager.find(loc, as_stream=True)
+
+                if cached_file is not None:
+                    response_class = StreamingHttpResponse
+                    read_range = partial(read_file_range, cached_file)
                 else:
-                    if unit != 'bytes':
-                        # Only accept ranges in bytes
-                        log.warning(u"Unknown unit in Range header: %s for content: %s", header_value, text_type(loc))
-                    elif len(ranges) > 1:
-                        # According to Http/1.1 spec content for multiple ranges should be sent as a multipart message.
-                        # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
-                        # But we send back the full content.
-                        log.warning(
-                            u"More than 1 ranges in Range header: %s for content: %s", header_value, text_type(loc)
-                        )
+                    response_class = HttpResponse
+                    read_range = None
+
+                response = self.get_range_response(request, content, loc, response_class, read_range)
+                if response is not None and response.status_code == 416:
+                    if cached_file is not None:
+                        cached_file.close()
+                    return response
+
+                # If Range header is absent or syntactically invalid return a full content response.
+                if response is None:
+                    if cached_file is not None:
+                        response = FileResponse(cached_file)
                     else:
-                        first, last = ranges[0]
-
-                        if 0 <= first <= last < content.length:
-                            # If the byte range is satisfiable
-                            response = HttpResponse(content.stream_data_in_range(first, last))
-                            response['Content-Range'] = u'bytes {first}-{last}/{length}'.format(
-                                first=first, last=last, length=content.length
-                            )
-                            response['Content-Length'] = str(last - first + 1)
-                            response.status_code = 206  # Partial Content
-
-                            if newrelic:
-                                newrelic.agent.add_custom_parameter('contentserver.ranged', True)
-                        else:
-                            log.warning(
-                                u"Cannot satisfy ranges in Range header: %s for content: %s",
-                                header_value, text_type(loc)
-                            )
-                            return HttpResponse(status=416)  # Requested Range Not Satisfiable
-
-            # If Range header is absent or syntactically invalid return a full content response.
-            if response is None:
-                response = HttpResponse(content.stream_data())
-                response['Content-Length'] = content.length
+                        response = HttpResponse(content.stream_data())
+                    response['Content-Length'] = content.length
+                elif cached_file is not None:
+                    response.streaming_content = close_after(response.streaming_content, cached_file)
 
             if newrelic:
                 newrelic.agent.add_custom_parameter('contentserver.content_len', content.length)
@@ -190,7 +193,8 @@ class StaticContentServer(MiddlewareMixin):
 
             # "Accept-Ranges: bytes" tells the user that only "bytes" ranges are allowed
             response['Accept-Ranges'] = 'bytes'
-            response['Content-Type'] = content.content_type
+            if not response.get('Content-Type', '').startswith('multipart/byteranges'):
+                response['Content-Type'] = content.content_type
             response['X-Frame-Options'] = 'ALLOW'
 
             # Set any caching headers, and do any response cleanup needed.  Based on how much
@@ -201,6 +205,76 @@ class StaticContentServer(MiddlewareMixin):
 
             return response
 
+    def get_range_response(self, request, content, location, response_class, read_range=None):
+        """
+        Returns a Partial Content response to the Range header of the request,
+        a Requested Range Not Satisfiable response, or None if the request has
+        no Range header or if the header is to be ignored.
+
+        `read_range(first, last)` streams the bytes of the given range (both
+        included), and defaults to reading them from GridFS.
+        """
+        # *** File streaming within a byte range ***
+        # If a Range is provided, parse Range attribute of the request
+        # Add Content-Range in the response if Range is structurally correct
+        # Request -> Range attribute structure: "Range: bytes=first-[last]"
+        # Response -> Content-Range attribute structure: "Content-Range: bytes first-last/totalLength"
+        # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.35
+        if not request.META.get('HTTP_RANGE'):
+            return None
+
+        if read_range is None:
+            # If we have a StaticContent, get a StaticContentStream.  Can't manipulate the bytes otherwise.
+            if isinstance(content, StaticContent) and not isinstance(content, StaticContentStream):
+                content = AssetManager.find(location, as_stream=True)
+            read_range = content.stream_data_in_range
+
+        header_value = request.META['HTTP_RANGE']
+        try:
+            unit, ranges = parse_range_header(header_value, content.length)
+        except ValueError as exception:
+            # If the header field is syntactically invalid it should be ignored.
+            log.exception(
+                u"%s in Range header: %s for content: %s",
+                text_type(exception), header_value, six.text_type(location)
+            )
+            return None
+
+        if unit != 'bytes':
+            # Only accept ranges in bytes
+            log.warning(u"Unknown unit in Range header: %s for content: %s", header_value, text_type(location))
+            return None
+
+        satisfiable_ranges = [(first, last) for first, last in ranges if 0 <= first <= last < content.length]
+        if not satisfiable_ranges:
+            log.warning(
+                u"Cannot satisfy ranges in Range header: %s for content: %s",
+                header_value, text_type(location)
+            )
+            return HttpResponse(status=416)  # Requested Range Not Satisfiable
+
+        if len(satisfiable_ranges) == 1:
+            first, last = satisfiable_ranges[0]
+            response = response_class(read_range(first, last))
+            response['Content-Range'] = u'bytes {first}-{last}/{length}'.format(
+                first=first, last=last, length=content.length
+            )
+            response['Content-Length'] = str(last - first + 1)
+        else:
+            # According to Http/1.1 spec content for multiple ranges should be sent as a multipart message.
+            # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
+            boundary = uuid.uuid4().hex
+            body, content_length = multipart_byteranges(
+                satisfiable_ranges, read_range, content.content_type, content.length, boundary
+            )
+            response = response_class(body, content_type='multipart/byteranges; boundary={}'.format(boundary))
+            response['Content-Length'] = str(content_length)
+        response.status_code = 206  # Partial Content
+
+        if newrelic:
+            newrelic.agent.add_custom_parameter('contentserver.ranged', True)
+        return response
+
     def set_caching_headers(self, content, response):
         """
         Sets caching headers based on whether or not the asset is locked.
@@ -346,3 +420,63 @@ def parse_range_header(header_value, content_length):
         raise ValueError('Invalid syntax')
 
     return unit, ranges
+
+
+def read_file_range(asset_file, first_byte, last_byte):
+    """
+    Streams the bytes of the given open file between first_byte and
+    last_byte (included).
+    """
+    asset_file.seek(first_byte)
+    remaining = last_byte - first_byte + 1
+    while remaining > 0:
+        chunk = asset_file.read(min(FILE_CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        yield chunk
+
+
+def close_after(chunks, asset_file):
+    """
+    Streams the given chunks, then closes the given file, also when the
+    response is closed before all chunks are streamed.
+    """
+    try:
+        for chunk in chunks:
+            yield chunk
+    finally:
+        asset_file.close()
+
+
+def multipart_byteranges(ranges, read_range, content_type, content_length, boundary):
+    """
+    Returns the body of a multipart/byteranges response for the given
+    (first, last) byte ranges, as an iterator of bytes, and its length.
+
+    See spec for details: https://tools.ietf.org/html/rfc7233#appendix-A
+    """
+    part_headers = [
+        u'--{boundary}\r\nContent-Type: {content_type}\r\nContent-Range: bytes {first}-{last}/{length}\r\n\r\n'.format(
+            boundary=boundary, content_type=content_type, first=first, last=last, length=content_length,
+        ).encode('utf-8')
+        for first, last in ranges
+    ]
+    closing = u'--{boundary}--\r\n'.format(boundary=boundary).encode('utf-8')
+    body_length = len(closing) + sum(
+        len(part_header) + (last - first + 1) + 2
+        for part_header, (first, last) in zip(part_headers, ranges)
+    )
+
+    def body():
+        """
+        Streams the parts of the body.
+        """
+        for part_header, (first, last) in zip(part_headers, ranges):
+            yield part_header
+            for chunk in read_range(first, last):
+                yield chunk
+            yield b'\r\n'
+        yield closing
+
+    return body(), body_length
@@ -8,6 +8,7 @@ import copy
 import datetime
 import ddt
 import logging
+import os
 import six
 import unittest
 from uuid import uuid4
@@ -18,6 +19,7 @@ from django.test.client import Client
 from django.test.utils import override_settings
 from mock import patch
 
+from openedx.core.lib.tempdir import mkdtemp_clean
 from xmodule.contentstore.django import contentstore
 from xmodule.contentstore.content import StaticContent, VERSIONED_ASSETS_PREFIX
 from xmodule.modulestore.django import modulestore
@@ -30,7 +32,8 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from student.models import CourseEnrollment
 from student.tests.factories import UserFactory, AdminFactory
 
-from ..middleware import parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
+from ..disk_cache import AssetDiskCache
+from ..middleware import multipart_byteranges, parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
 
 log = logging.getLogger(__name__)
 
@@ -240,17 +243,24 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
 
     def test_range_request_multiple_ranges(self):
         """
-        Test that multiple ranges in request outputs the full content.
+        Test that multiple ranges in request output a multipart message of the ranges.
         """
-        first_byte = self.length_unlocked / 4
-        last_byte = self.length_unlocked / 2
-        # pylint: disable=unicode-format-string
+        first_byte = self.length_unlocked // 4
+        last_byte = self.length_unlocked // 2
         resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={first}-{last}, -100'.format(
             first=first_byte, last=last_byte))
 
-        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
         self.assertNotIn('Content-Range', resp)
-        self.assertEqual(resp['Content-Length'], str(self.length_unlocked))
+        self.assertTrue(resp['Content-Type'].startswith('multipart/byteranges; boundary='))
+        self.assertEqual(resp['Content-Length'], str(len(resp.content)))
+        for first, last in [(first_byte, last_byte), (self.length_unlocked - 100, self.length_unlocked - 1)]:
+            self.assertIn(
+                u'Content-Range: bytes {first}-{last}/{length}'.format(
+                    first=first, last=last, length=self.length_unlocked
+                ).encode('utf-8'),
+                resp.content
+            )
 
     @ddt.data(
         'bytes 0-',
@@ -284,6 +294,75 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
             first=(self.length_unlocked), last=(self.length_unlocked)))
         self.assertEqual(resp.status_code, 416)
 
+    def _disk_cache_settings(self, **kwargs):
+        """
+        Returns CONTENTSERVER_DISK_CACHE settings enabling a disk cache in a
+        new temporary directory.
+        """
+        disk_cache_settings = {'DIRECTORY': mkdtemp_clean(), 'MAX_SIZE': 2 ** 20}
+        disk_cache_settings.update(kwargs)
+        return disk_cache_settings
+
+    def _patch_load_asset_as_stream(self):
+        """
+        Patches the contentserver to load assets as streams, as it does for
+        those too large for the course_assets cache.
+        """
+        return patch.object(
+            StaticContentServer, 'load_asset_from_location',
+            side_effect=lambda location: AssetManager.find(location, as_stream=True),
+        )
+
+    def test_disk_cache(self):
+        """
+        Test that large assets are stored in, then served from, the disk cache.
+        """
+        content = AssetManager.find(self.unlocked_asset)
+        disk_cache_settings = self._disk_cache_settings()
+        with override_settings(CONTENTSERVER_DISK_CACHE=disk_cache_settings), self._patch_load_asset_as_stream():
+            resp = self.client.get(self.url_unlocked)
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(b''.join(resp.streaming_content), content.data)
+            self.assertEqual(os.listdir(disk_cache_settings['DIRECTORY']), [content.content_digest])
+
+            with patch.object(AssetManager, 'find', wraps=AssetManager.find) as mock_find:
+                resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=1-3')
+                # Only the metadata of the asset is read from GridFS.
+                self.assertEqual(mock_find.call_count, 1)
+            self.assertEqual(resp.status_code, 206)
+            self.assertEqual(b''.join(resp.streaming_content), content.data[1:4])
+
+    @ddt.data(None, 'bytes=1-3')
+    def test_disk_cache_evicted(self, http_range):
+        """
+        Test that assets evicted from the disk cache by another process while
+        being served are streamed from GridFS.
+        """
+        content = AssetManager.find(self.unlocked_asset)
+        disk_cache_settings = self._disk_cache_settings()
+        with override_settings(CONTENTSERVER_DISK_CACHE=disk_cache_settings), self._patch_load_asset_as_stream():
+            self.client.get(self.url_unlocked)
+            with patch.object(AssetDiskCache, 'path', return_value=os.path.join(mkdtemp_clean(), 'evicted')):
+                resp = self.client.get(self.url_unlocked, **({'HTTP_RANGE': http_range} if http_range else {}))
+        if http_range:
+            self.assertEqual(resp.status_code, 206)
+            self.assertEqual(resp.content, content.data[1:4])
+        else:
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.content, content.data)
+
+    def test_disk_cache_x_accel_redirect(self):
+        """
+        Test that assets in the disk cache can be sent by the web server.
+        """
+        content = AssetManager.find(self.unlocked_asset)
+        disk_cache_settings = self._disk_cache_settings(X_ACCEL_REDIRECT_LOCATION='/contentserver-cache/')
+        with override_settings(CONTENTSERVER_DISK_CACHE=disk_cache_settings), self._patch_load_asset_as_stream():
+            resp = self.client.get(self.url_unlocked)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp['X-Accel-Redirect'], '/contentserver-cache/' + content.content_digest)
+        self.assertEqual(resp['Content-Type'], content.content_type)
+
     def test_vary_header_sent(self):
         """
         Tests that we're properly setting the Vary header to ensure browser requests don't get
@@ -446,3 +525,22 @@ class ParseRangeHeaderTestCase(unittest.TestCase):
         self.assertRaisesRegex(
             exception_class, exception_message_regex, parse_range_header, header_value, self.content_length
         )
+
+
+class MultipartByterangesTestCase(unittest.TestCase):
+    """
+    Tests for the multipart_byteranges function.
+    """
+
+    def test_multipart_byteranges(self):
+        data = b'0123456789'
+        body, content_length = multipart_byteranges(
+            [(0, 1), (5, 9)], lambda first, last: iter([data[first:last + 1]]), 'text/plain', len(data), 'BOUNDARY'
+        )
+        body = b''.join(body)
+        self.assertEqual(len(body), content_length)
+        self.assertEqual(body, (
+            b'--BOUNDARY\r\nContent-Type: text/plain\r\nContent-Range: bytes 0-1/10\r\n\r\n01\r\n'
+            b'--BOUNDARY\r\nContent-Type: text/plain\r\nContent-Range: bytes 5-9/10\r\n\r\n56789\r\n'
+            b'--BOUNDARY--\r\n'
+        ))
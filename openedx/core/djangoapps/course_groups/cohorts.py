@@ -11,7 +11,7 @@ import six
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.db.models.signals import m2m_changed, post_save
 from django.dispatch import receiver
 from django.http import Http404
@@ -23,6 +23,7 @@ from lms.djangoapps.courseware import courses
 from openedx.core.lib.cache_utils import request_cached
 from student.models import get_user_by_username_or_email
 
+from .membership_index import get_membership_index, invalidate_membership_index
 from .models import (
     CohortMembership,
     CourseCohort,
@@ -162,6 +163,7 @@ def get_cohort_id(user, course_key, use_cached=False):
 
 
 COHORT_CACHE_NAMESPACE = u"cohorts.get_cohort"
+GROUP_INFO_CACHE_NAMESPACE = u"cohorts.get_group_info_for_cohort"
 
 
 def _cohort_cache_key(user_id, course_key):
@@ -174,7 +176,14 @@ def _cohort_cache_key(user_id, course_key):
 def bulk_cache_cohorts(course_key, users):
     """
     Pre-fetches and caches the cohort assignments for the
-    given users, for later fast retrieval by get_cohort.
+    given users, for later fast retrieval by get_cohort, and
+    the partition groups of their cohorts, for later fast
+    retrieval by get_group_info_for_cohort.
+
+    The assignments are read from the cohort membership index
+    of the course when it is cached, and queried for the given
+    users otherwise: the index is not built here, as building it
+    reads the memberships of all of the users of the course.
     """
     # before populating the cache with another bulk set of data,
     # remove previously cached entries to keep memory usage low.
@@ -182,19 +191,138 @@ def bulk_cache_cohorts(course_key, users):
     cache = RequestCache(COHORT_CACHE_NAMESPACE).data
 
     if is_course_cohorted(course_key):
-        cohorts_by_user = {
-            membership.user: membership
-            for membership in
-            CohortMembership.objects.filter(user__in=users, course_id=course_key).select_related('user')
+        index = get_membership_index(course_key, build=False)
+        if index is not None:
+            cohort_ids_by_user_id = {user.id: index.get(user.id) for user in users}
+        else:
+            cohort_ids_by_user_id = dict.fromkeys([user.id for user in users])
+            cohort_ids_by_user_id.update(
+                CohortMembership.objects.filter(
+                    user__in=users, course_id=course_key
+                ).values_list('user_id', 'course_user_group_id')
+            )
+        cohort_ids = set(cohort_ids_by_user_id.values()) - {None}
+        cohorts_by_id = {
+            cohort.id: cohort
+            for cohort in (CourseUserGroup.objects.filter(id__in=cohort_ids) if cohort_ids else [])
         }
-        for user, membership in six.iteritems(cohorts_by_user):
-            cache[_cohort_cache_key(user.id, course_key)] = membership.course_user_group
-        uncohorted_users = [u for u in users if u not in cohorts_by_user]
+        _bulk_cache_group_info(list(cohorts_by_id.values()))
+        for user_id, cohort_id in six.iteritems(cohort_ids_by_user_id):
+            cache[_cohort_cache_key(user_id, course_key)] = cohorts_by_id.get(cohort_id)
     else:
-        uncohorted_users = users
+        for user in users:
+            cache[_cohort_cache_key(user.id, course_key)] = None
+
+
+def _bulk_cache_group_info(cohorts):
+    """
+    Pre-fetches and caches the partition groups linked to the given
+    cohorts, for later fast retrieval by get_group_info_for_cohort.
+    """
+    if not cohorts:
+        return
+    cache = RequestCache(GROUP_INFO_CACHE_NAMESPACE).data
+    group_info_by_cohort_id = {
+        partition_group.course_user_group_id: (partition_group.group_id, partition_group.partition_id)
+        for partition_group in CourseUserGroupPartitionGroup.objects.filter(course_user_group__in=cohorts)
+    }
+    for cohort in cohorts:
+        cache[six.text_type(cohort.id)] = group_info_by_cohort_id.get(cohort.id, (None, None))
 
-    for user in uncohorted_users:
-        cache[_cohort_cache_key(user.id, course_key)] = None
+
+def bulk_assign_random_cohorts(course_key, users):
+    """
+    Assigns those of the given users who have no cohort in the given
+    cohorted course to its random cohorts, as get_cohort does on their
+    first access to the course, so that bulk operations over the course
+    find all of its learners assigned.
+
+    Unlike add_user_to_cohort, the memberships are created in bulk
+    without locking them.  A user assigned to a cohort concurrently
+    keeps that cohort, and users pre-registered in a cohort by email
+    are left to get_cohort.
+
+    Returns the number of users assigned.
+    """
+    if not is_course_cohorted(course_key):
+        return 0
+
+    cohorted_user_ids = set(
+        CohortMembership.objects.filter(course_id=course_key, user__in=users).values_list('user_id', flat=True)
+    )
+    preregistered_emails = set(
+        UnregisteredLearnerCohortAssignments.objects.filter(
+            course_id=course_key, email__in=[user.email for user in users]
+        ).values_list('email', flat=True)
+    )
+    users = [user for user in users if user.id not in cohorted_user_ids and user.email not in preregistered_emails]
+    if not users:
+        return 0
+
+    course = courses.get_course(course_key)
+    random_cohorts = get_course_cohorts(course, assignment_type=CourseCohort.RANDOM) or [
+        get_random_cohort(course_key)
+    ]
+    cohorts_by_user_id = {user.id: local_random().choice(random_cohorts) for user in users}
+    _bulk_create_ignoring_conflicts(
+        CohortMembership,
+        [
+            CohortMembership(course_user_group=cohorts_by_user_id[user.id], user=user, course_id=course_key)
+            for user in users
+        ],
+    )
+    # bulk_create doesn't send post_save for the index to be updated.
+    invalidate_membership_index(course_key)
+
+    assigned_user_ids = set(
+        user_id
+        for user_id, cohort_id in CohortMembership.objects.filter(
+            course_id=course_key, user__in=users
+        ).values_list('user_id', 'course_user_group_id')
+        if cohort_id == cohorts_by_user_id[user_id].id
+    )
+    _bulk_create_ignoring_conflicts(
+        CourseUserGroup.users.through,
+        [
+            CourseUserGroup.users.through(courseusergroup_id=cohorts_by_user_id[user_id].id, user_id=user_id)
+            for user_id in assigned_user_ids
+        ],
+    )
+
+    cache = RequestCache(COHORT_CACHE_NAMESPACE).data
+    for user in users:
+        if user.id in assigned_user_ids:
+            cohort = cohorts_by_user_id[user.id]
+            tracker.emit(
+                "edx.cohort.user_added",
+                {"cohort_id": cohort.id, "cohort_name": cohort.name, "user_id": user.id}
+            )
+            cache[_cohort_cache_key(user.id, course_key)] = cohort
+            COHORT_MEMBERSHIP_UPDATED.send(sender=None, user=user, course_key=course_key)
+    return len(assigned_user_ids)
+
+
+def _bulk_create_ignoring_conflicts(model, instances):
+    """
+    Inserts the given instances of the given model in bulk, skipping
+    those which conflict with existing rows.
+
+    The instances are inserted one by one if the bulk insert fails,
+    each in its own savepoint, as bulk_create can't ignore conflicts
+    before Django 2.2.
+    """
+    if not instances:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.bulk_create(instances)
+    except IntegrityError:
+        for instance in instances:
+            try:
+                with transaction.atomic():
+                    model.objects.bulk_create([instance])
+            except IntegrityError:
+                continue
 
 
 def get_cohort(user, course_key, assign=True, use_cached=False):
@@ -522,7 +650,7 @@ def get_group_info_for_cohort(cohort, use_cached=False):
     use_cached=True to use the cached value instead of fetching from the
     database.
     """
-    cache = RequestCache(u"cohorts.get_group_info_for_cohort").data
+    cache = RequestCache(GROUP_INFO_CACHE_NAMESPACE).data
     cache_key = six.text_type(cohort.id)
 
     if use_cached and cache_key in cache:
@@ -0,0 +1,49 @@
+"""
+Assigns the enrolled learners of cohorted courses who have no cohort yet to
+the courses' random cohorts, ahead of their first access to the courses.
+
+Example usage:
+    $ ./manage.py lms assign_random_cohorts course-v1:edX+DemoX+Demo_Course
+"""
+
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from lms.djangoapps.courseware.models import chunks
+from openedx.core.djangoapps.course_groups.cohorts import bulk_assign_random_cohorts
+from student.models import CourseEnrollment
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Assigns the enrolled learners of the given courses to random cohorts.
+    """
+    help = 'Assigns the enrolled learners of the given cohorted courses who have no cohort to random cohorts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_ids', nargs='+', help='The ids of the courses.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='The number of learners assigned at once.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            course_keys = [CourseKey.from_string(course_id) for course_id in options['course_ids']]
+        except InvalidKeyError as error:
+            raise CommandError(u'Invalid course id: {}'.format(error))
+
+        for course_key in course_keys:
+            users = CourseEnrollment.objects.users_enrolled_in(course_key).order_by('id')
+            assigned_count = 0
+            for users_batch in chunks(users, options['batch_size']):
+                assigned_count += bulk_assign_random_cohorts(course_key, users_batch)
+            log.info(u'Assigned %d learners of %s to random cohorts.', assigned_count, course_key)
@@ -0,0 +1,256 @@
+"""
+A compact index of the cohort memberships of all of the users of a course.
+
+Each version of the index of a course is cached in chunks, each smaller
+than the size limit of a memcached item, along with a log of the users
+whose memberships changed since the index was built.  A membership change
+appends its user to the log rather than making the index out of date, and
+the memberships of the users in the log are queried whenever the index is
+read, so the index is only rebuilt when the log grows beyond
+MEMBERSHIP_INDEX_MAX_CHANGES, when memberships are changed in bulk, or
+when any of its cache entries is evicted.
+"""
+
+
+import zlib
+from array import array
+from bisect import bisect_left
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import CohortMembership
+
+MEMBERSHIP_INDEX_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Below the 1MB limit on the size of a memcached item.
+MEMBERSHIP_INDEX_CHUNK_SIZE = 512 * 1024
+
+MEMBERSHIP_INDEX_MAX_CHANGES = 1000
+
+
+class CohortMembershipIndex(object):
+    """
+    Maps the ids of the users of a course to the ids of their cohorts.
+
+    The ids are kept in two arrays sorted by user id, so that the index of
+    a course with many learners is small enough to be cached, and so that
+    looking up a batch of users doesn't query the database.  The cohorts of
+    the users whose memberships changed since the arrays were built are
+    kept in changes, by user id.
+    """
+    def __init__(self, course_key, user_ids, cohort_ids):
+        self.course_key = course_key
+        self.user_ids = user_ids
+        self.cohort_ids = cohort_ids
+        self.changes = {}
+
+    @classmethod
+    def build(cls, course_key):
+        """
+        Returns the index of the current cohort memberships in the given course.
+        """
+        user_ids, cohort_ids = array('l'), array('l')
+        memberships = CohortMembership.objects.filter(course_id=course_key).order_by('user_id')
+        for user_id, cohort_id in memberships.values_list('user_id', 'course_user_group_id'):
+            user_ids.append(user_id)
+            cohort_ids.append(cohort_id)
+        return cls(course_key, user_ids, cohort_ids)
+
+    @classmethod
+    def from_bytes(cls, course_key, data):
+        """
+        Returns the index of the given course serialized by to_bytes.
+        """
+        ids = array('l')
+        ids.frombytes(zlib.decompress(data))
+        return cls(course_key, ids[:len(ids) // 2], ids[len(ids) // 2:])
+
+    def to_bytes(self):
+        """
+        Returns the arrays of the index, compressed.
+        """
+        return zlib.compress(self.user_ids.tobytes() + self.cohort_ids.tobytes())
+
+    def apply_changes(self, user_ids):
+        """
+        Reads the current cohorts of the given users, whose memberships
+        changed since the index was built.
+        """
+        self.changes = dict.fromkeys(user_ids)
+        self.changes.update(
+            CohortMembership.objects.filter(
+                course_id=self.course_key, user_id__in=user_ids
+            ).values_list('user_id', 'course_user_group_id')
+        )
+
+    def get(self, user_id):
+        """
+        Returns the id of the cohort of the given user, or None if the user
+        has no cohort.
+        """
+        if user_id in self.changes:
+            return self.changes[user_id]
+        position = bisect_left(self.user_ids, user_id)
+        if position < len(self.user_ids) and self.user_ids[position] == user_id:
+            return self.cohort_ids[position]
+        return None
+
+    def __len__(self):
+        return len(self.user_ids)
+
+
+def _version_cache_key(course_key):
+    """
+    Returns the cache key of the current version of the index of the given course.
+    """
+    return u'course_groups.membership_index.version.{}'.format(course_key)
+
+
+def _index_cache_key(course_key, version):
+    """
+    Returns the cache key of the number of chunks of the given version of
+    the index of the given course.
+    """
+    return u'course_groups.membership_index.{}.{}'.format(course_key, version)
+
+
+def _chunk_cache_key(course_key, version, number):
+    """
+    Returns the cache key of the given chunk of the given version of the
+    index of the given course.
+    """
+    return u'course_groups.membership_index.{}.{}.chunk.{}'.format(course_key, version, number)
+
+
+def _changes_cache_key(course_key, version):
+    """
+    Returns the cache key of the number of changes logged since the given
+    version of the index of the given course was built.
+    """
+    return u'course_groups.membership_index.{}.{}.changes'.format(course_key, version)
+
+
+def _change_cache_key(course_key, version, number):
+    """
+    Returns the cache key of the id of the user of the given logged change.
+    """
+    return u'course_groups.membership_index.{}.{}.change.{}'.format(course_key, version, number)
+
+
+def _get_cached_index(course_key, version):
+    """
+    Returns the given version of the index of the given course with the
+    logged changes applied, or None if any of its cache entries is missing.
+    """
+    num_chunks = cache.get(_index_cache_key(course_key, version))
+    if num_chunks is None:
+        return None
+    chunk_keys = [_chunk_cache_key(course_key, version, number) for number in range(num_chunks)]
+    changes_key = _changes_cache_key(course_key, version)
+    entries = cache.get_many(chunk_keys + [changes_key])
+    if len(entries) < len(chunk_keys) + 1:
+        return None
+
+    change_keys = [_change_cache_key(course_key, version, number) for number in range(1, entries[changes_key] + 1)]
+    changed_user_ids = cache.get_many(change_keys) if change_keys else {}
+    if len(changed_user_ids) < len(change_keys):
+        return None
+
+    index = CohortMembershipIndex.from_bytes(course_key, b''.join(entries[key] for key in chunk_keys))
+    if changed_user_ids:
+        index.apply_changes(set(changed_user_ids.values()))
+    return index
+
+
+def _build_cached_index(course_key, version):
+    """
+    Returns the index of the given course, built from all of its memberships
+    and cached as the given version.
+    """
+    # Added before reading the memberships, so that any change made while
+    # they are read is logged.
+    cache.add(_changes_cache_key(course_key, version), 0, MEMBERSHIP_INDEX_CACHE_TIMEOUT)
+    index = CohortMembershipIndex.build(course_key)
+    data = index.to_bytes()
+    chunks = [
+        data[start:start + MEMBERSHIP_INDEX_CHUNK_SIZE]
+        for start in range(0, len(data), MEMBERSHIP_INDEX_CHUNK_SIZE)
+    ]
+    cache.set_many(
+        {_chunk_cache_key(course_key, version, number): chunk for number, chunk in enumerate(chunks)},
+        MEMBERSHIP_INDEX_CACHE_TIMEOUT,
+    )
+    cache.set(_index_cache_key(course_key, version), len(chunks), MEMBERSHIP_INDEX_CACHE_TIMEOUT)
+    return index
+
+
+def get_membership_index(course_key, build=True):
+    """
+    Returns the CohortMembershipIndex of the given course, from the cache
+    if it holds the current version of the index.
+
+    If the cache doesn't hold the current version, the index is built from
+    all of the memberships of the course, unless build is False, in which
+    case None is returned.
+    """
+    version_key = _version_cache_key(course_key)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid4().hex, None)
+        version = cache.get(version_key)
+
+    index = _get_cached_index(course_key, version) if version else None
+    if index is None:
+        if not build:
+            return None
+        index = _build_cached_index(course_key, version) if version else CohortMembershipIndex.build(course_key)
+    return index
+
+
+def _change_version(course_key):
+    """
+    Changes the version of the index of the given course, so that it is rebuilt.
+    """
+    cache.set(_version_cache_key(course_key), uuid4().hex, None)
+
+
+def record_membership_change(course_key, user_id):
+    """
+    Logs a change to the membership of the given user in the given course,
+    for the cached index of the course to be read with the current cohort
+    of the user.
+
+    The change is logged again once the current transaction is committed,
+    so that it is read after it is committed.  The index is made out of
+    date instead when the log is full or has been evicted.
+    """
+    def _log_change():
+        version = cache.get(_version_cache_key(course_key))
+        if version is None:
+            return
+        try:
+            number = cache.incr(_changes_cache_key(course_key, version))
+        except ValueError:
+            number = None
+        if number is None or number > MEMBERSHIP_INDEX_MAX_CHANGES:
+            _change_version(course_key)
+        else:
+            cache.set(_change_cache_key(course_key, version, number), user_id, MEMBERSHIP_INDEX_CACHE_TIMEOUT)
+
+    _log_change()
+    transaction.on_commit(_log_change)
+
+
+def invalidate_membership_index(course_key):
+    """
+    Makes the cached index of the given course out of date, for memberships
+    changed in bulk.
+
+    The version of the index is changed again once the current transaction
+    is committed, so that an index built from the memberships before the
+    change is committed isn't used.
+    """
+    _change_version(course_key)
+    transaction.on_commit(lambda: _change_version(course_key))
@@ -9,7 +9,7 @@ import logging
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
-from django.db.models.signals import pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.utils.encoding import python_2_unicode_compatible
 from opaque_keys.edx.django.models import CourseKeyField
@@ -148,6 +148,17 @@ def remove_user_from_cohort(sender, instance, **kwargs):  # pylint: disable=unus
     instance.course_user_group.save()
 
 
+@receiver(post_save, sender=CohortMembership)
+@receiver(post_delete, sender=CohortMembership)
+def record_cohort_membership_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Logs a changed CohortMembership for the cached cohort membership index
+    of its course.
+    """
+    from .membership_index import record_membership_change
+    record_membership_change(instance.course_id, instance.user_id)
+
+
 class CourseUserGroupPartitionGroup(models.Model):
     """
     Create User Partition Info.
@@ -9,6 +9,7 @@ from django.contrib.auth.models import AnonymousUser, User
 from django.db import IntegrityError
 from django.http import Http404
 from django.test import TestCase
+from edx_django_utils.cache import RequestCache
 from mock import call, patch
 from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import CourseLocator
@@ -22,7 +23,14 @@ from xmodule.modulestore.tests.django_utils import TEST_DATA_MIXED_MODULESTORE,
 from xmodule.modulestore.tests.factories import ToyCourseFactory
 
 from .. import cohorts
-from ..models import CourseCohort, CourseUserGroup, CourseUserGroupPartitionGroup, UnregisteredLearnerCohortAssignments
+from ..membership_index import get_membership_index
+from ..models import (
+    CohortMembership,
+    CourseCohort,
+    CourseUserGroup,
+    CourseUserGroupPartitionGroup,
+    UnregisteredLearnerCohortAssignments
+)
 from ..tests.helpers import CohortFactory, CourseCohortFactory, config_course_cohorts, config_course_cohorts_legacy
 
 
@@ -510,6 +518,72 @@ class TestCohorts(ModuleStoreTestCase):
             self.assertGreater(num_users, 1)
             self.assertLess(num_users, 50)
 
+    @ddt.data(True, False)
+    def test_bulk_cache_cohorts(self, index_built):
+        """
+        Make sure cohorts.bulk_cache_cohorts() caches the cohorts and partition groups of all users,
+        whether the cohort membership index of the course is cached or not.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True)
+        users = [UserFactory() for _ in range(3)]
+        cohort = CohortFactory(course_id=course.id, name="TestCohort", users=users[:2])
+        CourseUserGroupPartitionGroup.objects.create(course_user_group=cohort, partition_id=1, group_id=10)
+        if index_built:
+            get_membership_index(course.id)
+        RequestCache.clear_all_namespaces()
+
+        cohorts.bulk_cache_cohorts(course.id, users)
+        with self.assertNumQueries(0):
+            self.assertEqual(cohorts.get_cohort(users[0], course.id, use_cached=True), cohort)
+            self.assertEqual(cohorts.get_cohort(users[1], course.id, use_cached=True), cohort)
+            self.assertIsNone(cohorts.get_cohort(users[2], course.id, use_cached=True))
+            self.assertEqual(cohorts.get_group_info_for_cohort(cohort, use_cached=True), (10, 1))
+
+    @patch("openedx.core.djangoapps.course_groups.cohorts.COHORT_MEMBERSHIP_UPDATED")
+    def test_bulk_assign_random_cohorts(self, mock_signal):
+        """
+        Make sure cohorts.bulk_assign_random_cohorts() assigns only users who have no cohort.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True, auto_cohorts=["AutoGroup"])
+        users = [UserFactory() for _ in range(4)]
+        cohort = CohortFactory(course_id=course.id, name="TestCohort", users=[users[0]])
+        UnregisteredLearnerCohortAssignments.objects.create(
+            course_user_group=cohort, email=users[1].email, course_id=course.id
+        )
+
+        self.assertEqual(cohorts.bulk_assign_random_cohorts(course.id, users), 2)
+        self.assertEqual(mock_signal.send.call_count, 2)
+        self.assertEqual(cohorts.bulk_assign_random_cohorts(course.id, users), 0)
+
+        RequestCache.clear_all_namespaces()
+        self.assertEqual(cohorts.get_cohort(users[0], course.id, assign=False), cohort)
+        self.assertIsNone(cohorts.get_cohort(users[1], course.id, assign=False))
+        for user in users[2:]:
+            auto_cohort = cohorts.get_cohort(user, course.id, assign=False)
+            self.assertEqual(auto_cohort.name, "AutoGroup")
+            self.assertIn(user, auto_cohort.users.all())
+
+    def test_bulk_create_ignoring_conflicts(self):
+        """
+        Make sure the memberships created in bulk skip users assigned to a cohort concurrently.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True)
+        users = [UserFactory() for _ in range(3)]
+        cohort = CohortFactory(course_id=course.id, name="TestCohort", users=[users[1]])
+        other_cohort = CohortFactory(course_id=course.id, name="OtherCohort")
+
+        cohorts._bulk_create_ignoring_conflicts(  # pylint: disable=protected-access
+            CohortMembership,
+            [CohortMembership(course_user_group=other_cohort, user=user, course_id=course.id) for user in users],
+        )
+        self.assertEqual(
+            dict(CohortMembership.objects.filter(course_id=course.id).values_list('user_id', 'course_user_group_id')),
+            {users[0].id: other_cohort.id, users[1].id: cohort.id, users[2].id: other_cohort.id},
+        )
+
     def test_get_course_cohorts_noop(self):
         """
         Tests get_course_cohorts returns an empty list when no cohorts exist.
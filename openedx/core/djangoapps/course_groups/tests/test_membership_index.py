@@ -0,0 +1,100 @@
+"""
+Tests for the cohort membership index
+"""
+
+
+from mock import patch
+from opaque_keys.edx.locator import CourseLocator
+
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from student.tests.factories import UserFactory
+
+from ..membership_index import CohortMembershipIndex, get_membership_index, invalidate_membership_index
+from ..models import CohortMembership
+from .helpers import CohortFactory
+
+
+class CohortMembershipIndexTestCase(CacheIsolationTestCase):
+    """
+    Tests for CohortMembershipIndex and get_membership_index.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(CohortMembershipIndexTestCase, self).setUp()
+        self.course_key = CourseLocator('dummy', 'dummy', 'dummy')
+        self.users = [UserFactory() for _ in range(3)]
+        self.first_cohort = CohortFactory(course_id=self.course_key, users=[self.users[2]])
+        self.second_cohort = CohortFactory(course_id=self.course_key, users=[self.users[0]])
+        CohortFactory(course_id=CourseLocator('other', 'dummy', 'dummy'), users=[self.users[1]])
+
+    def test_build(self):
+        index = CohortMembershipIndex.build(self.course_key)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.get(self.users[0].id), self.second_cohort.id)
+        self.assertIsNone(index.get(self.users[1].id))
+        self.assertEqual(index.get(self.users[2].id), self.first_cohort.id)
+        self.assertIsNone(index.get(self.users[2].id + 1000))
+
+    def test_bytes(self):
+        index = CohortMembershipIndex.from_bytes(
+            self.course_key, CohortMembershipIndex.build(self.course_key).to_bytes()
+        )
+        self.assertEqual(index.course_key, self.course_key)
+        self.assertEqual(index.get(self.users[0].id), self.second_cohort.id)
+        self.assertEqual(index.get(self.users[2].id), self.first_cohort.id)
+
+    def test_cached(self):
+        get_membership_index(self.course_key)
+        with self.assertNumQueries(0):
+            index = get_membership_index(self.course_key)
+        self.assertEqual(index.get(self.users[0].id), self.second_cohort.id)
+
+    @patch('openedx.core.djangoapps.course_groups.membership_index.MEMBERSHIP_INDEX_CHUNK_SIZE', 8)
+    def test_chunks(self):
+        get_membership_index(self.course_key)
+        with self.assertNumQueries(0):
+            index = get_membership_index(self.course_key, build=False)
+        self.assertEqual(index.get(self.users[0].id), self.second_cohort.id)
+        self.assertEqual(index.get(self.users[2].id), self.first_cohort.id)
+
+    def test_membership_changes(self):
+        get_membership_index(self.course_key)
+
+        membership = CohortMembership.objects.get(user=self.users[0], course_id=self.course_key)
+        membership.course_user_group = self.first_cohort
+        membership.save()
+        # The index isn't rebuilt, only the changed membership is read.
+        with self.assertNumQueries(1):
+            index = get_membership_index(self.course_key, build=False)
+        self.assertEqual(index.get(self.users[0].id), self.first_cohort.id)
+        self.assertEqual(index.get(self.users[2].id), self.first_cohort.id)
+
+        membership.delete()
+        index = get_membership_index(self.course_key, build=False)
+        self.assertIsNone(index.get(self.users[0].id))
+        self.assertEqual(index.get(self.users[2].id), self.first_cohort.id)
+
+    @patch('openedx.core.djangoapps.course_groups.membership_index.MEMBERSHIP_INDEX_MAX_CHANGES', 1)
+    def test_too_many_changes(self):
+        get_membership_index(self.course_key)
+        CohortMembership.objects.get(user=self.users[0], course_id=self.course_key).delete()
+        self.assertIsNotNone(get_membership_index(self.course_key, build=False))
+        CohortMembership.objects.get(user=self.users[2], course_id=self.course_key).delete()
+        self.assertIsNone(get_membership_index(self.course_key, build=False))
+
+        index = get_membership_index(self.course_key)
+        self.assertEqual(len(index), 0)
+
+    def test_invalidate(self):
+        get_membership_index(self.course_key)
+        invalidate_membership_index(self.course_key)
+        self.assertIsNone(get_membership_index(self.course_key, build=False))
+
+    def test_not_built(self):
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_membership_index(self.course_key, build=False))
+        get_membership_index(self.course_key)
+        with self.assertNumQueries(0):
+            index = get_membership_index(self.course_key, build=False)
+        self.assertEqual(index.get(self.users[0].id), self.second_cohort.id)
@@ -1,8 +1,11 @@
 # pylint: disable=missing-docstring,unused-argument
 
 
+import json
 import logging
 
+from six import text_type
+
 from .utils import CommentClientRequestError, extract, perform_request
 
 log = logging.getLogger(__name__)
@@ -68,6 +71,24 @@ class Model(object):
             self.retrieved = True
         return self
 
+    @classmethod
+    def retrieve_all(cls, instances, *args, **kwargs):
+        """
+        Retrieves the given instances, sending a single request for all of
+        the instances of the same attributes, and returns them.
+        """
+        same_instances_by_attributes = {}
+        for instance in instances:
+            if not instance.retrieved and instance.id is not None:
+                attributes_key = json.dumps(instance.attributes, sort_keys=True, default=text_type)
+                same_instances_by_attributes.setdefault(attributes_key, []).append(instance)
+        for same_instances in same_instances_by_attributes.values():
+            retrieved_instance = same_instances[0].retrieve(*args, **kwargs)
+            for instance in same_instances[1:]:
+                instance.attributes = dict(retrieved_instance.attributes)
+                instance.retrieved = True
+        return instances
+
     def _retrieve(self, *args, **kwargs):
         url = self.url(action='get', params=self.attributes)
         response = perform_request(
@@ -71,7 +71,8 @@ class Thread(models.Model):
             params,
             metric_tags=[u'course_id:{}'.format(query_params['course_id'])],
             metric_action='thread.search',
-            paged_results=True
+            paged_results=True,
+            cache_response=True
         )
         if query_params.get('text'):
             search_query = query_params['text']
@@ -157,7 +158,9 @@ class Thread(models.Model):
             url,
             request_params,
             metric_action='model.retrieve',
-            metric_tags=self._metric_tags
+            metric_tags=self._metric_tags,
+            # Marking the thread as read changes the read state of the user's threads.
+            changes_state=bool(request_params.get('mark_as_read') and request_params.get('user_id')),
         )
         self._update_from_response(response)
 
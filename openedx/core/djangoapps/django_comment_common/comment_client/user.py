@@ -114,6 +114,7 @@ class User(models.Model):
             metric_action='user.active_threads',
             metric_tags=self._metric_tags,
             paged_results=True,
+            cache_response=True,
         )
         return response.get('collection', []), response.get('page', 1), response.get('num_pages', 1)
 
@@ -133,7 +134,8 @@ class User(models.Model):
             params,
             metric_action='user.subscribed_threads',
             metric_tags=self._metric_tags,
-            paged_results=True
+            paged_results=True,
+            cache_response=True
         )
         return utils.CommentClientPaginatedResult(
             collection=response.get('collection', []),
@@ -157,6 +159,7 @@ class User(models.Model):
                 retrieve_params,
                 metric_action='model.retrieve',
                 metric_tags=self._metric_tags,
+                cache_response=True,
             )
         except utils.CommentClientRequestError as e:
             if e.status_code == 404:
@@ -2,17 +2,28 @@
 """" Common utilities for comment client wrapper """
 
 
+import copy
+import hashlib
+import json
 import logging
+import threading
 from uuid import uuid4
 
 import requests
 import six
+from django.core.cache import cache
 from django.utils.translation import get_language
+from edx_django_utils.cache import RequestCache
 
 from .settings import SERVICE_HOST as COMMENTS_SERVICE
 
 log = logging.getLogger(__name__)
 
+REQUEST_CACHE_NAMESPACE = 'comment_client.responses'
+CACHE_VERSION_KEY = 'comment_client.cache_version'
+
+_local = threading.local()  # pylint: disable=invalid-name
+
 
 def strip_none(dic):
     return dict([(k, v) for k, v in six.iteritems(dic) if v is not None])
@@ -31,8 +42,61 @@ def extract(dic, keys):
         return strip_none({k: dic.get(k) for k in keys})
 
 
+def request(method, url, **kwargs):
+    """
+    Sends a request to the comment service, like requests.request, but over
+    the keep-alive connections of a session kept by each thread, so that
+    requests don't each pay for connecting to the service.
+    """
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session.request(method, url, **kwargs)
+
+
+def _response_cache_key(method, url, params, raw):
+    """
+    Returns the cache key of the response of the given read, which doesn't
+    depend on the id of the request.
+    """
+    request_key = json.dumps([method, url, params, raw, get_language()], sort_keys=True, default=six.text_type)
+    return hashlib.md5(request_key.encode('utf-8')).hexdigest()
+
+
+def _cache_version():
+    """
+    Returns the current version of the responses cached across requests,
+    which changes on each write to the comment service.
+    """
+    version = cache.get(CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(CACHE_VERSION_KEY, uuid4().hex, None)
+        version = cache.get(CACHE_VERSION_KEY)
+    return version
+
+
+def _invalidate_cached_responses():
+    """
+    Makes the responses cached for this request and across requests out of
+    date, since a write may have changed them.
+    """
+    RequestCache(REQUEST_CACHE_NAMESPACE).clear()
+    cache.set(CACHE_VERSION_KEY, uuid4().hex, None)
+
+
 def perform_request(method, url, data_or_params=None, raw=False,
-                    metric_action=None, metric_tags=None, paged_results=False):
+                    metric_action=None, metric_tags=None, paged_results=False, cache_response=False,
+                    changes_state=False):
+    """
+    Sends a request to the comment service and returns its response.
+
+    If the ForumsConfig coalesces requests, identical reads made while
+    handling a request are only sent once.  If cache_response is set, the
+    response of a read is also cached across requests for the cache_timeout
+    of the ForumsConfig.  Any write makes the cached responses out of date,
+    as do GETs which change state on the service, such as retrieving a
+    thread with mark_as_read, for which changes_state must be set.
+    """
     # To avoid dependency conflict
     from openedx.core.djangoapps.django_comment_common.models import ForumsConfig
     config = ForumsConfig.current()
@@ -40,6 +104,43 @@ def perform_request(method, url, data_or_params=None, raw=False,
     if not config.enabled:
         raise CommentClientMaintenanceError('service disabled')
 
+    if method.lower() != 'get' or changes_state:
+        try:
+            return _perform_request(config, method, url, data_or_params, raw, metric_action, metric_tags)
+        finally:
+            if config.coalesce_requests or config.cache_timeout:
+                _invalidate_cached_responses()
+
+    request_cache = RequestCache(REQUEST_CACHE_NAMESPACE) if config.coalesce_requests else None
+    cache_timeout = config.cache_timeout if cache_response else 0
+    if request_cache is None and not cache_timeout:
+        return _perform_request(config, method, url, data_or_params, raw, metric_action, metric_tags)
+
+    cache_key = _response_cache_key(method.lower(), url, data_or_params, raw)
+    if request_cache is not None:
+        cached_response = request_cache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return copy.deepcopy(cached_response.value)
+
+    response = None
+    if cache_timeout:
+        versioned_cache_key = u'comment_client.response.{}.{}'.format(_cache_version(), cache_key)
+        response = cache.get(versioned_cache_key)
+    if response is None:
+        response = _perform_request(config, method, url, data_or_params, raw, metric_action, metric_tags)
+        if cache_timeout:
+            cache.set(versioned_cache_key, response, cache_timeout)
+    if request_cache is not None:
+        request_cache.set(cache_key, response)
+    return copy.deepcopy(response)
+
+
+def _perform_request(config, method, url, data_or_params, raw, metric_action, metric_tags):
+    """
+    Sends a request to the comment service and returns its response, with
+    no caching.
+    """
+
     if metric_tags is None:
         metric_tags = []
 
@@ -63,7 +164,7 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = data_or_params.copy()
         params.update(request_id_dict)
-    response = requests.request(
+    response = request(
         method,
         url,
         data=data,
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_comment_common', '0008_role_user_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='forumsconfig',
+            name='cache_timeout',
+            field=models.PositiveIntegerField(default=0, help_text=u'Seconds for which thread lists and user stats read from the comment service are cached. The cache is disabled if 0.'),
+        ),
+        migrations.AddField(
+            model_name='forumsconfig',
+            name='coalesce_requests',
+            field=models.BooleanField(default=False, help_text=u'Whether identical reads from the comment service are only sent once per request.'),
+        ),
+    ]
@@ -207,6 +207,17 @@ class ForumsConfig(ConfigurationModel):
         default=5.0,
         help_text=u"Seconds to wait when trying to connect to the comment service.",
     )
+    cache_timeout = models.PositiveIntegerField(
+        default=0,
+        help_text=(
+            u"Seconds for which thread lists and user stats read from the comment service are cached. "
+            u"The cache is disabled if 0."
+        ),
+    )
+    coalesce_requests = models.BooleanField(
+        default=False,
+        help_text=u"Whether identical reads from the comment service are only sent once per request.",
+    )
 
     class Meta(ConfigurationModel.Meta):
         # use existing table that was originally created from django_comment_common app
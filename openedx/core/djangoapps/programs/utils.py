@@ -500,6 +500,14 @@ class ProgramDataExtender(object):
 
     def _extend_course_runs(self):
         """Execute course run data handlers."""
+        CourseEnrollment.bulk_fetch_enrollment_states_for_courses(
+            [self.user],
+            [
+                CourseKey.from_string(course_run['key'])
+                for course in self.data['courses']
+                for course_run in course['course_runs']
+            ]
+        )
         for course in self.data['courses']:
             for course_run in course['course_runs']:
                 # State to be shared across handlers.
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import six
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def index_orgs(apps, schema_editor):
+    """
+    Index the orgs of the course_org_filter of the existing site configurations.
+    """
+    SiteConfiguration = apps.get_model('site_configuration', 'SiteConfiguration')
+    SiteConfigurationOrg = apps.get_model('site_configuration', 'SiteConfigurationOrg')
+    site_configuration_orgs = []
+    for site_configuration in SiteConfiguration.objects.all():
+        try:
+            course_org_filter = site_configuration.site_values.get('course_org_filter', [])
+        except AttributeError:
+            continue
+        if not isinstance(course_org_filter, list):
+            course_org_filter = [course_org_filter]
+        site_configuration_orgs.extend(
+            SiteConfigurationOrg(site_configuration=site_configuration, org=org)
+            for org in set(course_org_filter) if isinstance(org, six.string_types) and org
+        )
+    SiteConfigurationOrg.objects.bulk_create(site_configuration_orgs)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('site_configuration', '0007_remove_values_field'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteConfigurationOrg',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('org', models.CharField(max_length=255, db_index=True)),
+                ('site_configuration', models.ForeignKey(related_name='orgs', on_delete=django.db.models.deletion.CASCADE, to='site_configuration.SiteConfiguration')),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='siteconfigurationorg',
+            unique_together=set([('site_configuration', 'org')]),
+        ),
+        migrations.RunPython(
+            index_orgs,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -5,17 +5,36 @@ Django models for site configurations.
 
 import collections
 from logging import getLogger
+from uuid import uuid4
 
+import six
 from django.contrib.sites.models import Site
-from django.db import models
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.encoding import python_2_unicode_compatible
 from jsonfield.fields import JSONField
 from model_utils.models import TimeStampedModel
 
+from openedx.core.lib.cache_utils import register_process_cache
+
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+ORG_INDEX_VERSION_CACHE_KEY = 'site_configuration.org_index.version'
+
+# The version of the org index and the enabled site configurations by org,
+# built once per version of the index.
+_org_index = {'current': (None, {})}
+
+
+@register_process_cache
+def _clear_process_org_index():
+    """
+    Drops the org index of this process.
+    """
+    _org_index['current'] = (None, {})
+
 
 @python_2_unicode_compatible
 class SiteConfiguration(models.Model):
@@ -70,28 +89,35 @@ class SiteConfiguration(models.Model):
 
         return default
 
+    def get_course_org_filter(self):
+        """
+        Returns the list of orgs of the course_org_filter of this configuration,
+        whether it is enabled or not.
+        """
+        try:
+            course_org_filter = self.site_values.get('course_org_filter', [])
+        except AttributeError:
+            return []
+        # The value of 'course_org_filter' can be configured as a string representing
+        # a single organization or a list of strings representing multiple organizations.
+        if not isinstance(course_org_filter, list):
+            course_org_filter = [course_org_filter]
+        return [org for org in course_org_filter if isinstance(org, six.string_types) and org]
+
     @classmethod
-    def get_configuration_for_org(cls, org, select_related=None):
+    def get_configuration_for_org(cls, org, select_related=None):  # pylint: disable=unused-argument
         """
         This returns a SiteConfiguration object which has an org_filter that matches
         the supplied org
 
+        The configurations are looked up in the org index, whose site
+        configurations always have their site loaded.
+
         Args:
             org (str): Org to use to filter SiteConfigurations
-            select_related (list or None): A list of values to pass as arguments to select_related
+            select_related (list or None): Ignored, kept for backwards compatibility
         """
-        query = cls.objects.filter(site_values__contains=org, enabled=True).all()
-        if select_related is not None:
-            query = query.select_related(*select_related)
-        for configuration in query:
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            # The value of 'course_org_filter' can be configured as a string representing
-            # a single organization or a list of strings representing multiple organizations.
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            if org in course_org_filter:
-                return configuration
-        return None
+        return _get_org_index().get(org)
 
     @classmethod
     def get_value_for_org(cls, org, name, default=None):
@@ -122,14 +148,7 @@ class SiteConfiguration(models.Model):
         Returns:
             A set of all organizations present in site configuration.
         """
-        org_filter_set = set()
-
-        for configuration in cls.objects.filter(site_values__contains='course_org_filter', enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            org_filter_set.update(course_org_filter)
-        return org_filter_set
+        return set(_get_org_index())
 
     @classmethod
     def has_org(cls, org):
@@ -139,7 +158,78 @@ class SiteConfiguration(models.Model):
         Returns:
             True if given organization is present in site configurations otherwise False.
         """
-        return org in cls.get_all_orgs()
+        return org in _get_org_index()
+
+
+@python_2_unicode_compatible
+class SiteConfigurationOrg(models.Model):
+    """
+    Index of the orgs of the course_org_filter of the site configurations,
+    maintained when they are saved, see update_site_configuration_orgs.
+
+    Fields:
+        site_configuration (ForeignKey): foreign-key to the site configuration
+        org (CharField): one of the orgs of the site configuration's course_org_filter
+
+    .. no_pii:
+    """
+    site_configuration = models.ForeignKey(SiteConfiguration, related_name='orgs', on_delete=models.CASCADE)
+    org = models.CharField(max_length=255, db_index=True)
+
+    class Meta(object):
+        unique_together = ('site_configuration', 'org')
+
+    def __str__(self):
+        return u"<SiteConfigurationOrg: {org}, {site_configuration} >".format(  # xss-lint: disable=python-wrap-html
+            org=self.org,
+            site_configuration=self.site_configuration,
+        )
+
+
+def _get_org_index():
+    """
+    Returns a dict of the enabled site configurations by org.
+
+    The dict is kept in memory until the version of the index, stored in the
+    cache, is changed by a save or a delete of a site configuration.  When
+    two configurations have the same org, the first created is used.
+    """
+    version = cache.get(ORG_INDEX_VERSION_CACHE_KEY)
+    index_version, configurations = _org_index['current']
+    if version is not None and index_version == version:
+        return configurations
+
+    if version is None:
+        # Set before reading the configurations, so that any change made
+        # while they are read changes the version again.
+        cache.add(ORG_INDEX_VERSION_CACHE_KEY, uuid4().hex, None)
+        version = cache.get(ORG_INDEX_VERSION_CACHE_KEY)
+
+    configurations = {}
+    site_configuration_orgs = SiteConfigurationOrg.objects.filter(
+        site_configuration__enabled=True,
+    ).select_related('site_configuration__site').order_by('site_configuration__id')
+    for site_configuration_org in site_configuration_orgs:
+        configurations.setdefault(site_configuration_org.org, site_configuration_org.site_configuration)
+
+    _org_index['current'] = (version, configurations)
+    return configurations
+
+
+def clear_org_index():
+    """
+    Makes every process rebuild its org index on its next lookup.
+
+    The index is cleared again once the current transaction is committed,
+    so that an index built from the configurations before the change is
+    committed isn't used.
+    """
+    def _clear():
+        cache.delete(ORG_INDEX_VERSION_CACHE_KEY)
+        _clear_process_org_index()
+
+    _clear()
+    transaction.on_commit(_clear)
 
 
 def save_siteconfig_without_historical_record(siteconfig, *args, **kwargs):
@@ -218,3 +308,30 @@ def update_site_configuration_history(sender, instance, created, **kwargs):  # p
             site_values=instance.site_values,
             enabled=instance.enabled,
         )
+
+
+@receiver(post_save, sender=SiteConfiguration)
+def update_site_configuration_orgs(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Update the org index with the orgs of the saved site configuration.
+
+    Note that updates made with QuerySet.update do not send this signal, so
+    clear_org_index has to be called after them.
+    """
+    orgs = set(instance.get_course_org_filter())
+    indexed_orgs = set(instance.orgs.values_list('org', flat=True))
+    if indexed_orgs - orgs:
+        instance.orgs.filter(org__in=indexed_orgs - orgs).delete()
+    if orgs - indexed_orgs:
+        SiteConfigurationOrg.objects.bulk_create([
+            SiteConfigurationOrg(site_configuration=instance, org=org) for org in orgs - indexed_orgs
+        ])
+    clear_org_index()
+
+
+@receiver(post_delete, sender=SiteConfiguration)
+def clear_org_index_on_delete(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Remove the deleted site configuration from the org indexes.
+    """
+    clear_org_index()
@@ -10,9 +10,11 @@ from mock import patch
 from openedx.core.djangoapps.site_configuration.models import (
     SiteConfiguration,
     SiteConfigurationHistory,
+    SiteConfigurationOrg,
     save_siteconfig_without_historical_record
 )
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteConfigurationFactory
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
 
 class SiteConfigurationTests(TestCase):
@@ -367,3 +369,70 @@ class SiteConfigurationTests(TestCase):
 
         # Test that the default value is returned if the value for the given key is not found in the configuration
         six.assertCountEqual(self, SiteConfiguration.get_all_orgs(), expected_orgs)
+
+
+class SiteConfigurationOrgIndexTests(CacheIsolationTestCase):
+    """
+    Tests for the org index of site configurations.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(SiteConfigurationOrgIndexTests, self).setUp()
+        self.config = SiteConfigurationFactory.create(site_values={'course_org_filter': ['TestX', 'OtherX']})
+
+    def assert_indexed_orgs(self, expected_orgs):
+        six.assertCountEqual(
+            self,
+            SiteConfigurationOrg.objects.filter(site_configuration=self.config).values_list('org', flat=True),
+            expected_orgs,
+        )
+
+    def test_index_maintained_on_save(self):
+        self.assert_indexed_orgs(['TestX', 'OtherX'])
+
+        self.config.site_values = {'course_org_filter': 'TestX'}
+        self.config.save()
+        self.assert_indexed_orgs(['TestX'])
+
+        self.config.site_values = {}
+        self.config.save()
+        self.assert_indexed_orgs([])
+
+    def test_lookups_cached(self):
+        self.assertEqual(SiteConfiguration.get_configuration_for_org('TestX'), self.config)
+        with self.assertNumQueries(0):
+            self.assertEqual(SiteConfiguration.get_configuration_for_org('OtherX').site, self.config.site)
+            self.assertTrue(SiteConfiguration.has_org('TestX'))
+            six.assertCountEqual(self, SiteConfiguration.get_all_orgs(), ['TestX', 'OtherX'])
+
+    def test_cache_invalidated(self):
+        self.assertTrue(SiteConfiguration.has_org('OtherX'))
+
+        self.config.site_values = {'course_org_filter': 'TestX'}
+        self.config.save()
+        self.assertFalse(SiteConfiguration.has_org('OtherX'))
+
+        self.config.enabled = False
+        self.config.save()
+        self.assertIsNone(SiteConfiguration.get_configuration_for_org('TestX'))
+
+        self.config.enabled = True
+        self.config.save()
+        self.config.delete()
+        self.assertEqual(SiteConfiguration.get_all_orgs(), set())
+
+    def test_cache_invalidated_on_commit(self):
+        self.assertTrue(SiteConfiguration.has_org('OtherX'))
+
+        with patch('openedx.core.djangoapps.site_configuration.models.transaction.on_commit') as mock_on_commit:
+            with transaction.atomic():
+                self.config.site_values = {'course_org_filter': 'TestX'}
+                self.config.save()
+                # As another process could, before the change is committed.
+                SiteConfiguration.has_org('OtherX')
+        for call in mock_on_commit.call_args_list:
+            call[0][0]()
+
+        with self.assertNumQueries(1):
+            self.assertFalse(SiteConfiguration.has_org('OtherX'))
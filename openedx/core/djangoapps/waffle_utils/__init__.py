@@ -72,6 +72,8 @@ from waffle import flag_is_active, switch_is_active
 
 from openedx.core.lib.cache_utils import get_cache as get_request_cache
 
+from .snapshot import get_snapshot
+
 log = logging.getLogger(__name__)
 
 
@@ -133,7 +135,11 @@ class WaffleSwitchNamespace(WaffleNamespace):
         namespaced_switch_name = self._namespaced_name(switch_name)
         value = self._cached_switches.get(namespaced_switch_name)
         if value is None:
-            value = switch_is_active(namespaced_switch_name)
+            snapshot = get_snapshot()
+            if snapshot is not None:
+                value = snapshot.is_switch_active(namespaced_switch_name)
+            else:
+                value = switch_is_active(namespaced_switch_name)
             self._cached_switches[namespaced_switch_name] = value
         return value
 
@@ -270,16 +276,23 @@ class WaffleFlagNamespace(six.with_metaclass(ABCMeta, WaffleNamespace)):
             value = self._cached_flags.get(namespaced_flag_name)
             if value is None:
 
+                snapshot = get_snapshot()
                 if flag_undefined_default is not None:
                     # determine if the flag is undefined in waffle
-                    try:
-                        Flag.objects.get(name=namespaced_flag_name)
-                    except Flag.DoesNotExist:
-                        value = flag_undefined_default
+                    if snapshot is not None:
+                        if not snapshot.has_flag(namespaced_flag_name):
+                            value = flag_undefined_default
+                    else:
+                        try:
+                            Flag.objects.get(name=namespaced_flag_name)
+                        except Flag.DoesNotExist:
+                            value = flag_undefined_default
 
                 if value is None:
                     request = crum.get_current_request()
-                    if request:
+                    if request and snapshot is not None:
+                        value = snapshot.is_flag_active(request, namespaced_flag_name)
+                    elif request:
                         value = flag_is_active(request, namespaced_flag_name)
                     else:
                         log.warning(u"%sFlag '%s' accessed without a request", self.log_prefix, namespaced_flag_name)
@@ -3,15 +3,20 @@ Models for configuring waffle utils.
 """
 
 from django.db.models import CharField
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.encoding import python_2_unicode_compatible
 from django.utils.translation import ugettext_lazy as _
 from model_utils import Choices
 from opaque_keys.edx.django.models import CourseKeyField
 from six import text_type
+from waffle.models import Flag, Switch
 
 from config_models.models import ConfigurationModel
 from openedx.core.lib.cache_utils import request_cached
 
+from .snapshot import get_snapshot, invalidate_snapshot
+
 
 @python_2_unicode_compatible
 class WaffleFlagCourseOverrideModel(ConfigurationModel):
@@ -51,6 +56,10 @@ class WaffleFlagCourseOverrideModel(ConfigurationModel):
         if not course_id or not waffle_flag:
             return cls.ALL_CHOICES.unset
 
+        snapshot = get_snapshot()
+        if snapshot is not None:
+            return snapshot.course_override(waffle_flag, course_id) or cls.ALL_CHOICES.unset
+
         effective = cls.objects.filter(waffle_flag=waffle_flag, course_id=course_id).order_by('-change_date').first()
         if effective and effective.enabled:
             return effective.override_choice
@@ -64,3 +73,17 @@ class WaffleFlagCourseOverrideModel(ConfigurationModel):
     def __str__(self):
         enabled_label = "Enabled" if self.enabled else "Not Enabled"
         return u"Course '{}': Persistent Grades {}".format(text_type(self.course_id), enabled_label)
+
+
+@receiver(post_save, sender=Flag)
+@receiver(post_delete, sender=Flag)
+@receiver(post_save, sender=Switch)
+@receiver(post_delete, sender=Switch)
+@receiver(post_save, sender=WaffleFlagCourseOverrideModel)
+@receiver(post_delete, sender=WaffleFlagCourseOverrideModel)
+def invalidate_waffle_snapshot(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Makes every process reload its waffle snapshot after a change to a flag,
+    a switch or a course override.
+    """
+    invalidate_snapshot()
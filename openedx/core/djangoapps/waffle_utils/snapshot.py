@@ -0,0 +1,168 @@
+"""
+A process-wide snapshot of the waffle flags, switches and course overrides.
+
+Checking a flag or a switch otherwise costs a cache or database lookup per
+request, and so does each course override of a CourseWaffleFlag.  The
+snapshot is shared by the requests handled by a process until its version,
+stored in the cache, is deleted by a change to a flag, a switch or a course
+override.  The version is only checked once per request.
+"""
+
+
+import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from edx_django_utils.cache import RequestCache
+from edx_django_utils.monitoring import set_custom_metric
+from six import text_type
+from waffle import flag_is_active, switch_is_active
+from waffle.utils import get_setting
+
+from openedx.core.lib.cache_utils import register_process_cache
+
+SNAPSHOT_VERSION_CACHE_KEY = 'waffle_utils.snapshot.version'
+
+_snapshot = {'current': None}
+
+
+@register_process_cache
+def _clear_snapshot():
+    """
+    Drops the snapshot of this process.
+    """
+    _snapshot['current'] = None
+
+
+class WaffleSnapshot(object):
+    """
+    The waffle flags, switches and course overrides at a given version.
+    """
+    def __init__(self, version, flags, switches, course_overrides):
+        """
+        Arguments:
+            version (String): The version of the snapshot.
+            flags (dict): The waffle Flags by name.
+            switches (dict): Whether the waffle switches are active, by name.
+            course_overrides (dict): The override choices of the enabled course
+                overrides, by flag name and course id.
+        """
+        self.version = version
+        self.flags = flags
+        self.switches = switches
+        self.course_overrides = course_overrides
+        self.loaded_at = time.time()
+
+    @classmethod
+    def load(cls, version):
+        """
+        Returns a snapshot of the current flags, switches and course overrides.
+        """
+        # Imports are placed here to avoid model import at project startup.
+        from waffle.models import Flag, Switch
+        from .models import WaffleFlagCourseOverrideModel
+
+        flags = {flag.name: flag for flag in Flag.objects.all()}
+        switches = dict(Switch.objects.values_list('name', 'active'))
+
+        # The latest override of each flag and course is the effective one.
+        course_overrides = {}
+        for waffle_flag, course_id, override_choice, enabled in WaffleFlagCourseOverrideModel.objects.order_by(
+            'change_date'
+        ).values_list('waffle_flag', 'course_id', 'override_choice', 'enabled'):
+            course_overrides[(waffle_flag, text_type(course_id))] = override_choice if enabled else None
+        course_overrides = {key: value for key, value in course_overrides.items() if value is not None}
+
+        return cls(version, flags, switches, course_overrides)
+
+    def has_flag(self, flag_name):
+        """
+        Returns whether the flag is defined in waffle.
+        """
+        return flag_name in self.flags
+
+    def is_flag_active(self, request, flag_name):
+        """
+        Returns whether the flag is active for the given request, as
+        waffle.flag_is_active would.
+
+        The flag is evaluated for each request, so that its rules for users,
+        groups and percentages of users still apply.
+        """
+        flag = self.flags.get(flag_name)
+        if flag is not None:
+            return flag.is_active(request)
+        if get_setting('CREATE_MISSING_FLAGS'):
+            return flag_is_active(request, flag_name)
+        return get_setting('FLAG_DEFAULT')
+
+    def is_switch_active(self, switch_name):
+        """
+        Returns whether the switch is active, as waffle.switch_is_active would.
+        """
+        active = self.switches.get(switch_name)
+        if active is not None:
+            return active
+        if get_setting('CREATE_MISSING_SWITCHES'):
+            return switch_is_active(switch_name)
+        return get_setting('SWITCH_DEFAULT')
+
+    def course_override(self, flag_name, course_id):
+        """
+        Returns the override choice of the flag for the course, or None.
+        """
+        return self.course_overrides.get((flag_name, text_type(course_id)))
+
+
+def get_snapshot():
+    """
+    Returns the current WaffleSnapshot, or None if snapshots are disabled or
+    cannot be versioned with the configured cache.
+    """
+    if not getattr(settings, 'WAFFLE_UTILS_SNAPSHOT_ENABLED', False):
+        return None
+
+    request_cache = RequestCache('waffle_utils.snapshot')
+    cached_response = request_cache.get_cached_response('snapshot')
+    if cached_response.is_found:
+        return cached_response.value
+
+    version = cache.get(SNAPSHOT_VERSION_CACHE_KEY)
+    snapshot = _snapshot['current']
+    if version is None or snapshot is None or snapshot.version != version:
+        if version is None:
+            # Set before loading the snapshot, so that any change made while
+            # it is loaded changes the version again.
+            cache.add(SNAPSHOT_VERSION_CACHE_KEY, uuid4().hex, None)
+            version = cache.get(SNAPSHOT_VERSION_CACHE_KEY)
+
+        if version is None:
+            snapshot = None
+        else:
+            start_time = time.time()
+            snapshot = WaffleSnapshot.load(version)
+            set_custom_metric('waffle_snapshot_refresh_duration', time.time() - start_time)
+            _snapshot['current'] = snapshot
+
+    if snapshot is not None:
+        set_custom_metric('waffle_snapshot_age', time.time() - snapshot.loaded_at)
+    request_cache.set('snapshot', snapshot)
+    return snapshot
+
+
+def invalidate_snapshot():
+    """
+    Makes every process reload its snapshot on its next request.
+
+    The version is deleted again once the current transaction is committed,
+    so that a snapshot loaded before the change is committed isn't used.
+    """
+    def _delete_version():
+        cache.delete(SNAPSHOT_VERSION_CACHE_KEY)
+        _snapshot['current'] = None
+        RequestCache('waffle_utils.snapshot').clear()
+
+    _delete_version()
+    transaction.on_commit(_delete_version)
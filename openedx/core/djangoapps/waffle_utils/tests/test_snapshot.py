@@ -0,0 +1,124 @@
+"""
+Tests for the waffle snapshot.
+"""
+
+
+import crum
+from django.contrib.auth.models import AnonymousUser
+from django.test import override_settings
+from django.test.client import RequestFactory
+from edx_django_utils.cache import RequestCache
+from mock import patch
+from opaque_keys.edx.keys import CourseKey
+from waffle.models import Flag, Switch
+
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from student.tests.factories import UserFactory
+
+from .. import CourseWaffleFlag, WaffleFlagNamespace, WaffleSwitchNamespace
+from ..models import WaffleFlagCourseOverrideModel
+from ..snapshot import get_snapshot
+
+
+@override_settings(WAFFLE_UTILS_SNAPSHOT_ENABLED=True)
+class WaffleSnapshotTests(CacheIsolationTestCase):
+    """
+    Tests for the waffle snapshot.
+    """
+    ENABLED_CACHES = ['default']
+
+    TEST_COURSE_KEY = CourseKey.from_string("edX/DemoX/Demo_Course")
+    TEST_FLAG_NAMESPACE = WaffleFlagNamespace('test_namespace')
+    TEST_SWITCH_NAMESPACE = WaffleSwitchNamespace('test_namespace')
+
+    def setUp(self):
+        super(WaffleSnapshotTests, self).setUp()
+        self.request = RequestFactory().request()
+        self.request.user = AnonymousUser()
+        self.addCleanup(crum.set_current_request, None)
+        crum.set_current_request(self.request)
+
+    def new_request(self):
+        """
+        Clears the request caches, as at the start of a new request.
+        """
+        RequestCache.clear_all_namespaces()
+
+    def test_switches(self):
+        switch = Switch.objects.create(name='test_namespace.test_switch', active=True)
+        self.new_request()
+        self.assertTrue(self.TEST_SWITCH_NAMESPACE.is_enabled('test_switch'))
+
+        self.new_request()
+        with self.assertNumQueries(0):
+            self.assertTrue(self.TEST_SWITCH_NAMESPACE.is_enabled('test_switch'))
+            self.assertFalse(self.TEST_SWITCH_NAMESPACE.is_enabled('undefined_switch'))
+
+        switch.active = False
+        switch.save()
+        self.new_request()
+        self.assertFalse(self.TEST_SWITCH_NAMESPACE.is_enabled('test_switch'))
+
+    def test_flags_evaluated_per_request(self):
+        Flag.objects.create(name='test_namespace.test_flag', authenticated=True)
+        self.new_request()
+        self.assertFalse(self.TEST_FLAG_NAMESPACE.is_flag_active('test_flag'))
+
+        self.request.user = UserFactory()
+        self.new_request()
+        self.assertTrue(self.TEST_FLAG_NAMESPACE.is_flag_active('test_flag'))
+
+    def test_undefined_flags(self):
+        get_snapshot()
+        self.new_request()
+        with self.assertNumQueries(0):
+            self.assertTrue(self.TEST_FLAG_NAMESPACE.is_flag_active('undefined_flag', flag_undefined_default=True))
+            self.assertFalse(self.TEST_FLAG_NAMESPACE.is_flag_active('other_undefined_flag'))
+
+    def test_course_overrides(self):
+        course_flag = CourseWaffleFlag(self.TEST_FLAG_NAMESPACE, 'test_flag')
+        WaffleFlagCourseOverrideModel.objects.create(
+            waffle_flag='test_namespace.test_flag',
+            course_id=self.TEST_COURSE_KEY,
+            override_choice=WaffleFlagCourseOverrideModel.ALL_CHOICES.on,
+            enabled=True,
+        )
+        get_snapshot()
+        self.new_request()
+        with self.assertNumQueries(0):
+            self.assertTrue(course_flag.is_enabled(self.TEST_COURSE_KEY))
+
+        WaffleFlagCourseOverrideModel.objects.create(
+            waffle_flag='test_namespace.test_flag',
+            course_id=self.TEST_COURSE_KEY,
+            override_choice=WaffleFlagCourseOverrideModel.ALL_CHOICES.on,
+            enabled=False,
+        )
+        self.new_request()
+        self.assertEqual(
+            WaffleFlagCourseOverrideModel.override_value('test_namespace.test_flag', self.TEST_COURSE_KEY),
+            WaffleFlagCourseOverrideModel.ALL_CHOICES.unset,
+        )
+
+    def test_snapshot_shared_until_changed(self):
+        snapshot = get_snapshot()
+        self.new_request()
+        self.assertIs(get_snapshot(), snapshot)
+
+        Switch.objects.create(name='test_namespace.test_switch', active=True)
+        self.new_request()
+        self.assertIsNot(get_snapshot(), snapshot)
+
+    def test_snapshot_invalidated_on_commit(self):
+        with patch('openedx.core.djangoapps.waffle_utils.snapshot.transaction.on_commit') as mock_on_commit:
+            Switch.objects.create(name='test_namespace.test_switch', active=True)
+        # A snapshot loaded before the change is committed is not used after it.
+        self.new_request()
+        snapshot = get_snapshot()
+        mock_on_commit.call_args[0][0]()
+        self.new_request()
+        self.assertIsNot(get_snapshot(), snapshot)
+
+    @override_settings(WAFFLE_UTILS_SNAPSHOT_ENABLED=False)
+    def test_disabled(self):
+        self.assertIsNone(get_snapshot())
@@ -10,14 +10,20 @@ and won't find the now-invalid cached data.
 """
 
 from datetime import datetime
+import logging
+from multiprocessing.pool import ThreadPool
 from uuid import UUID
 
+from django.conf import settings
 from django.core.cache import caches, InvalidCacheBackendError
 from pytz import UTC
 import requests
 
+from openedx.core.djangolib.blockstore_file_cache import get_bundle_file_cache
 from openedx.core.lib import blockstore_api
 
+log = logging.getLogger(__name__)
+
 try:
     # Use a dedicated cache for blockstore, if available:
     cache = caches['blockstore']
@@ -204,8 +210,64 @@ def get_bundle_file_data_with_cache(bundle_uuid, path, bundle_version=None, draf
     """
     Method to read a file out of a Blockstore Bundle[Version] or Draft, using the
     cached list of files in each bundle if available.
+
+    The contents of the file are cached locally by hash, see
+    blockstore_file_cache.
     """
     file_info = get_bundle_file_metadata_with_cache(bundle_uuid, path, bundle_version, draft_name)
+    return get_bundle_file_cache().get_or_fetch(
+        file_info.hash_digest,
+        lambda: _fetch_bundle_file_data(bundle_uuid, file_info),
+    )
+
+
+def prefetch_bundle_files(bundle_uuid, paths, bundle_version=None, draft_name=None):
+    """
+    Fetch the files with the given paths out of a Blockstore Bundle[Version] or
+    Draft, so that reading them with get_bundle_file_data_with_cache then only
+    uses the local file cache.
+
+    The files that are not cached yet are fetched concurrently, using at most
+    BLOCKSTORE_FILE_PREFETCH_THREADS threads. Files that cannot be fetched are
+    skipped, so that reading them reports the error.
+    """
+    file_cache = get_bundle_file_cache()
+    if not file_cache.enabled:
+        return
+    paths = set(paths)
+    missing_files = [
+        file_info for file_info in get_bundle_files_cached(bundle_uuid, bundle_version, draft_name)
+        if file_info.path in paths and file_cache.get(file_info.hash_digest) is None
+    ]
+    if not missing_files:
+        return
+
+    def prefetch(file_info):
+        """
+        Fetch and cache the given file.
+        """
+        try:
+            file_cache.set(file_info.hash_digest, _fetch_bundle_file_data(bundle_uuid, file_info))
+        except (blockstore_api.BundleStorageError, requests.RequestException):
+            log.exception("Unable to prefetch %s from bundle %s", file_info.path, bundle_uuid)
+
+    num_threads = min(len(missing_files), getattr(settings, 'BLOCKSTORE_FILE_PREFETCH_THREADS', 1))
+    if num_threads <= 1:
+        for file_info in missing_files:
+            prefetch(file_info)
+        return
+    pool = ThreadPool(num_threads)
+    try:
+        pool.map(prefetch, missing_files)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _fetch_bundle_file_data(bundle_uuid, file_info):
+    """
+    Read the contents of the given file from Blockstore.
+    """
     response = requests.get(file_info.url)
     if response.status_code != 200:
         try:
@@ -214,7 +276,7 @@ def get_bundle_file_data_with_cache(bundle_uuid, path, bundle_version=None, draf
             error_response = '(error details unavailable - response was not a [unicode] string)'
         raise blockstore_api.BundleStorageError(
             "Unexpected error ({}) trying to read {} from bundle {} using URL {}: \n{}".format(
-                response.status_code, path, bundle_uuid, file_info.url, error_response,
+                response.status_code, file_info.path, bundle_uuid, file_info.url, error_response,
             )
         )
     return response.content
@@ -0,0 +1,223 @@
+"""
+A local cache of the contents of Blockstore bundle files.
+
+The files of bundles and drafts are listed by Blockstore along with the hash
+of their contents, so the contents can be cached by hash: a given hash always
+refers to the same bytes, no matter the bundle, version or draft the file was
+listed in, and the cached contents never need to be invalidated.
+
+The most recently used contents are kept in memory, and optionally also in a
+directory shared by the processes of a server, so that they survive restarts.
+"""
+
+import logging
+import os
+import re
+import tempfile
+from threading import Lock
+
+from django.conf import settings
+
+from openedx.core.lib.cache_utils import ProcessLRUCache, register_process_cache
+
+log = logging.getLogger(__name__)
+
+# The hashes that can safely be used as file names.
+VALID_HASH_PATTERN = re.compile(r'^[0-9A-Za-z_-]+$')
+
+# When the directory grows beyond its maximum size, the least recently used
+# files are removed until it is back to this fraction of the maximum size.
+DIRECTORY_PRUNE_RATIO = 0.9
+
+
+class BundleFileCache(object):
+    """
+    Keeps the contents of bundle files, keyed by their hash digest, in memory
+    and optionally in a directory, evicting the least recently used ones.
+    """
+    def __init__(self, max_memory_size, directory=None, max_directory_size=0):
+        """
+        Arguments:
+            max_memory_size (int) - The total size in bytes of the contents
+                kept in memory. Nothing is kept in memory if it is 0.
+            directory (str) - The directory the contents are also stored in,
+                or None.
+            max_directory_size (int) - The total size in bytes of the contents
+                stored in the directory.
+        """
+        self.max_memory_size = max_memory_size
+        self.directory = directory
+        self.max_directory_size = max_directory_size
+        self._entries = ProcessLRUCache(max_memory_size, size=len)
+        self._directory_size = None
+        self._lock = Lock()
+
+    @property
+    def enabled(self):
+        """
+        Whether any contents can be stored.
+        """
+        return self.max_memory_size > 0 or bool(self.directory and self.max_directory_size > 0)
+
+    def get(self, hash_digest):
+        """
+        Returns the contents stored for the given hash digest, or None.
+        """
+        data = self._entries.get(hash_digest)
+        if data is not None:
+            return data
+
+        data = self._read_file(hash_digest)
+        if data is not None:
+            self._entries.set(hash_digest, data)
+        return data
+
+    def set(self, hash_digest, data):
+        """
+        Stores the contents of the file with the given hash digest.
+        """
+        if not hash_digest or data is None:
+            return
+        self._entries.set(hash_digest, data)
+        self._write_file(hash_digest, data)
+
+    def get_or_fetch(self, hash_digest, fetch):
+        """
+        Returns the contents stored for the given hash digest, or the result
+        of fetch(), which is then stored.
+        """
+        data = self.get(hash_digest) if hash_digest else None
+        if data is None:
+            data = fetch()
+            self.set(hash_digest, data)
+        return data
+
+    def clear(self):
+        """
+        Removes all contents kept in memory. The directory is left as is.
+        """
+        self._entries.clear()
+
+    def _file_path(self, hash_digest):
+        """
+        Returns the path of the file storing the given contents, or None if
+        they are not stored in a directory.
+        """
+        if not self.directory or not VALID_HASH_PATTERN.match(hash_digest):
+            return None
+        return os.path.join(self.directory, hash_digest[:2], hash_digest)
+
+    def _read_file(self, hash_digest):
+        """
+        Returns the contents stored in the directory for the given hash
+        digest, or None.
+        """
+        path = self._file_path(hash_digest)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as stored_file:
+                data = stored_file.read()
+            # Marks the file as recently used.
+            os.utime(path, None)
+        except (IOError, OSError):
+            return None
+        return data
+
+    def _write_file(self, hash_digest, data):
+        """
+        Stores the given contents in the directory, if any.
+
+        The contents are written to a temporary file which is then renamed,
+        so that other processes never read a partially written file.
+        """
+        path = self._file_path(hash_digest)
+        if path is None or len(data) > self.max_directory_size or os.path.exists(path):
+            return
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+        except OSError:
+            # Another process may have created it in the meantime.
+            if not os.path.isdir(os.path.dirname(path)):
+                log.exception(u'Unable to create the Blockstore file cache directory %s', os.path.dirname(path))
+                return
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                temp_file.write(data)
+            os.rename(temp_path, path)
+        except (IOError, OSError):
+            log.exception(u'Unable to store the Blockstore file %s in %s', hash_digest, self.directory)
+            return
+
+        with self._lock:
+            if self._directory_size is None:
+                self._directory_size = sum(size for _, size, _ in self._stored_files())
+            else:
+                self._directory_size += len(data)
+            if self._directory_size > self.max_directory_size:
+                self._prune_directory()
+
+    def _stored_files(self):
+        """
+        Returns a list of (path, size, last use time) tuples of the files
+        stored in the directory.
+        """
+        stored_files = []
+        for dir_path, _, file_names in os.walk(self.directory):
+            for file_name in file_names:
+                if file_name.startswith('.tmp-'):
+                    continue
+                path = os.path.join(dir_path, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                stored_files.append((path, stat.st_size, stat.st_mtime))
+        return stored_files
+
+    def _prune_directory(self):
+        """
+        Removes the least recently used files of the directory until it is
+        back under its maximum size.
+
+        The directory may be shared by several processes, so its size is
+        computed again from the files it holds.
+        """
+        stored_files = sorted(self._stored_files(), key=lambda stored_file: stored_file[2])
+        self._directory_size = sum(size for _, size, _ in stored_files)
+        for path, size, _ in stored_files:
+            if self._directory_size <= self.max_directory_size * DIRECTORY_PRUNE_RATIO:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._directory_size -= size
+
+
+_bundle_file_cache = {}
+
+
+def get_bundle_file_cache():
+    """
+    Returns the BundleFileCache of this process, as configured by the
+    BLOCKSTORE_FILE_CACHE_* settings.
+    """
+    if 'cache' not in _bundle_file_cache:
+        _bundle_file_cache['cache'] = BundleFileCache(
+            max_memory_size=getattr(settings, 'BLOCKSTORE_FILE_CACHE_MAX_MEMORY_SIZE', 0),
+            directory=getattr(settings, 'BLOCKSTORE_FILE_CACHE_DIR', None),
+            max_directory_size=getattr(settings, 'BLOCKSTORE_FILE_CACHE_MAX_DIR_SIZE', 0),
+        )
+    return _bundle_file_cache['cache']
+
+
+@register_process_cache
+def clear_bundle_file_cache():
+    """
+    Drops the BundleFileCache of this process, so that it is created again
+    from the current settings.
+    """
+    _bundle_file_cache.clear()
@@ -22,6 +22,8 @@ from django.test import RequestFactory, TestCase, override_settings
 from django.test.utils import CaptureQueriesContext
 from edx_django_utils.cache import RequestCache
 
+from openedx.core.lib.cache_utils import clear_process_caches
+
 
 class CacheIsolationMixin(object):
     """
@@ -138,6 +140,9 @@ class CacheIsolationMixin(object):
         # Clear that.
         sites.models.SITE_CACHE.clear()
 
+        # As are the other caches kept in the memory of the process.
+        clear_process_caches()
+
         RequestCache.clear_all_namespaces()
 
 
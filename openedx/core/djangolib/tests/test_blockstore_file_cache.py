@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the Blockstore bundle file cache
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from uuid import UUID
+
+from mock import patch
+from six.moves import BaseHTTPServer
+
+from openedx.core.djangolib import blockstore_cache
+from openedx.core.djangolib.blockstore_file_cache import BundleFileCache
+from openedx.core.lib import blockstore_api as api
+
+BUNDLE_UUID = UUID('11111111-2222-3333-4444-555555555555')
+
+
+class BundleFileCacheTest(unittest.TestCase):
+    """
+    Tests for BundleFileCache
+    """
+
+    def setUp(self):
+        super(BundleFileCacheTest, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_memory_eviction(self):
+        cache = BundleFileCache(max_memory_size=10)
+        cache.set('first', b'12345')
+        cache.set('second', b'12345')
+        # Marks the first file as recently used.
+        cache.get('first')
+        cache.set('third', b'12345')
+        self.assertEqual(cache.get('first'), b'12345')
+        self.assertIsNone(cache.get('second'))
+        self.assertEqual(cache.get('third'), b'12345')
+
+    def test_get_or_fetch(self):
+        cache = BundleFileCache(max_memory_size=100)
+        self.assertEqual(cache.get_or_fetch('hash', lambda: b'data'), b'data')
+        self.assertEqual(cache.get_or_fetch('hash', lambda: b'other data'), b'data')
+        # Files without a hash are never cached.
+        self.assertEqual(cache.get_or_fetch('', lambda: b'data'), b'data')
+        self.assertEqual(cache.get_or_fetch('', lambda: b'other data'), b'other data')
+
+    def test_directory(self):
+        cache = BundleFileCache(max_memory_size=0, directory=self.directory, max_directory_size=100)
+        cache.set('abcdef', b'data')
+        self.assertTrue(os.path.exists(os.path.join(self.directory, 'ab', 'abcdef')))
+
+        # The files are shared with the other processes using the directory.
+        other_cache = BundleFileCache(max_memory_size=100, directory=self.directory, max_directory_size=100)
+        self.assertEqual(other_cache.get('abcdef'), b'data')
+        self.assertIsNone(other_cache.get('123456'))
+
+    def test_directory_invalid_hash(self):
+        cache = BundleFileCache(max_memory_size=0, directory=self.directory, max_directory_size=100)
+        cache.set('../abcdef', b'data')
+        self.assertEqual(os.listdir(self.directory), [])
+        self.assertIsNone(cache.get('../abcdef'))
+
+    def test_directory_pruning(self):
+        cache = BundleFileCache(max_memory_size=0, directory=self.directory, max_directory_size=12)
+        cache.set('first', b'12345')
+        os.utime(os.path.join(self.directory, 'fi', 'first'), (1, 1))
+        cache.set('second', b'12345')
+        cache.set('third', b'12345')
+        self.assertIsNone(cache.get('first'))
+        self.assertEqual(cache.get('second'), b'12345')
+        self.assertEqual(cache.get('third'), b'12345')
+
+
+class StubBlockstoreHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Serves the files of StubBlockstoreHandler.files, by path.
+    """
+    files = {}
+    requested_paths = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.requested_paths.append(self.path)
+        data = self.files.get(self.path)
+        self.send_response(200 if data is not None else 404)
+        self.end_headers()
+        self.wfile.write(data if data is not None else b'Not found')
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class BundleFileDataTest(unittest.TestCase):
+    """
+    Tests for reading bundle files through the bundle file cache, from a local
+    stub Blockstore server.
+    """
+
+    def setUp(self):
+        super(BundleFileDataTest, self).setUp()
+        server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), StubBlockstoreHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url_root = 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+        StubBlockstoreHandler.files = {
+            '/html/intro/definition.xml': b'<html>Intro</html>',
+            '/unit/unit1/definition.xml': b'<unit />',
+            '/static/image.png': b'image',
+        }
+        StubBlockstoreHandler.requested_paths = []
+        self.bundle_files = [
+            api.BundleFile(path=path.lstrip('/'), size=len(data), url=url_root + path, hash_digest='hash' + str(index))
+            for index, (path, data) in enumerate(sorted(StubBlockstoreHandler.files.items()))
+        ]
+        self.bundle_files.append(api.BundleFile(
+            path='html/missing/definition.xml', size=0, url=url_root + '/missing', hash_digest='missing',
+        ))
+
+        patcher = patch.object(blockstore_cache, 'get_bundle_files_cached', return_value=self.bundle_files)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.file_cache = BundleFileCache(max_memory_size=1000)
+        patcher = patch.object(blockstore_cache, 'get_bundle_file_cache', return_value=self.file_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_bundle_file_data_with_cache(self):
+        for _ in range(2):
+            data = blockstore_cache.get_bundle_file_data_with_cache(BUNDLE_UUID, 'unit/unit1/definition.xml', 1)
+            self.assertEqual(data, b'<unit />')
+        self.assertEqual(StubBlockstoreHandler.requested_paths, ['/unit/unit1/definition.xml'])
+
+    def test_get_bundle_file_data_error(self):
+        with self.assertRaises(api.BundleStorageError):
+            blockstore_cache.get_bundle_file_data_with_cache(BUNDLE_UUID, 'html/missing/definition.xml', 1)
+        self.assertIsNone(self.file_cache.get('missing'))
+
+    def test_prefetch_bundle_files(self):
+        olx_paths = ['html/intro/definition.xml', 'unit/unit1/definition.xml', 'html/missing/definition.xml']
+        blockstore_cache.prefetch_bundle_files(BUNDLE_UUID, olx_paths, bundle_version=1)
+        self.assertEqual(
+            sorted(StubBlockstoreHandler.requested_paths),
+            ['/html/intro/definition.xml', '/missing', '/unit/unit1/definition.xml'],
+        )
+
+        # The prefetched files are read from the cache, and only the missing ones are fetched again.
+        blockstore_cache.prefetch_bundle_files(BUNDLE_UUID, olx_paths, bundle_version=1)
+        self.assertEqual(
+            blockstore_cache.get_bundle_file_data_with_cache(BUNDLE_UUID, 'html/intro/definition.xml', 1),
+            b'<html>Intro</html>',
+        )
+        self.assertEqual(len(StubBlockstoreHandler.requested_paths), 4)
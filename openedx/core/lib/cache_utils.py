@@ -6,7 +6,9 @@ Utilities related to caching.
 import collections
 import functools
 import itertools
+import weakref
 import zlib
+from threading import Lock
 
 import six
 import wrapt
@@ -153,6 +155,113 @@ class process_cached(object):  # pylint: disable=invalid-name
         return functools.partial(self.__call__, obj)
 
 
+# The functions clearing the caches kept in the memory of this process, see
+# register_process_cache.
+_process_cache_clearers = []
+
+# The ProcessLRUCaches of this process.
+_process_lru_caches = weakref.WeakSet()
+
+
+def register_process_cache(clear):
+    """
+    Registers the given function, which removes the contents of a cache kept
+    in the memory of this process, to be called by clear_process_caches.
+
+    Returns the function, so that it can be used as a decorator.
+    ProcessLRUCaches don't need to be registered.
+    """
+    _process_cache_clearers.append(clear)
+    return clear
+
+
+def clear_process_caches():
+    """
+    Removes the contents of all of the ProcessLRUCaches of this process, and
+    of the caches registered by register_process_cache.
+    """
+    for lru_cache in list(_process_lru_caches):
+        lru_cache.clear()
+    for clear in _process_cache_clearers:
+        clear()
+
+
+class ProcessLRUCache(object):
+    """
+    A thread-safe mapping kept in the memory of a process, which evicts the
+    least recently used entries once the total size of its values exceeds
+    max_size.
+
+    The size of a value is measured by the given size function, so that by
+    default max_size is the number of entries.  Values larger than max_size
+    are not stored, so nothing is stored if max_size is 0.
+    """
+    def __init__(self, max_size, size=lambda value: 1):
+        self.max_size = max_size
+        self._value_size = size
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        _process_lru_caches.add(self)
+
+    def get(self, key, default=None):
+        """
+        Returns the value stored for the given key, marked as recently used,
+        or default.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value = self._entries.pop(key)
+            self._entries[key] = value
+            return value
+
+    def set(self, key, value):
+        """
+        Stores the given value for the given key, evicting the least recently
+        used entries beyond max_size.
+        """
+        value_size = self._value_size(value)
+        if value_size > self.max_size:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = value
+            self._size += value_size
+            while self._size > self.max_size:
+                _, evicted_value = self._entries.popitem(last=False)
+                self._size -= self._value_size(evicted_value)
+
+    def pop(self, key, default=None):
+        """
+        Removes and returns the value stored for the given key, or default.
+        """
+        with self._lock:
+            return self._pop(key, default)
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key, default=None):
+        """
+        Removes and returns the value stored for the given key, or default.
+        Must be called with the lock held.
+        """
+        if key not in self._entries:
+            return default
+        value = self._entries.pop(key)
+        self._size -= self._value_size(value)
+        return value
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class CacheInvalidationManager:
     """
     This class provides a decorator for simple functions, which can handle invalidation.
@@ -8,9 +8,14 @@ from unittest import TestCase
 import ddt
 import six
 from edx_django_utils.cache import RequestCache
-from mock import Mock
+from mock import Mock, patch
 
-from openedx.core.lib.cache_utils import request_cached
+from openedx.core.lib.cache_utils import (
+    ProcessLRUCache,
+    clear_process_caches,
+    register_process_cache,
+    request_cached
+)
 
 
 @ddt.ddt
@@ -297,3 +302,50 @@ class TestRequestCachedDecorator(TestCase):
         result = wrapped(3)
         self.assertEqual(result, 2)
         self.assertEqual(to_be_wrapped.call_count, 2)
+
+
+class TestProcessLRUCache(TestCase):
+    """
+    Test ProcessLRUCache and the clearing of the caches of the process.
+    """
+    def test_lru_eviction(self):
+        lru_cache = ProcessLRUCache(2)
+        lru_cache.set('a', 1)
+        lru_cache.set('b', 2)
+        self.assertEqual(lru_cache.get('a'), 1)
+        lru_cache.set('c', 3)
+        self.assertIsNone(lru_cache.get('b'))
+        self.assertEqual(lru_cache.get('a'), 1)
+        self.assertEqual(lru_cache.get('c'), 3)
+        self.assertEqual(len(lru_cache), 2)
+
+    def test_size(self):
+        lru_cache = ProcessLRUCache(10, size=len)
+        lru_cache.set('a', 'aaaa')
+        lru_cache.set('b', 'bbbb')
+        lru_cache.set('a', 'aaaaaa')
+        self.assertEqual(lru_cache.get('a'), 'aaaaaa')
+        self.assertEqual(lru_cache.get('b'), 'bbbb')
+        lru_cache.set('c', 'c')
+        self.assertIsNone(lru_cache.get('a'))
+        self.assertEqual(lru_cache.pop('b'), 'bbbb')
+        self.assertIsNone(lru_cache.get('b'))
+
+        lru_cache.set('d', 'd' * 11)
+        self.assertIsNone(lru_cache.get('d'))
+        self.assertEqual(lru_cache.get('c'), 'c')
+
+    def test_disabled(self):
+        lru_cache = ProcessLRUCache(0)
+        lru_cache.set('a', 1)
+        self.assertIsNone(lru_cache.get('a'))
+
+    @patch('openedx.core.lib.cache_utils._process_cache_clearers', [])
+    def test_clear_process_caches(self):
+        lru_cache = ProcessLRUCache(2)
+        lru_cache.set('a', 1)
+        clear = register_process_cache(Mock())
+
+        clear_process_caches()
+        self.assertIsNone(lru_cache.get('a'))
+        clear.assert_called_once_with()
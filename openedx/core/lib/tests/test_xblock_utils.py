@@ -9,6 +9,7 @@ import ddt
 import six
 from django.conf import settings
 from django.test.client import RequestFactory
+from edx_django_utils.cache import RequestCache
 from mock import patch
 from opaque_keys.edx.asides import AsideUsageKeyV1, AsideUsageKeyV2
 from web_fragments.fragment import Fragment
@@ -27,6 +28,8 @@ from openedx.core.lib.xblock_utils import (
     wrap_fragment,
     wrap_xblock
 )
+from xmodule.contentstore.content import StaticContent
+from xmodule.contentstore.django import contentstore
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
@@ -177,6 +180,47 @@ class TestXblockUtils(SharedModuleStoreTestCase):
         self.assertIsInstance(test_replace, Fragment)
         self.assertEqual(test_replace.content, anchor_tag)
 
+    def test_replace_static_urls_cached(self):
+        """
+        Verify that the replaced static URLs are reused until the assets of the course change.
+        """
+        def replace():
+            RequestCache.clear_all_namespaces()
+            return replace_static_urls(
+                data_dir=None,
+                course_id=self.course_split.id,
+                block=self.course_split,
+                view='baseview',
+                frag=Fragment('<a href="/static/cached">'),
+                context=None
+            ).content
+
+        anchor_tag = replace()
+        with patch('static_replace._get_course_static_url') as mock_get_course_static_url:
+            self.assertEqual(replace(), anchor_tag)
+            self.assertFalse(mock_get_course_static_url.called)
+
+        asset_key = self.course_split.id.make_asset_key('asset', 'cached')
+        contentstore().save(StaticContent(asset_key, 'cached', 'text/plain', b'cached'))
+        self.addCleanup(contentstore().delete, asset_key)
+        self.assertNotEqual(replace(), anchor_tag)
+
+    def test_replace_static_urls_without_static_urls(self):
+        """
+        Verify that the static URL map of the course isn't fetched for fragments without static URLs.
+        """
+        with patch('openedx.core.lib.xblock_utils.get_course_static_url_map') as mock_get_course_static_url_map:
+            test_replace = replace_static_urls(
+                data_dir=None,
+                course_id=self.course_split.id,
+                block=self.course_split,
+                view='baseview',
+                frag=Fragment('<a href="/courses/id">'),
+                context=None
+            )
+        self.assertEqual(test_replace.content, '<a href="/courses/id">')
+        self.assertFalse(mock_get_course_static_url_map.called)
+
     def test_sanitize_html_id(self):
         """
         Verify that colons and dashes are replaced.
@@ -30,6 +30,7 @@ from xblock.scorable import ScorableXBlockMixin
 
 import static_replace
 from edxmako.shortcuts import render_to_string
+from static_replace.url_map import get_course_static_url_map
 from xmodule.seq_module import SequenceModule
 from xmodule.util.xmodule_django import add_webpack_to_fragment
 from xmodule.vertical_block import VerticalBlock
@@ -263,12 +264,20 @@ def replace_static_urls(data_dir, block, view, frag, context, course_id=None, st
     Updates the supplied module with a new get_html function that wraps
     the old get_html function and substitutes urls of the form /static/...
     with urls that are /static/<prefix>/...
+
+    The urls of the course's static content are looked up in the course's
+    StaticUrlMap, shared by the fragments rendered by this process, which is
+    only fetched for fragments with static urls to replace.
     """
+    static_url_map = None
+    if course_id and not static_asset_path and '/static/' in frag.content:
+        static_url_map = get_course_static_url_map(course_id)
     return wrap_fragment(frag, static_replace.replace_static_urls(
         frag.content,
         data_dir,
         course_id,
-        static_asset_path=static_asset_path
+        static_asset_path=static_asset_path,
+        static_url_map=static_url_map,
     ))
 
 
@@ -5,9 +5,10 @@ from datetime import datetime, timedelta
 
 import ddt
 import pytz
+from django.db import transaction
 from django.utils import timezone
 from edx_django_utils.cache import RequestCache
-from mock import Mock
+from mock import Mock, patch
 from opaque_keys.edx.locator import CourseLocator
 
 from course_modes.tests.factories import CourseModeFactory
@@ -225,6 +226,74 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):
             }
         )
 
+    def test_current_many(self):
+        site_cfg = SiteConfigurationFactory.create(site_values={'course_org_filter': 'org-1'})
+        ContentTypeGatingConfig.objects.create(enabled=True, enabled_as_of=datetime(2018, 1, 1))
+        ContentTypeGatingConfig.objects.create(site=site_cfg.site, studio_override_enabled=True)
+        ContentTypeGatingConfig.objects.create(org='org-2', enabled=False)
+        ContentTypeGatingConfig.objects.create(org_course='org-1+course-1', enabled_as_of=datetime(2019, 1, 1))
+        courses = [
+            CourseOverviewFactory.create(org=org, id=CourseLocator(org, course, 'run'))
+            for org, course in [('org-1', 'course-1'), ('org-1', 'course-2'), ('org-2', 'course-1')]
+        ]
+        ContentTypeGatingConfig.objects.create(course=courses[1], enabled=False)
+        course_keys = [course.id for course in courses]
+
+        def current_values(config):
+            """
+            Return the values and provenances of the stackable fields of the given configuration.
+            """
+            return [
+                (getattr(config, field_name), config.provenances[field_name])
+                for field_name in ContentTypeGatingConfig.STACKABLE_FIELDS
+            ]
+
+        expected_values = {
+            course_key: current_values(ContentTypeGatingConfig.current(course_key=course_key))
+            for course_key in course_keys
+        }
+        self.clear_caches()
+
+        # The site of org-1, the default site of org-2, and the overrides of each level
+        with self.assertNumQueries(7):
+            configs = ContentTypeGatingConfig.current_many(course_keys)
+        self.assertEqual(
+            {course_key: current_values(config) for course_key, config in configs.items()},
+            expected_values,
+        )
+
+        RequestCache.clear_all_namespaces()
+
+        # Check that the overrides are kept in memory and the configurations cached, only
+        # the default site of org-2 being queried again
+        with self.assertNumQueries(1):
+            ContentTypeGatingConfig.current_many(course_keys)
+        with self.assertNumQueries(0):
+            ContentTypeGatingConfig.current(course_key=course_keys[0])
+
+        # Check that the overrides are reloaded after a save
+        ContentTypeGatingConfig.objects.create(course=courses[0], enabled=False)
+        configs = ContentTypeGatingConfig.current_many(course_keys)
+        self.assertEqual(configs[course_keys[0]].enabled, False)
+        self.assertEqual(configs[course_keys[0]].provenances['enabled'], Provenance.run)
+
+    def test_current_many_reloaded_on_commit(self):
+        course_key = CourseOverviewFactory.create(org='org-1', id=CourseLocator('org-1', 'course-1', 'run')).id
+        ContentTypeGatingConfig.objects.create(enabled=True, enabled_as_of=datetime(2018, 1, 1))
+
+        with patch('openedx.core.djangoapps.config_model_utils.models.transaction.on_commit') as mock_on_commit:
+            with transaction.atomic():
+                ContentTypeGatingConfig.objects.create(org='org-1', enabled=False)
+                # As another process could, before the save is committed.
+                ContentTypeGatingConfig.current_many([course_key])
+                RequestCache.clear_all_namespaces()
+        for call in mock_on_commit.call_args_list:
+            call[0][0]()
+
+        with patch.object(ContentTypeGatingConfig, '_load_overrides', return_value={}) as mock_load_overrides:
+            ContentTypeGatingConfig.current_many([course_key])
+        self.assertTrue(mock_load_overrides.called)
+
     def test_caching_global(self):
         global_config = ContentTypeGatingConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1))
         global_config.save()
@@ -310,8 +379,9 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value in cache was deleted on save
-        with self.assertNumQueries(2):
+        # Check that the org value in cache was deleted on save, the site of the org
+        # being looked up in the org index of the site configurations
+        with self.assertNumQueries(1):
             self.assertFalse(ContentTypeGatingConfig.current(org=course.org).enabled)
 
         global_config = ContentTypeGatingConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1))
@@ -357,8 +427,9 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value in cache was deleted on save
-        with self.assertNumQueries(2):
+        # Check that the org value in cache was deleted on save, the site of the org
+        # being looked up in the org index of the site configurations
+        with self.assertNumQueries(1):
             self.assertFalse(ContentTypeGatingConfig.current(course_key=course.id).enabled)
 
         global_config = ContentTypeGatingConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1))
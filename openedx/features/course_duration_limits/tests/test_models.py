@@ -328,8 +328,9 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value in cache was deleted on save
-        with self.assertNumQueries(2):
+        # Check that the org value in cache was deleted on save, the site of the org
+        # being looked up in the org index of the site configurations
+        with self.assertNumQueries(1):
             self.assertFalse(CourseDurationLimitConfig.current(org=course.org).enabled)
 
         global_config = CourseDurationLimitConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1))
@@ -375,8 +376,9 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value in cache was deleted on save
-        with self.assertNumQueries(2):
+        # Check that the org value in cache was deleted on save, the site of the org
+        # being looked up in the org index of the site configurations
+        with self.assertNumQueries(1):
             self.assertFalse(CourseDurationLimitConfig.current(course_key=course.id).enabled)
 
         global_config = CourseDurationLimitConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1))